@@ -2,17 +2,24 @@ import asyncio
 import yaml
 import os
 import time
+from collections import deque
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
 from functools import partial
 from typing import Any
 from forwarder import Forwarder
+from core.anomaly_detection import load_optional_anomaly_detector
 from core.data_plane import (
     DeduplicationMode,
     OutputBatch,
     ProcessingSnapshot,
     ProcessingWorkItem,
 )
+from core.egress_targets import (
+    PerTargetEgressDispatcher,
+    load_target_queue_settings,
+)
+from core.emission_throttle import load_optional_emission_throttle
 from core.ingress_frame import (
     IngressFrame,
     coerce_ingress_frame,
@@ -20,6 +27,7 @@ from core.ingress_frame import (
 )
 from core.metrics import EgressMetricsSnapshot, QueueMetricsSnapshot
 from core.network_policy import NetworkPolicy, compile_ingress_policy
+from core.output_builder import load_target_output_profiles
 from core.python_data_plane import PythonDataPlaneProcessor
 from core.runtime_control import build_optional_routing_control_server
 from core.runtime_statistics import InputTrafficMetrics, RuntimeStatisticsProvider
@@ -27,11 +35,13 @@ from core.runtime_routing import load_optional_routing_table
 from core.routing_state import RoutingState
 from core.source_identity import build_udp_source_id
 from core.udp_listener import create_udp_listener_socket
+from core.vessel_table import load_optional_vessel_table
 from aismixer_secure import secure_server
 
 
 DEFAULT_INGRESS_QUEUE_MAXSIZE = 1024
 DEFAULT_PROCESSING_QUEUE_MAXSIZE = 1024
+DEFAULT_EGRESS_INFLIGHT_BATCHES = 1
 
 try:
     from setproctitle import setproctitle
@@ -116,12 +126,22 @@ G_PRESERVE_INGRESS_GID = config.get("g_preserve_ingress_gid", True)
 G_ID_DIGITS = config.get("g_id_digits", 18)
 G_ALWAYS_TAG_SINGLE = config.get("g_always_tag_single", False)
 C_PRESERVE_INGRESS_C = config.get("c_preserve_ingress_c", True)
+EGRESS_INFLIGHT_BATCHES = config.get(
+    "egress_inflight_batches",
+    DEFAULT_EGRESS_INFLIGHT_BATCHES,
+)
 forwarder = Forwarder(FORWARDERS)
 initial_routing_table = load_optional_routing_table(
     config,
     forwarder.target_id_by_name,
 )
 routing_state = RoutingState(initial_routing_table)
+vessel_table = load_optional_vessel_table(config)
+anomaly_detector = load_optional_anomaly_detector(
+    config,
+    forwarder.target_id_by_name,
+)
+emission_throttle = load_optional_emission_throttle(forwarder.targets)
 
 
 def create_data_plane_processor() -> PythonDataPlaneProcessor:
@@ -133,6 +153,10 @@ def create_data_plane_processor() -> PythonDataPlaneProcessor:
         preserve_ingress_gid=G_PRESERVE_INGRESS_GID,
         always_tag_single=G_ALWAYS_TAG_SINGLE,
         gid_digits=G_ID_DIGITS,
+        target_profiles=load_target_output_profiles(forwarder.targets),
+        vessel_table=vessel_table,
+        anomaly_detector=anomaly_detector,
+        emission_throttle=emission_throttle,
     )
 
 
@@ -467,6 +491,7 @@ def _bind_processing_work_item(
             routing_generation=routing_generation,
             deduplication_mode=DeduplicationMode.PER_TARGET,
             target_ids=routing_table.match_target_ids(frame.source_id),
+            target_filter=routing_table.match_target_filter(frame.source_id),
         )
 
     return ProcessingWorkItem(
@@ -541,32 +566,52 @@ async def processor_stage_loop(
     egress_queue,
     *,
     processor,
+    max_inflight_batches=DEFAULT_EGRESS_INFLIGHT_BATCHES,
 ):
-    """Process one bound work item and await its egress completion barrier."""
+    """Process bound work items within a bounded egress completion window.
 
-    while True:
-        work_item = await processing_queue.get()
-        if not isinstance(work_item, ProcessingWorkItem):
-            raise TypeError(
-                "processor queue item must be a ProcessingWorkItem"
-            )
+    At most ``max_inflight_batches`` non-empty batches may be handed to egress
+    without completion. Completions are awaited in handoff order, so an
+    egress failure or cancellation surfaces here no later than the handoff
+    that would exceed the window. With a window of one, every batch completes
+    before the next work item is taken.
+    """
 
-        output_batch = processor.process(
-            work_item.frame,
-            work_item.snapshot,
-        )
-        if not output_batch.outputs:
-            continue
+    max_inflight_batches = _validate_queue_capacity(
+        max_inflight_batches,
+        name="max_inflight_batches",
+    )
+    pending = deque()
+    try:
+        while True:
+            work_item = await processing_queue.get()
+            if not isinstance(work_item, ProcessingWorkItem):
+                raise TypeError(
+                    "processor queue item must be a ProcessingWorkItem"
+                )
 
-        completion = asyncio.get_running_loop().create_future()
-        batch = _EgressBatch(
-            output_batch=output_batch,
-            completion=completion,
-        )
-        try:
-            await egress_queue.put(batch)
-            await completion
-        finally:
+            output_batch = processor.process(
+                work_item.frame,
+                work_item.snapshot,
+            )
+            if not output_batch.outputs:
+                continue
+
+            completion = asyncio.get_running_loop().create_future()
+            pending.append(completion)
+            await egress_queue.put(
+                _EgressBatch(
+                    output_batch=output_batch,
+                    completion=completion,
+                )
+            )
+            while pending and (
+                len(pending) >= max_inflight_batches or pending[0].done()
+            ):
+                await pending[0]
+                pending.popleft()
+    finally:
+        for completion in pending:
             _cancel_or_retrieve_completion(completion)
 
 
@@ -629,6 +674,22 @@ async def egress_stage_loop(
                 batch.completion.set_result(None)
 
 
+async def egress_target_workers_loop(dispatcher):
+    """Own one supervised drain worker per numeric egress target."""
+
+    target_ids = dispatcher.all_target_ids
+    if not target_ids:
+        await asyncio.get_running_loop().create_future()
+
+    await _supervise_named_tasks(
+        _RuntimeTaskSpec(
+            name=f"egress-target:{target_id}",
+            coroutine_factory=partial(dispatcher.run_target, target_id),
+        )
+        for target_id in target_ids
+    )
+
+
 async def _run_runtime_stages(
     ingress_queue,
     egress_queue,
@@ -641,6 +702,7 @@ async def _run_runtime_stages(
     timestamp=None,
     processing_queue_maxsize=DEFAULT_PROCESSING_QUEUE_MAXSIZE,
     egress_metrics=None,
+    egress_inflight_batches=DEFAULT_EGRESS_INFLIGHT_BATCHES,
 ):
     """Run one ingress binding, processor, and egress lifecycle."""
 
@@ -668,6 +730,7 @@ async def _run_runtime_stages(
                     processing_queue,
                     egress_queue,
                     processor=processor,
+                    max_inflight_batches=egress_inflight_batches,
                 ),
             ),
             _RuntimeTaskSpec(
@@ -737,11 +800,22 @@ async def main(
         ingress_queue_maxsize,
         name="ingress_queue_maxsize",
     )
+    egress_inflight_batches = _validate_queue_capacity(
+        EGRESS_INFLIGHT_BATCHES,
+        name="egress_inflight_batches",
+    )
     processor_queue = _BoundedProcessingQueue(processing_queue_maxsize)
     processor = create_data_plane_processor()
+    egress_dispatcher = PerTargetEgressDispatcher(
+        forwarder,
+        load_target_queue_settings(forwarder.targets),
+    )
     input_queues = []
     input_traffic = []
-    egress_queue = _ObservedQueue(name="egress", maxsize=1)
+    egress_queue = _ObservedQueue(
+        name="egress",
+        maxsize=egress_inflight_batches,
+    )
     egress_metrics = _EgressMetrics()
     runtime_task_specs = []
     udp_sockets = []
@@ -751,6 +825,8 @@ async def main(
     control_server_started = False
 
     try:
+        await forwarder.start()
+
         # Secure входове
         for index, (entry, ingress_policy) in enumerate(
             zip(SEC_INPUTS, sec_input_policies)
@@ -839,6 +915,11 @@ async def main(
             egress_operations=egress_metrics,
             input_traffic=input_traffic,
             output_traffic=forwarder,
+            target_queues=egress_dispatcher,
+            tcp_servers=forwarder,
+            emission_throttle=emission_throttle,
+            vessels=vessel_table,
+            anomalies=anomaly_detector,
         )
         control_server = build_optional_routing_control_server(
             config,
@@ -870,6 +951,7 @@ async def main(
                         processor_queue,
                         egress_queue,
                         processor=processor,
+                        max_inflight_batches=egress_inflight_batches,
                     ),
                 ),
                 _RuntimeTaskSpec(
@@ -877,12 +959,23 @@ async def main(
                     coroutine_factory=partial(
                         egress_stage_loop,
                         egress_queue,
-                        forwarder,
+                        egress_dispatcher,
                         debug=DEBUG,
                         timestamp=ts,
                         metrics=egress_metrics,
                     ),
                 ),
+                _RuntimeTaskSpec(
+                    name="egress-targets",
+                    coroutine_factory=partial(
+                        egress_target_workers_loop,
+                        egress_dispatcher,
+                    ),
+                ),
+                _RuntimeTaskSpec(
+                    name="forwarder-resolver",
+                    coroutine_factory=forwarder.run_resolver,
+                ),
             )
         )
         await _supervise_named_tasks(runtime_task_specs)
@@ -7,14 +7,24 @@ import time
 import yaml
 from collections import OrderedDict, deque
 from dataclasses import dataclass
+from typing import Optional
 from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from core.ingress_frame import frame_from_text_payload
+from core.ingress_frame import IngressFrame, frame_from_text_payload
 from core.network_policy import NetworkPolicy
 from core.source_identity import build_udpsec_source_id
 from core.udp_listener import create_udp_listener_socket
+from core.udpsec_batch import (
+    BATCH_AAD,
+    BATCH_PREFIX,
+    COMPRESSION_DEFLATE_NMEA,
+    DATA_VERSION_BATCH,
+    DATA_VERSION_JSON,
+    decode_batch,
+    decompress_batch,
+)
 from core.udpsec_crypto import (
     DOMAIN_CONTEXT,
     build_client_auth_digest,
@@ -261,6 +271,8 @@ class _SecureSession:
     created_at: float
     last_seen: float
     seen_data_nonces: _BoundedExpiringSet
+    data_version: int = DATA_VERSION_JSON
+    compression: Optional[str] = None
 
 
 @dataclass
@@ -273,6 +285,21 @@ class _PendingSecureSession:
     seen_data_nonces: _BoundedExpiringSet
 
 
+@dataclass(frozen=True)
+class StationCompressionStats:
+    station_id: str
+    frames: int
+    compressed_bytes: int
+    uncompressed_bytes: int
+    cpu_ns: int
+
+    @property
+    def ratio(self) -> float:
+        if not self.compressed_bytes:
+            return 0.0
+        return self.uncompressed_bytes / self.compressed_bytes
+
+
 @dataclass(frozen=True)
 class SecureStateStats:
     handshake_replay_accepted: int
@@ -298,6 +325,10 @@ class SecureStateStats:
     data_nonces_capacity_evicted: int
     data_nonces_session_discarded: int
 
+    batch_frames_accepted: int
+    batch_sentences_accepted: int
+    compression_by_station: tuple[StationCompressionStats, ...]
+
     current_handshake_replays: int
     peak_handshake_replays: int
     current_sessions: int
@@ -367,6 +398,10 @@ class SecureState:
         self._data_nonces_capacity_evicted = 0
         self._data_nonces_session_discarded = 0
 
+        self._batch_frames_accepted = 0
+        self._batch_sentences_accepted = 0
+        self._compression_by_station = {}
+
         self._current_data_nonces = 0
         self._peak_handshake_replays = 0
         self._peak_sessions = 0
@@ -402,6 +437,14 @@ class SecureState:
             data_nonces_session_discarded=(
                 self._data_nonces_session_discarded
             ),
+            batch_frames_accepted=self._batch_frames_accepted,
+            batch_sentences_accepted=self._batch_sentences_accepted,
+            compression_by_station=tuple(
+                StationCompressionStats(station_id, *totals)
+                for station_id, totals in sorted(
+                    self._compression_by_station.items()
+                )
+            ),
             current_handshake_replays=len(self._handshake_replays),
             peak_handshake_replays=self._peak_handshake_replays,
             current_sessions=len(self._sessions),
@@ -594,7 +637,14 @@ class SecureState:
         self._touch_active_session(addr, session, now)
         return True
 
-    def promote_pending_session(self, addr, pending, now):
+    def promote_pending_session(
+        self,
+        addr,
+        pending,
+        now,
+        data_version=DATA_VERSION_JSON,
+        compression=None,
+    ):
         if self._get_live_pending_session_handle(
             addr, pending, now
         ) is None:
@@ -622,6 +672,8 @@ class SecureState:
             created_at=now,
             last_seen=now,
             seen_data_nonces=pending.seen_data_nonces,
+            data_version=data_version,
+            compression=compression,
         )
         self._sessions[addr] = session
         self._sessions_created += 1
@@ -677,6 +729,25 @@ class SecureState:
         )
         return True
 
+    def account_batch_frame(self, sentence_count):
+        self._batch_frames_accepted += 1
+        self._batch_sentences_accepted += sentence_count
+
+    def account_compressed_batch(
+        self,
+        station_id,
+        compressed_bytes,
+        uncompressed_bytes,
+        cpu_ns,
+    ):
+        totals = self._compression_by_station.get(station_id)
+        if totals is None:
+            totals = self._compression_by_station[station_id] = [0, 0, 0, 0]
+        totals[0] += 1
+        totals[1] += compressed_bytes
+        totals[2] += uncompressed_bytes
+        totals[3] += cpu_ns
+
     def accept_pending_data_nonce(self, pending, nonce, now):
         if self._get_live_pending_session_handle(
             pending._address, pending, now
@@ -738,14 +809,14 @@ def build_handshake_replay_key(
     return digest.finalize()
 
 
-def parse_secure_data_packet(data):
-    min_len = len(DATA_PREFIX) + 12 + 16
-    if not data.startswith(DATA_PREFIX):
+def parse_secure_data_packet(data, prefix=DATA_PREFIX):
+    min_len = len(prefix) + 12 + 16
+    if not data.startswith(prefix):
         raise ValueError("Invalid secure data packet prefix")
     if len(data) < min_len:
         raise ValueError("Secure data packet too short")
-    nonce = data[len(DATA_PREFIX):len(DATA_PREFIX)+12]
-    ciphertext = data[len(DATA_PREFIX)+12:]
+    nonce = data[len(prefix):len(prefix)+12]
+    ciphertext = data[len(prefix)+12:]
     return nonce, ciphertext
 
 
@@ -777,6 +848,38 @@ def _is_session_confirmation_ping(message, station_id):
     )
 
 
+def _negotiated_data_version(confirmation):
+    """Return the data frame version for a confirmed session.
+
+    Stations that batch list their versions in ``data_versions``; older
+    stations send no list and keep version 1 JSON frames.
+    """
+
+    offered = confirmation.get("data_versions")
+    if isinstance(offered, list) and any(
+        type(version) is int and version == DATA_VERSION_BATCH
+        for version in offered
+    ):
+        return DATA_VERSION_BATCH
+    return DATA_VERSION_JSON
+
+
+def _negotiated_compression(confirmation, data_version):
+    """Return the batch compression for a confirmed session, or None.
+
+    Only batch frames are compressed, so a version 1 session never gets one.
+    """
+
+    offered = confirmation.get("compression")
+    if (
+        data_version == DATA_VERSION_BATCH
+        and isinstance(offered, list)
+        and COMPRESSION_DEFLATE_NMEA in offered
+    ):
+        return COMPRESSION_DEFLATE_NMEA
+    return None
+
+
 def _build_server_handshake(client_hello, client_ephemeral_public_key):
     """Build one authenticated ServerHello and directional session ciphers."""
 
@@ -988,10 +1091,19 @@ async def _secure_server_loop(
                             )
                             continue
 
+                        data_version = _negotiated_data_version(
+                            pending_message
+                        )
+                        compression = _negotiated_compression(
+                            pending_message,
+                            data_version,
+                        )
                         session = state_owner.promote_pending_session(
                             addr,
                             pending,
                             local_now,
+                            data_version,
+                            compression,
                         )
                         if session is None:
                             continue
@@ -1006,6 +1118,10 @@ async def _secure_server_loop(
                             "timestamp": int(wall_now()),
                             "source_id": session.station_id,
                         }
+                        if data_version != DATA_VERSION_JSON:
+                            response["data_version"] = data_version
+                        if compression is not None:
+                            response["compression"] = compression
                         sock.sendto(
                             encrypt_secure_json_message(
                                 session.server_to_client_aesgcm,
@@ -1110,6 +1226,84 @@ async def _secure_server_loop(
                 print(
                     f"[!] Secure data error from {addr}: {type(e).__name__}: {e}")
 
+        elif data.startswith(BATCH_PREFIX):
+            try:
+                session = state_owner.get_active_session(addr, local_now)
+                if session is None:
+                    print(f"[!] No session for {addr}")
+                    sock.sendto(build_no_session_hint(), addr)
+                    continue
+                if session.data_version != DATA_VERSION_BATCH:
+                    print(f"[!] Batch frame without negotiation from {addr}")
+                    continue
+
+                nonce, ciphertext = parse_secure_data_packet(
+                    data, BATCH_PREFIX
+                )
+                if state_owner.data_nonce_seen(session, nonce, local_now):
+                    print(f"[!] Duplicate secure data nonce from {addr}")
+                    continue
+
+                plaintext = session.client_to_server_aesgcm.decrypt(
+                    nonce,
+                    ciphertext,
+                    BATCH_AAD,
+                )
+                if session.compression is None:
+                    flags, sentences = decode_batch(plaintext)
+                else:
+                    cpu_started_ns = time.thread_time_ns()
+                    uncompressed = decompress_batch(plaintext)
+                    cpu_ns = time.thread_time_ns() - cpu_started_ns
+                    flags, sentences = decode_batch(uncompressed)
+                if flags:
+                    print(f"[!] Unsupported batch flags from {addr}")
+                    continue
+
+                if not state_owner.accept_data_nonce(
+                    session, nonce, local_now
+                ):
+                    print(f"[!] Duplicate secure data nonce from {addr}")
+                    continue
+
+                state_owner.touch_session(addr, session, local_now)
+                state_owner.account_batch_frame(len(sentences))
+                if session.compression is not None:
+                    state_owner.account_compressed_batch(
+                        session.station_id,
+                        len(plaintext),
+                        len(uncompressed),
+                        cpu_ns,
+                    )
+
+                station_id = session.station_id
+                source_id = build_udpsec_source_id(station_id)
+                alias_for_s = sec_input_id or station_id or "ANONYMOUS"
+                remote_ip = addr[0]
+                assembler_key = f"{addr[0]}:{addr[1]}"
+                for sentence in sentences:
+                    await queue.put(
+                        IngressFrame(
+                            kind="sec",
+                            source_id=source_id,
+                            alias_for_s=alias_for_s,
+                            remote_ip=remote_ip,
+                            assembler_key=assembler_key,
+                            payload=sentence,
+                        )
+                    )
+                    if input_traffic is not None:
+                        input_traffic.frame_accepted(sentence)
+
+                if DEBUG:
+                    print(
+                        f"{wall_now()} [SECURE] "
+                        f"From {station_id}: {len(sentences)} sentences")
+
+            except Exception as e:
+                print(
+                    f"[!] Secure batch error from {addr}: {type(e).__name__}: {e}")
+
 
 async def secure_server(
     queue,
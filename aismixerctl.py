@@ -23,11 +23,16 @@ import yaml
 
 from core.routing_control_protocol import (
     METHOD_DISABLE,
+    METHOD_PATCH,
     METHOD_REPLACE,
     METHOD_RUNTIME_STATISTICS,
+    METHOD_RUNTIME_STATISTICS_ANOMALIES,
+    METHOD_RUNTIME_STATISTICS_CLIENTS,
     METHOD_RUNTIME_STATISTICS_INPUTS,
     METHOD_RUNTIME_STATISTICS_OUTPUTS,
     METHOD_STATUS,
+    METHOD_VESSELS_GET,
+    METHOD_VESSELS_QUERY,
     ROUTING_CONTROL_PROTOCOL_VERSION,
 )
 from core.routing_control_unix_client import (
@@ -55,7 +60,13 @@ _STATISTICS_HELP = (
     "Statistics commands:\n"
     "  show statistics\n"
     "  show statistics inputs [INPUT]\n"
-    "  show statistics outputs [OUTPUT]"
+    "  show statistics outputs [OUTPUT]\n"
+    "  show statistics clients [OUTPUT]\n"
+    "  show statistics anomalies\n"
+    "\n"
+    "Vessel commands:\n"
+    "  show vessel MMSI\n"
+    "  show vessels MIN_LON MIN_LAT MAX_LON MAX_LAT [--limit N]"
 )
 
 
@@ -129,12 +140,46 @@ def build_runtime_statistics_inputs_request(
 def build_runtime_statistics_outputs_request(
     request_id: str,
     output: str | None = None,
+) -> dict[str, object]:
+    return _build_target_statistics_request(
+        request_id,
+        METHOD_RUNTIME_STATISTICS_OUTPUTS,
+        output,
+    )
+
+
+def build_runtime_statistics_clients_request(
+    request_id: str,
+    output: str | None = None,
+) -> dict[str, object]:
+    return _build_target_statistics_request(
+        request_id,
+        METHOD_RUNTIME_STATISTICS_CLIENTS,
+        output,
+    )
+
+
+def build_runtime_statistics_anomalies_request(
+    request_id: str,
+) -> dict[str, object]:
+    _validate_request_id(request_id)
+    return {
+        "version": ROUTING_CONTROL_PROTOCOL_VERSION,
+        "request_id": request_id,
+        "method": METHOD_RUNTIME_STATISTICS_ANOMALIES,
+    }
+
+
+def _build_target_statistics_request(
+    request_id: str,
+    method: str,
+    output: str | None,
 ) -> dict[str, object]:
     _validate_request_id(request_id)
     request: dict[str, object] = {
         "version": ROUTING_CONTROL_PROTOCOL_VERSION,
         "request_id": request_id,
-        "method": METHOD_RUNTIME_STATISTICS_OUTPUTS,
+        "method": method,
     }
     if output is not None:
         if not isinstance(output, str) or not output:
@@ -148,6 +193,38 @@ def build_runtime_statistics_outputs_request(
     return request
 
 
+def build_vessel_request(request_id: str, mmsi: int) -> dict[str, object]:
+    _validate_request_id(request_id)
+    return {
+        "version": ROUTING_CONTROL_PROTOCOL_VERSION,
+        "request_id": request_id,
+        "method": METHOD_VESSELS_GET,
+        "params": {"mmsi": mmsi},
+    }
+
+
+def build_vessels_request(
+    request_id: str,
+    bbox: Sequence[float],
+    *,
+    limit: int | None = None,
+) -> dict[str, object]:
+    _validate_request_id(request_id)
+    if len(bbox) != 4:
+        raise AismixerCtlInputError(
+            "Vessel query needs MIN_LON MIN_LAT MAX_LON MAX_LAT."
+        )
+    params: dict[str, object] = {"bbox": list(bbox)}
+    if limit is not None:
+        params["limit"] = limit
+    return {
+        "version": ROUTING_CONTROL_PROTOCOL_VERSION,
+        "request_id": request_id,
+        "method": METHOD_VESSELS_QUERY,
+        "params": params,
+    }
+
+
 def build_disable_request(
     request_id: str,
     *,
@@ -188,6 +265,30 @@ def build_replace_request(
     }
 
 
+def build_patch_request(
+    request_id: str,
+    operations: Sequence[Mapping[str, object]],
+    *,
+    expected_generation: int | None = None,
+) -> dict[str, object]:
+    _validate_request_id(request_id)
+    if not operations:
+        raise AismixerCtlInputError("Routing patch needs at least one operation.")
+
+    params: dict[str, object] = {
+        "operations": [dict(operation) for operation in operations]
+    }
+    if expected_generation is not None:
+        params["expected_generation"] = _validate_expected_generation(expected_generation)
+
+    return {
+        "version": ROUTING_CONTROL_PROTOCOL_VERSION,
+        "request_id": request_id,
+        "method": METHOD_PATCH,
+        "params": params,
+    }
+
+
 def load_routing_section_file(path: str | Path) -> Mapping[str, object]:
     """Load YAML and extract a candidate routing section without compiling it."""
 
@@ -392,6 +493,24 @@ def _add_remote_command_parsers(
         dest="expected_generation",
     )
 
+    patch_parser = subparsers.add_parser(
+        "patch",
+        help="change one zone source or route target in the active routing",
+    )
+    patch_subparsers = patch_parser.add_subparsers(
+        dest="patch_command",
+        required=True,
+    )
+    for patch_command, (subject, value) in _PATCH_COMMANDS.items():
+        operation_parser = patch_subparsers.add_parser(patch_command)
+        operation_parser.add_argument("patch_name", metavar=subject.upper())
+        operation_parser.add_argument("patch_value", metavar=value.upper())
+        operation_parser.add_argument(
+            "--expected-generation",
+            type=_parse_expected_generation,
+            dest="expected_generation",
+        )
+
     disable_parser = subparsers.add_parser("disable")
     disable_parser.add_argument(
         "--expected-generation",
@@ -432,10 +551,49 @@ def _add_remote_command_parsers(
         nargs="?",
         metavar="OUTPUT",
     )
+    clients_parser = statistics_subparsers.add_parser(
+        "clients",
+        help="show TCP fan-out servers and their connected clients",
+    )
+    clients_parser.add_argument(
+        "output_filter",
+        nargs="?",
+        metavar="OUTPUT",
+    )
+    statistics_subparsers.add_parser(
+        "anomalies",
+        help="show kinematic anomaly detection counters",
+    )
+
+    vessel_parser = show_subparsers.add_parser(
+        "vessel",
+        help="show the last known position of one vessel",
+    )
+    vessel_parser.add_argument("mmsi", type=int, metavar="MMSI")
+    vessels_parser = show_subparsers.add_parser(
+        "vessels",
+        help="show vessels inside a longitude/latitude box",
+    )
+    for metavar in ("MIN_LON", "MIN_LAT", "MAX_LON", "MAX_LAT"):
+        vessels_parser.add_argument(
+            metavar.lower(),
+            type=float,
+            metavar=metavar,
+        )
+    vessels_parser.add_argument("--limit", type=int)
 
     return subparsers
 
 
+# Command name -> (subject field, value field) of the protocol operation.
+_PATCH_COMMANDS = {
+    "add-source": ("zone", "source"),
+    "remove-source": ("zone", "source"),
+    "add-target": ("route", "target"),
+    "remove-target": ("route", "target"),
+}
+
+
 def run_interactive_shell(
     *,
     socket_path: str = DEFAULT_SOCKET_PATH,
@@ -556,6 +714,7 @@ def completion_candidates(line: str, text: str) -> tuple[str, ...]:
     commands = (
         "status",
         "replace",
+        "patch",
         "disable",
         "show",
         "help",
@@ -573,16 +732,25 @@ def completion_candidates(line: str, text: str) -> tuple[str, ...]:
         candidates = ("--file", "--expected-generation")
     elif words[0] == "disable":
         candidates = ("--expected-generation",)
+    elif words[0] == "patch" and (
+        len(words) == 1
+        or (len(words) == 2 and not stripped[-1:].isspace())
+    ):
+        candidates = tuple(_PATCH_COMMANDS)
+    elif words[0] == "patch":
+        candidates = ("--expected-generation",)
     elif words[0] == "show" and (
         len(words) == 1
         or (len(words) == 2 and not stripped[-1:].isspace())
     ):
-        candidates = ("statistics",)
+        candidates = ("statistics", "vessel", "vessels")
+    elif words[:2] == ["show", "vessels"]:
+        candidates = ("--limit",)
     elif words[:2] == ["show", "statistics"] and (
         len(words) == 2
         or (len(words) == 3 and not stripped[-1:].isspace())
     ):
-        candidates = ("inputs", "outputs")
+        candidates = ("inputs", "outputs", "clients", "anomalies")
     else:
         candidates = ()
     return tuple(candidate for candidate in candidates if candidate.startswith(text))
@@ -707,12 +875,40 @@ def build_request_from_args(args: argparse.Namespace, request_id: str) -> dict[s
                 request_id,
                 args.output_filter,
             )
+        if statistics_command == "clients":
+            return build_runtime_statistics_clients_request(
+                request_id,
+                args.output_filter,
+            )
+        if statistics_command == "anomalies":
+            return build_runtime_statistics_anomalies_request(request_id)
         return build_runtime_statistics_request(request_id)
+    if args.command == "show" and args.show_command == "vessel":
+        return build_vessel_request(request_id, args.mmsi)
+    if args.command == "show" and args.show_command == "vessels":
+        return build_vessels_request(
+            request_id,
+            (args.min_lon, args.min_lat, args.max_lon, args.max_lat),
+            limit=args.limit,
+        )
     if args.command == "disable":
         return build_disable_request(
             request_id,
             expected_generation=args.expected_generation,
         )
+    if args.command == "patch":
+        subject, value = _PATCH_COMMANDS[args.patch_command]
+        return build_patch_request(
+            request_id,
+            [
+                {
+                    "op": args.patch_command.replace("-", "_"),
+                    subject: args.patch_name,
+                    value: args.patch_value,
+                }
+            ],
+            expected_generation=args.expected_generation,
+        )
     if args.command == "replace":
         routing = load_routing_section_file(args.routing_file)
         return build_replace_request(
@@ -739,6 +935,10 @@ def _format_interactive_statistics(
         return format_runtime_statistics_inputs(result)
     if statistics_command == "outputs":
         return format_runtime_statistics_outputs(result)
+    if statistics_command == "clients":
+        return format_runtime_statistics_clients(result)
+    if statistics_command == "anomalies":
+        return format_runtime_statistics_anomalies(result)
     return format_runtime_statistics(result)
 
 
@@ -774,6 +974,7 @@ _PROCESSOR_RESULT_FIELDS = (
     "reset_completed",
     "reset_failed",
     "reset_in_flight",
+    "gid_pool_refills",
 )
 _EGRESS_RESULT_FIELDS = (
     "batches_started",
@@ -818,6 +1019,38 @@ _OUTPUT_TRAFFIC_RESULT_FIELDS = (
     "dispatch_failed",
     "messages",
     "bytes",
+    "buffered_bytes",
+    "buffer_drops",
+    "write_pauses",
+    "resolutions",
+    "resolve_failures",
+    "transport_failures",
+    "address_changes",
+    "resolve_latency_us",
+    "sink_bytes_written",
+    "sink_rotations",
+    "sink_write_errors",
+    "sink_dropped",
+    "sink_lag_us",
+    "queue",
+    "throttled",
+)
+_OUTPUT_TRAFFIC_COUNTER_FIELDS = _OUTPUT_TRAFFIC_RESULT_FIELDS[2:-2]
+_TARGET_QUEUE_RESULT_FIELDS = (
+    "overflow_policy",
+    "capacity",
+    "depth",
+    "peak_depth",
+    "enqueued",
+    "dequeued",
+    "dropped",
+    "put_waits",
+    "sent_messages",
+    "sent_datagrams",
+    "shaped",
+)
+_TARGET_QUEUE_OVERFLOW_POLICIES = frozenset(
+    {"block", "drop_newest", "drop_oldest"}
 )
 _OUTPUT_TRAFFIC_HEADERS = (
     "TARGET ID",
@@ -827,6 +1060,27 @@ _OUTPUT_TRAFFIC_HEADERS = (
     "FAILED",
     "MESSAGES",
     "BYTES",
+    "BUFFERED",
+    "BUF DROPS",
+    "PAUSES",
+    "RESOLVES",
+    "RESOLVE FAILS",
+    "TRANSPORT FAILS",
+    "ADDR CHANGES",
+    "RESOLVE US",
+    "SINK BYTES",
+    "ROTATIONS",
+    "SINK ERRORS",
+    "SINK DROPS",
+    "SINK LAG US",
+    "POLICY",
+    "QUEUE DEPTH",
+    "QUEUE PEAK",
+    "DROPPED",
+    "SENT MSGS",
+    "DATAGRAMS",
+    "SHAPED",
+    "THROTTLED",
 )
 
 
@@ -987,13 +1241,214 @@ def _output_traffic_table_row(
         raise RoutingControlResponseError(
             f"Runtime statistics {description} name is invalid."
         )
-    for field_name in _OUTPUT_TRAFFIC_RESULT_FIELDS[2:]:
+    for field_name in _OUTPUT_TRAFFIC_COUNTER_FIELDS:
         _require_counter(row[field_name], f"{description}.{field_name}")
+    queue_cells = _target_queue_table_cells(row["queue"], f"{description}.queue")
+    throttled = row["throttled"]
+    if throttled is not None:
+        _require_counter(throttled, f"{description}.throttled")
     return (
         str(row["target_id"]),
         "-" if name is None else name,
-        *(str(row[field_name]) for field_name in _OUTPUT_TRAFFIC_RESULT_FIELDS[2:]),
+        *(str(row[field_name]) for field_name in _OUTPUT_TRAFFIC_COUNTER_FIELDS),
+        *queue_cells,
+        "-" if throttled is None else str(throttled),
+    )
+
+
+def _target_queue_table_cells(
+    value: object,
+    description: str,
+) -> tuple[str, ...]:
+    if value is None:
+        return ("-",) * 7
+    queue = _require_exact_statistics_mapping(
+        value,
+        _TARGET_QUEUE_RESULT_FIELDS,
+        description,
+    )
+    overflow_policy = queue["overflow_policy"]
+    if (
+        not isinstance(overflow_policy, str)
+        or overflow_policy not in _TARGET_QUEUE_OVERFLOW_POLICIES
+    ):
+        raise RoutingControlResponseError(
+            f"Runtime statistics {description} overflow_policy is invalid."
+        )
+    for field_name in _TARGET_QUEUE_RESULT_FIELDS[1:]:
+        _require_counter(queue[field_name], f"{description}.{field_name}")
+    return (
+        overflow_policy,
+        f"{queue['depth']}/{queue['capacity']}",
+        str(queue["peak_depth"]),
+        str(queue["dropped"]),
+        str(queue["sent_messages"]),
+        str(queue["sent_datagrams"]),
+        str(queue["shaped"]),
+    )
+
+
+_TCP_SERVER_RESULT_FIELDS = (
+    "target_id",
+    "name",
+    "listen",
+    "accepted",
+    "rejected",
+    "evicted",
+    "clients",
+)
+_TCP_SERVER_HEADERS = (
+    "TARGET ID",
+    "NAME",
+    "LISTEN",
+    "CLIENTS",
+    "ACCEPTED",
+    "REJECTED",
+    "EVICTED",
+)
+_TCP_CLIENT_RESULT_FIELDS = (
+    "client_id",
+    "peer",
+    "bytes",
+    "buffered_bytes",
+    "lag_us",
+)
+_TCP_CLIENT_HEADERS = (
+    "TARGET ID",
+    "CLIENT",
+    "PEER",
+    "BYTES",
+    "BUFFERED",
+    "LAG US",
+)
+
+
+def format_runtime_statistics_clients(result: object) -> str:
+    """Render TCP fan-out servers and their clients as two ASCII tables."""
+
+    statistics = _require_exact_statistics_mapping(
+        result,
+        ("servers",),
+        "client statistics result",
+    )
+    servers = _require_statistics_sequence(
+        statistics["servers"],
+        "client statistics servers",
+    )
+    server_rows = []
+    client_rows = []
+    for index, value in enumerate(servers):
+        description = f"servers[{index}]"
+        server = _require_exact_statistics_mapping(
+            value,
+            _TCP_SERVER_RESULT_FIELDS,
+            description,
+        )
+        _require_counter(server["target_id"], f"{description}.target_id")
+        name = server["name"]
+        if name is not None and (not isinstance(name, str) or not name):
+            raise RoutingControlResponseError(
+                f"Runtime statistics {description} name is invalid."
+            )
+        if not isinstance(server["listen"], str):
+            raise RoutingControlResponseError(
+                f"Runtime statistics {description} listen is invalid."
+            )
+        for field_name in ("accepted", "rejected", "evicted"):
+            _require_counter(server[field_name], f"{description}.{field_name}")
+        clients = _require_statistics_sequence(
+            server["clients"],
+            f"{description}.clients",
+        )
+        server_rows.append(
+            (
+                str(server["target_id"]),
+                "-" if name is None else name,
+                server["listen"],
+                str(len(clients)),
+                str(server["accepted"]),
+                str(server["rejected"]),
+                str(server["evicted"]),
+            )
+        )
+        for client_index, client_value in enumerate(clients):
+            client_rows.append(
+                (
+                    str(server["target_id"]),
+                    *_tcp_client_table_cells(
+                        client_value,
+                        f"{description}.clients[{client_index}]",
+                    ),
+                )
+            )
+    sections = (
+        "TCP servers\n"
+        + _format_ascii_table(_TCP_SERVER_HEADERS, tuple(server_rows)),
+        "TCP clients\n"
+        + _format_ascii_table(_TCP_CLIENT_HEADERS, tuple(client_rows)),
+    )
+    return "\n\n".join(sections) + "\n"
+
+
+def _tcp_client_table_cells(
+    value: object,
+    description: str,
+) -> tuple[str, ...]:
+    client = _require_exact_statistics_mapping(
+        value,
+        _TCP_CLIENT_RESULT_FIELDS,
+        description,
+    )
+    if not isinstance(client["peer"], str):
+        raise RoutingControlResponseError(
+            f"Runtime statistics {description} peer is invalid."
+        )
+    for field_name in ("client_id", "bytes", "buffered_bytes", "lag_us"):
+        _require_counter(client[field_name], f"{description}.{field_name}")
+    return (
+        str(client["client_id"]),
+        client["peer"] or "-",
+        str(client["bytes"]),
+        str(client["buffered_bytes"]),
+        str(client["lag_us"]),
+    )
+
+
+_ANOMALY_RESULT_FIELDS = (
+    "checked",
+    "speed",
+    "teleport",
+    "duplicate_mmsi",
+    "out_of_range",
+    "tracked_vessels",
+)
+_ANOMALY_HEADERS = (
+    "CHECKED",
+    "SPEED",
+    "TELEPORT",
+    "DUPLICATE MMSI",
+    "OUT OF RANGE",
+    "TRACKED",
+)
+
+
+def format_runtime_statistics_anomalies(result: object) -> str:
+    """Render anomaly detection counters as one deterministic ASCII table."""
+
+    statistics = _require_exact_statistics_mapping(
+        result,
+        ("anomalies",),
+        "anomaly result",
+    )
+    if statistics["anomalies"] is None:
+        return "Anomaly detection is not enabled.\n"
+    anomalies = _require_counter_mapping(
+        statistics["anomalies"],
+        _ANOMALY_RESULT_FIELDS,
+        "anomalies",
     )
+    row = tuple(str(anomalies[field_name]) for field_name in _ANOMALY_RESULT_FIELDS)
+    return _format_ascii_table(_ANOMALY_HEADERS, (row,)) + "\n"
 
 
 def _require_statistics_sequence(
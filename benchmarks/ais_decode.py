@@ -0,0 +1,128 @@
+"""Measure AIS payload decoding cost per payload.
+
+Processes the mixed workload's frames into their armoured payloads and
+decodes MMSI, longitude and latitude from each single-sentence one. The
+"per character" row is the naive loop that shifts in one character at a
+time. "translate" decodes a fresh ``AisPayload`` each time. "LRU" goes
+through ``decode_payload``, so the copies of one transmission that several
+receivers heard are decoded once. "numpy batch" decodes every payload in one
+``decode_payloads`` call and is skipped when NumPy is not installed.
+
+Run from the repository root::
+
+    python -m benchmarks.ais_decode [--frames N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from benchmarks._workloads import mixed_traffic, print_table, timed
+from core.ais_payload import (
+    SIXBIT_VALUES,
+    AisPayload,
+    FIELDS,
+    decode_payload,
+    decode_payloads,
+)
+
+
+NAMES = ("mmsi", "lon", "lat")
+
+
+def _per_character(payloads):
+    sixbit = dict(SIXBIT_VALUES)
+
+    def decode() -> None:
+        for payload in payloads:
+            bits = 0
+            for character in payload:
+                bits = bits << 6 | sixbit[character]
+            bit_count = len(payload) * 6
+            for name in NAMES:
+                field = FIELDS[sixbit[payload[0]]][name]
+                value = (
+                    bits >> bit_count - field.offset - field.width
+                    & (1 << field.width) - 1
+                )
+                if field.kind == "i" and value >> field.width - 1:
+                    value -= 1 << field.width
+                value / field.scale
+
+    return decode
+
+
+def _translate(payloads):
+    def decode() -> None:
+        for payload in payloads:
+            decoded = AisPayload(payload)
+            for name in NAMES:
+                decoded[name]
+
+    return decode
+
+
+def _lru(payloads):
+    def decode() -> None:
+        decode_payload.cache_clear()
+        for payload in payloads:
+            decoded = decode_payload(payload)
+            for name in NAMES:
+                decoded[name]
+
+    return decode
+
+
+def _numpy_batch(payloads):
+    def decode() -> None:
+        decode_payloads(payloads, NAMES)
+
+    return decode
+
+
+def run(frame_count: int, repeat: int) -> None:
+    payloads = [
+        sentence.split(",")[5]
+        for sentence in (
+            frame.payload.decode("ascii").rsplit("\\", 1)[-1]
+            for frame in mixed_traffic(frame_count)
+        )
+        if sentence.split(",")[1] == "1"
+    ]
+
+    rows = []
+    baseline = None
+    for label, decoder in (
+        ("per character", _per_character),
+        ("translate", _translate),
+        ("LRU", _lru),
+        ("numpy batch", _numpy_batch),
+    ):
+        try:
+            seconds = timed(decoder(payloads), repeat=repeat)
+        except ImportError:
+            rows.append((label, "skipped: numpy not installed", ""))
+            continue
+        per_payload = seconds / len(payloads) * 1e9
+        baseline = per_payload if baseline is None else baseline
+        rows.append(
+            (label, f"{per_payload:,.0f}", f"{baseline / per_payload:.2f}x")
+        )
+
+    print(
+        f"{len(payloads)} single-sentence payloads, fields {', '.join(NAMES)}, "
+        f"best of {repeat}"
+    )
+    print_table(("decoder", "ns/payload", "speedup"), rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+    run(arguments.frames, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Measure kinematic anomaly detection cost per message and per frame.
+
+Times ``AnomalyDetector.check`` on every sentence of the mixed workload,
+then compares processor throughput without a detector, with one that only
+counts, and with one that copies flagged reports to an extra target. The
+workload draws a fresh random position for every report, so nearly every
+repeat report of a vessel is flagged: the worst case for the flagged path.
+
+Run from the repository root::
+
+    python -m benchmarks.anomaly_detection [--frames N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from benchmarks._workloads import STATION_ID, mixed_traffic, print_table, timed
+from core.anomaly_detection import AnomalyDetector, AnomalyRouting
+from core.data_plane import DeduplicationMode, ProcessingSnapshot
+from core.python_data_plane import PythonDataPlaneProcessor
+
+
+def run(frame_count: int, repeat: int) -> None:
+    frames = mixed_traffic(frame_count)
+    sentences = [
+        frame.payload.decode("ascii").rsplit("\\", 1)[-1].strip()
+        for frame in frames
+    ]
+
+    counted = AnomalyDetector()
+    flagged = sum(
+        bool(counted.check(sentence, float(index)))
+        for index, sentence in enumerate(sentences)
+    )
+
+    def check() -> None:
+        detector = AnomalyDetector()
+        for index, sentence in enumerate(sentences):
+            detector.check(sentence, float(index))
+
+    seconds = timed(check, repeat=repeat)
+    print(f"{len(sentences)} sentences, best of {repeat}")
+    print_table(
+        ("checked", "flagged", "ns/message"),
+        [
+            (
+                f"{counted.metrics_snapshot().checked:,}",
+                f"{flagged:,}",
+                f"{seconds / len(sentences) * 1e9:,.0f}",
+            )
+        ],
+    )
+
+    snapshot = ProcessingSnapshot(
+        routing_generation=0,
+        deduplication_mode=DeduplicationMode.GLOBAL,
+        target_ids=(0, 1),
+    )
+    processor_rows = []
+    baseline = None
+    for label, make_detector in (
+        ("off", lambda: None),
+        ("count", AnomalyDetector),
+        (
+            "copy to target",
+            lambda: AnomalyDetector(routing=AnomalyRouting(target_id=2)),
+        ),
+    ):
+
+        def feed() -> None:
+            processor = PythonDataPlaneProcessor(
+                station_id=STATION_ID,
+                wall_clock=lambda: 1_700_000_000.0,
+                anomaly_detector=make_detector(),
+            )
+            process = processor.process
+            for frame in frames:
+                process(frame, snapshot)
+
+        rate = frame_count / timed(feed, repeat=repeat)
+        baseline = rate if baseline is None else baseline
+        processor_rows.append(
+            (label, f"{rate:,.0f}", f"{rate / baseline:.2f}x")
+        )
+
+    print()
+    print(f"{frame_count} frames through the processor, best of {repeat}")
+    print_table(("detector", "frames/s", "relative"), processor_rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+    run(arguments.frames, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
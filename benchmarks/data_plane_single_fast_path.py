@@ -0,0 +1,56 @@
+"""Compare the single-sentence fast path with the general processor path.
+
+Run from the repository root::
+
+    python -m benchmarks.data_plane_single_fast_path [--frames N]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from benchmarks._workloads import STATION_ID, mixed_traffic, print_table, timed
+from core.data_plane import DeduplicationMode, ProcessingSnapshot
+from core.python_data_plane import PythonDataPlaneProcessor
+
+
+def run(frame_count: int, repeat: int) -> None:
+    frames = mixed_traffic(frame_count)
+    snapshot = ProcessingSnapshot(
+        routing_generation=0,
+        deduplication_mode=DeduplicationMode.GLOBAL,
+        target_ids=(0, 1),
+    )
+
+    rows = []
+    baseline = None
+    for label, fast_path in (("general path", False), ("fast path", True)):
+        def feed() -> None:
+            processor = PythonDataPlaneProcessor(
+                station_id=STATION_ID,
+                single_fast_path=fast_path,
+                wall_clock=lambda: 1_700_000_000.0,
+            )
+            process = processor.process
+            for frame in frames:
+                process(frame, snapshot)
+
+        seconds = timed(feed, repeat=repeat)
+        rate = frame_count / seconds
+        baseline = rate if baseline is None else baseline
+        rows.append((label, f"{rate:,.0f}", f"{rate / baseline:.2f}x"))
+
+    print(f"{frame_count} frames, best of {repeat}")
+    print_table(("processor", "frames/s", "speedup"), rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+    run(arguments.frames, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
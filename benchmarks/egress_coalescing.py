@@ -0,0 +1,149 @@
+"""Measure per-target egress drain cost with and without datagram coalescing.
+
+Processes the mixed workload once to obtain real output sentences, queues
+them for several loopback UDP targets, and times the per-target workers
+draining every queue through a started ``Forwarder``. Coalescing packs
+consecutive CRLF-terminated sentences into datagrams of at most
+``--max-bytes`` bytes, so fewer ``sendto()`` calls carry the same bytes.
+
+Run from the repository root::
+
+    python -m benchmarks.egress_coalescing [--frames N] [--targets T]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import time
+
+from benchmarks._workloads import STATION_ID, mixed_traffic, print_table
+from core.data_plane import DeduplicationMode, ProcessingSnapshot
+from core.egress_targets import (
+    DEFAULT_COALESCE_MAX_BYTES,
+    EgressTargetQueueSettings,
+    PerTargetEgressDispatcher,
+)
+from core.python_data_plane import PythonDataPlaneProcessor
+from forwarder import Forwarder
+
+
+def output_messages(frame_count: int) -> list[bytes]:
+    processor = PythonDataPlaneProcessor(
+        station_id=STATION_ID,
+        wall_clock=lambda: 1_700_000_000.0,
+    )
+    snapshot = ProcessingSnapshot(
+        routing_generation=0,
+        deduplication_mode=DeduplicationMode.GLOBAL,
+        target_ids=(0,),
+    )
+    return [
+        output.message
+        for frame in mixed_traffic(frame_count)
+        for output in processor.process(frame, snapshot).outputs
+    ]
+
+
+async def drain_all(targets, messages, max_bytes: int | None):
+    forwarder = Forwarder(targets)
+    await forwarder.start()
+    try:
+        dispatcher = PerTargetEgressDispatcher(
+            forwarder,
+            (
+                EgressTargetQueueSettings(
+                    maxsize=len(messages),
+                    coalesce_max_bytes=max_bytes,
+                    coalesce_deadline=0.0,
+                ),
+            )
+            * len(targets),
+        )
+        target_ids = dispatcher.all_target_ids
+        for message in messages:
+            await dispatcher.send_to_ids(target_ids, message)
+
+        started = time.perf_counter()
+        workers = [
+            asyncio.create_task(dispatcher.run_target(target_id))
+            for target_id in target_ids
+        ]
+        expected = len(messages) * len(target_ids)
+        while (
+            sum(s.sent_messages for s in dispatcher.target_queue_snapshot())
+            < expected
+        ):
+            await asyncio.sleep(0)
+        elapsed = time.perf_counter() - started
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        datagrams = sum(
+            snapshot.sent_datagrams
+            for snapshot in dispatcher.target_queue_snapshot()
+        )
+        return elapsed, datagrams
+    finally:
+        forwarder.close()
+
+
+def run(frame_count: int, target_count: int, max_bytes: int) -> None:
+    messages = output_messages(frame_count)
+    sinks = []
+    for _ in range(target_count):
+        sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sink.bind(("127.0.0.1", 0))
+        sinks.append(sink)
+    targets = [
+        {"host": "127.0.0.1", "port": sink.getsockname()[1]} for sink in sinks
+    ]
+    sent = len(messages) * target_count
+    rows = []
+    baseline = None
+    try:
+        for label, limit in (("per message", None), ("coalesced", max_bytes)):
+            seconds, datagrams = asyncio.run(
+                drain_all(targets, messages, limit)
+            )
+            per_message = seconds / sent * 1e6
+            baseline = per_message if baseline is None else baseline
+            rows.append(
+                (
+                    label,
+                    f"{datagrams:,}",
+                    f"{sent / datagrams:.1f}",
+                    f"{per_message:.2f}",
+                    f"{baseline / per_message:.2f}x",
+                )
+            )
+    finally:
+        for sink in sinks:
+            sink.close()
+
+    print(
+        f"{len(messages)} sentences to {target_count} loopback targets, "
+        f"coalescing limit {max_bytes} bytes"
+    )
+    print_table(
+        ("mode", "datagrams", "msgs/datagram", "us/message", "speedup"),
+        rows,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20_000)
+    parser.add_argument("--targets", type=int, default=4)
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=DEFAULT_COALESCE_MAX_BYTES,
+    )
+    arguments = parser.parse_args()
+    run(arguments.frames, arguments.targets, arguments.max_bytes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Measure runtime throughput as the egress in-flight window grows.
+
+Runs the production processor and egress stages over the mixed workload with
+a forwarder that awaits a fixed simulated delay per output, modelling a send
+path that yields to the event loop. With a window of one the processor idles
+during every dispatch; larger windows overlap processing with egress.
+
+Run from the repository root::
+
+    python -m benchmarks.egress_inflight_window [--frames N] [--delay-us D]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import aismixer
+from benchmarks._workloads import STATION_ID, mixed_traffic, print_table
+from core.data_plane import DeduplicationMode, ProcessingSnapshot
+from core.python_data_plane import PythonDataPlaneProcessor
+
+
+WINDOWS = (1, 2, 4, 8, 16)
+
+
+def make_processor() -> PythonDataPlaneProcessor:
+    return PythonDataPlaneProcessor(
+        station_id=STATION_ID,
+        wall_clock=lambda: 1_700_000_000.0,
+    )
+
+
+def expected_outputs(frames) -> int:
+    processor = make_processor()
+    snapshot = ProcessingSnapshot(
+        routing_generation=0,
+        deduplication_mode=DeduplicationMode.GLOBAL,
+        target_ids=(0,),
+    )
+    return sum(len(processor.process(frame, snapshot).outputs) for frame in frames)
+
+
+class DelayedForwarder:
+    def __init__(self, delay: float, expected: int) -> None:
+        self._delay = delay
+        self._expected = expected
+        self.sent = 0
+        self.done = asyncio.Event()
+
+    async def send_to_ids(self, _target_ids, _message) -> None:
+        await asyncio.sleep(self._delay)
+        self.sent += 1
+        if self.sent == self._expected:
+            self.done.set()
+
+
+async def run_window(frames, window: int, delay: float, expected: int) -> float:
+    ingress_queue = asyncio.Queue()
+    for frame in frames:
+        ingress_queue.put_nowait(frame)
+    forwarder = DelayedForwarder(delay, expected)
+    started = time.perf_counter()
+    task = asyncio.create_task(
+        aismixer._run_runtime_stages(
+            ingress_queue,
+            asyncio.Queue(maxsize=window),
+            processor=make_processor(),
+            legacy_target_ids=(0,),
+            output_forwarder=forwarder,
+            egress_inflight_batches=window,
+        )
+    )
+    await forwarder.done.wait()
+    elapsed = time.perf_counter() - started
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    return elapsed
+
+
+def run(frame_count: int, delay_us: float) -> None:
+    frames = mixed_traffic(frame_count)
+    expected = expected_outputs(frames)
+    delay = delay_us / 1e6
+    rows = []
+    baseline = None
+    for window in WINDOWS:
+        seconds = asyncio.run(run_window(frames, window, delay, expected))
+        rate = frame_count / seconds
+        baseline = rate if baseline is None else baseline
+        rows.append((window, f"{rate:,.0f}", f"{rate / baseline:.2f}x"))
+
+    print(
+        f"{frame_count} frames, {expected} outputs, "
+        f"{delay_us:g} us simulated send delay"
+    )
+    print_table(("window", "frames/s", "speedup"), rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20_000)
+    parser.add_argument("--delay-us", type=float, default=0.0)
+    arguments = parser.parse_args()
+    run(arguments.frames, arguments.delay_us)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Measure healthy-target latency next to a slow egress target.
+
+Sends the mixed workload's frames to two numeric targets. Target 0 awaits a
+fixed simulated delay per send, modelling a destination whose send path keeps
+yielding; target 1 returns immediately. The direct mode awaits both sends in
+order, as a single egress stage does; the per-target mode hands each message
+to ``PerTargetEgressDispatcher`` and lets independent workers drain it.
+
+Run from the repository root::
+
+    python -m benchmarks.egress_target_isolation [--messages N] [--delay-us D]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from benchmarks._workloads import mixed_traffic, print_table
+from core.egress_targets import (
+    EgressOverflowPolicy,
+    EgressTargetQueueSettings,
+    PerTargetEgressDispatcher,
+)
+
+
+SLOW_TARGET_ID = 0
+HEALTHY_TARGET_ID = 1
+
+
+class SplitLatencySender:
+    def __init__(self, delay: float, expected: int) -> None:
+        self._delay = delay
+        self._expected = expected
+        self.handed_off_at: dict[bytes, float] = {}
+        self.healthy_latencies: list[float] = []
+        self.done = asyncio.Event()
+
+    async def send_to_ids(self, target_ids, message) -> None:
+        for target_id in target_ids:
+            if target_id == SLOW_TARGET_ID:
+                await asyncio.sleep(self._delay)
+                continue
+            self.healthy_latencies.append(
+                time.perf_counter() - self.handed_off_at[message]
+            )
+            if len(self.healthy_latencies) == self._expected:
+                self.done.set()
+
+
+async def run_direct(messages, delay: float) -> tuple[float, list[float]]:
+    sender = SplitLatencySender(delay, len(messages))
+    started = time.perf_counter()
+    for message in messages:
+        sender.handed_off_at[message] = time.perf_counter()
+        await sender.send_to_ids((SLOW_TARGET_ID, HEALTHY_TARGET_ID), message)
+        await asyncio.sleep(0)
+    return time.perf_counter() - started, sender.healthy_latencies
+
+
+async def run_per_target(
+    messages,
+    delay: float,
+    policy: EgressOverflowPolicy,
+) -> tuple[float, list[float]]:
+    sender = SplitLatencySender(delay, len(messages))
+    dispatcher = PerTargetEgressDispatcher(
+        sender,
+        (EgressTargetQueueSettings(overflow_policy=policy),) * 2,
+    )
+    workers = [
+        asyncio.create_task(dispatcher.run_target(target_id))
+        for target_id in dispatcher.all_target_ids
+    ]
+    started = time.perf_counter()
+    for message in messages:
+        sender.handed_off_at[message] = time.perf_counter()
+        await dispatcher.send_to_ids(
+            (SLOW_TARGET_ID, HEALTHY_TARGET_ID),
+            message,
+        )
+        await asyncio.sleep(0)
+    await sender.done.wait()
+    elapsed = time.perf_counter() - started
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    return elapsed, sender.healthy_latencies
+
+
+def latency_row(label: str, elapsed: float, latencies: list[float]):
+    ordered = sorted(latencies)
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    return (
+        label,
+        f"{elapsed * 1e3:,.1f}",
+        f"{statistics.median(ordered) * 1e6:,.1f}",
+        f"{p99 * 1e6:,.1f}",
+    )
+
+
+def run(message_count: int, delay_us: float) -> None:
+    # Distinct payloads keep the per-message hand-off timestamps unambiguous.
+    messages = [frame.payload for frame in mixed_traffic(message_count)]
+    messages = list(dict.fromkeys(messages))
+    delay = delay_us / 1e6
+    rows = [
+        latency_row("direct", *asyncio.run(run_direct(messages, delay))),
+    ]
+    for policy in (EgressOverflowPolicy.DROP_OLDEST, EgressOverflowPolicy.BLOCK):
+        rows.append(
+            latency_row(
+                f"per-target {policy.value}",
+                *asyncio.run(run_per_target(messages, delay, policy)),
+            )
+        )
+
+    print(
+        f"{len(messages)} messages, {delay_us:g} us simulated delay "
+        "on the slow target"
+    )
+    print_table(
+        ("mode", "healthy done ms", "healthy p50 us", "healthy p99 us"),
+        rows,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=5_000)
+    parser.add_argument("--delay-us", type=float, default=200.0)
+    arguments = parser.parse_args()
+    run(arguments.messages, arguments.delay_us)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Measure per-target position throttling cost and downstream volume.
+
+Feeds the mixed workload through the processor with two routed targets:
+target 0 unthrottled and target 1 throttled at each ``--intervals`` value.
+The processor clock is scaled so each of the ``--vessels`` vessels reports
+every ``--report-interval`` seconds, as a class A vessel underway does.
+Reports the messages each target receives and whole-frame throughput against
+a processor without a throttle. Type 5 static reports, about a tenth of the
+workload, are never throttled.
+
+Run from the repository root::
+
+    python -m benchmarks.emission_throttle [--frames N] [--vessels V]
+        [--report-interval S] [--intervals S ...] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from benchmarks._workloads import STATION_ID, mixed_traffic, print_table, timed
+from core.data_plane import DeduplicationMode, ProcessingSnapshot
+from core.emission_throttle import EmissionThrottle
+from core.python_data_plane import PythonDataPlaneProcessor
+
+
+def _frame_clock(frames, seconds_per_transmission: float) -> list[float]:
+    """Return one processor clock reading per frame.
+
+    mixed_traffic advances its ``c`` field by one per transmission, and every
+    frame of a transmission either carries it or follows one that does.
+    """
+
+    readings = []
+    first = current = None
+    for frame in frames:
+        text = frame.payload.decode("ascii")
+        if text.startswith("\\c:"):
+            current = int(text[3:text.index(",")])
+            first = current if first is None else first
+        readings.append(
+            0.0
+            if current is None
+            else (current - first) * seconds_per_transmission
+        )
+    return readings
+
+
+def run(
+    frame_count: int,
+    vessels: int,
+    report_interval: float,
+    intervals: list[float],
+    repeat: int,
+) -> None:
+    frames = mixed_traffic(frame_count, vessels=vessels)
+    readings = _frame_clock(frames, report_interval / vessels)
+    snapshot = ProcessingSnapshot(
+        routing_generation=0,
+        deduplication_mode=DeduplicationMode.GLOBAL,
+        target_ids=(0, 1),
+    )
+
+    rows = []
+    baseline = None
+    for interval in (None, *intervals):
+        delivered = [0, 0]
+
+        def feed(count: bool = False) -> None:
+            clock = iter(readings)
+            now = [0.0]
+            processor = PythonDataPlaneProcessor(
+                station_id=STATION_ID,
+                wall_clock=lambda: now[0],
+                emission_throttle=(
+                    None if interval is None else EmissionThrottle({1: interval})
+                ),
+            )
+            process = processor.process
+            for frame in frames:
+                now[0] = next(clock)
+                batch = process(frame, snapshot)
+                if count:
+                    for output in batch.outputs:
+                        for target_id in output.target_ids:
+                            delivered[target_id] += 1
+
+        feed(count=True)
+        rate = frame_count / timed(feed, repeat=repeat)
+        baseline = rate if baseline is None else baseline
+        rows.append(
+            (
+                "off" if interval is None else f"{interval:g} s",
+                f"{delivered[0]:,}",
+                f"{delivered[1]:,}",
+                f"{delivered[0] / max(delivered[1], 1):.1f}x",
+                f"{rate:,.0f}",
+                f"{rate / baseline:.2f}x",
+            )
+        )
+
+    print(
+        f"{frame_count} frames, {vessels} vessels reporting every "
+        f"{report_interval:g} s, best of {repeat}"
+    )
+    print_table(
+        (
+            "throttle",
+            "target 0 msgs",
+            "target 1 msgs",
+            "reduction",
+            "frames/s",
+            "relative",
+        ),
+        rows,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--vessels", type=int, default=200)
+    parser.add_argument("--report-interval", type=float, default=6.0)
+    parser.add_argument(
+        "--intervals",
+        type=float,
+        nargs="+",
+        default=[10.0, 60.0, 300.0],
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+    run(
+        arguments.frames,
+        arguments.vessels,
+        arguments.report_interval,
+        arguments.intervals,
+        arguments.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Measure Forwarder send cost per message across several UDP targets.
+
+Binds throw-away loopback UDP sinks and compares three send paths: the lazy
+``send_to_ids()`` path that resolves a transport on every send, the same
+coroutine after ``start()`` created every transport, and the synchronous
+``send_to_ids_nowait()`` bulk variant.
+
+Run from the repository root::
+
+    python -m benchmarks.forwarder_send_path [--messages N] [--targets T]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import time
+from functools import partial
+
+from benchmarks._workloads import mixed_traffic, print_table
+from forwarder import Forwarder
+
+
+def bind_sinks(count: int) -> list[socket.socket]:
+    sinks = []
+    for _ in range(count):
+        sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sink.bind(("127.0.0.1", 0))
+        sinks.append(sink)
+    return sinks
+
+
+async def run_async(targets, messages, target_ids, *, start: bool) -> float:
+    forwarder = Forwarder(targets)
+    try:
+        if start:
+            await forwarder.start()
+        send_to_ids = forwarder.send_to_ids
+        started = time.perf_counter()
+        for message in messages:
+            await send_to_ids(target_ids, message)
+        return time.perf_counter() - started
+    finally:
+        forwarder.close()
+
+
+async def run_nowait(targets, messages, target_ids) -> float:
+    forwarder = Forwarder(targets)
+    try:
+        await forwarder.start()
+        send_to_ids_nowait = forwarder.send_to_ids_nowait
+        started = time.perf_counter()
+        for message in messages:
+            send_to_ids_nowait(target_ids, message)
+        return time.perf_counter() - started
+    finally:
+        forwarder.close()
+
+
+def run(message_count: int, target_count: int) -> None:
+    messages = [frame.payload for frame in mixed_traffic(message_count)]
+    sinks = bind_sinks(target_count)
+    targets = [
+        {"host": "127.0.0.1", "port": sink.getsockname()[1]} for sink in sinks
+    ]
+    target_ids = tuple(range(target_count))
+    modes = (
+        ("lazy send_to_ids", partial(run_async, start=False)),
+        ("started send_to_ids", partial(run_async, start=True)),
+        ("send_to_ids_nowait", run_nowait),
+    )
+    rows = []
+    baseline = None
+    try:
+        for label, scenario in modes:
+            seconds = asyncio.run(scenario(targets, messages, target_ids))
+            per_message = seconds / len(messages) * 1e6
+            baseline = per_message if baseline is None else baseline
+            rows.append(
+                (label, f"{per_message:.2f}", f"{baseline / per_message:.2f}x")
+            )
+    finally:
+        for sink in sinks:
+            sink.close()
+
+    print(f"{len(messages)} messages to {target_count} loopback targets")
+    print_table(("path", "us/message", "speedup"), rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--targets", type=int, default=4)
+    arguments = parser.parse_args()
+    run(arguments.messages, arguments.targets)
+
+
+if __name__ == "__main__":
+    main()
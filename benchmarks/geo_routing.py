@@ -0,0 +1,134 @@
+"""Measure route-area index build time and per-message area filter cost.
+
+Builds ``--areas`` deterministic partner polygons over the mixed workload's
+European sea area, one filtered route each, and times ``GeoGridIndex``
+construction and ``TargetFilter.select`` on the workload's sentences. The
+"linear" column tests every area exactly per message, as a filter without an
+index would. The grid cost depends on the areas around each position, not on
+how many areas there are.
+
+Run from the repository root::
+
+    python -m benchmarks.geo_routing [--frames N] [--areas A ...] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+
+from benchmarks._workloads import mixed_traffic, print_table, timed
+from core.geo_index import GeoArea, GeoGridIndex
+from core.message_filter import MessageFilter, TargetFilter, decode_ais_position
+
+
+def partner_areas(count: int, *, seed: int = 44) -> tuple[GeoArea, ...]:
+    """Return irregular hexagons 0.5 to 3 degrees across within the workload."""
+
+    rng = random.Random(seed)
+    areas = []
+    for _ in range(count):
+        lon = rng.uniform(-10.0, 30.0)
+        lat = rng.uniform(35.0, 60.0)
+        radius = rng.uniform(0.25, 1.5)
+        areas.append(
+            GeoArea(
+                polygon=tuple(
+                    (
+                        lon + radius * rng.uniform(0.6, 1.0) * math.cos(angle),
+                        lat + radius * rng.uniform(0.6, 1.0) * math.sin(angle),
+                    )
+                    for angle in (step * math.pi / 3 for step in range(6))
+                )
+            )
+        )
+    return tuple(areas)
+
+
+def _linear_select(areas, sentences):
+    def evaluate() -> None:
+        for sentence in sentences:
+            position = decode_ais_position(sentence)
+            if position is not None:
+                [area for area in areas if area.contains(*position)]
+
+    return evaluate
+
+
+def run(frame_count: int, area_counts: list[int], repeat: int) -> None:
+    sentences = [
+        frame.payload.decode("ascii").rsplit("\\", 1)[-1].strip()
+        for frame in mixed_traffic(frame_count)
+    ]
+
+    rows = []
+    for count in area_counts:
+        areas = partner_areas(count)
+        started = time.perf_counter()
+        index = GeoGridIndex(areas)
+        build_ms = (time.perf_counter() - started) * 1e3
+        target_filter = TargetFilter(
+            clauses=tuple(
+                (MessageFilter(areas=(area,)), (area_id,))
+                for area_id, area in enumerate(areas)
+            ),
+            geo_index=index,
+        )
+        select = target_filter.select
+        routed = sum(bool(select(sentence)) for sentence in sentences)
+
+        def evaluate() -> None:
+            for sentence in sentences:
+                select(sentence)
+
+        grid = timed(evaluate, repeat=repeat) / len(sentences) * 1e9
+        linear = (
+            timed(_linear_select(areas, sentences), repeat=repeat)
+            / len(sentences)
+            * 1e9
+        )
+        rows.append(
+            (
+                f"{count:,}",
+                f"{build_ms:,.1f}",
+                f"{len(index):,}",
+                f"{routed / len(sentences):.0%}",
+                f"{grid:,.0f}",
+                f"{linear:,.0f}",
+                f"{linear / grid:.1f}x",
+            )
+        )
+
+    print(f"{len(sentences)} sentences, best of {repeat}")
+    print_table(
+        (
+            "areas",
+            "build ms",
+            "cells",
+            "routed",
+            "grid ns/msg",
+            "linear ns/msg",
+            "speedup",
+        ),
+        rows,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=50_000)
+    parser.add_argument(
+        "--areas",
+        type=int,
+        nargs="+",
+        default=[10, 100, 500, 1000],
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+    run(arguments.frames, arguments.areas, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
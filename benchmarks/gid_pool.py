@@ -0,0 +1,94 @@
+"""Measure group-ID generation on multipart-heavy static report traffic.
+
+Compares the per-call ``secrets.randbelow`` generator with the pooled
+``NumericGroupIdPool``, both in isolation and inside the processor on bursts
+of type 5 and type 24 reports with ``g_always_tag_single`` enabled.
+
+Run from the repository root::
+
+    python -m benchmarks.gid_pool [--frames N]
+"""
+
+from __future__ import annotations
+
+import argparse
+from secrets import randbelow
+
+from benchmarks._workloads import (
+    STATION_ID,
+    print_table,
+    static_burst_traffic,
+    timed,
+)
+from core.data_plane import DeduplicationMode, ProcessingSnapshot
+from core.gid_pool import NumericGroupIdPool
+from core.python_data_plane import PythonDataPlaneProcessor
+
+
+DIGITS = 18
+
+
+def randbelow_gid(digits: int) -> str:
+    base = 10 ** (digits - 1)
+    return str(base + randbelow(9 * base))
+
+
+def run(frame_count: int, repeat: int) -> None:
+    frames = static_burst_traffic(frame_count)
+    snapshot = ProcessingSnapshot(
+        routing_generation=0,
+        deduplication_mode=DeduplicationMode.PER_TARGET,
+        target_ids=(0,),
+    )
+    gid_rows = []
+    processor_rows = []
+    refills = 0
+
+    for label, make_generator in (
+        ("secrets.randbelow", lambda: randbelow_gid),
+        ("NumericGroupIdPool", NumericGroupIdPool),
+    ):
+        def generate() -> None:
+            generator = make_generator()
+            for _ in range(frame_count):
+                generator(DIGITS)
+
+        seconds = timed(generate, repeat=repeat)
+        gid_rows.append((label, f"{seconds / frame_count * 1e9:,.0f}"))
+
+        def feed() -> None:
+            nonlocal refills
+            generator = make_generator()
+            processor = PythonDataPlaneProcessor(
+                station_id=STATION_ID,
+                always_tag_single=True,
+                gid_digits=DIGITS,
+                gid_generator=generator,
+                wall_clock=lambda: 1_700_000_000.0,
+            )
+            process = processor.process
+            for frame in frames:
+                process(frame, snapshot)
+            refills = getattr(generator, "refills", 0)
+
+        seconds = timed(feed, repeat=repeat)
+        processor_rows.append(
+            (label, f"{frame_count / seconds:,.0f}", refills)
+        )
+
+    print(f"{frame_count} gids / frames, best of {repeat}")
+    print_table(("generator", "ns/gid"), gid_rows)
+    print()
+    print_table(("processor gids", "frames/s", "refills"), processor_rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+    run(arguments.frames, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Compare co-located egress over loopback UDP, Unix datagrams and shared memory.
+
+Processes the mixed workload once to obtain real output sentences, then sends
+them through a started single-target ``Forwarder`` of each type while a local
+consumer in the same process drains them in chunks. UDP and Unix consumers
+pay one ``recv()`` per datagram; the shared-memory consumer collects each
+chunk with one ``ShmRingReader.read()`` poll.
+
+Run from the repository root::
+
+    python -m benchmarks.local_egress [--frames N] [--chunk C] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import socket
+import tempfile
+import time
+
+from benchmarks._workloads import print_table
+from benchmarks.egress_coalescing import output_messages
+from core.shm_ring import ShmRingReader
+from forwarder import Forwarder
+
+
+def _socket_consumer(family, address):
+    sink = socket.socket(family, socket.SOCK_DGRAM)
+    sink.bind(address)
+    sink.setblocking(False)
+
+    async def drain(count):
+        received = []
+        while len(received) < count:
+            try:
+                received.append(sink.recv(65535))
+            except BlockingIOError:
+                # Let the transport flush datagrams the kernel deferred.
+                await asyncio.sleep(0)
+        return received
+
+    return sink, drain
+
+
+async def _timed_run(target, messages, chunk, drain):
+    forwarder = Forwarder([target])
+    await forwarder.start()
+    try:
+        reader = None
+        if target.get("type") == "shm":
+            reader = ShmRingReader(target["name"])
+
+            async def drain(_count):
+                return reader.read()
+
+        received = 0
+        started = time.perf_counter()
+        for offset in range(0, len(messages), chunk):
+            batch = messages[offset:offset + chunk]
+            for message in batch:
+                forwarder.send_to_ids_nowait((0,), message)
+            received += len(await drain(len(batch)))
+        elapsed = time.perf_counter() - started
+        if reader is not None:
+            reader.close()
+        return elapsed, received
+    finally:
+        forwarder.close()
+
+
+def run(frame_count: int, chunk: int, repeat: int) -> None:
+    messages = output_messages(frame_count)
+    with tempfile.TemporaryDirectory() as directory:
+        udp_sink, udp_drain = _socket_consumer(
+            socket.AF_INET,
+            ("127.0.0.1", 0),
+        )
+        unix_path = os.path.join(directory, "feed.sock")
+        unix_sink, unix_drain = _socket_consumer(socket.AF_UNIX, unix_path)
+        cases = (
+            (
+                "udp loopback",
+                {"host": "127.0.0.1", "port": udp_sink.getsockname()[1]},
+                udp_drain,
+            ),
+            ("unix datagram", {"type": "unix", "path": unix_path}, unix_drain),
+            (
+                "shm ring",
+                {"type": "shm", "name": f"aismixer-bench-{os.getpid()}"},
+                None,
+            ),
+        )
+        rows = []
+        baseline = None
+        try:
+            for label, target, drain in cases:
+                seconds, received = min(
+                    asyncio.run(_timed_run(target, messages, chunk, drain))
+                    for _ in range(repeat)
+                )
+                per_message = seconds / len(messages) * 1e6
+                baseline = per_message if baseline is None else baseline
+                rows.append(
+                    (
+                        label,
+                        f"{received:,}",
+                        f"{per_message:.2f}",
+                        f"{baseline / per_message:.2f}x",
+                    )
+                )
+        finally:
+            udp_sink.close()
+            unix_sink.close()
+
+    print(
+        f"{len(messages)} sentences, consumer drains every {chunk} sends, "
+        f"best of {repeat}"
+    )
+    print_table(("transport", "received", "us/message", "speedup"), rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20_000)
+    parser.add_argument("--chunk", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+    run(arguments.frames, arguments.chunk, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
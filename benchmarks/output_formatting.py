@@ -0,0 +1,102 @@
+"""Measure per-sentence TAG formatting cost.
+
+Compares the string-level ``wrap_with_meta()`` plus encode reference with the
+bytes-level ``build_output_bytes()`` and its cached ``c``/``s`` headers, and
+the source-value selection with and without memoisation.
+
+Run from the repository root::
+
+    python -m benchmarks.output_formatting [--sentences N]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from benchmarks._workloads import (
+    mixed_traffic,
+    print_table,
+    timed,
+)
+from core.output_builder import build_output_bytes
+from core.s_policy import choose_s_value_from_candidates
+from meta_writer import wrap_with_meta
+
+
+def reference_output_bytes(nmea_line, station_id, timestamp, is_first, g):
+    return (
+        wrap_with_meta(
+            nmea_line,
+            station_id,
+            timestamp,
+            is_first=is_first,
+            g_triplet=g,
+        )
+        + "\r\n"
+    ).encode("utf-8")
+
+
+def workload(sentence_count: int) -> list[tuple]:
+    """Return builder arguments with about ten sentences per second."""
+
+    calls = []
+    for index, frame in enumerate(mixed_traffic(sentence_count)):
+        text = frame.payload.decode("utf-8")
+        sentence = text[text.index("!"):]
+        fields = sentence.split(",")
+        total, part = int(fields[1]), int(fields[2])
+        g = f"{part}-{total}-{index // 2:018d}" if total > 1 else None
+        calls.append(
+            (sentence, "mixstation_1", 1_700_000_000 + index // 10,
+             part == 1, g)
+        )
+    return calls
+
+
+def run(sentence_count: int, repeat: int) -> None:
+    calls = workload(sentence_count)
+    for call in calls:
+        assert build_output_bytes(*call) == reference_output_bytes(*call)
+
+    def format_with(builder):
+        def feed() -> None:
+            for call in calls:
+                builder(*call)
+        return feed
+
+    candidates = [
+        (None, f"rx{index % 4}", None, f"192.0.2.{index % 4 + 1}")
+        for index in range(sentence_count)
+    ]
+    unmemoised = choose_s_value_from_candidates.__wrapped__
+
+    def select_with(chooser):
+        def feed() -> None:
+            for candidate in candidates:
+                chooser(*candidate)
+        return feed
+
+    rows = []
+    for label, feed in (
+        ("wrap_with_meta + encode", format_with(reference_output_bytes)),
+        ("build_output_bytes", format_with(build_output_bytes)),
+        ("s selection", select_with(unmemoised)),
+        ("s selection, memoised", select_with(choose_s_value_from_candidates)),
+    ):
+        seconds = timed(feed, repeat=repeat)
+        rows.append((label, f"{seconds / sentence_count * 1e9:,.0f}"))
+
+    print(f"{sentence_count} sentences, best of {repeat}")
+    print_table(("operation", "ns/sentence"), rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sentences", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+    run(arguments.sentences, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
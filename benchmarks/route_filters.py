@@ -0,0 +1,118 @@
+"""Measure message-type and MMSI route filter cost per message.
+
+Processes the mixed workload once to obtain real output sentences, then times
+``TargetFilter.select`` on every sentence for routes restricted by message
+type, by an MMSI set, by MMSI ranges, and by all three. Each filtered route
+sits next to one unfiltered route, as a partner feed would next to the main
+feed. The processor rows compare whole-frame throughput without and with the
+combined filter.
+
+Run from the repository root::
+
+    python -m benchmarks.route_filters [--frames N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from benchmarks._workloads import STATION_ID, mixed_traffic, print_table, timed
+from core.data_plane import DeduplicationMode, ProcessingSnapshot
+from core.message_filter import MessageFilter, TargetFilter
+from core.python_data_plane import PythonDataPlaneProcessor
+
+
+# mixed_traffic draws MMSIs from 200000000 upwards.
+FILTERS = {
+    "message type": MessageFilter(message_types=frozenset({1, 2, 3, 18, 19, 27})),
+    "mmsi set": MessageFilter(
+        mmsis=frozenset(range(200_000_000, 200_002_000, 4))
+    ),
+    "mmsi ranges": MessageFilter(
+        mmsi_ranges=tuple(
+            (low, low + 99) for low in range(200_000_000, 200_002_000, 400)
+        )
+    ),
+    "all three": MessageFilter(
+        message_types=frozenset({1, 2, 3, 18, 19, 27}),
+        mmsis=frozenset(range(200_000_000, 200_002_000, 4)),
+        mmsi_ranges=((200_001_000, 200_001_999),),
+    ),
+}
+
+
+def _target_filter(message_filter: MessageFilter) -> TargetFilter:
+    return TargetFilter(clauses=((message_filter, (0,)), (None, (1,))))
+
+
+def run(frame_count: int, repeat: int) -> None:
+    frames = mixed_traffic(frame_count)
+    sentences = [
+        frame.payload.decode("ascii").rsplit("\\", 1)[-1].strip()
+        for frame in frames
+    ]
+
+    rows = []
+    for label, message_filter in FILTERS.items():
+        select = _target_filter(message_filter).select
+        selected = sum(0 in select(sentence) for sentence in sentences)
+
+        def evaluate() -> None:
+            for sentence in sentences:
+                select(sentence)
+
+        seconds = timed(evaluate, repeat=repeat)
+        rows.append(
+            (
+                label,
+                f"{selected / len(sentences):.0%}",
+                f"{seconds / len(sentences) * 1e9:,.0f}",
+            )
+        )
+
+    print(f"{len(sentences)} sentences, best of {repeat}")
+    print_table(("filter", "selected", "ns/message"), rows)
+
+    processor_rows = []
+    baseline = None
+    for label, target_filter in (
+        ("unfiltered", None),
+        ("all three", _target_filter(FILTERS["all three"])),
+    ):
+        snapshot = ProcessingSnapshot(
+            routing_generation=0,
+            deduplication_mode=DeduplicationMode.PER_TARGET,
+            target_ids=(0, 1),
+            target_filter=target_filter,
+        )
+
+        def feed() -> None:
+            processor = PythonDataPlaneProcessor(
+                station_id=STATION_ID,
+                wall_clock=lambda: 1_700_000_000.0,
+            )
+            process = processor.process
+            for frame in frames:
+                process(frame, snapshot)
+
+        rate = frame_count / timed(feed, repeat=repeat)
+        baseline = rate if baseline is None else baseline
+        processor_rows.append(
+            (label, f"{rate:,.0f}", f"{rate / baseline:.2f}x")
+        )
+
+    print()
+    print(f"{frame_count} frames through the processor, best of {repeat}")
+    print_table(("routes", "frames/s", "relative"), processor_rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+    run(arguments.frames, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Measure per-frame numeric route matching as the route count grows.
+
+Builds a compiled routing table with ``--routes`` routes, each from its own
+zone of ``--zone-size`` sources to two of eight targets, and times the
+target lookup for every source in turn. "route scan" walks the compiled
+routes the way ``RoutingTable.match_target_ids`` used to; "source memo" is
+the current per-source lookup.
+
+Run from the repository root::
+
+    python -m benchmarks.routing_match [--lookups N] [--routes R ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from benchmarks._workloads import print_table, timed
+from core.routing import RoutingTable
+
+
+TARGET_COUNT = 8
+
+
+def build_table(route_count: int, zone_size: int) -> RoutingTable:
+    zones = {
+        f"zone{index}": {
+            "include": [
+                f"udp:station{(index + offset) % (route_count * 2)}"
+                for offset in range(zone_size)
+            ]
+        }
+        for index in range(route_count)
+    }
+    routes = [
+        {
+            "name": f"route{index}",
+            "from_zone": f"zone{index}",
+            "to": [
+                f"udp:target{index % TARGET_COUNT}",
+                f"udp:target{(index * 3 + 1) % TARGET_COUNT}",
+            ],
+        }
+        for index in range(route_count)
+    ]
+    return RoutingTable.from_config(zones, routes).compile_target_ids(
+        {f"udp:target{index}": index for index in range(TARGET_COUNT)}
+    )
+
+
+def scan_target_ids(table: RoutingTable, source_id: str):
+    target_ids = []
+    seen_target_ids = set()
+    for route in table._compiled_target_routes:
+        if source_id not in route.source_ids:
+            continue
+        for target_id in route.target_ids:
+            if target_id in seen_target_ids:
+                continue
+            seen_target_ids.add(target_id)
+            target_ids.append(target_id)
+    return tuple(target_ids)
+
+
+def run(lookup_count: int, route_counts, zone_size: int, repeat: int) -> None:
+    rows = []
+    for route_count in route_counts:
+        table = build_table(route_count, zone_size)
+        sources = [
+            f"udp:station{index % (route_count * 2)}"
+            for index in range(lookup_count)
+        ]
+        timings = []
+        for match in (
+            lambda source_id: scan_target_ids(table, source_id),
+            table.match_target_ids,
+        ):
+            def lookup() -> None:
+                for source_id in sources:
+                    match(source_id)
+
+            timings.append(timed(lookup, repeat=repeat) / lookup_count * 1e9)
+        assert all(
+            scan_target_ids(table, source_id)
+            == table.match_target_ids(source_id)
+            for source_id in sources[: route_count * 2]
+        )
+        scan, memo = timings
+        rows.append(
+            (
+                route_count,
+                f"{scan:,.0f}",
+                f"{memo:,.0f}",
+                f"{scan / memo:.1f}x",
+            )
+        )
+
+    print(
+        f"{lookup_count} lookups, {zone_size} sources per zone, "
+        f"best of {repeat}"
+    )
+    print_table(
+        ("routes", "route scan ns", "source memo ns", "speedup"),
+        rows,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument(
+        "--routes",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100, 500],
+    )
+    parser.add_argument("--zone-size", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+    run(arguments.lookups, arguments.routes, arguments.zone_size, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Compare a routing patch with a full recompile as the source count grows.
+
+Builds a routing section with ``--sources`` stations spread over sixteen
+regional ``include`` zones, a union of all regions, a quarantine zone and a
+difference of the two, routed to eight targets. Each timed step moves one
+station into the quarantine: "full recompile" compiles the whole patched
+section the way ``routing.replace`` does; "patch" applies the same change
+with ``RoutingTable.apply_patch`` as ``routing.patch`` does.
+
+Run from the repository root::
+
+    python -m benchmarks.routing_patch [--sources N ...] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from benchmarks._workloads import print_table, timed
+from core.routing import RoutingPatchOperation
+from core.runtime_routing import compile_routing_section
+
+
+REGION_COUNT = 16
+TARGET_COUNT = 8
+TARGET_ID_BY_NAME = {f"udp:target{index}": index for index in range(TARGET_COUNT)}
+
+
+def routing_section(source_count: int, quarantined=()) -> dict[str, object]:
+    zones: dict[str, object] = {
+        f"region{region}": {
+            "include": [
+                f"udp:station{index}"
+                for index in range(region, source_count, REGION_COUNT)
+            ]
+        }
+        for region in range(REGION_COUNT)
+    }
+    zones["all"] = {"union": [f"region{region}" for region in range(REGION_COUNT)]}
+    zones["quarantined"] = {"include": list(quarantined)}
+    zones["clean"] = {"difference": ["all", "quarantined"]}
+    routes = [
+        {
+            "name": f"region{region}",
+            "from_zone": f"region{region}",
+            "to": [f"udp:target{region % TARGET_COUNT}"],
+        }
+        for region in range(REGION_COUNT)
+    ]
+    routes.append(
+        {"name": "clean", "from_zone": "clean", "to": ["udp:target0", "udp:target1"]}
+    )
+    return {"zones": zones, "routes": routes}
+
+
+def run(source_counts, repeat: int) -> None:
+    rows = []
+    for source_count in source_counts:
+        table = compile_routing_section(
+            routing_section(source_count),
+            TARGET_ID_BY_NAME,
+        )
+        operation = RoutingPatchOperation("add_source", "quarantined", "udp:station7")
+        patched_section = routing_section(source_count, ("udp:station7",))
+
+        full = timed(
+            lambda: compile_routing_section(patched_section, TARGET_ID_BY_NAME),
+            repeat=repeat,
+        )
+        patch = timed(
+            lambda: table.apply_patch((operation,), TARGET_ID_BY_NAME),
+            repeat=repeat,
+        )
+        expected = compile_routing_section(patched_section, TARGET_ID_BY_NAME)
+        patched = table.apply_patch((operation,), TARGET_ID_BY_NAME)
+        assert patched.resolved_zones == expected.resolved_zones
+        assert dict(patched._target_ids_by_source) == dict(
+            expected._target_ids_by_source
+        )
+        rows.append(
+            (
+                f"{source_count:,}",
+                f"{full * 1e3:.2f}",
+                f"{patch * 1e3:.3f}",
+                f"{full / patch:.0f}x",
+            )
+        )
+
+    print(
+        f"{REGION_COUNT} regions, union, quarantine and difference zones, "
+        f"{REGION_COUNT + 1} routes, best of {repeat}"
+    )
+    print_table(("sources", "full recompile ms", "patch ms", "speedup"), rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sources",
+        type=int,
+        nargs="+",
+        default=[100, 1_000, 10_000],
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+    run(arguments.sources, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Measure TCP fan-out cost per message as the subscriber count grows.
+
+Processes the mixed workload once to obtain real output sentences, connects
+``--clients`` loopback subscribers to a ``TcpFanoutServer`` and times how
+long the server needs to hand every sentence to every subscriber while the
+subscribers drain their sockets. "per message" flushes after every write,
+the way an unbatched fan-out would; "per iteration" lets the server join all
+sentences written during one event-loop iteration, as it does at runtime.
+
+Run from the repository root::
+
+    python -m benchmarks.tcp_fanout [--frames N] [--clients C] [--chunk K]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from benchmarks._workloads import print_table
+from benchmarks.egress_coalescing import output_messages
+from core.tcp_fanout import TcpFanoutServer
+
+
+async def _drain(reader, expected: int) -> None:
+    remaining = expected
+    while remaining:
+        chunk = await reader.read(1 << 16)
+        if not chunk:
+            raise RuntimeError("subscriber was disconnected")
+        remaining -= len(chunk)
+
+
+async def _timed_run(messages, client_count: int, chunk: int, batched: bool):
+    server = TcpFanoutServer(
+        "127.0.0.1",
+        0,
+        client_buffer_bytes=64 * 1024 * 1024,
+        max_clients=client_count,
+    )
+    await server.start()
+    host, port = server.listen.rsplit(":", 1)
+    connections = [
+        await asyncio.open_connection(host, int(port))
+        for _ in range(client_count)
+    ]
+    await asyncio.sleep(0.05)
+    total = sum(map(len, messages))
+    drains = [
+        asyncio.create_task(_drain(reader, total)) for reader, _ in connections
+    ]
+    started = time.perf_counter()
+    for offset in range(0, len(messages), chunk):
+        for message in messages[offset:offset + chunk]:
+            server.write(message)
+            if not batched:
+                server._flush()
+        await asyncio.sleep(0)
+    await asyncio.gather(*drains)
+    elapsed = time.perf_counter() - started
+    for _reader, writer in connections:
+        writer.close()
+    server.close()
+    return elapsed
+
+
+def run(frame_count: int, client_count: int, chunk: int) -> None:
+    messages = output_messages(frame_count)
+    deliveries = len(messages) * client_count
+    rows = []
+    baseline = None
+    for label, batched in (("per message", False), ("per iteration", True)):
+        seconds = asyncio.run(_timed_run(messages, client_count, chunk, batched))
+        per_delivery = seconds / deliveries * 1e6
+        baseline = per_delivery if baseline is None else baseline
+        rows.append(
+            (
+                label,
+                f"{deliveries:,}",
+                f"{per_delivery:.3f}",
+                f"{baseline / per_delivery:.2f}x",
+            )
+        )
+
+    print(
+        f"{len(messages)} sentences to {client_count} loopback subscribers, "
+        f"{chunk} sentences per loop iteration"
+    )
+    print_table(("flush", "deliveries", "us/delivery", "speedup"), rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20_000)
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--chunk", type=int, default=64)
+    arguments = parser.parse_args()
+    run(arguments.frames, arguments.clients, arguments.chunk)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Measure UDPSEC version 1 JSON frames against version 2 batch frames.
+
+Station side: sends the mixed workload through ``send_udpsec_nmea_sentence``
+(one JSON object, nonce and datagram per sentence) and through
+``UdpsecBatchSender`` at each ``--batch-bytes`` limit, with and without
+``deflate-nmea1`` compression, into a socket that only records datagrams.
+Server side: repeats the listener's per-datagram work on those datagrams:
+decrypt, then ``json.loads`` and ``frame_from_text_payload`` per JSON frame,
+or ``decompress_batch``, ``decode_batch`` and one ``IngressFrame`` per
+sentence of a batch frame. Both sides use one session key and skip the
+socket calls themselves. The mixed workload repeats each transmission for
+several receivers, so it compresses better than a single-receiver station.
+
+Run from the repository root::
+
+    python -m benchmarks.udpsec_batching [--frames N]
+        [--batch-bytes B ...] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from benchmarks._workloads import STATION_ID, mixed_traffic, print_table, timed
+from core.ingress_frame import IngressFrame, frame_from_text_payload
+from core.udpsec_batch import (
+    BATCH_AAD,
+    BATCH_PREFIX,
+    decode_batch,
+    decompress_batch,
+)
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "nmea_sproxy"),
+)
+import nmea_sproxy  # noqa: E402
+
+
+KEY = bytes(range(32))
+REMOTE_ADDR = ("192.0.2.10", 19999)
+SOURCE_ID = f"udpsec:{STATION_ID}"
+ASSEMBLER_KEY = f"{REMOTE_ADDR[0]}:{REMOTE_ADDR[1]}"
+
+
+class _RecordingSocket:
+    def __init__(self) -> None:
+        self.sent: list[bytes] = []
+
+    def sendto(self, data: bytes, _address: object) -> None:
+        self.sent.append(data)
+
+
+def _send_json(sentences: list[str]) -> list[bytes]:
+    sock = _RecordingSocket()
+    config = {"station_id": STATION_ID}
+    for sentence in sentences:
+        nmea_sproxy.send_udpsec_nmea_sentence(
+            sentence, sock, config, KEY, REMOTE_ADDR
+        )
+    return sock.sent
+
+
+def _send_batched(
+    sentences: list[str],
+    max_bytes: int,
+    compress: bool,
+) -> list[bytes]:
+    sock = _RecordingSocket()
+    sender = nmea_sproxy.UdpsecBatchSender(
+        sock,
+        KEY,
+        REMOTE_ADDR,
+        max_bytes,
+        compress=compress,
+    )
+    for sentence in sentences:
+        sender.send_sentence(sentence)
+    sender.flush()
+    return sock.sent
+
+
+def _receive_json(packets: list[bytes]) -> int:
+    decrypt = AESGCM(KEY).decrypt
+    prefix = len(nmea_sproxy.DATA_PREFIX)
+    frames = 0
+    for packet in packets:
+        message = json.loads(
+            decrypt(
+                packet[prefix:prefix + 12],
+                packet[prefix + 12:],
+                nmea_sproxy.DATA_AAD,
+            ).decode()
+        )
+        frame = frame_from_text_payload(
+            kind="sec",
+            source_id=SOURCE_ID,
+            alias_for_s=STATION_ID,
+            remote_ip=REMOTE_ADDR[0],
+            assembler_key=ASSEMBLER_KEY,
+            payload=message["payload"],
+        )
+        frames += frame is not None
+    return frames
+
+
+def _receive_batched(packets: list[bytes]) -> int:
+    decrypt = AESGCM(KEY).decrypt
+    prefix = len(BATCH_PREFIX)
+    frames = 0
+    for packet in packets:
+        _flags, sentences = decode_batch(
+            decompress_batch(
+                decrypt(
+                    packet[prefix:prefix + 12],
+                    packet[prefix + 12:],
+                    BATCH_AAD,
+                )
+            )
+        )
+        for sentence in sentences:
+            IngressFrame(
+                kind="sec",
+                source_id=SOURCE_ID,
+                alias_for_s=STATION_ID,
+                remote_ip=REMOTE_ADDR[0],
+                assembler_key=ASSEMBLER_KEY,
+                payload=sentence,
+            )
+            frames += 1
+    return frames
+
+
+def run(frame_count: int, batch_bytes: list[int], repeat: int) -> None:
+    sentences = [
+        frame.payload.decode("ascii") for frame in mixed_traffic(frame_count)
+    ]
+    rows = []
+    for label, send, receive in (
+        ("v1 json", _send_json, _receive_json),
+        *(
+            (
+                f"v2 {max_bytes} B{' deflate' if compress else ''}",
+                lambda items, max_bytes=max_bytes, compress=compress: (
+                    _send_batched(items, max_bytes, compress)
+                ),
+                _receive_batched,
+            )
+            for max_bytes in batch_bytes
+            for compress in (False, True)
+        ),
+    ):
+        packets = send(sentences)
+        assert receive(packets) == len(sentences)
+        send_seconds = timed(lambda: send(sentences), repeat=repeat)
+        receive_seconds = timed(lambda: receive(packets), repeat=repeat)
+        wire_bytes = sum(len(packet) for packet in packets)
+        rows.append(
+            (
+                label,
+                f"{len(packets):,}",
+                f"{wire_bytes / len(sentences):.1f}",
+                f"{send_seconds / len(sentences) * 1e9:,.0f}",
+                f"{receive_seconds / len(sentences) * 1e9:,.0f}",
+            )
+        )
+
+    print(f"{len(sentences)} sentences, best of {repeat}")
+    print_table(
+        (
+            "frames",
+            "datagrams",
+            "bytes/sentence",
+            "station ns/sentence",
+            "server ns/sentence",
+        ),
+        rows,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument(
+        "--batch-bytes",
+        type=int,
+        nargs="+",
+        default=[512, 1200, 8000],
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+    run(arguments.frames, arguments.batch_bytes, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
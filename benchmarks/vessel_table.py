@@ -0,0 +1,140 @@
+"""Measure vessel table memory per vessel and update and query costs.
+
+Fills a ``VesselTable`` with ``--vessels`` vessels spread over the mixed
+workload's European sea area and reports the memory traced while filling
+it, next to a plain dict holding one dict per vessel with the same fields.
+Then times position updates of known vessels, ``get`` by MMSI, and
+``query_bounds`` over a one-degree box capped at the default limit.
+
+Run from the repository root::
+
+    python -m benchmarks.vessel_table [--vessels N ...] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tracemalloc
+
+from benchmarks._workloads import print_table, timed
+from core.vessel_table import VesselTable
+
+
+def _positions(count: int, *, seed: int = 46) -> list[tuple[int, float, float]]:
+    rng = random.Random(seed)
+    return [
+        (
+            200_000_000 + vessel,
+            rng.uniform(-10.0, 30.0),
+            rng.uniform(35.0, 60.0),
+        )
+        for vessel in range(count)
+    ]
+
+
+def _traced_bytes(build) -> tuple[int, object]:
+    tracemalloc.start()
+    try:
+        built = build()
+        size, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size, built
+
+
+def _fill_table(positions):
+    def build() -> VesselTable:
+        table = VesselTable(capacity=len(positions), clock=lambda: 0.0)
+        for mmsi, lon, lat in positions:
+            table.update(mmsi, lon, lat, 12.3, 45.6, 0.0, 1, "udp:roof")
+        return table
+
+    return build
+
+
+def _fill_dicts(positions):
+    def build() -> dict[int, dict[str, object]]:
+        return {
+            mmsi: {
+                "lon": lon,
+                "lat": lat,
+                "sog": 12.3,
+                "cog": 45.6,
+                "timestamp": 0.0,
+                "message_type": 1,
+                "source_id": "udp:roof",
+            }
+            for mmsi, lon, lat in positions
+        }
+
+    return build
+
+
+def run(vessel_counts: list[int], repeat: int) -> None:
+    rows = []
+    for count in vessel_counts:
+        positions = _positions(count)
+        table_bytes, table = _traced_bytes(_fill_table(positions))
+        dict_bytes, _dicts = _traced_bytes(_fill_dicts(positions))
+        moves = [(mmsi, lon + 0.01, lat + 0.01) for mmsi, lon, lat in positions]
+        mmsis = [mmsi for mmsi, _lon, _lat in positions]
+        boxes = [
+            (lon - 0.5, lat - 0.5, lon + 0.5, lat + 0.5)
+            for _mmsi, lon, lat in positions[:1000]
+        ]
+
+        def update() -> None:
+            for mmsi, lon, lat in moves:
+                table.update(mmsi, lon, lat, 12.3, 45.6, 0.0, 1, "udp:roof")
+
+        def get() -> None:
+            for mmsi in mmsis:
+                table.get(mmsi)
+
+        def query() -> None:
+            for bounds in boxes:
+                table.query_bounds(bounds)
+
+        rows.append(
+            (
+                f"{count:,}",
+                f"{table_bytes / count:,.0f}",
+                f"{dict_bytes / count:,.0f}",
+                f"{table_bytes / 2**20:,.1f}",
+                f"{timed(update, repeat=repeat) / count * 1e9:,.0f}",
+                f"{timed(get, repeat=repeat) / count * 1e9:,.0f}",
+                f"{timed(query, repeat=repeat) / len(boxes) * 1e6:,.1f}",
+            )
+        )
+
+    print(f"best of {repeat}")
+    print_table(
+        (
+            "vessels",
+            "table B/vessel",
+            "dicts B/vessel",
+            "table MiB",
+            "update ns",
+            "get ns",
+            "1 deg query us",
+        ),
+        rows,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--vessels",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000],
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+    run(arguments.vessels, arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
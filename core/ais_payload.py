@@ -0,0 +1,367 @@
+"""Armoured AIS payload decoding.
+
+AIS armour is base64 with another alphabet, so de-armouring is one
+``bytes.translate`` into the standard alphabet, one ``binascii.a2b_base64``
+and one ``int.from_bytes``; no Python code runs per character. Fields are
+then plain shifts and masks of that integer.
+
+``AisPayload`` decodes a field only when it is first asked for and keeps the
+result. ``decode_payload`` memoises payloads in a small LRU, so a message
+heard by many receivers is de-armoured once. ``decode_payloads`` decodes
+numeric fields of many payloads at once with the optional NumPy package, for
+offline work.
+"""
+
+from __future__ import annotations
+
+import binascii
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+import string
+from types import MappingProxyType
+
+
+PAYLOAD_CACHE_SIZE = 4096
+
+# Armoured payload character -> six-bit value (ITU-R M.1371 / IEC 61162-1).
+SIXBIT_VALUES: Mapping[str, int] = MappingProxyType({
+    chr(value + 48 if value < 40 else value + 56): value
+    for value in range(64)
+})
+
+_INVALID = 0xFF
+# Armour character -> six-bit value, for the NumPy batch path.
+_ARMOUR_TABLE = bytes(
+    SIXBIT_VALUES.get(chr(byte), _INVALID) for byte in range(256)
+)
+_BASE64_ALPHABET = (
+    string.ascii_uppercase + string.ascii_lowercase + string.digits + "+/"
+).encode("ascii")
+# Armour character -> the base64 character of the same value. Anything else
+# becomes "!", which a2b_base64 would silently skip, so it is checked first.
+_BASE64_TABLE = bytes(
+    _BASE64_ALPHABET[SIXBIT_VALUES[chr(byte)]]
+    if chr(byte) in SIXBIT_VALUES
+    else ord("!")
+    for byte in range(256)
+)
+
+
+class AisPayloadError(ValueError):
+    """Raised when a payload is not valid AIS armour."""
+
+
+@dataclass(frozen=True, slots=True)
+class AisField:
+    """Bit ``offset`` and ``width`` of one field and how to read it.
+
+    ``kind`` is ``"u"`` (unsigned), ``"i"`` (two's complement) or ``"t"``
+    (six-bit text, trailing ``@`` and spaces removed). A numeric field with a
+    ``scale`` other than 1 is returned as ``value / scale``.
+    """
+
+    offset: int
+    width: int
+    kind: str = "u"
+    scale: int = 1
+
+
+_COMMON_FIELDS = {
+    "message_type": AisField(0, 6),
+    "repeat": AisField(6, 2),
+    "mmsi": AisField(8, 30),
+}
+_CLASS_A_POSITION = {
+    "nav_status": AisField(38, 4),
+    "rot": AisField(42, 8, "i"),
+    "sog": AisField(50, 10, scale=10),
+    "position_accuracy": AisField(60, 1),
+    "lon": AisField(61, 28, "i", 600_000),
+    "lat": AisField(89, 27, "i", 600_000),
+    "cog": AisField(116, 12, scale=10),
+    "heading": AisField(128, 9),
+    "second": AisField(137, 6),
+}
+_CLASS_B_POSITION = {
+    "sog": AisField(46, 10, scale=10),
+    "position_accuracy": AisField(56, 1),
+    "lon": AisField(57, 28, "i", 600_000),
+    "lat": AisField(85, 27, "i", 600_000),
+    "cog": AisField(112, 12, scale=10),
+    "heading": AisField(124, 9),
+    "second": AisField(133, 6),
+}
+
+# Message type -> field name -> layout. Type 24's part B reuses bits that
+# part A spends on the name, so callers must check ``partno`` first.
+FIELDS: Mapping[int, Mapping[str, AisField]] = MappingProxyType({
+    message_type: MappingProxyType({**_COMMON_FIELDS, **fields})
+    for message_type, fields in {
+        1: _CLASS_A_POSITION,
+        2: _CLASS_A_POSITION,
+        3: _CLASS_A_POSITION,
+        4: {
+            "year": AisField(38, 14),
+            "month": AisField(52, 4),
+            "day": AisField(56, 5),
+            "hour": AisField(61, 5),
+            "minute": AisField(66, 6),
+            "second": AisField(72, 6),
+            "position_accuracy": AisField(78, 1),
+            "lon": AisField(79, 28, "i", 600_000),
+            "lat": AisField(107, 27, "i", 600_000),
+        },
+        5: {
+            "ais_version": AisField(38, 2),
+            "imo": AisField(40, 30),
+            "callsign": AisField(70, 42, "t"),
+            "shipname": AisField(112, 120, "t"),
+            "ship_type": AisField(232, 8),
+            "to_bow": AisField(240, 9),
+            "to_stern": AisField(249, 9),
+            "to_port": AisField(258, 6),
+            "to_starboard": AisField(264, 6),
+            "epfd": AisField(270, 4),
+            "draught": AisField(294, 8, scale=10),
+            "destination": AisField(302, 120, "t"),
+        },
+        18: _CLASS_B_POSITION,
+        19: {
+            **_CLASS_B_POSITION,
+            "shipname": AisField(143, 120, "t"),
+            "ship_type": AisField(263, 8),
+        },
+        21: {
+            "aid_type": AisField(38, 5),
+            "name": AisField(43, 120, "t"),
+            "position_accuracy": AisField(163, 1),
+            "lon": AisField(164, 28, "i", 600_000),
+            "lat": AisField(192, 27, "i", 600_000),
+        },
+        24: {
+            "partno": AisField(38, 2),
+            "shipname": AisField(40, 120, "t"),
+            "ship_type": AisField(40, 8),
+            "callsign": AisField(90, 42, "t"),
+        },
+        27: {
+            "position_accuracy": AisField(38, 1),
+            "raim": AisField(39, 1),
+            "nav_status": AisField(40, 4),
+            "lon": AisField(44, 18, "i", 600),
+            "lat": AisField(62, 17, "i", 600),
+            "sog": AisField(79, 6),
+            "cog": AisField(85, 9),
+        },
+    }.items()
+})
+_FIELD_NAMES = frozenset(
+    name for fields in FIELDS.values() for name in fields
+)
+
+
+def _layout(field: AisField) -> tuple[int, int, int, str, int]:
+    return (
+        field.offset + field.width,
+        field.width,
+        (1 << field.width) - 1,
+        field.kind,
+        field.scale,
+    )
+
+
+# FIELDS as plain dicts of (end bit, width, mask, kind, scale) tuples, which
+# the per-field path reads without attribute lookups.
+_COMMON_LAYOUTS = {name: _layout(field) for name, field in _COMMON_FIELDS.items()}
+_LAYOUTS = {
+    message_type: {name: _layout(field) for name, field in fields.items()}
+    for message_type, fields in FIELDS.items()
+}
+
+
+def dearmour(payload: str, fill_bits: int = 0) -> tuple[int, int]:
+    """Return ``(bits, bit_count)`` for an armoured payload.
+
+    ``bits`` holds the payload's ``6 * len(payload) - fill_bits`` bits, the
+    first payload bit most significant.
+    """
+
+    try:
+        data = payload.encode("ascii").translate(_BASE64_TABLE)
+    except UnicodeEncodeError:
+        raise AisPayloadError("AIS payload must be ASCII armour.") from None
+    if b"!" in data:
+        raise AisPayloadError("AIS payload contains invalid armour characters.")
+    bit_count = len(data) * 6 - fill_bits
+    if not 0 <= fill_bits <= 5 or bit_count < 0:
+        raise AisPayloadError("AIS payload fill bits must be between 0 and 5.")
+    # base64 decodes whole four-character groups; "A" pads with zero bits.
+    padding = -len(data) % 4
+    bits = int.from_bytes(binascii.a2b_base64(data + b"A" * padding), "big")
+    return bits >> padding * 6 + fill_bits, bit_count
+
+
+class AisPayload:
+    """One armoured payload whose fields are decoded on first access.
+
+    ``payload[name]`` returns a field of the payload's message type, or
+    ``None`` when the payload is too short to hold it; a name the type does
+    not define raises ``KeyError``. Nothing beyond the message type is
+    de-armoured until a field is read.
+    """
+
+    __slots__ = (
+        "payload",
+        "fill_bits",
+        "message_type",
+        "_bits",
+        "_bit_count",
+        "_values",
+    )
+
+    def __init__(self, payload: str, fill_bits: int = 0) -> None:
+        message_type = SIXBIT_VALUES.get(payload[:1])
+        if message_type is None:
+            raise AisPayloadError("AIS payload must start with a valid type.")
+        self.payload = payload
+        self.fill_bits = fill_bits
+        self.message_type = message_type
+        self._bits: int | None = None
+        self._bit_count = 0
+        self._values: dict[str, object] = {}
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return tuple(FIELDS.get(self.message_type, _COMMON_FIELDS))
+
+    def __getitem__(self, name: str) -> int | float | str | None:
+        values = self._values
+        if name in values:
+            return values[name]
+        end, width, mask, kind, scale = _LAYOUTS.get(
+            self.message_type,
+            _COMMON_LAYOUTS,
+        )[name]
+        bits = self._bits
+        if bits is None:
+            bits, self._bit_count = dearmour(self.payload, self.fill_bits)
+            self._bits = bits
+        bit_count = self._bit_count
+        if end > bit_count:
+            value = None
+        else:
+            value = bits >> bit_count - end & mask
+            if kind == "t":
+                value = _text(value, width)
+            else:
+                if kind == "i" and value >> width - 1:
+                    value -= 1 << width
+                if scale != 1:
+                    value /= scale
+        values[name] = value
+        return value
+
+    def get(self, name: str, default: object = None) -> object:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+
+@lru_cache(maxsize=PAYLOAD_CACHE_SIZE)
+def decode_payload(payload: str, fill_bits: int = 0) -> AisPayload:
+    """Return the shared, lazily decoded ``AisPayload`` for ``payload``."""
+
+    return AisPayload(payload, fill_bits)
+
+
+def _text(value: int, width: int) -> str:
+    characters = []
+    for shift in range(width - 6, -1, -6):
+        code = value >> shift & 0x3F
+        characters.append(chr(code + 64 if code < 32 else code))
+    return "".join(characters).rstrip("@ ")
+
+
+def load_numpy():
+    """Return the ``numpy`` module, imported only when a batch is decoded."""
+
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("decode_payloads requires the numpy package") from exc
+    return numpy
+
+
+def decode_payloads(
+    payloads: Sequence[str],
+    names: Sequence[str],
+) -> dict[str, object]:
+    """Decode numeric ``names`` of many payloads into NumPy arrays.
+
+    Unscaled fields become ``int64`` arrays with -1, and scaled fields
+    ``float64`` arrays with NaN, where a payload's type lacks the field or
+    the payload is too short. Fill bits are ignored.
+    """
+
+    numpy = load_numpy()
+    unknown = sorted(set(names) - _FIELD_NAMES)
+    if unknown:
+        raise KeyError(", ".join(unknown))
+    count = len(payloads)
+    width = max(map(len, payloads), default=1)
+    try:
+        data = b"".join(
+            payload.encode("ascii").translate(_ARMOUR_TABLE).ljust(width, b"\0")
+            for payload in payloads
+        )
+    except UnicodeEncodeError:
+        raise AisPayloadError("AIS payload must be ASCII armour.") from None
+    values = numpy.frombuffer(data, numpy.uint8).reshape(count, width)
+    if (values == _INVALID).any():
+        raise AisPayloadError("AIS payload contains invalid armour characters.")
+    bit_counts = numpy.fromiter(map(len, payloads), numpy.int64, count) * 6
+    types = values[:, 0] if width else numpy.zeros(count, numpy.uint8)
+
+    columns: dict[str, object] = {}
+    for name in names:
+        layouts = {
+            message_type: fields[name]
+            for message_type, fields in FIELDS.items()
+            if name in fields
+        }
+        if any(layout.kind == "t" for layout in layouts.values()):
+            raise AisPayloadError(f"decode_payloads cannot decode text field {name!r}.")
+        scaled = any(layout.scale != 1 for layout in layouts.values())
+        column = (
+            numpy.full(count, numpy.nan)
+            if scaled
+            else numpy.full(count, -1, numpy.int64)
+        )
+        for message_type in numpy.unique(types).tolist():
+            layout = layouts.get(message_type)
+            if layout is None:
+                continue
+            rows = (types == message_type) & (
+                bit_counts >= layout.offset + layout.width
+            )
+            if rows.any():
+                column[rows] = _batch_field_values(numpy, values[rows], layout)
+        columns[name] = column
+    return columns
+
+
+def _batch_field_values(numpy, values, field: AisField):
+    first = field.offset // 6
+    last = (field.offset + field.width - 1) // 6
+    accumulated = numpy.zeros(len(values), numpy.uint64)
+    for column in range(first, last + 1):
+        accumulated = accumulated << numpy.uint64(6) | values[:, column]
+    shift = (last - first + 1) * 6 - (field.offset - first * 6) - field.width
+    raw = (
+        accumulated >> numpy.uint64(shift) & numpy.uint64((1 << field.width) - 1)
+    ).astype(numpy.int64)
+    if field.kind == "i":
+        raw = numpy.where(raw >> field.width - 1, raw - (1 << field.width), raw)
+    return raw if field.scale == 1 else raw / field.scale
@@ -0,0 +1,353 @@
+"""Kinematic anomaly and spoofing checks on emitted position reports.
+
+``AnomalyDetector`` compares each position report with the last one for its
+MMSI and flags what no real vessel does: moving faster than
+``max_speed_knots``, jumping ``teleport_nm`` or more at once, reporting from
+two distant positions in turn (two transmitters sharing one MMSI), and
+coordinates outside the valid range. Each check is a dictionary lookup and a
+flat-earth distance, and the track table is bounded.
+
+A track holds the last plausible position and, after an impossible jump,
+the position the jump went to. When later reports continue from the second
+position while the first keeps reporting too, the MMSI is in use twice. When
+the first position has gone quiet instead, the vessel simply moved, and the
+second position becomes its track.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+import enum
+import math
+
+from core.ais_payload import FIELDS, AisPayloadError, dearmour
+from core.metrics import AnomalyMetricsSnapshot
+from core.target_identity import EgressTargetId
+
+
+DEFAULT_MAX_SPEED_KNOTS = 60.0
+DEFAULT_TELEPORT_NM = 10.0
+DEFAULT_DUPLICATE_WINDOW_SECONDS = 600.0
+DEFAULT_ANOMALY_TRACK_CAPACITY = 262_144
+# Smaller moves are position noise, whatever speed they imply.
+POSITION_TOLERANCE_NM = 0.1
+
+
+def _position_layout(message_type: int) -> tuple[int, int, int, int, int, int]:
+    """Return armour characters to read, then lon and lat end bit and width."""
+
+    lon = FIELDS[message_type]["lon"]
+    lat = FIELDS[message_type]["lat"]
+    end = lat.offset + lat.width
+    return (
+        -(-end // 6),
+        lon.offset + lon.width,
+        lon.width,
+        end,
+        lat.width,
+        lon.scale,
+    )
+
+
+# Position report type character -> _position_layout of its message type.
+# Only the armour up to the latitude is de-armoured.
+_POSITION_LAYOUTS = {
+    character: _position_layout(message_type)
+    for character, message_type in (
+        ("1", 1), ("2", 2), ("3", 3), ("B", 18), ("C", 19), ("K", 27),
+    )
+}
+_MMSI_END = FIELDS[1]["mmsi"].offset + FIELDS[1]["mmsi"].width
+_MMSI_MASK = (1 << FIELDS[1]["mmsi"].width) - 1
+_NM_PER_DEGREE = 60.0
+# Reports are stamped on arrival; shorter gaps are treated as one second.
+_MIN_INTERVAL_SECONDS = 1.0
+
+
+class Anomaly(enum.IntFlag):
+    """Anomalies one position report can carry."""
+
+    SPEED = enum.auto()
+    TELEPORT = enum.auto()
+    DUPLICATE_MMSI = enum.auto()
+    OUT_OF_RANGE = enum.auto()
+
+
+_NO_ANOMALY = Anomaly(0)
+
+
+class AnomalyConfigError(ValueError):
+    """Raised when the optional ``anomaly_detection`` config is invalid."""
+
+
+@dataclass(frozen=True, slots=True)
+class AnomalyRouting:
+    """Where flagged reports go, in addition to or instead of their routes."""
+
+    target_id: EgressTargetId
+    divert: bool = False
+
+
+class AnomalyDetector:
+    """Bounded per-MMSI track table that flags implausible position reports.
+
+    ``check`` returns the ``Anomaly`` flags of one report, ``Anomaly(0)``
+    for a plausible one or a sentence that is no position report. Tracks of
+    the least recently reporting vessels are evicted beyond ``capacity``.
+    """
+
+    __slots__ = (
+        "max_speed_knots",
+        "teleport_nm",
+        "duplicate_window_s",
+        "capacity",
+        "routing",
+        "_tracks",
+        "_checked",
+        "_counts",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_speed_knots: float = DEFAULT_MAX_SPEED_KNOTS,
+        teleport_nm: float = DEFAULT_TELEPORT_NM,
+        duplicate_window_s: float = DEFAULT_DUPLICATE_WINDOW_SECONDS,
+        capacity: int = DEFAULT_ANOMALY_TRACK_CAPACITY,
+        routing: AnomalyRouting | None = None,
+    ) -> None:
+        if not max_speed_knots > 0:
+            raise ValueError("max_speed_knots must be greater than 0.")
+        if not teleport_nm > 0:
+            raise ValueError("teleport_nm must be greater than 0.")
+        if not duplicate_window_s > 0:
+            raise ValueError("duplicate_window_s must be greater than 0.")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.max_speed_knots = max_speed_knots
+        self.teleport_nm = teleport_nm
+        self.duplicate_window_s = duplicate_window_s
+        self.capacity = capacity
+        self.routing = routing
+        # MMSI -> (lon, lat, time) of the track, then of the position an
+        # impossible jump went to, or None.
+        self._tracks: dict[
+            int,
+            tuple[
+                tuple[float, float, float],
+                tuple[float, float, float] | None,
+            ],
+        ] = {}
+        self._checked = 0
+        self._counts = dict.fromkeys(Anomaly, 0)
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def check(self, sentence: str, timestamp: float) -> Anomaly:
+        """Flag one AIVDM/AIVDO sentence received at ``timestamp``."""
+
+        fields = sentence.split(",", 7)
+        if len(fields) < 7:
+            return _NO_ANOMALY
+        payload = fields[5]
+        layout = _POSITION_LAYOUTS.get(payload[:1])
+        if layout is None:
+            return _NO_ANOMALY
+        characters, lon_end, lon_width, lat_end, lat_width, scale = layout
+        if len(payload) < characters:
+            return _NO_ANOMALY
+        fill = fields[6][:1]
+        try:
+            bits, bit_count = dearmour(
+                payload[:characters],
+                int(fill) if len(payload) == characters and fill.isdigit() else 0,
+            )
+        except AisPayloadError:
+            return _NO_ANOMALY
+        if bit_count < lat_end:
+            return _NO_ANOMALY
+        lon = bits >> bit_count - lon_end & (1 << lon_width) - 1
+        if lon >> lon_width - 1:
+            lon -= 1 << lon_width
+        lat = bits >> bit_count - lat_end & (1 << lat_width) - 1
+        if lat >> lat_width - 1:
+            lat -= 1 << lat_width
+        lon /= scale
+        lat /= scale
+        if lon == 181 or lat == 91:
+            return _NO_ANOMALY
+        self._checked += 1
+        if not (-180 <= lon <= 180 and -90 <= lat <= 90):
+            flags = Anomaly.OUT_OF_RANGE
+        else:
+            flags = self._track(
+                bits >> bit_count - _MMSI_END & _MMSI_MASK,
+                (lon, lat, timestamp),
+            )
+        if flags:
+            self._counts[flags] += 1
+        return flags
+
+    def flagged_targets(
+        self,
+        target_ids: tuple[EgressTargetId, ...],
+    ) -> tuple[EgressTargetId, ...]:
+        """Return the targets of a flagged report under ``routing``."""
+
+        routing = self.routing
+        if routing is None:
+            return target_ids
+        if routing.divert:
+            return (routing.target_id,)
+        if routing.target_id in target_ids:
+            return target_ids
+        return (*target_ids, routing.target_id)
+
+    def metrics_snapshot(self) -> AnomalyMetricsSnapshot:
+        """Return fresh immutable lifetime counters."""
+
+        counts = self._counts
+        return AnomalyMetricsSnapshot(
+            checked=self._checked,
+            speed=counts[Anomaly.SPEED],
+            teleport=counts[Anomaly.TELEPORT],
+            duplicate_mmsi=counts[Anomaly.DUPLICATE_MMSI],
+            out_of_range=counts[Anomaly.OUT_OF_RANGE],
+            tracked_vessels=len(self._tracks),
+        )
+
+    def _track(
+        self,
+        mmsi: int,
+        position: tuple[float, float, float],
+    ) -> Anomaly:
+        tracks = self._tracks
+        state = tracks.pop(mmsi, None)
+        if state is None:
+            if len(tracks) >= self.capacity:
+                del tracks[next(iter(tracks))]
+            tracks[mmsi] = (position, None)
+            return _NO_ANOMALY
+
+        track, jumped = state
+        timestamp = position[2]
+        if jumped is not None and timestamp - jumped[2] > self.duplicate_window_s:
+            jumped = None
+
+        distance = self._distance_nm(track, position)
+        if distance is None:
+            tracks[mmsi] = (position, jumped)
+            return _NO_ANOMALY
+        if jumped is not None and self._distance_nm(jumped, position) is None:
+            if track[2] >= jumped[2]:
+                # Both positions keep reporting: two transmitters, one MMSI.
+                tracks[mmsi] = (track, position)
+                return Anomaly.DUPLICATE_MMSI
+            tracks[mmsi] = (position, None)
+            return _NO_ANOMALY
+
+        tracks[mmsi] = (track, position)
+        if distance >= self.teleport_nm:
+            return Anomaly.TELEPORT
+        return Anomaly.SPEED
+
+    def _distance_nm(
+        self,
+        start: tuple[float, float, float],
+        end: tuple[float, float, float],
+    ) -> float | None:
+        """Return the jump from ``start`` to ``end``, ``None`` if plausible."""
+
+        start_lon, start_lat, start_time = start
+        end_lon, end_lat, end_time = end
+        delta_lon = (end_lon - start_lon + 180) % 360 - 180
+        distance = _NM_PER_DEGREE * math.hypot(
+            delta_lon * math.cos(math.radians((start_lat + end_lat) / 2)),
+            end_lat - start_lat,
+        )
+        if distance <= POSITION_TOLERANCE_NM:
+            return None
+        hours = max(end_time - start_time, _MIN_INTERVAL_SECONDS) / 3600
+        if distance <= self.max_speed_knots * hours:
+            return None
+        return distance
+
+
+def load_optional_anomaly_detector(
+    config: Mapping[str, object],
+    target_id_by_name: Mapping[str, EgressTargetId],
+) -> AnomalyDetector | None:
+    """Build the detector from the optional ``anomaly_detection`` section.
+
+    It exists only with ``enabled: true``. An optional ``target`` names the
+    forwarder that also receives flagged reports, or receives them alone
+    with ``divert: true``.
+    """
+
+    section = config.get("anomaly_detection")
+    if section is None:
+        return None
+    if not isinstance(section, Mapping):
+        raise AnomalyConfigError("'anomaly_detection' config must be a mapping.")
+    unknown_fields = set(section) - {
+        "enabled",
+        "max_speed_knots",
+        "teleport_nm",
+        "duplicate_window_s",
+        "capacity",
+        "target",
+        "divert",
+    }
+    if unknown_fields:
+        raise AnomalyConfigError(
+            "'anomaly_detection' config has unknown field(s): "
+            f"{', '.join(sorted(str(field) for field in unknown_fields))}."
+        )
+    for name in ("enabled", "divert"):
+        if not isinstance(section.get(name, False), bool):
+            raise AnomalyConfigError(
+                f"'anomaly_detection.{name}' must be a boolean."
+            )
+    if not section.get("enabled", False):
+        return None
+
+    values = {}
+    for name, default in (
+        ("max_speed_knots", DEFAULT_MAX_SPEED_KNOTS),
+        ("teleport_nm", DEFAULT_TELEPORT_NM),
+        ("duplicate_window_s", DEFAULT_DUPLICATE_WINDOW_SECONDS),
+    ):
+        value = section.get(name, default)
+        if (
+            isinstance(value, bool)
+            or not isinstance(value, (int, float))
+            or not value > 0
+        ):
+            raise AnomalyConfigError(
+                f"'anomaly_detection.{name}' must be a positive number."
+            )
+        values[name] = float(value)
+    capacity = section.get("capacity", DEFAULT_ANOMALY_TRACK_CAPACITY)
+    if isinstance(capacity, bool) or not isinstance(capacity, int) or capacity < 1:
+        raise AnomalyConfigError(
+            "'anomaly_detection.capacity' must be a positive integer."
+        )
+
+    routing = None
+    if "target" in section:
+        target = section["target"]
+        if not isinstance(target, str) or target not in target_id_by_name:
+            raise AnomalyConfigError(
+                "'anomaly_detection.target' must name a configured forwarder."
+            )
+        routing = AnomalyRouting(
+            target_id=target_id_by_name[target],
+            divert=section.get("divert", False),
+        )
+    elif section.get("divert", False):
+        raise AnomalyConfigError(
+            "'anomaly_detection.divert' requires 'anomaly_detection.target'."
+        )
+    return AnomalyDetector(capacity=capacity, routing=routing, **values)
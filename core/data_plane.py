@@ -8,6 +8,7 @@ from enum import Enum
 from typing import Protocol, runtime_checkable
 
 from core.ingress_frame import IngressFrame
+from core.message_filter import TargetFilter
 from core.metrics import ProcessorMetricsSnapshot
 from core.target_identity import EgressTargetId
 
@@ -21,11 +22,16 @@ class DeduplicationMode(Enum):
 
 @dataclass(frozen=True, slots=True)
 class ProcessingSnapshot:
-    """Immutable target-only processing view for one accepted ingress frame."""
+    """Immutable target-only processing view for one accepted ingress frame.
+
+    When routes matching the frame's source carry message filters,
+    ``target_filter`` selects each message's targets from ``target_ids``.
+    """
 
     routing_generation: int
     deduplication_mode: DeduplicationMode
     target_ids: tuple[EgressTargetId, ...]
+    target_filter: TargetFilter | None = None
 
     def __post_init__(self) -> None:
         if isinstance(self.routing_generation, bool) or not isinstance(
@@ -53,6 +59,13 @@ class ProcessingSnapshot:
         _validate_numeric_target_ids(target_ids)
         if len(set(target_ids)) != len(target_ids):
             raise ValueError("ProcessingSnapshot target_ids must be unique.")
+        if self.target_filter is not None:
+            if not isinstance(self.target_filter, TargetFilter):
+                raise TypeError("target_filter must be a TargetFilter or None.")
+            if self.deduplication_mode is not DeduplicationMode.PER_TARGET:
+                raise ValueError(
+                    "target_filter requires PER_TARGET deduplication."
+                )
         object.__setattr__(
             self,
             "target_ids",
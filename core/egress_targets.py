@@ -0,0 +1,584 @@
+"""Per-target bounded egress queues drained by independent workers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from enum import Enum
+from typing import Protocol
+
+from core.metrics import EgressTargetQueueMetricsSnapshot
+from core.target_identity import EgressTargetId
+
+
+class EgressOverflowPolicy(Enum):
+    """What a full per-target queue does with one more message."""
+
+    BLOCK = "block"
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+
+
+DEFAULT_TARGET_QUEUE_MAXSIZE = 1024
+DEFAULT_TARGET_OVERFLOW_POLICY = EgressOverflowPolicy.DROP_OLDEST
+# 1280-byte IPv6 minimum MTU minus 40-byte IPv6 and 8-byte UDP headers.
+DEFAULT_COALESCE_MAX_BYTES = 1232
+DEFAULT_COALESCE_DEADLINE_MS = 20
+MAX_UDP_PAYLOAD_BYTES = 65507
+
+
+class EgressTargetQueueConfigError(ValueError):
+    """Raised when per-target egress queue configuration is invalid."""
+
+
+class UnknownEgressTargetError(ValueError):
+    """Raised when a numeric egress target has no per-target queue."""
+
+
+@dataclass(frozen=True, slots=True)
+class EgressTargetQueueSettings:
+    """Capacity, overflow, coalescing, and shaping of one egress queue.
+
+    ``coalesce_max_bytes=None`` sends every message as its own datagram.
+    Otherwise consecutive CRLF-terminated messages are packed into one
+    datagram of at most ``coalesce_max_bytes`` bytes, flushed no later than
+    ``coalesce_deadline`` seconds after its first message was dequeued.
+
+    ``rate_messages_per_s`` and ``rate_bytes_per_s`` each enable a token
+    bucket holding up to ``rate_burst_messages`` or ``rate_burst_bytes``
+    tokens. While a bucket is empty the worker waits, and newer messages
+    wait in the queue under its capacity and overflow policy.
+    """
+
+    maxsize: int = DEFAULT_TARGET_QUEUE_MAXSIZE
+    overflow_policy: EgressOverflowPolicy = DEFAULT_TARGET_OVERFLOW_POLICY
+    coalesce_max_bytes: int | None = None
+    coalesce_deadline: float = DEFAULT_COALESCE_DEADLINE_MS / 1000
+    rate_messages_per_s: float | None = None
+    rate_burst_messages: float | None = None
+    rate_bytes_per_s: float | None = None
+    rate_burst_bytes: float | None = None
+
+    def __post_init__(self) -> None:
+        if isinstance(self.maxsize, bool) or not isinstance(self.maxsize, int):
+            raise TypeError("maxsize must be a positive integer.")
+        if self.maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+        if not isinstance(self.overflow_policy, EgressOverflowPolicy):
+            raise TypeError("overflow_policy must be an EgressOverflowPolicy.")
+        if self.coalesce_max_bytes is not None:
+            if isinstance(self.coalesce_max_bytes, bool) or not isinstance(
+                self.coalesce_max_bytes,
+                int,
+            ):
+                raise TypeError("coalesce_max_bytes must be an integer.")
+            if not 1 <= self.coalesce_max_bytes <= MAX_UDP_PAYLOAD_BYTES:
+                raise ValueError(
+                    "coalesce_max_bytes must be between 1 and "
+                    f"{MAX_UDP_PAYLOAD_BYTES}."
+                )
+        if isinstance(self.coalesce_deadline, bool) or not isinstance(
+            self.coalesce_deadline,
+            (int, float),
+        ):
+            raise TypeError("coalesce_deadline must be a number.")
+        if not 0 <= self.coalesce_deadline < float("inf"):
+            raise ValueError(
+                "coalesce_deadline must be a finite non-negative number."
+            )
+        for field_name in (
+            "rate_messages_per_s",
+            "rate_burst_messages",
+            "rate_bytes_per_s",
+            "rate_burst_bytes",
+        ):
+            value = getattr(self, field_name)
+            if value is None:
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError(f"{field_name} must be a number or None.")
+            if not 0 < value < float("inf"):
+                raise ValueError(
+                    f"{field_name} must be a finite positive number."
+                )
+        if (
+            self.is_shaped
+            and self.overflow_policy is EgressOverflowPolicy.BLOCK
+        ):
+            raise ValueError(
+                "A rate-limited queue cannot use the block overflow policy."
+            )
+
+    @property
+    def is_shaped(self) -> bool:
+        return (
+            self.rate_messages_per_s is not None
+            or self.rate_bytes_per_s is not None
+        )
+
+
+class EgressTargetSender(Protocol):
+    """Structural contract for the transport owner used by target workers."""
+
+    async def send_to_ids(
+        self,
+        target_ids: Iterable[EgressTargetId],
+        message: bytes,
+    ) -> None:
+        ...
+
+
+def load_target_queue_settings(
+    targets: Iterable[Mapping[str, object]],
+) -> tuple[EgressTargetQueueSettings, ...]:
+    """Read the optional per-target queue, coalescing, and rate fields."""
+
+    settings = []
+    for index, entry in enumerate(targets):
+        context = f"forwarders[{index}]"
+        maxsize = entry.get("queue_maxsize", DEFAULT_TARGET_QUEUE_MAXSIZE)
+        if (
+            isinstance(maxsize, bool)
+            or not isinstance(maxsize, int)
+            or maxsize < 1
+        ):
+            raise EgressTargetQueueConfigError(
+                f"{context}.queue_maxsize must be a positive integer."
+            )
+
+        policy_value = entry.get(
+            "queue_overflow",
+            DEFAULT_TARGET_OVERFLOW_POLICY.value,
+        )
+        try:
+            overflow_policy = EgressOverflowPolicy(policy_value)
+        except ValueError:
+            allowed = ", ".join(policy.value for policy in EgressOverflowPolicy)
+            raise EgressTargetQueueConfigError(
+                f"{context}.queue_overflow must be one of: {allowed}."
+            ) from None
+
+        coalesce = entry.get("coalesce", False)
+        if not isinstance(coalesce, bool):
+            raise EgressTargetQueueConfigError(
+                f"{context}.coalesce must be a boolean."
+            )
+
+        coalesce_max_bytes = entry.get(
+            "coalesce_max_bytes",
+            DEFAULT_COALESCE_MAX_BYTES,
+        )
+        if (
+            isinstance(coalesce_max_bytes, bool)
+            or not isinstance(coalesce_max_bytes, int)
+            or not 1 <= coalesce_max_bytes <= MAX_UDP_PAYLOAD_BYTES
+        ):
+            raise EgressTargetQueueConfigError(
+                f"{context}.coalesce_max_bytes must be an integer between 1 "
+                f"and {MAX_UDP_PAYLOAD_BYTES}."
+            )
+
+        coalesce_deadline_ms = entry.get(
+            "coalesce_deadline_ms",
+            DEFAULT_COALESCE_DEADLINE_MS,
+        )
+        if (
+            isinstance(coalesce_deadline_ms, bool)
+            or not isinstance(coalesce_deadline_ms, (int, float))
+            or not 0 <= coalesce_deadline_ms < float("inf")
+        ):
+            raise EgressTargetQueueConfigError(
+                f"{context}.coalesce_deadline_ms must be a finite "
+                "non-negative number."
+            )
+
+        rates = {}
+        for rate_key, burst_key in (
+            ("rate_messages_per_s", "rate_burst_messages"),
+            ("rate_bytes_per_s", "rate_burst_bytes"),
+        ):
+            for key in (rate_key, burst_key):
+                value = entry.get(key)
+                if value is not None and (
+                    isinstance(value, bool)
+                    or not isinstance(value, (int, float))
+                    or not 0 < value < float("inf")
+                ):
+                    raise EgressTargetQueueConfigError(
+                        f"{context}.{key} must be a finite positive number."
+                    )
+                rates[key] = value
+            if rates[rate_key] is None:
+                if rates[burst_key] is not None:
+                    raise EgressTargetQueueConfigError(
+                        f"{context}.{burst_key} requires {rate_key}."
+                    )
+            elif rates[burst_key] is None:
+                # Default to one second of traffic, and at least one message.
+                rates[burst_key] = max(rates[rate_key], 1)
+        if (
+            overflow_policy is EgressOverflowPolicy.BLOCK
+            and (
+                rates["rate_messages_per_s"] is not None
+                or rates["rate_bytes_per_s"] is not None
+            )
+        ):
+            raise EgressTargetQueueConfigError(
+                f"{context}.queue_overflow cannot be block for a rate-limited "
+                "target; its backlog would stall every other target."
+            )
+
+        settings.append(
+            EgressTargetQueueSettings(
+                maxsize=maxsize,
+                overflow_policy=overflow_policy,
+                coalesce_max_bytes=coalesce_max_bytes if coalesce else None,
+                coalesce_deadline=coalesce_deadline_ms / 1000,
+                **rates,
+            )
+        )
+    return tuple(settings)
+
+
+class _TokenBucket:
+    """Refill ``rate`` tokens per second, holding at most ``burst``.
+
+    A reservation may take the level below zero, so a payload larger than
+    the burst still goes out once the debt it leaves has been repaid.
+    """
+
+    __slots__ = ("_rate", "_burst", "_tokens", "_updated")
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._updated = None
+
+    def reserve(self, amount: int, now: float) -> float:
+        """Take ``amount`` tokens; return seconds to wait before using them."""
+
+        if self._updated is not None:
+            self._tokens = min(
+                self._burst,
+                self._tokens + (now - self._updated) * self._rate,
+            )
+        self._updated = now
+        self._tokens -= amount
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self._rate
+
+
+class _TargetQueue:
+    """Own one bounded message queue and its lifetime counters."""
+
+    __slots__ = (
+        "_target_id",
+        "_overflow_policy",
+        "_coalesce_max_bytes",
+        "_coalesce_deadline",
+        "_queue",
+        "_peak_depth",
+        "_enqueued",
+        "_dequeued",
+        "_dropped",
+        "_put_waits",
+        "_sent_messages",
+        "_sent_datagrams",
+        "_message_bucket",
+        "_byte_bucket",
+        "_shaped",
+    )
+
+    def __init__(
+        self,
+        target_id: EgressTargetId,
+        settings: EgressTargetQueueSettings,
+    ) -> None:
+        self._target_id = target_id
+        self._overflow_policy = settings.overflow_policy
+        self._coalesce_max_bytes = settings.coalesce_max_bytes
+        self._coalesce_deadline = settings.coalesce_deadline
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue(settings.maxsize)
+        self._peak_depth = 0
+        self._enqueued = 0
+        self._dequeued = 0
+        self._dropped = 0
+        self._put_waits = 0
+        self._sent_messages = 0
+        self._sent_datagrams = 0
+        self._message_bucket = (
+            None
+            if settings.rate_messages_per_s is None
+            else _TokenBucket(
+                settings.rate_messages_per_s,
+                settings.rate_burst_messages
+                or max(settings.rate_messages_per_s, 1),
+            )
+        )
+        self._byte_bucket = (
+            None
+            if settings.rate_bytes_per_s is None
+            else _TokenBucket(
+                settings.rate_bytes_per_s,
+                settings.rate_burst_bytes
+                or max(settings.rate_bytes_per_s, 1),
+            )
+        )
+        self._shaped = 0
+
+    @property
+    def is_shaped(self) -> bool:
+        return (
+            self._message_bucket is not None or self._byte_bucket is not None
+        )
+
+    @property
+    def coalesce_max_bytes(self) -> int | None:
+        return self._coalesce_max_bytes
+
+    @property
+    def coalesce_deadline(self) -> float:
+        return self._coalesce_deadline
+
+    async def put(self, message: bytes) -> None:
+        queue = self._queue
+        if queue.full():
+            overflow_policy = self._overflow_policy
+            if overflow_policy is EgressOverflowPolicy.DROP_NEWEST:
+                self._dropped += 1
+                return
+            if overflow_policy is EgressOverflowPolicy.DROP_OLDEST:
+                queue.get_nowait()
+                self._dropped += 1
+            else:
+                self._put_waits += 1
+                await queue.put(message)
+                self._accepted()
+                return
+
+        queue.put_nowait(message)
+        self._accepted()
+
+    async def get(self) -> bytes:
+        message = await self._queue.get()
+        self._dequeued += 1
+        return message
+
+    def get_nowait(self) -> bytes | None:
+        queue = self._queue
+        if queue.empty():
+            return None
+        self._dequeued += 1
+        return queue.get_nowait()
+
+    def shaping_delay(
+        self,
+        message_count: int,
+        size: int,
+        now: float,
+    ) -> float:
+        """Reserve tokens for one payload; return how long it must wait."""
+
+        delay = 0.0
+        if self._message_bucket is not None:
+            delay = self._message_bucket.reserve(message_count, now)
+        if self._byte_bucket is not None:
+            delay = max(delay, self._byte_bucket.reserve(size, now))
+        if delay > 0:
+            self._shaped += 1
+        return delay
+
+    def sent(self, message_count: int) -> None:
+        self._sent_messages += message_count
+        self._sent_datagrams += 1
+
+    def _accepted(self) -> None:
+        self._enqueued += 1
+        depth = self._queue.qsize()
+        if depth > self._peak_depth:
+            self._peak_depth = depth
+
+    def snapshot(self) -> EgressTargetQueueMetricsSnapshot:
+        return EgressTargetQueueMetricsSnapshot(
+            target_id=self._target_id,
+            overflow_policy=self._overflow_policy.value,
+            capacity=self._queue.maxsize,
+            depth=self._queue.qsize(),
+            peak_depth=self._peak_depth,
+            enqueued=self._enqueued,
+            dequeued=self._dequeued,
+            dropped=self._dropped,
+            put_waits=self._put_waits,
+            sent_messages=self._sent_messages,
+            sent_datagrams=self._sent_datagrams,
+            shaped=self._shaped,
+        )
+
+
+class PerTargetEgressDispatcher:
+    """Fan numeric-target outputs into independent per-target queues.
+
+    ``send_to_ids()`` only enqueues, so it completes once the message is
+    queued, dropped, or, under ``EgressOverflowPolicy.BLOCK``, admitted after
+    waiting for space. One ``run_target()`` worker per target drains its queue
+    through the wrapped sender in FIFO order, optionally coalescing
+    consecutive messages into one datagram and pacing sends through token
+    buckets. A slow, stuck, or rate-limited destination therefore delays
+    only its own queue unless its policy is ``BLOCK``.
+    Worker send failures propagate to the worker's owner.
+    """
+
+    __slots__ = ("_sender", "_queues", "_all_target_ids")
+
+    def __init__(
+        self,
+        sender: EgressTargetSender,
+        settings: Iterable[EgressTargetQueueSettings],
+    ) -> None:
+        settings = tuple(settings)
+        if not all(
+            isinstance(target_settings, EgressTargetQueueSettings)
+            for target_settings in settings
+        ):
+            raise TypeError(
+                "settings must be an iterable of EgressTargetQueueSettings."
+            )
+        self._sender = sender
+        self._queues = tuple(
+            _TargetQueue(target_id, target_settings)
+            for target_id, target_settings in enumerate(settings)
+        )
+        self._all_target_ids = tuple(range(len(self._queues)))
+
+    @property
+    def all_target_ids(self) -> tuple[EgressTargetId, ...]:
+        return self._all_target_ids
+
+    async def send_to_ids(
+        self,
+        target_ids: Iterable[EgressTargetId],
+        message: bytes,
+    ) -> None:
+        """Enqueue one message once for each distinct target ID, in order."""
+
+        if type(message) is not bytes:
+            raise TypeError("message must be immutable bytes.")
+        queues = self._queues
+        for target_id in self._validate_target_ids(target_ids):
+            await queues[target_id].put(message)
+
+    async def run_target(self, target_id: EgressTargetId) -> None:
+        """Drain one target queue forever through the wrapped sender."""
+
+        (target_id,) = self._validate_target_ids((target_id,))
+        queue = self._queues[target_id]
+        if queue.coalesce_max_bytes is None:
+            await self._drain_each(queue, (target_id,))
+        else:
+            await self._drain_coalesced(queue, (target_id,))
+
+    async def _drain_each(
+        self,
+        queue: _TargetQueue,
+        target_ids: tuple[EgressTargetId],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        send_to_ids = self._sender.send_to_ids
+        shaped = queue.is_shaped
+        while True:
+            message = await queue.get()
+            if shaped:
+                delay = queue.shaping_delay(1, len(message), loop.time())
+                if delay:
+                    await asyncio.sleep(delay)
+            await send_to_ids(target_ids, message)
+            queue.sent(1)
+
+    async def _drain_coalesced(
+        self,
+        queue: _TargetQueue,
+        target_ids: tuple[EgressTargetId],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        send_to_ids = self._sender.send_to_ids
+        max_bytes = queue.coalesce_max_bytes
+        deadline = queue.coalesce_deadline
+        shaped = queue.is_shaped
+        carried = None
+        while True:
+            if carried is None:
+                message = await queue.get()
+            else:
+                message, carried = carried, None
+            parts = [message]
+            size = len(message)
+            if message.endswith(b"\r\n") and size < max_bytes:
+                flush_at = loop.time() + deadline
+                while size < max_bytes:
+                    following = queue.get_nowait()
+                    if following is None:
+                        remaining = flush_at - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            following = await asyncio.wait_for(
+                                queue.get(),
+                                remaining,
+                            )
+                        except asyncio.TimeoutError:
+                            break
+                    if (
+                        not following.endswith(b"\r\n")
+                        or size + len(following) > max_bytes
+                    ):
+                        carried = following
+                        break
+                    parts.append(following)
+                    size += len(following)
+
+            payload = message if len(parts) == 1 else b"".join(parts)
+            if shaped:
+                delay = queue.shaping_delay(
+                    len(parts),
+                    len(payload),
+                    loop.time(),
+                )
+                if delay:
+                    await asyncio.sleep(delay)
+            await send_to_ids(target_ids, payload)
+            queue.sent(len(parts))
+
+    def target_queue_snapshot(
+        self,
+    ) -> tuple[EgressTargetQueueMetricsSnapshot, ...]:
+        """Return fresh per-target queue snapshots in numeric order."""
+
+        return tuple(queue.snapshot() for queue in self._queues)
+
+    def _validate_target_ids(
+        self,
+        target_ids: Iterable[EgressTargetId],
+    ) -> tuple[EgressTargetId, ...]:
+        if isinstance(target_ids, (str, bytes)):
+            raise TypeError(
+                "target_ids must be an iterable of integer egress target IDs."
+            )
+
+        queue_count = len(self._queues)
+        ordered: list[EgressTargetId] = []
+        for target_id in target_ids:
+            if isinstance(target_id, bool) or not isinstance(target_id, int):
+                raise TypeError(
+                    "Egress target IDs must be integers, "
+                    f"got {type(target_id).__name__}."
+                )
+            if target_id < 0 or target_id >= queue_count:
+                raise UnknownEgressTargetError(
+                    f"Unknown egress target ID: {target_id}"
+                )
+            if target_id not in ordered:
+                ordered.append(target_id)
+        return tuple(ordered)
@@ -0,0 +1,148 @@
+"""Per-target position downsampling keyed by MMSI and message class.
+
+A forwarder with ``throttle_interval_s`` receives at most one position report
+per vessel and message class (class A, class B, long-range) in that interval;
+the others still go to every other target. Other messages are never
+throttled.
+
+Each throttled target keeps a dict from MMSI and class to the time it last
+received one. A key is moved to the end when it is refreshed, so the dict is
+ordered by last emission and expired keys are reclaimed from its front, a
+few per emission, which bounds it by the vessels heard within one interval.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+
+from core.ais_payload import FIELDS, AisPayloadError, dearmour
+from core.metrics import EmissionThrottleMetricsSnapshot
+from core.target_identity import EgressTargetId
+
+
+# Position report type character -> message class.
+_POSITION_CLASSES = {"1": 0, "2": 0, "3": 0, "B": 1, "C": 1, "K": 2}
+_MMSI_FIELD = FIELDS[1]["mmsi"]
+_MMSI_END = _MMSI_FIELD.offset + _MMSI_FIELD.width
+# Armour characters holding the MMSI, and the bits that follow it in them.
+_MMSI_CHARACTERS = -(-_MMSI_END // 6)
+_MMSI_SHIFT = _MMSI_CHARACTERS * 6 - _MMSI_END
+_MMSI_MASK = (1 << _MMSI_FIELD.width) - 1
+_RECLAIM_PER_EMIT = 2
+
+
+class EmissionThrottleConfigError(ValueError):
+    """Raised when a forwarder's ``throttle_interval_s`` is invalid."""
+
+
+class EmissionThrottle:
+    """Last-emission times of position reports for throttled targets.
+
+    ``intervals`` maps numeric target IDs to their minimum interval in
+    seconds between two position reports of one vessel and class.
+    ``suppressed`` counts the reports each of them did not receive.
+    """
+
+    __slots__ = ("intervals", "_tables", "suppressed")
+
+    def __init__(self, intervals: Mapping[EgressTargetId, float]) -> None:
+        for target_id, interval in intervals.items():
+            if not interval > 0:
+                raise ValueError(
+                    f"target {target_id} throttle interval must be positive."
+                )
+        self.intervals = dict(intervals)
+        self._tables: dict[EgressTargetId, dict[int, float]] = {
+            target_id: {} for target_id in intervals
+        }
+        self.suppressed: dict[EgressTargetId, int] = dict.fromkeys(intervals, 0)
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables.values())
+
+    def select(
+        self,
+        sentence: str,
+        target_ids: tuple[EgressTargetId, ...],
+        now: float,
+    ) -> tuple[EgressTargetId, ...]:
+        """Return the targets due to receive one sentence at ``now``.
+
+        Records the emission for every throttled target that is kept.
+        """
+
+        tables = self._tables
+        if tables.keys().isdisjoint(target_ids):
+            return target_ids
+        fields = sentence.split(",", 7)
+        if len(fields) < 7:
+            return target_ids
+        payload = fields[5]
+        message_class = _POSITION_CLASSES.get(payload[:1])
+        if message_class is None or len(payload) <= _MMSI_CHARACTERS:
+            return target_ids
+        try:
+            bits, _bit_count = dearmour(payload[:_MMSI_CHARACTERS])
+        except AisPayloadError:
+            return target_ids
+        key = (bits >> _MMSI_SHIFT & _MMSI_MASK) << 2 | message_class
+
+        intervals = self.intervals
+        kept = []
+        for target_id in target_ids:
+            table = tables.get(target_id)
+            if table is None:
+                kept.append(target_id)
+                continue
+            interval = intervals[target_id]
+            last = table.get(key)
+            # A clock stepping backwards must not silence a vessel.
+            if last is not None and 0 <= now - last < interval:
+                self.suppressed[target_id] += 1
+                continue
+            if last is not None:
+                del table[key]
+            table[key] = now
+            kept.append(target_id)
+            for _ in range(_RECLAIM_PER_EMIT):
+                oldest = next(iter(table))
+                if now - table[oldest] < interval:
+                    break
+                del table[oldest]
+        return tuple(kept)
+
+    def metrics_snapshot(self) -> tuple[EmissionThrottleMetricsSnapshot, ...]:
+        """Return the suppression counter of every throttled target."""
+
+        return tuple(
+            EmissionThrottleMetricsSnapshot(target_id=target_id, suppressed=count)
+            for target_id, count in sorted(self.suppressed.items())
+        )
+
+
+def load_optional_emission_throttle(
+    targets: Iterable[Mapping[str, object]],
+) -> EmissionThrottle | None:
+    """Read the optional ``throttle_interval_s`` field of every forwarder.
+
+    Returns ``None`` when no forwarder is throttled.
+    """
+
+    intervals = {}
+    for index, entry in enumerate(targets):
+        if "throttle_interval_s" not in entry:
+            continue
+        interval = entry["throttle_interval_s"]
+        if (
+            isinstance(interval, bool)
+            or not isinstance(interval, (int, float))
+            or not 0 < interval < float("inf")
+        ):
+            raise EmissionThrottleConfigError(
+                f"forwarders[{index}].throttle_interval_s must be a positive "
+                "number."
+            )
+        intervals[index] = float(interval)
+    if not intervals:
+        return None
+    return EmissionThrottle(intervals)
@@ -0,0 +1,216 @@
+"""Time-rotated archive files written by a background thread.
+
+The event loop only appends message bytes to an in-memory batch, bounded by
+``queue_max_bytes``; messages that would exceed it are dropped and counted.
+A dedicated writer thread swaps that batch out once per flush interval and
+writes it with one call, so disk latency never reaches the event loop. Files
+are named by the UTC start of their rotation period and may be gzip or zstd
+compressed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import threading
+import time
+from typing import Callable
+
+
+FILE_SINK_COMPRESSIONS = ("none", "gzip", "zstd")
+DEFAULT_FILE_SINK_ROTATE_INTERVAL_S = 3600
+DEFAULT_FILE_SINK_FLUSH_INTERVAL_MS = 1000
+DEFAULT_FILE_SINK_QUEUE_MAX_BYTES = 16 * 1024 * 1024
+
+_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+class FileSinkConfigError(ValueError):
+    """Raised when a file sink cannot be configured."""
+
+
+def load_zstd_compressor_factory() -> Callable[[], object]:
+    """Return ``zstandard.ZstdCompressor``, imported only when requested."""
+
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise FileSinkConfigError(
+            "compression: zstd requires the zstandard package"
+        ) from exc
+    return zstandard.ZstdCompressor
+
+
+class FileSinkWriter:
+    """Append batches of bytes to time-rotated files from a worker thread."""
+
+    __slots__ = (
+        "_directory",
+        "_prefix",
+        "_compression",
+        "_rotate_interval_s",
+        "_flush_interval_s",
+        "_queue_max_bytes",
+        "_wall_clock",
+        "_lock",
+        "_wakeup",
+        "_pending",
+        "_pending_bytes",
+        "_pending_since",
+        "_closing",
+        "_thread",
+        "_file",
+        "_period",
+        "bytes_written",
+        "rotations",
+        "write_errors",
+        "dropped",
+    )
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        prefix: str = "aismixer",
+        compression: str = "none",
+        rotate_interval_s: int = DEFAULT_FILE_SINK_ROTATE_INTERVAL_S,
+        flush_interval_ms: int = DEFAULT_FILE_SINK_FLUSH_INTERVAL_MS,
+        queue_max_bytes: int = DEFAULT_FILE_SINK_QUEUE_MAX_BYTES,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        if compression not in FILE_SINK_COMPRESSIONS:
+            raise FileSinkConfigError(
+                "compression must be one of: " + ", ".join(FILE_SINK_COMPRESSIONS)
+            )
+        if compression == "zstd":
+            load_zstd_compressor_factory()
+        self._directory = directory
+        self._prefix = prefix
+        self._compression = compression
+        self._rotate_interval_s = rotate_interval_s
+        self._flush_interval_s = flush_interval_ms / 1000
+        self._queue_max_bytes = queue_max_bytes
+        self._wall_clock = wall_clock
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._pending_since = None
+        self._closing = False
+        self._thread = None
+        self._file = None
+        self._period = None
+        self.bytes_written = 0
+        self.rotations = 0
+        self.write_errors = 0
+        self.dropped = 0
+
+    @property
+    def pending_bytes(self) -> int:
+        return self._pending_bytes
+
+    @property
+    def lag_us(self) -> int:
+        """Age of the oldest message not yet handed to the file."""
+
+        since = self._pending_since
+        if since is None:
+            return 0
+        return int((time.monotonic() - since) * 1e6)
+
+    def start(self) -> None:
+        os.makedirs(self._directory, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"file-sink-{self._prefix}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def write(self, data: bytes) -> None:
+        """Queue bytes for the next flush; never touches the disk.
+
+        Bytes that would take the queue past ``queue_max_bytes`` are dropped
+        and counted in ``dropped``.
+        """
+
+        with self._lock:
+            if self._pending_bytes + len(data) > self._queue_max_bytes:
+                self.dropped += 1
+                return
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending.append(data)
+            self._pending_bytes += len(data)
+
+    def close(self) -> None:
+        """Flush what is queued, close the current file, and stop the thread."""
+
+        if self._thread is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._closing:
+            self._wakeup.wait(self._flush_interval_s)
+            self._flush()
+        self._flush()
+        self._discard_file()
+
+    def _flush(self) -> None:
+        with self._lock:
+            batch = self._pending
+            size = self._pending_bytes
+            self._pending = []
+            self._pending_bytes = 0
+            self._pending_since = None
+        if not batch:
+            return
+        try:
+            self._current_file().write(b"".join(batch))
+            self._file.flush()
+        except Exception:
+            # Any failure, including a compressor or rotation error, loses
+            # only this batch; the thread lives on and reopens the file on
+            # the next flush.
+            self.write_errors += 1
+            self._discard_file()
+            return
+        self.bytes_written += size
+
+    def _discard_file(self) -> None:
+        file, self._file, self._period = self._file, None, None
+        if file is not None:
+            try:
+                file.close()
+            except Exception:
+                self.write_errors += 1
+
+    def _current_file(self):
+        period = int(self._wall_clock()) // self._rotate_interval_s
+        if period == self._period:
+            return self._file
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self.rotations += 1
+        self._file = self._open(period * self._rotate_interval_s)
+        self._period = period
+        return self._file
+
+    def _open(self, period_start: int):
+        stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(period_start))
+        path = os.path.join(
+            self._directory,
+            f"{self._prefix}-{stamp}.nmea{_SUFFIXES[self._compression]}",
+        )
+        if self._compression == "gzip":
+            return gzip.open(path, "ab")
+        raw = open(path, "ab")
+        if self._compression == "zstd":
+            compressor = load_zstd_compressor_factory()()
+            return compressor.stream_writer(raw, closefd=True)
+        return raw
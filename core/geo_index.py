@@ -0,0 +1,274 @@
+"""Geographic route areas and the uniform grid that locates positions in them.
+
+Areas are bounding boxes or simple polygons in WGS 84 longitude/latitude
+degrees. ``GeoGridIndex`` splits the globe into square cells once, when the
+routing table is compiled. A cell records the areas that cover it whole and
+the few whose border crosses it, so locating a position costs one dictionary
+lookup plus an exact test only for areas whose border is nearby, however many
+areas the table holds. Areas crossing the antimeridian must be split in two.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+import math
+
+
+DEFAULT_GEO_CELL_DEGREES = 0.5
+
+_NO_AREAS: frozenset[int] = frozenset()
+_EDGE_MARGIN = 1e-9
+
+Point = tuple[float, float]
+Bounds = tuple[float, float, float, float]
+
+
+@dataclass(frozen=True, slots=True)
+class GeoArea:
+    """One bounding box or simple polygon, in ``(lon, lat)`` degrees.
+
+    ``bounds`` is ``(min_lon, min_lat, max_lon, max_lat)``. A box contains its
+    border. A polygon derives ``bounds`` from its vertices and uses the
+    even-odd rule; its ring closes implicitly.
+    """
+
+    bounds: Bounds | None = None
+    polygon: tuple[Point, ...] | None = None
+
+    def __post_init__(self) -> None:
+        if (self.bounds is None) == (self.polygon is None):
+            raise ValueError("Route area must set exactly one of bbox or polygon.")
+        if self.polygon is not None:
+            polygon = tuple(_point(vertex) for vertex in self.polygon)
+            if len(polygon) < 3:
+                raise ValueError("Route area polygon needs at least 3 vertices.")
+            longitudes = [lon for lon, _lat in polygon]
+            latitudes = [lat for _lon, lat in polygon]
+            object.__setattr__(self, "polygon", polygon)
+            object.__setattr__(
+                self,
+                "bounds",
+                (min(longitudes), min(latitudes), max(longitudes), max(latitudes)),
+            )
+            return
+        bounds = _coordinates(self.bounds, 4, "bbox")
+        min_lon, min_lat, max_lon, max_lat = bounds
+        _check_point(min_lon, min_lat)
+        _check_point(max_lon, max_lat)
+        if min_lon > max_lon or min_lat > max_lat:
+            raise ValueError(
+                "Route area bbox must be [min_lon, min_lat, max_lon, max_lat]; "
+                "split areas crossing the antimeridian."
+            )
+        object.__setattr__(self, "bounds", bounds)
+
+    def contains(self, lon: float, lat: float) -> bool:
+        min_lon, min_lat, max_lon, max_lat = self.bounds
+        if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+            return False
+        polygon = self.polygon
+        return polygon is None or _polygon_contains(polygon, lon, lat)
+
+
+class GeoGridIndex:
+    """Uniform-grid index over a fixed tuple of areas.
+
+    ``locate(lon, lat)`` returns the positions of the areas, within
+    ``areas``, that contain the point. A cell no border crosses returns one
+    shared frozenset, so callers may key memos by results cheaply.
+    """
+
+    __slots__ = ("areas", "cell_degrees", "_scale", "_columns", "_rows", "_cells")
+
+    def __init__(
+        self,
+        areas: Sequence[GeoArea],
+        *,
+        cell_degrees: float = DEFAULT_GEO_CELL_DEGREES,
+    ) -> None:
+        if not 0 < cell_degrees <= 90:
+            raise ValueError("cell_degrees must be greater than 0 and at most 90.")
+        self.areas = tuple(areas)
+        self.cell_degrees = cell_degrees
+        self._scale = 1 / cell_degrees
+        self._columns = math.ceil(360 / cell_degrees)
+        self._rows = math.ceil(180 / cell_degrees)
+        inside: dict[int, list[int]] = {}
+        crossing: dict[int, list[int]] = {}
+        for area_id, area in enumerate(self.areas):
+            self._add_area(area_id, area, inside, crossing)
+        interned: dict[object, object] = {}
+        cells = {}
+        for key in inside.keys() | crossing.keys():
+            value = (
+                frozenset(inside.get(key, ())),
+                tuple(
+                    (area_id, self.areas[area_id])
+                    for area_id in crossing.get(key, ())
+                ),
+            )
+            cells[key] = interned.setdefault(value, value)
+        self._cells: dict[int, tuple[frozenset[int], tuple]] = cells
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def locate(self, lon: float, lat: float) -> frozenset[int]:
+        # _row and _column inlined; positions are already in range.
+        scale = self._scale
+        columns = self._columns
+        column = int((lon + 180) * scale)
+        row = int((lat + 90) * scale)
+        cell = self._cells.get(
+            (row - (row == self._rows)) * columns
+            + column
+            - (column == columns)
+        )
+        if cell is None:
+            return _NO_AREAS
+        inside, crossing = cell
+        if not crossing:
+            return inside
+        matched = [
+            area_id
+            for area_id, area in crossing
+            if area.contains(lon, lat)
+        ]
+        return inside.union(matched) if matched else inside
+
+    def _column(self, lon: float) -> int:
+        column = int((lon + 180) * self._scale)
+        return min(max(column, 0), self._columns - 1)
+
+    def _row(self, lat: float) -> int:
+        row = int((lat + 90) * self._scale)
+        return min(max(row, 0), self._rows - 1)
+
+    def _add_area(
+        self,
+        area_id: int,
+        area: GeoArea,
+        inside: dict[int, list[int]],
+        crossing: dict[int, list[int]],
+    ) -> None:
+        columns = self._columns
+        size = self.cell_degrees
+        border: set[int] = set()
+        edges = _area_edges(area)
+        for (x0, y0), (x1, y1) in edges:
+            for row in range(self._row(min(y0, y1)), self._row(max(y0, y1)) + 1):
+                low = max(min(y0, y1), row * size - 90)
+                high = min(max(y0, y1), (row + 1) * size - 90)
+                if y0 == y1:
+                    xs = (x0, x1)
+                else:
+                    xs = (
+                        x0 + (x1 - x0) * (low - y0) / (y1 - y0),
+                        x0 + (x1 - x0) * (high - y0) / (y1 - y0),
+                    )
+                # Widened so rounding never drops a cell the edge touches.
+                first = self._column(min(xs) - _EDGE_MARGIN)
+                last = self._column(max(xs) + _EDGE_MARGIN)
+                border.update(range(row * columns + first, row * columns + last + 1))
+
+        min_lon, min_lat, max_lon, max_lat = area.bounds
+        first_column = self._column(min_lon)
+        last_column = self._column(max_lon)
+        for row in range(self._row(min_lat), self._row(max_lat) + 1):
+            # Cells no border crosses are wholly in or out; one scanline
+            # through the row's centre decides every one of them.
+            centre = (row + 0.5) * size - 90
+            crossings = sorted(
+                x0 + (x1 - x0) * (centre - y0) / (y1 - y0)
+                for (x0, y0), (x1, y1) in edges
+                if (y0 > centre) != (y1 > centre)
+            )
+            passed = 0
+            for column in range(first_column, last_column + 1):
+                key = row * columns + column
+                if key in border:
+                    crossing.setdefault(key, []).append(area_id)
+                    continue
+                x = (column + 0.5) * size - 180
+                while passed < len(crossings) and crossings[passed] < x:
+                    passed += 1
+                if passed % 2:
+                    inside.setdefault(key, []).append(area_id)
+
+
+def load_geo_area(config: Mapping[str, object]) -> GeoArea:
+    """Convert one plain ``{bbox: ...}`` or ``{polygon: ...}`` mapping."""
+
+    if isinstance(config, GeoArea):
+        return config
+    if not isinstance(config, Mapping) or len(config) != 1:
+        raise TypeError(
+            "Route filter 'areas' entries must be mappings with one bbox or "
+            "polygon key."
+        )
+    (kind, value), = config.items()
+    if kind == "bbox":
+        return GeoArea(bounds=value)
+    if kind == "polygon":
+        if not isinstance(value, Iterable) or isinstance(value, str):
+            raise TypeError("Route area polygon must be a list of [lon, lat] pairs.")
+        return GeoArea(polygon=tuple(value))
+    raise ValueError(f"Route area has unknown field {kind!r}.")
+
+
+def _area_edges(area: GeoArea) -> tuple[tuple[Point, Point], ...]:
+    if area.polygon is None:
+        min_lon, min_lat, max_lon, max_lat = area.bounds
+        ring = (
+            (min_lon, min_lat),
+            (max_lon, min_lat),
+            (max_lon, max_lat),
+            (min_lon, max_lat),
+        )
+    else:
+        ring = area.polygon
+    return tuple(zip(ring, ring[1:] + ring[:1]))
+
+
+def _polygon_contains(polygon: tuple[Point, ...], lon: float, lat: float) -> bool:
+    contained = False
+    previous_lon, previous_lat = polygon[-1]
+    for vertex_lon, vertex_lat in polygon:
+        if (vertex_lat > lat) != (previous_lat > lat) and lon < (
+            vertex_lon
+            + (previous_lon - vertex_lon)
+            * (lat - vertex_lat)
+            / (previous_lat - vertex_lat)
+        ):
+            contained = not contained
+        previous_lon, previous_lat = vertex_lon, vertex_lat
+    return contained
+
+
+def _point(value: object) -> Point:
+    lon, lat = _coordinates(value, 2, "polygon vertex")
+    _check_point(lon, lat)
+    return lon, lat
+
+
+def _coordinates(value: object, count: int, name: str) -> tuple[float, ...]:
+    values = (
+        tuple(value)
+        if isinstance(value, Iterable) and not isinstance(value, str)
+        else ()
+    )
+    if len(values) != count or not all(
+        isinstance(coordinate, (int, float)) and not isinstance(coordinate, bool)
+        for coordinate in values
+    ):
+        raise TypeError(f"Route area {name} must be {count} numbers.")
+    return tuple(float(coordinate) for coordinate in values)
+
+
+def _check_point(lon: float, lat: float) -> None:
+    if not (-180 <= lon <= 180 and -90 <= lat <= 90):
+        raise ValueError(
+            "Route area coordinates must be longitudes in [-180, 180] and "
+            "latitudes in [-90, 90]."
+        )
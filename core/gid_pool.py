@@ -0,0 +1,109 @@
+"""Pooled generation of fixed-width numeric TAG group IDs."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import os
+
+
+DEFAULT_GID_POOL_SIZE = 256
+
+
+class NumericGroupIdPool:
+    """Refillable pool of uniformly distributed fixed-width numeric IDs.
+
+    Each refill draws one ``os.urandom`` block and derives up to ``pool_size``
+    IDs from it. Every candidate uses the smallest whole number of bytes that
+    covers the ``9 * 10 ** (digits - 1)`` ID range; candidates at or above the
+    largest multiple of that range are rejected, so accepted IDs are exactly
+    uniform over ``10 ** (digits - 1)`` through ``10 ** digits - 1``.
+
+    Instances are not thread-safe and are intended to be owned by one serial
+    processor. Calling the pool with a different digit count discards the
+    pooled IDs and refills for the new width.
+    """
+
+    __slots__ = (
+        "_pool_size",
+        "_random_bytes",
+        "_digits",
+        "_base",
+        "_span",
+        "_width",
+        "_limit",
+        "_pooled",
+        "_refills",
+    )
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_GID_POOL_SIZE,
+        *,
+        random_bytes: Callable[[int], bytes] | None = None,
+    ) -> None:
+        if isinstance(pool_size, bool) or not isinstance(pool_size, int):
+            raise TypeError("pool_size must be a positive integer.")
+        if pool_size < 1:
+            raise ValueError("pool_size must be a positive integer.")
+
+        self._pool_size = pool_size
+        self._random_bytes = (
+            os.urandom if random_bytes is None else random_bytes
+        )
+        self._digits: int | None = None
+        self._base = 0
+        self._span = 0
+        self._width = 0
+        self._limit = 0
+        self._pooled: list[str] = []
+        self._refills = 0
+
+    @property
+    def refills(self) -> int:
+        """Return how many random blocks have been drawn."""
+
+        return self._refills
+
+    def __call__(self, digits: int) -> str:
+        """Return one group ID with exactly ``digits`` decimal digits."""
+
+        if digits != self._digits:
+            self._configure(digits)
+        pooled = self._pooled
+        while not pooled:
+            self._refill()
+        return pooled.pop()
+
+    def _configure(self, digits: int) -> None:
+        if isinstance(digits, bool) or not isinstance(digits, int):
+            raise TypeError("digits must be a positive integer.")
+        if digits < 1:
+            raise ValueError("digits must be a positive integer.")
+
+        base = 10 ** (digits - 1)
+        span = 9 * base
+        width = ((span - 1).bit_length() + 7) // 8
+        self._digits = digits
+        self._base = base
+        self._span = span
+        self._width = width
+        self._limit = (256 ** width // span) * span
+        self._pooled.clear()
+
+    def _refill(self) -> None:
+        width = self._width
+        block = self._random_bytes(width * self._pool_size)
+        self._refills += 1
+
+        base = self._base
+        span = self._span
+        limit = self._limit
+        from_bytes = int.from_bytes
+        self._pooled.extend(
+            str(base + value % span)
+            for value in (
+                from_bytes(block[offset:offset + width], "big")
+                for offset in range(0, len(block) - width + 1, width)
+            )
+            if value < limit
+        )
@@ -0,0 +1,431 @@
+"""Per-route AIS message-type, MMSI and area filters.
+
+Filters read only the message type and MMSI, which the first seven armoured
+payload characters carry, and, for area filters, the position fields of
+position reports, so a message is never fully decoded. A message whose header
+cannot be read passes no filter.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+from core.ais_payload import SIXBIT_VALUES, AisPayloadError, dearmour
+from core.geo_index import GeoArea, GeoGridIndex, load_geo_area
+from core.target_identity import EgressTargetId
+
+
+MAX_AIS_MESSAGE_TYPE = 27
+MAX_MMSI = 999_999_999
+
+# A plain dict: the header path looks up seven characters per message.
+_SIXBIT = dict(SIXBIT_VALUES)
+_HEADER_CHARACTERS = 7
+# Headers repeat per vessel and message type, so a bounded memo keyed by the
+# seven characters serves nearly every message of a live feed.
+_SELECTION_CACHE_SIZE = 16384
+DEFAULT_VESSEL_POSITION_CAPACITY = 262_144
+
+
+def _position_layout(
+    offset: int,
+    width: int,
+    units: int,
+) -> tuple[int, int, int, int, int]:
+    """Locate a longitude field and the one-bit-narrower latitude after it.
+
+    Returns the payload character slice holding both, the longitude's shift
+    within the bits of that slice, its width, and the units per degree.
+    """
+
+    first = offset // 6
+    end = -(-(offset + 2 * width - 1) // 6)
+    return first, end, (end - first) * 6 - (offset - first * 6) - width, width, units
+
+
+# Only the characters holding the position are decoded.
+_POSITION_FIELDS = {
+    1: _position_layout(61, 28, 600_000),
+    2: _position_layout(61, 28, 600_000),
+    3: _position_layout(61, 28, 600_000),
+    18: _position_layout(57, 28, 600_000),
+    19: _position_layout(57, 28, 600_000),
+    27: _position_layout(44, 18, 600),
+}
+# Static and voyage data (5) and static data reports (24) carry no position;
+# area filters place them at the vessel's last reported position.
+_LAST_POSITION_TYPES = frozenset((5, 24))
+_NO_AREAS: frozenset[int] = frozenset()
+
+
+def decode_ais_header(sentence: str) -> tuple[int, int] | None:
+    """Return ``(message_type, mmsi)`` from an AIVDM/AIVDO sentence.
+
+    Only the payload field's first seven characters are decoded. ``None`` is
+    returned when the payload is shorter or not valid armour.
+    """
+
+    return _decode_header_characters(_header_characters(sentence))
+
+
+def decode_ais_position(sentence: str) -> tuple[float, float] | None:
+    """Return ``(lon, lat)`` in degrees from a type 1-3, 18, 19 or 27 report.
+
+    ``None`` is returned for other types, short payloads, and the
+    "not available" or out-of-range position values.
+    """
+
+    payload = _payload(sentence)
+    header = _decode_header_characters(payload[:_HEADER_CHARACTERS])
+    if header is None:
+        return None
+    return _decode_position(header[0], payload)
+
+
+def _payload(sentence: str) -> str:
+    fields = sentence.split(",", 6)
+    if len(fields) < 7:
+        return ""
+    return fields[5]
+
+
+def _header_characters(sentence: str) -> str:
+    return _payload(sentence)[:_HEADER_CHARACTERS]
+
+
+def _decode_header_characters(header: str) -> tuple[int, int] | None:
+    if len(header) < _HEADER_CHARACTERS:
+        return None
+    sixbit = _SIXBIT
+    try:
+        message_type = sixbit[header[0]]
+        mmsi = (
+            (sixbit[header[1]] & 0x0F) << 26
+            | sixbit[header[2]] << 20
+            | sixbit[header[3]] << 14
+            | sixbit[header[4]] << 8
+            | sixbit[header[5]] << 2
+            | sixbit[header[6]] >> 4
+        )
+    except KeyError:
+        return None
+    return message_type, mmsi
+
+
+def _decode_position(message_type: int, payload: str) -> tuple[float, float] | None:
+    fields = _POSITION_FIELDS.get(message_type)
+    if fields is None:
+        return None
+    first, end, shift, width, units = fields
+    if len(payload) < end:
+        return None
+    try:
+        bits, _bit_count = dearmour(payload[first:end])
+    except AisPayloadError:
+        return None
+    lon = bits >> shift & (1 << width) - 1
+    lat = bits >> shift - width + 1 & (1 << width - 1) - 1
+    if lon >= 1 << width - 1:
+        lon -= 1 << width
+    if lat >= 1 << width - 2:
+        lat -= 1 << width - 1
+    lon /= units
+    lat /= units
+    if not (-180 <= lon <= 180 and -90 <= lat <= 90):
+        return None
+    return lon, lat
+
+
+class VesselPositions:
+    """Bounded last-known position per MMSI, oldest update evicted first."""
+
+    __slots__ = ("_positions", "_capacity")
+
+    def __init__(self, capacity: int = DEFAULT_VESSEL_POSITION_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self._positions: dict[int, tuple[float, float]] = {}
+        self._capacity = capacity
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def get(self, mmsi: int) -> tuple[float, float] | None:
+        return self._positions.get(mmsi)
+
+    def update(self, mmsi: int, position: tuple[float, float]) -> None:
+        positions = self._positions
+        if positions.pop(mmsi, None) is None and len(positions) >= self._capacity:
+            del positions[next(iter(positions))]
+        positions[mmsi] = position
+
+
+@dataclass(frozen=True, slots=True)
+class MessageFilter:
+    """Message types and MMSIs one route is restricted to.
+
+    ``None`` leaves that field unrestricted. An MMSI passes when it is in
+    ``mmsis`` or inside any inclusive ``mmsi_ranges`` pair. A position passes
+    when it is inside any of ``areas``. Every restricted field must pass.
+    """
+
+    message_types: frozenset[int] | None = None
+    mmsis: frozenset[int] | None = None
+    mmsi_ranges: tuple[tuple[int, int], ...] = ()
+    areas: tuple[GeoArea, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.message_types is not None:
+            message_types = _int_set(self.message_types, "message_types")
+            if not all(
+                1 <= message_type <= MAX_AIS_MESSAGE_TYPE
+                for message_type in message_types
+            ):
+                raise ValueError(
+                    "Route filter 'message_types' values must be between 1 "
+                    f"and {MAX_AIS_MESSAGE_TYPE}."
+                )
+            object.__setattr__(self, "message_types", message_types)
+        if self.mmsis is not None:
+            mmsis = _int_set(self.mmsis, "mmsi")
+            if not all(0 <= mmsi <= MAX_MMSI for mmsi in mmsis):
+                raise ValueError(
+                    f"Route filter 'mmsi' values must be between 0 and {MAX_MMSI}."
+                )
+            object.__setattr__(self, "mmsis", mmsis)
+        object.__setattr__(
+            self,
+            "mmsi_ranges",
+            tuple(_mmsi_range(value) for value in self.mmsi_ranges),
+        )
+        areas = tuple(self.areas)
+        if not all(isinstance(area, GeoArea) for area in areas):
+            raise TypeError("Route filter 'areas' must contain GeoArea values.")
+        object.__setattr__(self, "areas", areas)
+        if (
+            self.message_types is None
+            and not self.restricts_mmsi
+            and not areas
+        ):
+            raise ValueError(
+                "Route filter must set at least one of message_types, mmsi, "
+                "mmsi_ranges, or areas."
+            )
+
+    @property
+    def restricts_mmsi(self) -> bool:
+        return self.mmsis is not None or bool(self.mmsi_ranges)
+
+    def matches(self, message_type: int, mmsi: int) -> bool:
+        if (
+            self.message_types is not None
+            and message_type not in self.message_types
+        ):
+            return False
+        if not self.restricts_mmsi:
+            return True
+        if self.mmsis is not None and mmsi in self.mmsis:
+            return True
+        return any(low <= mmsi <= high for low, high in self.mmsi_ranges)
+
+
+@dataclass(frozen=True, slots=True)
+class TargetFilter:
+    """Compiled per-source target selection for routes with filters.
+
+    ``clauses`` holds each matching route's filter (``None`` when the route
+    is unfiltered) and numeric targets in route order. ``select`` returns the
+    ordered unique targets of the clauses a message passes, memoised by the
+    payload header characters that decide it.
+
+    When a clause has areas, ``geo_index`` must index them and the memo key
+    also holds the areas containing the message's position. Position reports
+    record that position in ``positions``; type 5 and 24 messages are placed
+    at the last one recorded for their MMSI.
+    """
+
+    clauses: tuple[tuple[MessageFilter | None, tuple[EgressTargetId, ...]], ...]
+    geo_index: GeoGridIndex | None = field(
+        default=None,
+        repr=False,
+        compare=False,
+    )
+    positions: VesselPositions | None = field(
+        default=None,
+        repr=False,
+        compare=False,
+    )
+    _unlocated_clauses: tuple[int, ...] = field(
+        default=(),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _clauses_by_area: dict[int, tuple[int, ...]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _selections: dict[object, tuple[EgressTargetId, ...]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        geo_index = self.geo_index
+        area_ids = (
+            {}
+            if geo_index is None
+            else {area: area_id for area_id, area in enumerate(geo_index.areas)}
+        )
+        # Area clauses are reached through the areas a position is in, so a
+        # selection never scans the clauses of areas elsewhere.
+        unlocated_clauses = []
+        clauses_by_area: dict[int, list[int]] = {}
+        for index, (message_filter, _target_ids) in enumerate(self.clauses):
+            if message_filter is None or not message_filter.areas:
+                unlocated_clauses.append(index)
+                continue
+            if geo_index is None:
+                raise ValueError("TargetFilter with areas requires a geo_index.")
+            if not all(area in area_ids for area in message_filter.areas):
+                raise ValueError("TargetFilter geo_index lacks a clause area.")
+            for area in message_filter.areas:
+                clauses_by_area.setdefault(area_ids[area], []).append(index)
+        if geo_index is not None and self.positions is None:
+            object.__setattr__(self, "positions", VesselPositions())
+        object.__setattr__(self, "_unlocated_clauses", tuple(unlocated_clauses))
+        self._clauses_by_area.update(
+            (area_id, tuple(indexes))
+            for area_id, indexes in clauses_by_area.items()
+        )
+
+    def select(self, sentence: str) -> tuple[EgressTargetId, ...]:
+        if self.geo_index is not None:
+            return self._select_located(sentence)
+        header_characters = _header_characters(sentence)
+        selections = self._selections
+        target_ids = selections.get(header_characters)
+        if target_ids is None:
+            if len(selections) >= _SELECTION_CACHE_SIZE:
+                selections.clear()
+            target_ids = selections[header_characters] = self._select(
+                _decode_header_characters(header_characters),
+                _NO_AREAS,
+            )
+        return target_ids
+
+    def _select_located(self, sentence: str) -> tuple[EgressTargetId, ...]:
+        payload = _payload(sentence)
+        header_characters = payload[:_HEADER_CHARACTERS]
+        header = _decode_header_characters(header_characters)
+        area_ids = _NO_AREAS
+        if header is not None:
+            message_type, mmsi = header
+            if message_type in _LAST_POSITION_TYPES:
+                position = self.positions.get(mmsi)
+            else:
+                position = _decode_position(message_type, payload)
+                if position is not None:
+                    self.positions.update(mmsi, position)
+            if position is not None:
+                area_ids = self.geo_index.locate(*position)
+        key = (header_characters, area_ids)
+        selections = self._selections
+        target_ids = selections.get(key)
+        if target_ids is None:
+            if len(selections) >= _SELECTION_CACHE_SIZE:
+                selections.clear()
+            target_ids = selections[key] = self._select(header, area_ids)
+        return target_ids
+
+    def _select(
+        self,
+        header: tuple[int, int] | None,
+        area_ids: frozenset[int],
+    ) -> tuple[EgressTargetId, ...]:
+        indexes = self._unlocated_clauses
+        if area_ids:
+            clauses_by_area = self._clauses_by_area
+            indexes = sorted(set(indexes).union(*(
+                clauses_by_area.get(area_id, ()) for area_id in area_ids
+            )))
+        clauses = self.clauses
+        target_ids: list[EgressTargetId] = []
+        for index in indexes:
+            message_filter, clause_target_ids = clauses[index]
+            if message_filter is not None and (
+                header is None
+                or not message_filter.matches(header[0], header[1])
+            ):
+                continue
+            for target_id in clause_target_ids:
+                if target_id not in target_ids:
+                    target_ids.append(target_id)
+        return tuple(target_ids)
+
+
+def load_message_filter(config: Mapping[str, object]) -> MessageFilter:
+    """Convert a plain route ``filter`` mapping into a ``MessageFilter``."""
+
+    if isinstance(config, MessageFilter):
+        return config
+    if not isinstance(config, Mapping):
+        raise TypeError("Route 'filter' must be a mapping.")
+    valid_fields = {"message_types", "mmsi", "mmsi_ranges", "areas"}
+    unknown_fields = set(config) - valid_fields
+    if unknown_fields:
+        unknown = ", ".join(sorted(str(field) for field in unknown_fields))
+        raise ValueError(f"Route filter has unknown field(s): {unknown}.")
+    mmsi_ranges = config.get("mmsi_ranges", ())
+    if not isinstance(mmsi_ranges, Iterable) or isinstance(mmsi_ranges, str):
+        raise TypeError("Route filter 'mmsi_ranges' must be a list of pairs.")
+    areas = config.get("areas", ())
+    if not isinstance(areas, Iterable) or isinstance(areas, str):
+        raise TypeError("Route filter 'areas' must be a list of areas.")
+    return MessageFilter(
+        message_types=config.get("message_types"),
+        mmsis=config.get("mmsi"),
+        mmsi_ranges=tuple(mmsi_ranges),
+        areas=tuple(load_geo_area(area) for area in areas),
+    )
+
+
+def _int_set(values: object, field_name: str) -> frozenset[int]:
+    if not isinstance(values, Iterable) or isinstance(values, str):
+        raise TypeError(f"Route filter {field_name!r} must be a list of integers.")
+    values = tuple(values)
+    if not values or not all(
+        isinstance(value, int) and not isinstance(value, bool)
+        for value in values
+    ):
+        raise TypeError(
+            f"Route filter {field_name!r} must be a non-empty list of integers."
+        )
+    return frozenset(values)
+
+
+def _mmsi_range(value: object) -> tuple[int, int]:
+    bounds = (
+        tuple(value)
+        if isinstance(value, Iterable) and not isinstance(value, str)
+        else ()
+    )
+    if len(bounds) != 2 or not all(
+        isinstance(bound, int) and not isinstance(bound, bool)
+        for bound in bounds
+    ):
+        raise TypeError(
+            "Route filter 'mmsi_ranges' entries must be [low, high] integer pairs."
+        )
+    low, high = bounds
+    if not 0 <= low <= high <= MAX_MMSI:
+        raise ValueError(
+            "Route filter 'mmsi_ranges' entries must satisfy "
+            f"0 <= low <= high <= {MAX_MMSI}."
+        )
+    return low, high
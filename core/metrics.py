@@ -75,6 +75,8 @@ class ProcessorMetricsSnapshot:
     reset_failed: int
     reset_in_flight: int
 
+    gid_pool_refills: int
+
     def __post_init__(self) -> None:
         for field_name in (
             "process_calls",
@@ -88,6 +90,7 @@ class ProcessorMetricsSnapshot:
             "reset_completed",
             "reset_failed",
             "reset_in_flight",
+            "gid_pool_refills",
         ):
             value = getattr(self, field_name)
             if isinstance(value, bool) or not isinstance(value, int):
@@ -226,6 +229,19 @@ class OutputTrafficMetricsSnapshot:
     dispatch_failed: int
     messages: int
     bytes: int
+    buffered_bytes: int
+    buffer_drops: int
+    write_pauses: int
+    resolutions: int
+    resolve_failures: int
+    transport_failures: int
+    address_changes: int
+    resolve_latency_us: int
+    sink_bytes_written: int
+    sink_rotations: int
+    sink_write_errors: int
+    sink_dropped: int
+    sink_lag_us: int
 
     def __post_init__(self) -> None:
         if isinstance(self.target_id, bool) or not isinstance(
@@ -247,6 +263,167 @@ class OutputTrafficMetricsSnapshot:
             "dispatch_failed",
             "messages",
             "bytes",
+            "buffered_bytes",
+            "buffer_drops",
+            "write_pauses",
+            "resolutions",
+            "resolve_failures",
+            "transport_failures",
+            "address_changes",
+            "resolve_latency_us",
+            "sink_bytes_written",
+            "sink_rotations",
+            "sink_write_errors",
+            "sink_dropped",
+            "sink_lag_us",
+        ):
+            value = getattr(self, field_name)
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise TypeError(f"{field_name} must be an integer.")
+            if value < 0:
+                raise ValueError(f"{field_name} must be non-negative.")
+
+
+@dataclass(frozen=True, slots=True)
+class EgressTargetQueueMetricsSnapshot:
+    """Current depth and lifetime counters for one per-target egress queue."""
+
+    target_id: int
+    overflow_policy: str
+    capacity: int
+    depth: int
+    peak_depth: int
+    enqueued: int
+    dequeued: int
+    dropped: int
+    put_waits: int
+    sent_messages: int
+    sent_datagrams: int
+    shaped: int
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.overflow_policy, str):
+            raise TypeError("overflow_policy must be a non-empty string.")
+        if not self.overflow_policy:
+            raise ValueError("overflow_policy must be a non-empty string.")
+
+        for field_name in (
+            "target_id",
+            "capacity",
+            "depth",
+            "peak_depth",
+            "enqueued",
+            "dequeued",
+            "dropped",
+            "put_waits",
+            "sent_messages",
+            "sent_datagrams",
+            "shaped",
+        ):
+            value = getattr(self, field_name)
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise TypeError(f"{field_name} must be an integer.")
+            if value < 0:
+                raise ValueError(f"{field_name} must be non-negative.")
+
+        if self.capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        if self.depth > self.capacity:
+            raise ValueError("depth must not exceed capacity.")
+        if self.peak_depth < self.depth:
+            raise ValueError("peak_depth must not be below depth.")
+        if self.peak_depth > self.capacity:
+            raise ValueError("peak_depth must not exceed capacity.")
+        if self.sent_messages > self.dequeued:
+            raise ValueError("sent_messages must not exceed dequeued.")
+        if self.sent_datagrams > self.sent_messages:
+            raise ValueError("sent_datagrams must not exceed sent_messages.")
+
+
+@dataclass(frozen=True, slots=True)
+class TcpClientMetricsSnapshot:
+    """Current delivery state of one connected TCP fan-out client."""
+
+    client_id: int
+    peer: str
+    bytes: int
+    buffered_bytes: int
+    lag_us: int
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.peer, str):
+            raise TypeError("peer must be a string.")
+
+        for field_name in ("client_id", "bytes", "buffered_bytes", "lag_us"):
+            value = getattr(self, field_name)
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise TypeError(f"{field_name} must be an integer.")
+            if value < 0:
+                raise ValueError(f"{field_name} must be non-negative.")
+
+
+@dataclass(frozen=True, slots=True)
+class TcpServerMetricsSnapshot:
+    """Lifetime counters and connected clients of one TCP fan-out target."""
+
+    target_id: int
+    name: str | None
+    listen: str
+    accepted: int
+    rejected: int
+    evicted: int
+    clients: tuple[TcpClientMetricsSnapshot, ...]
+
+    def __post_init__(self) -> None:
+        if self.name is not None:
+            if not isinstance(self.name, str):
+                raise TypeError("name must be a non-empty string or None.")
+            if not self.name:
+                raise ValueError("name must be a non-empty string or None.")
+        if not isinstance(self.listen, str):
+            raise TypeError("listen must be a string.")
+
+        for field_name in ("target_id", "accepted", "rejected", "evicted"):
+            value = getattr(self, field_name)
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise TypeError(f"{field_name} must be an integer.")
+            if value < 0:
+                raise ValueError(f"{field_name} must be non-negative.")
+
+        try:
+            clients = tuple(self.clients)
+        except TypeError as exc:
+            raise TypeError(
+                "clients must be an iterable of TcpClientMetricsSnapshot."
+            ) from exc
+        object.__setattr__(self, "clients", clients)
+        for index, snapshot in enumerate(clients):
+            if not isinstance(snapshot, TcpClientMetricsSnapshot):
+                raise TypeError(
+                    "clients entries must be TcpClientMetricsSnapshot "
+                    f"instances; entry {index} is invalid."
+                )
+
+
+@dataclass(frozen=True, slots=True)
+class AnomalyMetricsSnapshot:
+    """Lifetime counters of the kinematic anomaly detector."""
+
+    checked: int
+    speed: int
+    teleport: int
+    duplicate_mmsi: int
+    out_of_range: int
+    tracked_vessels: int
+
+    def __post_init__(self) -> None:
+        for field_name in (
+            "checked",
+            "speed",
+            "teleport",
+            "duplicate_mmsi",
+            "out_of_range",
+            "tracked_vessels",
         ):
             value = getattr(self, field_name)
             if isinstance(value, bool) or not isinstance(value, int):
@@ -254,6 +431,28 @@ class OutputTrafficMetricsSnapshot:
             if value < 0:
                 raise ValueError(f"{field_name} must be non-negative.")
 
+        flagged = (
+            self.speed + self.teleport + self.duplicate_mmsi + self.out_of_range
+        )
+        if flagged > self.checked:
+            raise ValueError("flagged reports must not exceed checked.")
+
+
+@dataclass(frozen=True, slots=True)
+class EmissionThrottleMetricsSnapshot:
+    """Lifetime count of position reports withheld from one throttled target."""
+
+    target_id: int
+    suppressed: int
+
+    def __post_init__(self) -> None:
+        for field_name in ("target_id", "suppressed"):
+            value = getattr(self, field_name)
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise TypeError(f"{field_name} must be an integer.")
+            if value < 0:
+                raise ValueError(f"{field_name} must be non-negative.")
+
 
 @dataclass(frozen=True, slots=True)
 class RuntimeStatisticsSnapshot:
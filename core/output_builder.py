@@ -2,9 +2,55 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
+from enum import Enum
+from functools import lru_cache
+import time
 
-from meta_writer import wrap_with_meta
+
+_TAG_HEADER_CACHE_SIZE = 1024
+
+
+class OutputProfile(Enum):
+    """TAG-block fields one egress target receives with each sentence.
+
+    ``FULL`` is the canonical ``c``/``s``/``g`` framing. ``C_S`` keeps the
+    ``c`` and ``s`` fields on every sentence and omits ``g`` grouping; ``C``
+    and ``S`` keep only that one field; ``BARE`` sends the NMEA sentence
+    without a TAG block.
+    """
+
+    FULL = "full"
+    C_S = "cs"
+    C = "c"
+    S = "s"
+    BARE = "bare"
+
+
+DEFAULT_OUTPUT_PROFILE = OutputProfile.FULL
+
+
+class OutputProfileConfigError(ValueError):
+    """Raised when a forwarder output profile is invalid."""
+
+
+def load_target_output_profiles(
+    targets: Iterable[Mapping[str, object]],
+) -> tuple[OutputProfile, ...]:
+    """Read the optional ``output_profile`` field of every forwarder."""
+
+    profiles = []
+    for index, entry in enumerate(targets):
+        value = entry.get("output_profile", DEFAULT_OUTPUT_PROFILE.value)
+        try:
+            profiles.append(OutputProfile(value))
+        except ValueError:
+            allowed = ", ".join(profile.value for profile in OutputProfile)
+            raise OutputProfileConfigError(
+                f"forwarders[{index}].output_profile must be one of: "
+                f"{allowed}."
+            ) from None
+    return tuple(profiles)
 
 
 def build_output_bytes(
@@ -16,14 +62,150 @@ def build_output_bytes(
     *,
     clock: Callable[[], float] | None = None,
 ) -> bytes:
-    """Format, frame, and UTF-8 encode one output NMEA sentence."""
+    """Format, frame, and UTF-8 encode one output NMEA sentence.
+
+    The result is byte-identical to UTF-8 encoding the canonical
+    ``wrap_with_meta()`` text followed by CRLF. Formatted ``\\c:...,s:...``
+    headers and their partial checksums are cached per timestamp and station
+    value, so sentences sharing one second and one ``s`` value reuse them.
+    """
+
+    if not timestamp:
+        wall_clock = time.time if clock is None else clock
+        timestamp = int(wall_clock())
+
+    # Mirror the canonical writer's short-line fallback without splitting.
+    if nmea_line.count(",") < 3:
+        return (nmea_line + "\r\n").encode("utf-8")
+
+    if not g_triplet:
+        return b"".join((
+            _c_s_header(f"{timestamp}", station_id)[2],
+            nmea_line.encode("utf-8"),
+            b"\r\n",
+        ))
+
+    if is_first:
+        prefix, checksum, _header = _c_s_header(f"{timestamp}", station_id)
+        g_text = f",g:{g_triplet}"
+    else:
+        prefix, checksum = b"\\", 0
+        g_text = f"g:{g_triplet}"
+    checksum ^= _text_checksum(g_text)
+
+    return b"".join((
+        prefix,
+        g_text.encode("utf-8"),
+        b"*",
+        _hex_checksum(checksum),
+        b"\\",
+        nmea_line.encode("utf-8"),
+        b"\r\n",
+    ))
+
+
+def build_single_output_bytes(
+    nmea_line: str,
+    station_id: str,
+    timestamp: int | str | None = None,
+    g_triplet: str | None = None,
+    *,
+    clock: Callable[[], float] | None = None,
+) -> bytes:
+    """Frame one single-sentence output.
+
+    Equivalent to ``build_output_bytes()`` with ``is_first=True``.
+    """
 
-    wrapped_text = wrap_with_meta(
+    return build_output_bytes(
         nmea_line,
         station_id,
         timestamp,
-        is_first=is_first,
-        g_triplet=g_triplet,
+        True,
+        g_triplet,
         clock=clock,
     )
-    return (wrapped_text + "\r\n").encode("utf-8")
+
+
+def build_profile_output_bytes(
+    profile: OutputProfile,
+    nmea_line: str,
+    station_id: str,
+    timestamp: int | str | None = None,
+    is_first: bool = True,
+    g_triplet: str | None = None,
+    *,
+    clock: Callable[[], float] | None = None,
+) -> bytes:
+    """Frame one output sentence for one output profile.
+
+    ``OutputProfile.FULL`` is exactly ``build_output_bytes()``. The other
+    profiles ignore ``is_first`` and ``g_triplet`` and put the same reduced
+    header on every sentence; short lines stay unframed as in every profile.
+    """
+
+    if profile is OutputProfile.FULL:
+        return build_output_bytes(
+            nmea_line,
+            station_id,
+            timestamp,
+            is_first,
+            g_triplet,
+            clock=clock,
+        )
+    if profile is OutputProfile.BARE or nmea_line.count(",") < 3:
+        return (nmea_line + "\r\n").encode("utf-8")
+
+    if not timestamp:
+        wall_clock = time.time if clock is None else clock
+        timestamp = int(wall_clock())
+    if profile is OutputProfile.C_S:
+        header = _c_s_header(f"{timestamp}", station_id)[2]
+    elif profile is OutputProfile.C:
+        header = _single_field_header(f"c:{timestamp}")
+    else:
+        header = _single_field_header(f"s:{station_id}")
+    return b"".join((header, nmea_line.encode("utf-8"), b"\r\n"))
+
+
+def _text_checksum(text: str) -> int:
+    checksum = 0
+    for character in text:
+        checksum ^= ord(character)
+    return checksum
+
+
+@lru_cache(maxsize=_TAG_HEADER_CACHE_SIZE)
+def _c_s_header(timestamp_text: str, station_id: str) -> tuple[bytes, int, bytes]:
+    """Return the open prefix, its checksum, and the closed c/s header."""
+
+    content = f"c:{timestamp_text},s:{station_id}"
+    checksum = _text_checksum(content)
+    prefix = ("\\" + content).encode("utf-8")
+    return prefix, checksum, b"".join((
+        prefix,
+        b"*",
+        _hex_checksum(checksum),
+        b"\\",
+    ))
+
+
+@lru_cache(maxsize=_TAG_HEADER_CACHE_SIZE)
+def _single_field_header(content: str) -> bytes:
+    return b"".join((
+        ("\\" + content).encode("utf-8"),
+        b"*",
+        _hex_checksum(_text_checksum(content)),
+        b"\\",
+    ))
+
+
+def _hex_checksum(checksum: int) -> bytes:
+    if checksum < 0x100:
+        return _HEX_CHECKSUMS[checksum]
+    # The canonical writer formats with "{:02X}", which widens checksums of
+    # TAG text containing code points above U+00FF.
+    return f"{checksum:02X}".encode("ascii")
+
+
+_HEX_CHECKSUMS = tuple(f"{value:02X}".encode("ascii") for value in range(0x100))
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
-from secrets import randbelow
 import time
 
 from assembler import AIVDMAssembler, AssemblyKey, AssemblyStatus
+from core.anomaly_detection import AnomalyDetector
 from core.data_plane import (
     DeduplicationMode,
     OutputBatch,
@@ -15,16 +15,50 @@ from core.data_plane import (
     ProcessorOutput,
     ProcessorResetReport,
 )
+from core.emission_throttle import EmissionThrottle
+from core.gid_pool import NumericGroupIdPool
 from core.ingress_frame import IngressFrame
 from core.metrics import ProcessorMetricsSnapshot
-from core.output_builder import build_output_bytes
-from core.parsed_sentence import parse_frame_sentences, parse_leading_s_value
+from core.output_builder import (
+    DEFAULT_OUTPUT_PROFILE,
+    OutputProfile,
+    build_output_bytes,
+    build_profile_output_bytes,
+    build_single_output_bytes,
+)
+from core.parsed_sentence import (
+    ParsedSentence,
+    parse_frame_sentences,
+    parse_leading_s_value,
+)
 from core.s_policy import choose_s_value_from_candidates
 from core.state.s_cache import SourceState
 from core.target_identity import EgressTargetId
+from core.vessel_table import VesselTable
 from dedup import Deduplicator
 
 
+_MULTIPART_CONTEXT_STATUSES = frozenset((
+    AssemblyStatus.PENDING,
+    AssemblyStatus.DUPLICATE,
+    AssemblyStatus.COMPLETE,
+))
+_INCOMPLETE_STATUSES = frozenset((
+    AssemblyStatus.PENDING,
+    AssemblyStatus.DUPLICATE,
+))
+_OUTPUTLESS_STATUSES = frozenset((
+    AssemblyStatus.INVALID,
+    AssemblyStatus.LIMIT_EXCEEDED,
+    AssemblyStatus.PENDING,
+    AssemblyStatus.DUPLICATE,
+    AssemblyStatus.CONFLICT,
+))
+# Filters, throttling and anomaly routing can produce many distinct target
+# sets, so the per-set profile grouping memo keeps only the newest ones.
+_PROFILE_GROUPS_MAX = 1024
+
+
 @dataclass(frozen=True, slots=True)
 class _ProcessingConfig:
     station_id: str | None
@@ -32,13 +66,9 @@ class _ProcessingConfig:
     preserve_ingress_gid: bool
     always_tag_single: bool
     gid_digits: int
-
-
-def _generate_numeric_gid_fixed(digits: int) -> str:
-    """Return a cryptographically secure fixed-width numeric group ID."""
-
-    base = 10 ** (digits - 1)
-    return str(base + randbelow(9 * base))
+    single_fast_path: bool
+    target_profiles: tuple[OutputProfile, ...]
+    profiled: bool
 
 
 class PythonDataPlaneProcessor:
@@ -49,6 +79,35 @@ class PythonDataPlaneProcessor:
     by that processor and must not be shared or reset externally. Calls to
     ``process()`` and ``reset()`` are intentionally synchronous and must be
     serialized by the owner; this class adds no locking or worker lifecycle.
+
+    ``AssemblyStatus.SINGLE`` outcomes take a fast path that performs no
+    multipart metadata bookkeeping and frames output from preassembled byte
+    templates. ``single_fast_path=False`` routes them through the general
+    path instead; both paths emit identical bytes and exist side by side for
+    differential testing.
+
+    Without an injected ``gid_generator``, generated group IDs come from an
+    owned ``NumericGroupIdPool`` whose refills are reported as
+    ``gid_pool_refills``; an injected generator reports zero refills.
+
+    ``target_profiles`` assigns an ``OutputProfile`` per numeric target ID;
+    unlisted targets use ``OutputProfile.FULL``. When any target uses another
+    profile, each emitted sentence is rendered once per distinct profile among
+    its eligible targets, and every profile becomes its own
+    ``ProcessorOutput`` whose bytes are shared by the targets using it.
+
+    An injected ``vessel_table`` is updated from every position report the
+    processor emits, stamped with ``wall_clock`` and the frame's source ID.
+    Deduplicated copies do not update it, and ``reset()`` leaves it intact.
+
+    An injected ``anomaly_detector`` checks the same position reports before
+    they are rendered. A flagged report is counted and, when the detector
+    names a target, also sent to it or sent to it alone; its bytes are
+    unchanged.
+
+    An injected ``emission_throttle`` then drops throttled targets that
+    received a position report of the same vessel and class too recently.
+    A report left with no targets is not rendered.
     """
 
     __slots__ = (
@@ -57,7 +116,12 @@ class PythonDataPlaneProcessor:
         "_deduplicator",
         "_wall_clock",
         "_gid_generator",
+        "_gid_pool",
+        "_profile_groups",
         "_source_state",
+        "_vessel_table",
+        "_anomaly_detector",
+        "_emission_throttle",
         "_multipart_s_ctx",
         "_multipart_c_ctx",
         "_multipart_gid_ctx",
@@ -87,14 +151,34 @@ class PythonDataPlaneProcessor:
         wall_clock: Callable[[], float] | None = None,
         gid_generator: Callable[[int], str] | None = None,
         source_state: SourceState | None = None,
+        single_fast_path: bool = True,
+        target_profiles: Sequence[OutputProfile] = (),
+        vessel_table: VesselTable | None = None,
+        anomaly_detector: AnomalyDetector | None = None,
+        emission_throttle: EmissionThrottle | None = None,
     ) -> None:
+        target_profiles = tuple(target_profiles)
+        if not all(
+            isinstance(profile, OutputProfile) for profile in target_profiles
+        ):
+            raise TypeError("target_profiles must contain OutputProfile values.")
         self._config = _ProcessingConfig(
             station_id=station_id,
             preserve_ingress_c=preserve_ingress_c,
             preserve_ingress_gid=preserve_ingress_gid,
             always_tag_single=always_tag_single,
             gid_digits=gid_digits,
+            single_fast_path=single_fast_path,
+            target_profiles=target_profiles,
+            profiled=any(
+                profile is not DEFAULT_OUTPUT_PROFILE
+                for profile in target_profiles
+            ),
         )
+        self._profile_groups: dict[
+            tuple[EgressTargetId, ...],
+            tuple[tuple[OutputProfile, tuple[EgressTargetId, ...]], ...],
+        ] = {}
         self._assembler = (
             AIVDMAssembler()
             if assembler is None
@@ -106,14 +190,22 @@ class PythonDataPlaneProcessor:
             else deduplicator
         )
         self._wall_clock = time.time if wall_clock is None else wall_clock
+        self._gid_pool = (
+            NumericGroupIdPool()
+            if gid_generator is None
+            else None
+        )
         self._gid_generator = (
-            _generate_numeric_gid_fixed
+            self._gid_pool
             if gid_generator is None
             else gid_generator
         )
         self._source_state = (
             SourceState() if source_state is None else source_state
         )
+        self._vessel_table = vessel_table
+        self._anomaly_detector = anomaly_detector
+        self._emission_throttle = emission_throttle
         self._multipart_s_ctx: dict[AssemblyKey, str] = {}
         self._multipart_c_ctx: dict[AssemblyKey, int] = {}
         self._multipart_gid_ctx: dict[AssemblyKey, frozenset[str]] = {}
@@ -164,6 +256,7 @@ class PythonDataPlaneProcessor:
 
         deduplication_mode = snapshot.deduplication_mode
         route_target_ids = snapshot.target_ids
+        target_filter = snapshot.target_filter
 
         leading_s = parse_leading_s_value(frame)
         parsed_sentences = parse_frame_sentences(
@@ -172,7 +265,30 @@ class PythonDataPlaneProcessor:
         )
         outputs: list[ProcessorOutput] = []
 
+        single_fast_path = self._config.single_fast_path
+
         for parsed in parsed_sentences:
+            outcome = self._assembler.feed_parsed_outcome(parsed)
+
+            # SINGLE outcomes never carry a group key or discarded keys, so
+            # they cannot read or invalidate multipart metadata.
+            if single_fast_path and outcome.status is AssemblyStatus.SINGLE:
+                sentence = outcome.sentences[0]
+                self._process_single(
+                    frame,
+                    parsed,
+                    sentence,
+                    leading_s,
+                    deduplication_mode,
+                    (
+                        route_target_ids
+                        if target_filter is None
+                        else target_filter.select(sentence)
+                    ),
+                    outputs,
+                )
+                continue
+
             g_value = parsed.tag.g_value
             current_ingress_gid = (
                 g_value.preservable_group_id
@@ -187,18 +303,12 @@ class PythonDataPlaneProcessor:
             )
             timestamp_for_header: int | str | None = valid_c
 
-            outcome = self._assembler.feed_parsed_outcome(parsed)
-
             # Discard old generations before current-arrival metadata can seed
             # a fresh generation with the same assembly key.
             self._discard_multipart_contexts(outcome.discarded_keys)
 
             if (
-                outcome.status in {
-                    AssemblyStatus.PENDING,
-                    AssemblyStatus.DUPLICATE,
-                    AssemblyStatus.COMPLETE,
-                }
+                outcome.status in _MULTIPART_CONTEXT_STATUSES
                 and outcome.group_key is not None
                 and valid_c is not None
             ):
@@ -210,11 +320,7 @@ class PythonDataPlaneProcessor:
                 )
 
             if (
-                outcome.status in {
-                    AssemblyStatus.PENDING,
-                    AssemblyStatus.DUPLICATE,
-                    AssemblyStatus.COMPLETE,
-                }
+                outcome.status in _MULTIPART_CONTEXT_STATUSES
                 and outcome.group_key is not None
                 and self._config.preserve_ingress_gid
                 and current_ingress_gid is not None
@@ -228,23 +334,14 @@ class PythonDataPlaneProcessor:
                 )
 
             if (
-                outcome.status in {
-                    AssemblyStatus.PENDING,
-                    AssemblyStatus.DUPLICATE,
-                }
+                outcome.status in _INCOMPLETE_STATUSES
                 and outcome.group_key is not None
                 and parsed.tag.s_value is not None
                 and g_value is not None
             ):
                 self._multipart_s_ctx[outcome.group_key] = parsed.tag.s_value
 
-            if outcome.status in {
-                AssemblyStatus.INVALID,
-                AssemblyStatus.LIMIT_EXCEEDED,
-                AssemblyStatus.PENDING,
-                AssemblyStatus.DUPLICATE,
-                AssemblyStatus.CONFLICT,
-            }:
+            if outcome.status in _OUTPUTLESS_STATUSES:
                 continue
 
             multipart = outcome.sentences
@@ -294,25 +391,43 @@ class PythonDataPlaneProcessor:
                 else tuple(multipart)
             )
 
-            eligible_target_ids: tuple[EgressTargetId, ...] = ()
-            if deduplication_mode is DeduplicationMode.GLOBAL:
-                eligible_target_ids = route_target_ids
-                emit_group = self._deduplicator.is_unique(logical_key)
-            elif deduplication_mode is DeduplicationMode.PER_TARGET:
-                eligible_target_ids = tuple(
-                    target_id
-                    for target_id in route_target_ids
-                    if self._deduplicator.is_unique(
-                        logical_key,
-                        scope=target_id,
-                    )
+            # A multipart group is filtered once, on completion, by the
+            # header its first fragment carries.
+            emit_group, eligible_target_ids = self._deduplicate(
+                logical_key,
+                deduplication_mode,
+                (
+                    route_target_ids
+                    if target_filter is None
+                    else target_filter.select(multipart[0])
+                ),
+            )
+
+            if (
+                emit_group
+                and total_parts == 1
+                and self._anomaly_detector is not None
+                and self._anomaly_detector.check(
+                    multipart[0],
+                    self._wall_clock(),
                 )
-                emit_group = bool(eligible_target_ids)
-            else:
-                raise AssertionError(
-                    "Unsupported deduplication mode: "
-                    f"{deduplication_mode!r}"
+            ):
+                eligible_target_ids = self._anomaly_detector.flagged_targets(
+                    eligible_target_ids
                 )
+            throttled = False
+            if (
+                emit_group
+                and total_parts == 1
+                and eligible_target_ids
+                and self._emission_throttle is not None
+            ):
+                eligible_target_ids = self._emission_throttle.select(
+                    multipart[0],
+                    eligible_target_ids,
+                    self._wall_clock(),
+                )
+                throttled = not eligible_target_ids
 
             incoming_s = parsed.tag.s_value
             if (
@@ -324,7 +439,7 @@ class PythonDataPlaneProcessor:
                 )
 
             for index, full_line in enumerate(
-                multipart if emit_group else ()
+                multipart if emit_group and not throttled else ()
             ):
                 is_first = index == 0
                 source_name_or_id = frame.alias_for_s or incoming_s
@@ -343,6 +458,18 @@ class PythonDataPlaneProcessor:
                 else:
                     g_triplet = None
 
+                if self._config.profiled:
+                    self._append_profile_outputs(
+                        outputs,
+                        eligible_target_ids,
+                        full_line,
+                        s_value,
+                        timestamp_for_header,
+                        is_first,
+                        g_triplet,
+                    )
+                    continue
+
                 message = build_output_bytes(
                     full_line,
                     s_value,
@@ -358,6 +485,17 @@ class PythonDataPlaneProcessor:
                     )
                 )
 
+            if (
+                emit_group
+                and total_parts == 1
+                and self._vessel_table is not None
+            ):
+                self._vessel_table.observe(
+                    multipart[0],
+                    frame.source_id,
+                    self._wall_clock(),
+                )
+
             # Normal completion consumes metadata even when routing or
             # deduplication suppresses every output.
             if (
@@ -368,6 +506,185 @@ class PythonDataPlaneProcessor:
 
         return OutputBatch(outputs=tuple(outputs))
 
+    def _process_single(
+        self,
+        frame: IngressFrame,
+        parsed: ParsedSentence,
+        sentence: str,
+        leading_s: str | None,
+        deduplication_mode: DeduplicationMode,
+        route_target_ids: tuple[EgressTargetId, ...],
+        outputs: list[ProcessorOutput],
+    ) -> None:
+        """Emit one ``SINGLE`` outcome without multipart bookkeeping."""
+
+        config = self._config
+        tag = parsed.tag
+
+        g_triplet = None
+        if config.always_tag_single:
+            g_value = tag.g_value
+            if (
+                config.preserve_ingress_gid
+                and g_value is not None
+                and g_value.preservable_group_id is not None
+            ):
+                output_gid = g_value.preservable_group_id
+            else:
+                output_gid = self._gid_generator(config.gid_digits)
+            g_triplet = f"1-1-{output_gid}"
+
+        emit, eligible_target_ids = self._deduplicate(
+            sentence,
+            deduplication_mode,
+            route_target_ids,
+        )
+        if not emit:
+            return
+        detector = self._anomaly_detector
+        if detector is not None and detector.check(
+            sentence,
+            self._wall_clock(),
+        ):
+            eligible_target_ids = detector.flagged_targets(eligible_target_ids)
+        if self._vessel_table is not None:
+            self._vessel_table.observe(
+                sentence,
+                frame.source_id,
+                self._wall_clock(),
+            )
+        throttle = self._emission_throttle
+        if throttle is not None and eligible_target_ids:
+            eligible_target_ids = throttle.select(
+                sentence,
+                eligible_target_ids,
+                self._wall_clock(),
+            )
+            if not eligible_target_ids:
+                return
+
+        s_value = choose_s_value_from_candidates(
+            config.station_id,
+            frame.alias_for_s or tag.s_value,
+            leading_s,
+            frame.remote_ip,
+        )
+        self._source_state.touch_s(s_value)
+
+        timestamp = tag.c_value if config.preserve_ingress_c else None
+        if config.profiled:
+            self._append_profile_outputs(
+                outputs,
+                eligible_target_ids,
+                sentence,
+                s_value,
+                timestamp,
+                True,
+                g_triplet,
+            )
+            return
+
+        message = build_single_output_bytes(
+            sentence,
+            s_value,
+            timestamp,
+            g_triplet,
+            clock=self._wall_clock,
+        )
+        outputs.append(
+            ProcessorOutput(
+                message=message,
+                target_ids=eligible_target_ids,
+            )
+        )
+
+    def _append_profile_outputs(
+        self,
+        outputs: list[ProcessorOutput],
+        target_ids: tuple[EgressTargetId, ...],
+        nmea_line: str,
+        s_value: str,
+        timestamp: int | str | None,
+        is_first: bool,
+        g_triplet: str | None,
+    ) -> None:
+        """Render one sentence once per distinct profile of its targets."""
+
+        if not timestamp:
+            # One clock reading keeps the c field identical across profiles.
+            timestamp = int(self._wall_clock())
+        profile_groups = self._profile_groups
+        groups = profile_groups.get(target_ids)
+        if groups is None:
+            groups = self._group_targets_by_profile(target_ids)
+            if len(profile_groups) >= _PROFILE_GROUPS_MAX:
+                del profile_groups[next(iter(profile_groups))]
+            profile_groups[target_ids] = groups
+        for profile, profile_target_ids in groups:
+            outputs.append(
+                ProcessorOutput(
+                    message=build_profile_output_bytes(
+                        profile,
+                        nmea_line,
+                        s_value,
+                        timestamp,
+                        is_first,
+                        g_triplet,
+                    ),
+                    target_ids=profile_target_ids,
+                )
+            )
+
+    def _group_targets_by_profile(
+        self,
+        target_ids: tuple[EgressTargetId, ...],
+    ) -> tuple[tuple[OutputProfile, tuple[EgressTargetId, ...]], ...]:
+        """Group targets by profile in order of each profile's first target."""
+
+        if not target_ids:
+            return ((DEFAULT_OUTPUT_PROFILE, ()),)
+        target_profiles = self._config.target_profiles
+        grouped: dict[OutputProfile, list[EgressTargetId]] = {}
+        for target_id in target_ids:
+            profile = (
+                target_profiles[target_id]
+                if target_id < len(target_profiles)
+                else DEFAULT_OUTPUT_PROFILE
+            )
+            grouped.setdefault(profile, []).append(target_id)
+        return tuple(
+            (profile, tuple(profile_target_ids))
+            for profile, profile_target_ids in grouped.items()
+        )
+
+    def _deduplicate(
+        self,
+        logical_key: str | tuple[str, ...],
+        deduplication_mode: DeduplicationMode,
+        route_target_ids: tuple[EgressTargetId, ...],
+    ) -> tuple[bool, tuple[EgressTargetId, ...]]:
+        """Return whether to emit one logical message and to which targets."""
+
+        if deduplication_mode is DeduplicationMode.GLOBAL:
+            return (
+                self._deduplicator.is_unique(logical_key),
+                route_target_ids,
+            )
+        if deduplication_mode is DeduplicationMode.PER_TARGET:
+            eligible_target_ids = tuple(
+                target_id
+                for target_id in route_target_ids
+                if self._deduplicator.is_unique(
+                    logical_key,
+                    scope=target_id,
+                )
+            )
+            return bool(eligible_target_ids), eligible_target_ids
+        raise AssertionError(
+            "Unsupported deduplication mode: "
+            f"{deduplication_mode!r}"
+        )
+
     def reset(self) -> ProcessorResetReport:
         """Reset assembler, deduplicator, source state, then metadata.
 
@@ -432,6 +749,9 @@ class PythonDataPlaneProcessor:
             reset_completed=self._reset_completed,
             reset_failed=self._reset_failed,
             reset_in_flight=self._reset_in_flight,
+            gid_pool_refills=(
+                0 if self._gid_pool is None else self._gid_pool.refills
+            ),
         )
 
     def _discard_multipart_contexts(
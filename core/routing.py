@@ -11,6 +11,13 @@ from dataclasses import dataclass, field
 from types import MappingProxyType
 from typing import Iterable, Mapping, Sequence, TypeAlias
 
+from core.geo_index import GeoGridIndex
+from core.message_filter import (
+    MessageFilter,
+    TargetFilter,
+    VesselPositions,
+    load_message_filter,
+)
 from core.target_identity import EgressTargetId, freeze_target_id_by_name
 
 
@@ -18,6 +25,20 @@ SourceId: TypeAlias = str
 TargetId: TypeAlias = str
 ZoneName: TypeAlias = str
 
+ROUTING_PATCH_OPERATIONS = (
+    "add_source",
+    "remove_source",
+    "add_target",
+    "remove_target",
+)
+# Plain-config field naming each operation's subject and value.
+_PATCH_FIELDS = {
+    "add_source": ("zone", "source"),
+    "remove_source": ("zone", "source"),
+    "add_target": ("route", "target"),
+    "remove_target": ("route", "target"),
+}
+
 
 class ZoneResolutionError(ValueError):
     """Base exception for invalid or unresolvable zone definitions."""
@@ -53,20 +74,51 @@ class ZoneDefinition:
 
 @dataclass(frozen=True, slots=True)
 class RouteDefinition:
-    """A route from one named zone to one or more opaque target IDs."""
+    """A route from one named zone to one or more opaque target IDs.
+
+    An optional ``filter`` restricts the route's numeric targets to messages
+    of the listed AIS types, MMSIs and areas. Descriptive matching by source
+    ignores it.
+    """
 
     name: str
     from_zone: ZoneName
     to: tuple[TargetId, ...]
+    filter: MessageFilter | None = None
 
     def __post_init__(self) -> None:
         if not isinstance(self.name, str) or not isinstance(self.from_zone, str):
             raise TypeError("Route 'name' and 'from_zone' values must be strings.")
         if not isinstance(self.to, Sequence) or isinstance(self.to, str):
             raise TypeError("Route 'to' must be a sequence of strings.")
+        if self.filter is not None and not isinstance(self.filter, MessageFilter):
+            raise TypeError("Route 'filter' must be a MessageFilter.")
         object.__setattr__(self, "to", _as_string_tuple(self.to, "to"))
 
 
+@dataclass(frozen=True, slots=True)
+class RoutingPatchOperation:
+    """One incremental change to an active routing table.
+
+    ``add_source`` and ``remove_source`` change the source IDs of the
+    ``include`` zone named by ``name``. ``add_target`` and ``remove_target``
+    change the targets of the uniquely named route ``name``.
+    """
+
+    op: str
+    name: str
+    value: str
+
+    def __post_init__(self) -> None:
+        if self.op not in ROUTING_PATCH_OPERATIONS:
+            raise ValueError(
+                "Routing patch 'op' must be one of: "
+                f"{', '.join(ROUTING_PATCH_OPERATIONS)}."
+            )
+        if not isinstance(self.name, str) or not isinstance(self.value, str):
+            raise TypeError("Routing patch names and values must be strings.")
+
+
 @dataclass(frozen=True, slots=True)
 class RoutingResult:
     """Ordered route names and unique target IDs matched for one source."""
@@ -78,6 +130,33 @@ class RoutingResult:
 ZoneConfig: TypeAlias = ZoneDefinition | Mapping[str, Iterable[str]]
 RouteConfig: TypeAlias = RouteDefinition | Mapping[str, object]
 ResolvedZones: TypeAlias = dict[ZoneName, frozenset[SourceId]]
+_TargetIdsBySource: TypeAlias = Mapping[SourceId, tuple[EgressTargetId, ...]]
+_TargetFiltersBySource: TypeAlias = Mapping[SourceId, TargetFilter]
+
+
+@dataclass(frozen=True, slots=True)
+class _ZoneGraph:
+    """Zone definitions with the reverse references patches propagate along.
+
+    ``dependents`` maps each zone to the zones whose expression names it, and
+    ``order`` gives every zone a position after all zones it references.
+    """
+
+    definitions: Mapping[ZoneName, ZoneDefinition]
+    dependents: Mapping[ZoneName, tuple[ZoneName, ...]]
+    order: Mapping[ZoneName, int]
+
+
+@dataclass(frozen=True, slots=True)
+class _GeoPlan:
+    """One grid index over every route area, and the positions it learns.
+
+    Every filtered source of a compiled table shares both, so a vessel's
+    last position is known whichever source reported it.
+    """
+
+    index: GeoGridIndex
+    positions: VesselPositions
 
 
 @dataclass(frozen=True, slots=True)
@@ -86,6 +165,7 @@ class _CompiledTargetRoute:
 
     source_ids: frozenset[SourceId]
     target_ids: tuple[EgressTargetId, ...]
+    filter: MessageFilter | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -99,6 +179,27 @@ class RoutingTable:
         init=False,
         repr=False,
     )
+    _target_ids_by_source: _TargetIdsBySource | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    _target_filters_by_source: _TargetFiltersBySource | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    _zone_graph: _ZoneGraph | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    _geo_plan: _GeoPlan | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def __post_init__(self) -> None:
         resolved_zones = {
@@ -110,6 +211,10 @@ class RoutingTable:
         object.__setattr__(self, "resolved_zones", MappingProxyType(resolved_zones))
         object.__setattr__(self, "route_definitions", route_definitions)
         object.__setattr__(self, "_compiled_target_routes", None)
+        object.__setattr__(self, "_target_ids_by_source", None)
+        object.__setattr__(self, "_target_filters_by_source", None)
+        object.__setattr__(self, "_zone_graph", None)
+        object.__setattr__(self, "_geo_plan", None)
 
     @property
     def has_compiled_target_plan(self) -> bool:
@@ -125,10 +230,16 @@ class RoutingTable:
     ) -> RoutingTable:
         """Compile already structured zone and route definitions."""
 
-        return cls(
-            resolved_zones=resolve_zones(zones),
+        definitions = {
+            name: _coerce_zone_definition(name, value)
+            for name, value in zones.items()
+        }
+        table = cls(
+            resolved_zones=resolve_zones(definitions),
             route_definitions=tuple(load_route_definitions(routes)),
         )
+        object.__setattr__(table, "_zone_graph", _build_zone_graph(definitions))
+        return table
 
     @classmethod
     def from_config(
@@ -140,10 +251,16 @@ class RoutingTable:
 
         zone_definitions = load_zone_definitions(zones_config)
         route_definitions = load_route_definitions(routes_config)
-        return cls(
+        table = cls(
             resolved_zones=resolve_zones(zone_definitions),
             route_definitions=tuple(route_definitions),
         )
+        object.__setattr__(
+            table,
+            "_zone_graph",
+            _build_zone_graph(zone_definitions),
+        )
+        return table
 
     def match(self, source_id: SourceId) -> RoutingResult:
         """Match a source against the compiled zones and routes."""
@@ -170,15 +287,24 @@ class RoutingTable:
             )
 
         compiled_target_routes = tuple(
-            _CompiledTargetRoute(
-                source_ids=self.resolved_zones[route.from_zone],
-                target_ids=tuple(
-                    frozen_target_ids[target_name]
-                    for target_name in route.to
-                ),
-            )
+            _compile_target_route(route, self.resolved_zones, frozen_target_ids)
             for route in self.route_definitions
         )
+        geo_plan = _build_geo_plan(self.route_definitions)
+        # Memoise every routed source's target plan once per compilation; a
+        # source outside every route zone matches nothing.
+        routes_by_source: dict[SourceId, list[_CompiledTargetRoute]] = {}
+        for route in compiled_target_routes:
+            for source_id in route.source_ids:
+                routes_by_source.setdefault(source_id, []).append(route)
+        target_ids_by_source: dict[SourceId, tuple[EgressTargetId, ...]] = {}
+        target_filters_by_source: dict[SourceId, TargetFilter] = {}
+        for source_id, routes in routes_by_source.items():
+            target_ids, target_filter = _source_target_plan(routes, geo_plan)
+            target_ids_by_source[source_id] = target_ids
+            if target_filter is not None:
+                target_filters_by_source[source_id] = target_filter
+
         compiled_table = RoutingTable(
             resolved_zones=self.resolved_zones,
             route_definitions=self.route_definitions,
@@ -188,32 +314,193 @@ class RoutingTable:
             "_compiled_target_routes",
             compiled_target_routes,
         )
+        object.__setattr__(
+            compiled_table,
+            "_target_ids_by_source",
+            MappingProxyType(target_ids_by_source),
+        )
+        object.__setattr__(
+            compiled_table,
+            "_target_filters_by_source",
+            MappingProxyType(target_filters_by_source),
+        )
+        object.__setattr__(compiled_table, "_zone_graph", self._zone_graph)
+        object.__setattr__(compiled_table, "_geo_plan", geo_plan)
         return compiled_table
 
+    def apply_patch(
+        self,
+        operations: Sequence[RoutingPatchOperation],
+        target_id_by_name: Mapping[str, EgressTargetId],
+    ) -> RoutingTable:
+        """Return a new compiled table with ``operations`` applied in order.
+
+        Set operations decide membership per source, so a source change is
+        propagated only to zones that depend on the changed ``include`` zone,
+        and a target change only to its route. Only the memo entries of
+        affected sources are recomputed. The table itself is not modified.
+        """
+
+        if self._target_ids_by_source is None:
+            raise RuntimeError(
+                "RoutingTable has no compiled numeric target plan; "
+                "call compile_target_ids() first."
+            )
+        graph = self._zone_graph
+        if graph is None:
+            raise ValueError(
+                "RoutingTable has no zone definitions to patch; build it with "
+                "from_definitions() or from_config()."
+            )
+        frozen_target_ids = freeze_target_id_by_name(target_id_by_name)
+
+        definitions = dict(graph.definitions)
+        resolved_zones = dict(self.resolved_zones)
+        route_definitions = list(self.route_definitions)
+        changed_zones: set[ZoneName] = set()
+        changed_routes: set[int] = set()
+        affected_sources: set[SourceId] = set()
+
+        for operation in operations:
+            if not isinstance(operation, RoutingPatchOperation):
+                raise TypeError(
+                    "Routing patch operations must be RoutingPatchOperation "
+                    "instances."
+                )
+            if operation.op in ("add_source", "remove_source"):
+                _patch_zone_source(
+                    operation,
+                    graph,
+                    definitions,
+                    resolved_zones,
+                    changed_zones,
+                )
+                affected_sources.add(operation.value)
+                continue
+
+            index = _unique_route_index(route_definitions, operation.name)
+            route = route_definitions[index]
+            if operation.op == "add_target":
+                if operation.value in route.to:
+                    raise ValueError(
+                        f"Route {operation.name!r} already targets "
+                        f"{operation.value!r}."
+                    )
+                if operation.value not in frozen_target_ids:
+                    raise ValueError(
+                        "Routing target name(s) are unavailable or "
+                        f"unsupported: {operation.value}."
+                    )
+                targets = route.to + (operation.value,)
+            else:
+                if operation.value not in route.to:
+                    raise ValueError(
+                        f"Route {operation.name!r} does not target "
+                        f"{operation.value!r}."
+                    )
+                targets = tuple(
+                    target for target in route.to if target != operation.value
+                )
+            route_definitions[index] = RouteDefinition(
+                name=route.name,
+                from_zone=route.from_zone,
+                to=targets,
+                filter=route.filter,
+            )
+            changed_routes.add(index)
+            affected_sources.update(resolved_zones[route.from_zone])
+
+        compiled_target_routes = tuple(
+            _compile_target_route(route, resolved_zones, frozen_target_ids)
+            if index in changed_routes or route.from_zone in changed_zones
+            else compiled_route
+            for index, (route, compiled_route) in enumerate(
+                zip(route_definitions, self._compiled_target_routes)
+            )
+        )
+        # Patches never change filters, so the area index is reused.
+        geo_plan = self._geo_plan
+        target_ids_by_source = dict(self._target_ids_by_source)
+        target_filters_by_source = dict(self._target_filters_by_source)
+        for source_id in affected_sources:
+            routes = [
+                route
+                for route in compiled_target_routes
+                if source_id in route.source_ids
+            ]
+            target_filters_by_source.pop(source_id, None)
+            if not routes:
+                target_ids_by_source.pop(source_id, None)
+                continue
+            target_ids, target_filter = _source_target_plan(routes, geo_plan)
+            target_ids_by_source[source_id] = target_ids
+            if target_filter is not None:
+                target_filters_by_source[source_id] = target_filter
+
+        patched_table = RoutingTable(
+            resolved_zones=resolved_zones,
+            route_definitions=tuple(route_definitions),
+        )
+        object.__setattr__(
+            patched_table,
+            "_compiled_target_routes",
+            compiled_target_routes,
+        )
+        object.__setattr__(
+            patched_table,
+            "_target_ids_by_source",
+            MappingProxyType(target_ids_by_source),
+        )
+        object.__setattr__(
+            patched_table,
+            "_target_filters_by_source",
+            MappingProxyType(target_filters_by_source),
+        )
+        object.__setattr__(
+            patched_table,
+            "_zone_graph",
+            _ZoneGraph(
+                definitions=MappingProxyType(definitions),
+                dependents=graph.dependents,
+                order=graph.order,
+            ),
+        )
+        object.__setattr__(patched_table, "_geo_plan", geo_plan)
+        return patched_table
+
     def match_target_ids(
         self,
         source_id: SourceId,
     ) -> tuple[EgressTargetId, ...]:
-        """Return ordered unique numeric targets without descriptive results."""
+        """Return ordered unique numeric targets without descriptive results.
 
-        compiled_target_routes = self._compiled_target_routes
-        if compiled_target_routes is None:
+        The result is one lookup in the table's per-source memo, so its cost
+        does not grow with the number of routes.
+        """
+
+        target_ids_by_source = self._target_ids_by_source
+        if target_ids_by_source is None:
             raise RuntimeError(
                 "RoutingTable has no compiled numeric target plan; "
                 "call compile_target_ids() first."
             )
+        return target_ids_by_source.get(source_id, ())
 
-        target_ids: list[EgressTargetId] = []
-        seen_target_ids: set[EgressTargetId] = set()
-        for route in compiled_target_routes:
-            if source_id not in route.source_ids:
-                continue
-            for target_id in route.target_ids:
-                if target_id in seen_target_ids:
-                    continue
-                seen_target_ids.add(target_id)
-                target_ids.append(target_id)
-        return tuple(target_ids)
+    def match_target_filter(self, source_id: SourceId) -> TargetFilter | None:
+        """Return the per-message target filter of ``source_id``, if any.
+
+        It is ``None`` unless a filtered route matches the source. Otherwise
+        each message's targets are ``select(sentence)``, a subset of
+        ``match_target_ids(source_id)``.
+        """
+
+        target_filters_by_source = self._target_filters_by_source
+        if target_filters_by_source is None:
+            raise RuntimeError(
+                "RoutingTable has no compiled numeric target plan; "
+                "call compile_target_ids() first."
+            )
+        return target_filters_by_source.get(source_id)
 
 
 def load_zone_definitions(config: Mapping[str, object]) -> dict[str, ZoneDefinition]:
@@ -238,6 +525,23 @@ def load_route_definitions(config: Sequence[RouteConfig]) -> list[RouteDefinitio
     return [_coerce_route_definition(route) for route in config]
 
 
+def load_routing_patch_operations(
+    config: Sequence[RoutingPatchOperation | Mapping[str, object]],
+) -> list[RoutingPatchOperation]:
+    """Convert plain patch operation mappings into validated operations.
+
+    Plain operations name their subject as ``zone`` or ``route`` and their
+    value as ``source`` or ``target``, for example
+    ``{"op": "add_source", "zone": "trusted", "source": "udp:station"}``.
+    """
+
+    if not isinstance(config, Sequence) or isinstance(config, str):
+        raise TypeError("Routing patch operations must be a sequence.")
+    if not config:
+        raise ValueError("Routing patch must contain at least one operation.")
+    return [_coerce_patch_operation(operation) for operation in config]
+
+
 def validate_routing_config(
     zones_config: Mapping[str, object], routes_config: Sequence[RouteConfig]
 ) -> ResolvedZones:
@@ -401,13 +705,234 @@ def _apply_operation(
     raise AssertionError(f"Unsupported zone operation: {operation}")
 
 
+def _coerce_patch_operation(
+    value: RoutingPatchOperation | Mapping[str, object],
+) -> RoutingPatchOperation:
+    if isinstance(value, RoutingPatchOperation):
+        return value
+    if not isinstance(value, Mapping):
+        raise TypeError(
+            "Routing patch operations must be mappings or "
+            "RoutingPatchOperation instances."
+        )
+    op = value.get("op")
+    if op not in _PATCH_FIELDS:
+        raise ValueError(
+            "Routing patch 'op' must be one of: "
+            f"{', '.join(ROUTING_PATCH_OPERATIONS)}."
+        )
+    subject_field, value_field = _PATCH_FIELDS[op]
+    unknown_fields = set(value) - {"op", subject_field, value_field}
+    if unknown_fields:
+        unknown = ", ".join(sorted(str(field) for field in unknown_fields))
+        raise ValueError(f"Routing patch {op!r} has unknown field(s): {unknown}.")
+    for field_name in (subject_field, value_field):
+        if field_name not in value:
+            raise ValueError(
+                f"Routing patch {op!r} is missing required field {field_name!r}."
+            )
+        if not isinstance(value[field_name], str) or not value[field_name]:
+            raise TypeError(
+                f"Routing patch {op!r} field {field_name!r} must be a "
+                "non-empty string."
+            )
+    return RoutingPatchOperation(
+        op=op,
+        name=value[subject_field],
+        value=value[value_field],
+    )
+
+
+def _build_zone_graph(definitions: Mapping[ZoneName, ZoneDefinition]) -> _ZoneGraph:
+    """Index reverse zone references of already resolved definitions."""
+
+    dependents: dict[ZoneName, list[ZoneName]] = {name: [] for name in definitions}
+    order: dict[ZoneName, int] = {}
+
+    def visit(zone_name: ZoneName) -> None:
+        if zone_name in order:
+            return
+        expression_name, values = _zone_expression(zone_name, definitions[zone_name])
+        if expression_name != "include":
+            for reference in values:
+                visit(reference)
+        order[zone_name] = len(order)
+
+    for name in sorted(definitions):
+        expression_name, values = _zone_expression(name, definitions[name])
+        if expression_name != "include":
+            for reference in dict.fromkeys(values):
+                dependents[reference].append(name)
+        visit(name)
+
+    return _ZoneGraph(
+        definitions=MappingProxyType(dict(definitions)),
+        dependents=MappingProxyType(
+            {name: tuple(names) for name, names in dependents.items()}
+        ),
+        order=MappingProxyType(order),
+    )
+
+
+def _patch_zone_source(
+    operation: RoutingPatchOperation,
+    graph: _ZoneGraph,
+    definitions: dict[ZoneName, ZoneDefinition],
+    resolved_zones: dict[ZoneName, frozenset[SourceId]],
+    changed_zones: set[ZoneName],
+) -> None:
+    zone_name = operation.name
+    source_id = operation.value
+    if zone_name not in definitions:
+        raise UnknownZoneError(f"Unknown zone {zone_name!r}.")
+    include = definitions[zone_name].include
+    if include is None:
+        raise ZoneResolutionError(
+            f"Zone {zone_name!r} is not an include zone; only include zones "
+            "accept source patches."
+        )
+    if operation.op == "add_source":
+        if source_id in include:
+            raise ValueError(
+                f"Zone {zone_name!r} already includes source {source_id!r}."
+            )
+        include = include + (source_id,)
+    else:
+        if source_id not in include:
+            raise ValueError(
+                f"Zone {zone_name!r} does not include source {source_id!r}."
+            )
+        include = tuple(member for member in include if member != source_id)
+    definitions[zone_name] = ZoneDefinition(include=include)
+
+    # Membership of other sources cannot change, so only this source is
+    # re-evaluated, and only in zones downstream of a zone whose membership
+    # of it actually changed.
+    pending = {zone_name}
+    for name in sorted(
+        _downstream_zones(graph, zone_name),
+        key=graph.order.__getitem__,
+    ):
+        if name not in pending:
+            continue
+        member = _zone_contains(name, definitions[name], resolved_zones, source_id)
+        zone = resolved_zones[name]
+        if member == (source_id in zone):
+            continue
+        resolved_zones[name] = zone | {source_id} if member else zone - {source_id}
+        changed_zones.add(name)
+        pending.update(graph.dependents[name])
+
+
+def _downstream_zones(graph: _ZoneGraph, zone_name: ZoneName) -> set[ZoneName]:
+    downstream = {zone_name}
+    stack = [zone_name]
+    while stack:
+        for dependent in graph.dependents[stack.pop()]:
+            if dependent not in downstream:
+                downstream.add(dependent)
+                stack.append(dependent)
+    return downstream
+
+
+def _zone_contains(
+    zone_name: ZoneName,
+    definition: ZoneDefinition,
+    resolved_zones: Mapping[ZoneName, frozenset[SourceId]],
+    source_id: SourceId,
+) -> bool:
+    expression_name, values = _zone_expression(zone_name, definition)
+    if expression_name == "include":
+        return source_id in values
+    members = [source_id in resolved_zones[reference] for reference in values]
+    if not members:
+        return False
+    if expression_name == "union":
+        return any(members)
+    if expression_name == "intersection":
+        return all(members)
+    return members[0] and not any(members[1:])
+
+
+def _unique_route_index(
+    route_definitions: Sequence[RouteDefinition],
+    route_name: str,
+) -> int:
+    indexes = [
+        index
+        for index, route in enumerate(route_definitions)
+        if route.name == route_name
+    ]
+    if not indexes:
+        raise ValueError(f"Unknown route {route_name!r}.")
+    if len(indexes) > 1:
+        raise ValueError(
+            f"Route name {route_name!r} is not unique; it cannot be patched."
+        )
+    return indexes[0]
+
+
+def _compile_target_route(
+    route: RouteDefinition,
+    resolved_zones: Mapping[ZoneName, frozenset[SourceId]],
+    target_id_by_name: Mapping[str, EgressTargetId],
+) -> _CompiledTargetRoute:
+    return _CompiledTargetRoute(
+        source_ids=resolved_zones[route.from_zone],
+        target_ids=tuple(
+            target_id_by_name[target_name]
+            for target_name in route.to
+        ),
+        filter=route.filter,
+    )
+
+
+def _build_geo_plan(
+    route_definitions: Sequence[RouteDefinition],
+) -> _GeoPlan | None:
+    areas = tuple(dict.fromkeys(
+        area
+        for route in route_definitions
+        if route.filter is not None
+        for area in route.filter.areas
+    ))
+    if not areas:
+        return None
+    return _GeoPlan(index=GeoGridIndex(areas), positions=VesselPositions())
+
+
+def _source_target_plan(
+    routes: Sequence[_CompiledTargetRoute],
+    geo_plan: _GeoPlan | None = None,
+) -> tuple[tuple[EgressTargetId, ...], TargetFilter | None]:
+    """Return one source's ordered unique targets and optional filter."""
+
+    target_ids: list[EgressTargetId] = []
+    for route in routes:
+        for target_id in route.target_ids:
+            if target_id not in target_ids:
+                target_ids.append(target_id)
+    if all(route.filter is None for route in routes):
+        return tuple(target_ids), None
+    clauses = tuple((route.filter, route.target_ids) for route in routes)
+    if geo_plan is None or not any(
+        route.filter is not None and route.filter.areas for route in routes
+    ):
+        return tuple(target_ids), TargetFilter(clauses=clauses)
+    return tuple(target_ids), TargetFilter(
+        clauses=clauses,
+        geo_index=geo_plan.index,
+        positions=geo_plan.positions,
+    )
+
+
 def _coerce_route_definition(value: RouteConfig) -> RouteDefinition:
     if isinstance(value, RouteDefinition):
         return value
     if not isinstance(value, Mapping):
         raise TypeError("Routes must be mappings or RouteDefinition instances.")
 
-    valid_fields = {"name", "from_zone", "to"}
+    valid_fields = {"name", "from_zone", "to", "filter"}
     unknown_fields = set(value) - valid_fields
     if unknown_fields:
         unknown = ", ".join(sorted(str(field) for field in unknown_fields))
@@ -424,4 +949,10 @@ def _coerce_route_definition(value: RouteConfig) -> RouteDefinition:
         raise TypeError("Route 'name' and 'from_zone' values must be strings.")
     if not isinstance(targets, Sequence) or isinstance(targets, str):
         raise TypeError("Route 'to' must be a sequence of strings.")
-    return RouteDefinition(name=name, from_zone=from_zone, to=targets)
+    route_filter = value.get("filter")
+    return RouteDefinition(
+        name=name,
+        from_zone=from_zone,
+        to=targets,
+        filter=None if route_filter is None else load_message_filter(route_filter),
+    )
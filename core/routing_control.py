@@ -8,11 +8,20 @@ installation, and RoutingState remains the single owner of generation numbers.
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 
-from core.routing import RoutingTable, ZoneResolutionError
-from core.routing_state import RoutingSnapshot, RoutingState
+from core.routing import (
+    RoutingPatchOperation,
+    RoutingTable,
+    ZoneResolutionError,
+    load_routing_patch_operations,
+)
+from core.routing_state import (
+    RoutingSnapshot,
+    RoutingState,
+    StaleRoutingGenerationError,
+)
 from core.runtime_routing import RuntimeRoutingConfigError, compile_routing_section
 from core.target_identity import EgressTargetId, freeze_target_id_by_name
 
@@ -82,6 +91,47 @@ class RoutingControlService:
         )
         return _status_from_snapshot(snapshot)
 
+    def patch(
+        self,
+        operations: Sequence[RoutingPatchOperation | Mapping[str, object]],
+        expected_generation: int | None = None,
+    ) -> RoutingControlStatus:
+        """Apply incremental patch operations to the active routing table.
+
+        The candidate is derived from the snapshot read here and installed
+        only if no other update landed in between, so a concurrent replace or
+        patch is reported as a stale generation rather than overwritten.
+        """
+
+        snapshot = self._routing_state.snapshot()
+        if (
+            expected_generation is not None
+            and expected_generation != snapshot.generation
+        ):
+            raise StaleRoutingGenerationError(
+                expected_generation=expected_generation,
+                actual_generation=snapshot.generation,
+            )
+        if snapshot.table is None:
+            raise RoutingCandidateConfigError(
+                "Routing is disabled; install a routing section with replace "
+                "before patching it."
+            )
+
+        try:
+            candidate_table = snapshot.table.apply_patch(
+                load_routing_patch_operations(operations),
+                self._target_id_by_name,
+            )
+        except (ZoneResolutionError, TypeError, ValueError) as exc:
+            raise RoutingCandidateConfigError(str(exc)) from exc
+
+        installed = self._routing_state.replace(
+            candidate_table,
+            expected_generation=snapshot.generation,
+        )
+        return _status_from_snapshot(installed)
+
     def disable(
         self,
         expected_generation: int | None = None,
@@ -3,8 +3,9 @@
 The protocol is transport-neutral: sockets, CLIs, HTTP handlers, and future
 peer transports should provide framing separately and delegate decoded messages
 to this module. Version 1 validates request envelopes, delegates routing
-operations to RoutingControlService, and pulls statistics from an explicitly
-injected runtime provider. It never compiles routing tables in this layer.
+operations to RoutingControlService, and pulls statistics and vessel queries
+from an explicitly injected runtime provider. It never compiles routing tables
+in this layer.
 """
 
 from __future__ import annotations
@@ -15,12 +16,16 @@ from dataclasses import dataclass
 from typing import Any
 
 from core.metrics import (
+    AnomalyMetricsSnapshot,
     EgressMetricsSnapshot,
+    EgressTargetQueueMetricsSnapshot,
+    EmissionThrottleMetricsSnapshot,
     InputTrafficMetricsSnapshot,
     OutputTrafficMetricsSnapshot,
     ProcessorMetricsSnapshot,
     QueueMetricsSnapshot,
     RuntimeStatisticsSnapshot,
+    TcpServerMetricsSnapshot,
 )
 from core.routing_control import (
     RoutingCandidateConfigError,
@@ -29,6 +34,11 @@ from core.routing_control import (
 )
 from core.routing_state import StaleRoutingGenerationError
 from core.runtime_statistics import RuntimeStatisticsSource
+from core.vessel_table import (
+    DEFAULT_VESSEL_QUERY_LIMIT,
+    MAX_VESSEL_QUERY_LIMIT,
+    VesselState,
+)
 
 
 ROUTING_CONTROL_PROTOCOL_VERSION = 1
@@ -39,13 +49,19 @@ ERROR_UNSUPPORTED_VERSION = "unsupported_version"
 ERROR_UNKNOWN_METHOD = "unknown_method"
 ERROR_INVALID_ROUTING_CONFIG = "invalid_routing_config"
 ERROR_STALE_GENERATION = "stale_generation"
+ERROR_VESSEL_TABLE_DISABLED = "vessel_table_disabled"
 
 METHOD_STATUS = "routing.status"
 METHOD_REPLACE = "routing.replace"
+METHOD_PATCH = "routing.patch"
 METHOD_DISABLE = "routing.disable"
 METHOD_RUNTIME_STATISTICS = "runtime.statistics"
 METHOD_RUNTIME_STATISTICS_INPUTS = "runtime.statistics.inputs"
 METHOD_RUNTIME_STATISTICS_OUTPUTS = "runtime.statistics.outputs"
+METHOD_RUNTIME_STATISTICS_CLIENTS = "runtime.statistics.clients"
+METHOD_RUNTIME_STATISTICS_ANOMALIES = "runtime.statistics.anomalies"
+METHOD_VESSELS_GET = "vessels.get"
+METHOD_VESSELS_QUERY = "vessels.query"
 
 
 class MalformedJsonError(ValueError):
@@ -178,6 +194,10 @@ class RoutingControlProtocol:
 
         if validated.method == METHOD_RUNTIME_STATISTICS_OUTPUTS:
             snapshots = self._statistics_provider.output_traffic_snapshot()
+            queue_snapshots = self._statistics_provider.target_queue_snapshot()
+            throttle_snapshots = (
+                self._statistics_provider.emission_throttle_snapshot()
+            )
             params = validated.params or {}
             target_id = params.get("target_id")
             name = params.get("name")
@@ -187,11 +207,74 @@ class RoutingControlProtocol:
                 validated.request_id,
                 _runtime_statistics_outputs_result(
                     snapshots,
+                    queue_snapshots,
+                    throttle_snapshots,
                     target_id=target_id,
                     name=name,
                 ),
             )
 
+        if validated.method == METHOD_RUNTIME_STATISTICS_CLIENTS:
+            snapshots = self._statistics_provider.tcp_server_snapshot()
+            params = validated.params or {}
+            target_id = params.get("target_id")
+            name = params.get("name")
+            assert target_id is None or isinstance(target_id, int)
+            assert name is None or isinstance(name, str)
+            return _success_response(
+                validated.request_id,
+                _runtime_statistics_clients_result(
+                    snapshots,
+                    target_id=target_id,
+                    name=name,
+                ),
+            )
+
+        if validated.method == METHOD_RUNTIME_STATISTICS_ANOMALIES:
+            snapshot = self._statistics_provider.anomaly_snapshot()
+            return _success_response(
+                validated.request_id,
+                {
+                    "anomalies": (
+                        None
+                        if snapshot is None
+                        else _anomaly_metrics_result(snapshot)
+                    )
+                },
+            )
+
+        if validated.method in {METHOD_VESSELS_GET, METHOD_VESSELS_QUERY}:
+            vessel_table = self._statistics_provider.vessel_table()
+            if vessel_table is None:
+                return _error_response(
+                    validated.request_id,
+                    ERROR_VESSEL_TABLE_DISABLED,
+                    "The vessel table is not enabled.",
+                )
+            params = validated.params
+            assert params is not None
+            if validated.method == METHOD_VESSELS_GET:
+                vessel = vessel_table.get(params["mmsi"])
+                return _success_response(
+                    validated.request_id,
+                    {
+                        "vessel": (
+                            None if vessel is None else _vessel_result(vessel)
+                        )
+                    },
+                )
+            vessels, truncated = vessel_table.query_bounds(
+                tuple(params["bbox"]),
+                limit=params.get("limit", DEFAULT_VESSEL_QUERY_LIMIT),
+            )
+            return _success_response(
+                validated.request_id,
+                {
+                    "vessels": [_vessel_result(vessel) for vessel in vessels],
+                    "truncated": truncated,
+                },
+            )
+
         if validated.method == METHOD_STATUS:
             status = self._service.status()
             return _success_response(
@@ -217,6 +300,24 @@ class RoutingControlProtocol:
                 _status_result(status),
             )
 
+        if validated.method == METHOD_PATCH:
+            params = validated.params
+            assert params is not None
+            try:
+                status = self._service.patch(
+                    params["operations"],
+                    expected_generation=params.get("expected_generation"),
+                )
+            except StaleRoutingGenerationError as exc:
+                return _stale_generation_response(validated.request_id, exc)
+            except RoutingCandidateConfigError as exc:
+                return _invalid_routing_config_response(validated.request_id, exc)
+
+            return _success_response(
+                validated.request_id,
+                _status_result(status),
+            )
+
         if validated.method == METHOD_DISABLE:
             params = validated.params or {}
             try:
@@ -282,17 +383,26 @@ def _validate_request_schema(request: Mapping[str, object]) -> _RequestError | N
     if method not in {
         METHOD_STATUS,
         METHOD_REPLACE,
+        METHOD_PATCH,
         METHOD_DISABLE,
         METHOD_RUNTIME_STATISTICS,
         METHOD_RUNTIME_STATISTICS_INPUTS,
         METHOD_RUNTIME_STATISTICS_OUTPUTS,
+        METHOD_RUNTIME_STATISTICS_CLIENTS,
+        METHOD_RUNTIME_STATISTICS_ANOMALIES,
+        METHOD_VESSELS_GET,
+        METHOD_VESSELS_QUERY,
     }:
         return _RequestError(
             ERROR_UNKNOWN_METHOD,
             f"Unknown routing control method: {method}.",
         )
 
-    if method in {METHOD_STATUS, METHOD_RUNTIME_STATISTICS}:
+    if method in {
+        METHOD_STATUS,
+        METHOD_RUNTIME_STATISTICS,
+        METHOD_RUNTIME_STATISTICS_ANOMALIES,
+    }:
         if "params" in request:
             return _RequestError(
                 ERROR_INVALID_REQUEST,
@@ -303,8 +413,21 @@ def _validate_request_schema(request: Mapping[str, object]) -> _RequestError | N
     if method == METHOD_RUNTIME_STATISTICS_INPUTS:
         return _validate_runtime_statistics_inputs_params(request)
 
-    if method == METHOD_RUNTIME_STATISTICS_OUTPUTS:
-        return _validate_runtime_statistics_outputs_params(request)
+    if method in {
+        METHOD_RUNTIME_STATISTICS_OUTPUTS,
+        METHOD_RUNTIME_STATISTICS_CLIENTS,
+    }:
+        return _validate_runtime_statistics_target_params(request, method)
+
+    if method in {METHOD_VESSELS_GET, METHOD_VESSELS_QUERY}:
+        if "params" not in request:
+            return _RequestError(
+                ERROR_INVALID_REQUEST,
+                f"Method {method!r} requires params.",
+            )
+        if method == METHOD_VESSELS_GET:
+            return _validate_vessels_get_params(request["params"])
+        return _validate_vessels_query_params(request["params"])
 
     if method == METHOD_REPLACE:
         if "params" not in request:
@@ -314,6 +437,14 @@ def _validate_request_schema(request: Mapping[str, object]) -> _RequestError | N
             )
         return _validate_replace_params(request["params"])
 
+    if method == METHOD_PATCH:
+        if "params" not in request:
+            return _RequestError(
+                ERROR_INVALID_REQUEST,
+                "Method 'routing.patch' requires params.",
+            )
+        return _validate_patch_params(request["params"])
+
     if "params" in request:
         params = request["params"]
         if not isinstance(params, Mapping):
@@ -359,8 +490,9 @@ def _validate_runtime_statistics_inputs_params(
     return None
 
 
-def _validate_runtime_statistics_outputs_params(
+def _validate_runtime_statistics_target_params(
     request: Mapping[str, object],
+    method: str,
 ) -> _RequestError | None:
     if "params" not in request:
         return None
@@ -368,13 +500,13 @@ def _validate_runtime_statistics_outputs_params(
     if not isinstance(params, Mapping):
         return _RequestError(
             ERROR_INVALID_REQUEST,
-            f"Method {METHOD_RUNTIME_STATISTICS_OUTPUTS!r} params must be an object.",
+            f"Method {method!r} params must be an object.",
         )
 
     error = _validate_params_fields(
         params,
         allowed_fields={"target_id", "name"},
-        method=METHOD_RUNTIME_STATISTICS_OUTPUTS,
+        method=method,
     )
     if error is not None:
         return error
@@ -382,7 +514,7 @@ def _validate_runtime_statistics_outputs_params(
     if "target_id" in params and "name" in params:
         return _RequestError(
             ERROR_INVALID_REQUEST,
-            f"Method {METHOD_RUNTIME_STATISTICS_OUTPUTS!r} params must not "
+            f"Method {method!r} params must not "
             "contain both 'target_id' and 'name'.",
         )
 
@@ -408,6 +540,99 @@ def _validate_runtime_statistics_outputs_params(
     return None
 
 
+def _validate_vessels_get_params(params: object) -> _RequestError | None:
+    if not isinstance(params, Mapping):
+        return _RequestError(
+            ERROR_INVALID_REQUEST,
+            f"Method {METHOD_VESSELS_GET!r} params must be an object.",
+        )
+
+    error = _validate_params_fields(
+        params,
+        allowed_fields={"mmsi"},
+        method=METHOD_VESSELS_GET,
+    )
+    if error is not None:
+        return error
+
+    if "mmsi" not in params:
+        return _RequestError(
+            ERROR_INVALID_REQUEST,
+            f"Method {METHOD_VESSELS_GET!r} params missing required field 'mmsi'.",
+        )
+    mmsi = params["mmsi"]
+    if (
+        isinstance(mmsi, bool)
+        or not isinstance(mmsi, int)
+        or not 0 <= mmsi <= 999_999_999
+    ):
+        return _RequestError(
+            ERROR_INVALID_REQUEST,
+            "Param 'mmsi' must be an integer from 0 to 999999999.",
+        )
+    return None
+
+
+def _validate_vessels_query_params(params: object) -> _RequestError | None:
+    if not isinstance(params, Mapping):
+        return _RequestError(
+            ERROR_INVALID_REQUEST,
+            f"Method {METHOD_VESSELS_QUERY!r} params must be an object.",
+        )
+
+    error = _validate_params_fields(
+        params,
+        allowed_fields={"bbox", "limit"},
+        method=METHOD_VESSELS_QUERY,
+    )
+    if error is not None:
+        return error
+
+    if "bbox" not in params:
+        return _RequestError(
+            ERROR_INVALID_REQUEST,
+            f"Method {METHOD_VESSELS_QUERY!r} params missing required field "
+            "'bbox'.",
+        )
+    bbox = params["bbox"]
+    if (
+        not isinstance(bbox, list)
+        or len(bbox) != 4
+        or any(
+            isinstance(value, bool) or not isinstance(value, (int, float))
+            for value in bbox
+        )
+    ):
+        return _RequestError(
+            ERROR_INVALID_REQUEST,
+            "Param 'bbox' must be an array of 4 numbers.",
+        )
+    min_lon, min_lat, max_lon, max_lat = bbox
+    if not (
+        -180 <= min_lon <= max_lon <= 180
+        and -90 <= min_lat <= max_lat <= 90
+    ):
+        return _RequestError(
+            ERROR_INVALID_REQUEST,
+            "Param 'bbox' must be [min_lon, min_lat, max_lon, max_lat] "
+            "within -180..180 and -90..90.",
+        )
+
+    if "limit" in params:
+        limit = params["limit"]
+        if (
+            isinstance(limit, bool)
+            or not isinstance(limit, int)
+            or not 1 <= limit <= MAX_VESSEL_QUERY_LIMIT
+        ):
+            return _RequestError(
+                ERROR_INVALID_REQUEST,
+                "Param 'limit' must be an integer from 1 to "
+                f"{MAX_VESSEL_QUERY_LIMIT}.",
+            )
+    return None
+
+
 def _validate_replace_params(params: object) -> _RequestError | None:
     if not isinstance(params, Mapping):
         return _RequestError(
@@ -431,6 +656,35 @@ def _validate_replace_params(params: object) -> _RequestError | None:
     return None
 
 
+def _validate_patch_params(params: object) -> _RequestError | None:
+    if not isinstance(params, Mapping):
+        return _RequestError(
+            ERROR_INVALID_REQUEST,
+            "Method 'routing.patch' params must be an object.",
+        )
+
+    error = _validate_params_fields(
+        params,
+        allowed_fields={"operations", "expected_generation"},
+        method=METHOD_PATCH,
+    )
+    if error is not None:
+        return error
+
+    if "operations" not in params:
+        return _RequestError(
+            ERROR_INVALID_REQUEST,
+            "Method 'routing.patch' params missing required field 'operations'.",
+        )
+    operations = params["operations"]
+    if not isinstance(operations, list) or not operations:
+        return _RequestError(
+            ERROR_INVALID_REQUEST,
+            "Param 'operations' must be a non-empty array.",
+        )
+    return None
+
+
 def _validate_params_fields(
     params: Mapping[str, object],
     allowed_fields: set[str],
@@ -601,11 +855,38 @@ def _input_traffic_metrics_result(
 
 def _runtime_statistics_outputs_result(
     snapshots: tuple[OutputTrafficMetricsSnapshot, ...],
+    queue_snapshots: tuple[EgressTargetQueueMetricsSnapshot, ...],
+    throttle_snapshots: tuple[EmissionThrottleMetricsSnapshot, ...],
     *,
     target_id: int | None,
     name: str | None,
 ) -> dict[str, object]:
-    rows = tuple(_output_traffic_metrics_result(snapshot) for snapshot in snapshots)
+    queue_by_target_id = {}
+    for queue_snapshot in queue_snapshots:
+        if not isinstance(queue_snapshot, EgressTargetQueueMetricsSnapshot):
+            raise TypeError(
+                "statistics provider must return "
+                "EgressTargetQueueMetricsSnapshot instances."
+            )
+        queue_by_target_id[queue_snapshot.target_id] = queue_snapshot
+    suppressed_by_target_id = {}
+    for throttle_snapshot in throttle_snapshots:
+        if not isinstance(throttle_snapshot, EmissionThrottleMetricsSnapshot):
+            raise TypeError(
+                "statistics provider must return "
+                "EmissionThrottleMetricsSnapshot instances."
+            )
+        suppressed_by_target_id[throttle_snapshot.target_id] = (
+            throttle_snapshot.suppressed
+        )
+    rows = tuple(
+        _output_traffic_metrics_result(
+            snapshot,
+            queue_by_target_id,
+            suppressed_by_target_id,
+        )
+        for snapshot in snapshots
+    )
     if target_id is not None:
         rows = tuple(row for row in rows if row["target_id"] == target_id)
     elif name is not None:
@@ -615,12 +896,15 @@ def _runtime_statistics_outputs_result(
 
 def _output_traffic_metrics_result(
     snapshot: OutputTrafficMetricsSnapshot,
+    queue_by_target_id: Mapping[int, EgressTargetQueueMetricsSnapshot],
+    suppressed_by_target_id: Mapping[int, int],
 ) -> dict[str, object]:
     if not isinstance(snapshot, OutputTrafficMetricsSnapshot):
         raise TypeError(
             "statistics provider must return OutputTrafficMetricsSnapshot "
             "instances."
         )
+    queue_snapshot = queue_by_target_id.get(snapshot.target_id)
     # Completion records only a successful local dispatch operation. UDP does
     # not acknowledge remote receipt or downstream processing.
     return {
@@ -631,6 +915,116 @@ def _output_traffic_metrics_result(
         "dispatch_failed": snapshot.dispatch_failed,
         "messages": snapshot.messages,
         "bytes": snapshot.bytes,
+        "buffered_bytes": snapshot.buffered_bytes,
+        "buffer_drops": snapshot.buffer_drops,
+        "write_pauses": snapshot.write_pauses,
+        "resolutions": snapshot.resolutions,
+        "resolve_failures": snapshot.resolve_failures,
+        "transport_failures": snapshot.transport_failures,
+        "address_changes": snapshot.address_changes,
+        "resolve_latency_us": snapshot.resolve_latency_us,
+        "sink_bytes_written": snapshot.sink_bytes_written,
+        "sink_rotations": snapshot.sink_rotations,
+        "sink_write_errors": snapshot.sink_write_errors,
+        "sink_dropped": snapshot.sink_dropped,
+        "sink_lag_us": snapshot.sink_lag_us,
+        "queue": (
+            None
+            if queue_snapshot is None
+            else _target_queue_metrics_result(queue_snapshot)
+        ),
+        # None for targets without throttle_interval_s.
+        "throttled": suppressed_by_target_id.get(snapshot.target_id),
+    }
+
+
+def _target_queue_metrics_result(
+    snapshot: EgressTargetQueueMetricsSnapshot,
+) -> dict[str, object]:
+    return {
+        "overflow_policy": snapshot.overflow_policy,
+        "capacity": snapshot.capacity,
+        "depth": snapshot.depth,
+        "peak_depth": snapshot.peak_depth,
+        "enqueued": snapshot.enqueued,
+        "dequeued": snapshot.dequeued,
+        "dropped": snapshot.dropped,
+        "put_waits": snapshot.put_waits,
+        "sent_messages": snapshot.sent_messages,
+        "sent_datagrams": snapshot.sent_datagrams,
+        "shaped": snapshot.shaped,
+    }
+
+
+def _runtime_statistics_clients_result(
+    snapshots: tuple[TcpServerMetricsSnapshot, ...],
+    *,
+    target_id: int | None,
+    name: str | None,
+) -> dict[str, object]:
+    rows = tuple(_tcp_server_metrics_result(snapshot) for snapshot in snapshots)
+    if target_id is not None:
+        rows = tuple(row for row in rows if row["target_id"] == target_id)
+    elif name is not None:
+        rows = tuple(row for row in rows if row["name"] == name)
+    return {"servers": list(rows)}
+
+
+def _tcp_server_metrics_result(
+    snapshot: TcpServerMetricsSnapshot,
+) -> dict[str, object]:
+    if not isinstance(snapshot, TcpServerMetricsSnapshot):
+        raise TypeError(
+            "statistics provider must return TcpServerMetricsSnapshot "
+            "instances."
+        )
+    return {
+        "target_id": snapshot.target_id,
+        "name": snapshot.name,
+        "listen": snapshot.listen,
+        "accepted": snapshot.accepted,
+        "rejected": snapshot.rejected,
+        "evicted": snapshot.evicted,
+        "clients": [
+            {
+                "client_id": client.client_id,
+                "peer": client.peer,
+                "bytes": client.bytes,
+                "buffered_bytes": client.buffered_bytes,
+                "lag_us": client.lag_us,
+            }
+            for client in snapshot.clients
+        ],
+    }
+
+
+def _anomaly_metrics_result(
+    snapshot: AnomalyMetricsSnapshot,
+) -> dict[str, object]:
+    if not isinstance(snapshot, AnomalyMetricsSnapshot):
+        raise TypeError(
+            "statistics provider must return an AnomalyMetricsSnapshot."
+        )
+    return {
+        "checked": snapshot.checked,
+        "speed": snapshot.speed,
+        "teleport": snapshot.teleport,
+        "duplicate_mmsi": snapshot.duplicate_mmsi,
+        "out_of_range": snapshot.out_of_range,
+        "tracked_vessels": snapshot.tracked_vessels,
+    }
+
+
+def _vessel_result(vessel: VesselState) -> dict[str, object]:
+    return {
+        "mmsi": vessel.mmsi,
+        "lon": vessel.lon,
+        "lat": vessel.lat,
+        "sog": vessel.sog,
+        "cog": vessel.cog,
+        "timestamp": vessel.timestamp,
+        "message_type": vessel.message_type,
+        "source_id": vessel.source_id,
     }
 
 
@@ -662,6 +1056,7 @@ def _processor_metrics_result(
         "reset_completed": snapshot.reset_completed,
         "reset_failed": snapshot.reset_failed,
         "reset_in_flight": snapshot.reset_in_flight,
+        "gid_pool_refills": snapshot.gid_pool_refills,
     }
 
 
@@ -34,7 +34,12 @@ class StaleRoutingGenerationError(RuntimeError):
 
 
 class RoutingState:
-    """Thread-safe process-local holder for immutable routing snapshots."""
+    """Thread-safe process-local holder for immutable routing snapshots.
+
+    Replacements are serialised by a lock. Reads take no lock: the current
+    snapshot is one immutable object published by a single reference
+    assignment, so a reader sees either the previous or the next snapshot.
+    """
 
     def __init__(self, initial_table: RoutingTable | None = None):
         _validate_table(initial_table)
@@ -42,8 +47,7 @@ class RoutingState:
         self._snapshot = RoutingSnapshot(generation=0, table=initial_table)
 
     def snapshot(self) -> RoutingSnapshot:
-        with self._lock:
-            return self._snapshot
+        return self._snapshot
 
     def replace(
         self,
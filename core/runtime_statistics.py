@@ -7,13 +7,18 @@ from dataclasses import dataclass
 from typing import Protocol
 
 from core.metrics import (
+    AnomalyMetricsSnapshot,
     EgressMetricsSnapshot,
+    EgressTargetQueueMetricsSnapshot,
+    EmissionThrottleMetricsSnapshot,
     InputTrafficMetricsSnapshot,
     OutputTrafficMetricsSnapshot,
     ProcessorMetricsSnapshot,
     QueueMetricsSnapshot,
     RuntimeStatisticsSnapshot,
+    TcpServerMetricsSnapshot,
 )
+from core.vessel_table import VesselTable
 
 
 class QueueMetricsSource(Protocol):
@@ -53,6 +58,36 @@ class OutputTrafficMetricsSource(Protocol):
         ...
 
 
+class TargetQueueMetricsSource(Protocol):
+    """Structural contract for the ordered per-target queue metric owner."""
+
+    def target_queue_snapshot(
+        self,
+    ) -> tuple[EgressTargetQueueMetricsSnapshot, ...]:
+        ...
+
+
+class TcpServerMetricsSource(Protocol):
+    """Structural contract for the ordered TCP fan-out metric owner."""
+
+    def tcp_server_snapshot(self) -> tuple[TcpServerMetricsSnapshot, ...]:
+        ...
+
+
+class EmissionThrottleMetricsSource(Protocol):
+    """Structural contract for the ordered per-target throttle metric owner."""
+
+    def metrics_snapshot(self) -> tuple[EmissionThrottleMetricsSnapshot, ...]:
+        ...
+
+
+class AnomalyMetricsSource(Protocol):
+    """Structural contract for the anomaly detector metric owner."""
+
+    def metrics_snapshot(self) -> AnomalyMetricsSnapshot:
+        ...
+
+
 class RuntimeStatisticsSource(Protocol):
     """Structural contract consumed by the transport-neutral control layer."""
 
@@ -69,6 +104,25 @@ class RuntimeStatisticsSource(Protocol):
     ) -> tuple[OutputTrafficMetricsSnapshot, ...]:
         ...
 
+    def target_queue_snapshot(
+        self,
+    ) -> tuple[EgressTargetQueueMetricsSnapshot, ...]:
+        ...
+
+    def tcp_server_snapshot(self) -> tuple[TcpServerMetricsSnapshot, ...]:
+        ...
+
+    def emission_throttle_snapshot(
+        self,
+    ) -> tuple[EmissionThrottleMetricsSnapshot, ...]:
+        ...
+
+    def vessel_table(self) -> VesselTable | None:
+        ...
+
+    def anomaly_snapshot(self) -> AnomalyMetricsSnapshot | None:
+        ...
+
 
 class InputTrafficMetrics:
     """Own process-local lifetime traffic counters for one runtime input."""
@@ -134,6 +188,11 @@ class RuntimeStatisticsProvider:
     egress_operations: EgressMetricsSource
     input_traffic: tuple[InputTrafficMetricsSource, ...]
     output_traffic: OutputTrafficMetricsSource | None
+    target_queues: TargetQueueMetricsSource | None
+    tcp_servers: TcpServerMetricsSource | None
+    emission_throttle: EmissionThrottleMetricsSource | None
+    vessels: VesselTable | None
+    anomalies: AnomalyMetricsSource | None
 
     def __init__(
         self,
@@ -145,6 +204,11 @@ class RuntimeStatisticsProvider:
         *,
         input_traffic: Iterable[InputTrafficMetricsSource] = (),
         output_traffic: OutputTrafficMetricsSource | None = None,
+        target_queues: TargetQueueMetricsSource | None = None,
+        tcp_servers: TcpServerMetricsSource | None = None,
+        emission_throttle: EmissionThrottleMetricsSource | None = None,
+        vessels: VesselTable | None = None,
+        anomalies: AnomalyMetricsSource | None = None,
     ) -> None:
         object.__setattr__(self, "ingress_queues", tuple(ingress_queues))
         object.__setattr__(self, "processing_queue", processing_queue)
@@ -153,6 +217,11 @@ class RuntimeStatisticsProvider:
         object.__setattr__(self, "egress_operations", egress_operations)
         object.__setattr__(self, "input_traffic", tuple(input_traffic))
         object.__setattr__(self, "output_traffic", output_traffic)
+        object.__setattr__(self, "target_queues", target_queues)
+        object.__setattr__(self, "tcp_servers", tcp_servers)
+        object.__setattr__(self, "emission_throttle", emission_throttle)
+        object.__setattr__(self, "vessels", vessels)
+        object.__setattr__(self, "anomalies", anomalies)
 
     def snapshot(self) -> RuntimeStatisticsSnapshot:
         """Return one fresh aggregate without caching or mutating its sources."""
@@ -185,3 +254,40 @@ class RuntimeStatisticsProvider:
         if self.output_traffic is None:
             return ()
         return self.output_traffic.output_traffic_snapshot()
+
+    def target_queue_snapshot(
+        self,
+    ) -> tuple[EgressTargetQueueMetricsSnapshot, ...]:
+        """Pull fresh per-target queue snapshots from the egress dispatcher."""
+
+        if self.target_queues is None:
+            return ()
+        return self.target_queues.target_queue_snapshot()
+
+    def tcp_server_snapshot(self) -> tuple[TcpServerMetricsSnapshot, ...]:
+        """Pull fresh TCP fan-out server snapshots from the forwarder."""
+
+        if self.tcp_servers is None:
+            return ()
+        return self.tcp_servers.tcp_server_snapshot()
+
+    def emission_throttle_snapshot(
+        self,
+    ) -> tuple[EmissionThrottleMetricsSnapshot, ...]:
+        """Pull fresh per-target counters from the processor's emission throttle."""
+
+        if self.emission_throttle is None:
+            return ()
+        return self.emission_throttle.metrics_snapshot()
+
+    def vessel_table(self) -> VesselTable | None:
+        """Return the processor's vessel table, or ``None`` when disabled."""
+
+        return self.vessels
+
+    def anomaly_snapshot(self) -> AnomalyMetricsSnapshot | None:
+        """Pull fresh anomaly detector counters, or ``None`` when disabled."""
+
+        if self.anomalies is None:
+            return None
+        return self.anomalies.metrics_snapshot()
@@ -1,9 +1,12 @@
+from functools import lru_cache
 import re
 from typing import Optional
 
 # Строг сет: само [A-Za-z0-9_]
 _SAFE = re.compile(r'[^A-Za-z0-9_]')
 
+_S_SELECTION_CACHE_SIZE = 4096
+
 
 def sanitize_s(val: Optional[str]) -> str:
     v = (val or "").strip()
@@ -137,13 +140,18 @@ def choose_s_value(
     )
 
 
+@lru_cache(maxsize=_S_SELECTION_CACHE_SIZE)
 def choose_s_value_from_candidates(
     global_station_id: Optional[str],
     source_name_or_id: Optional[str],
     incoming_s: Optional[str],
     remote_ip: Optional[str],
 ) -> str:
-    """Choose and sanitize a source value from already parsed candidates."""
+    """Choose and sanitize a source value from already parsed candidates.
+
+    The selection is pure, so results are memoised per candidate tuple to
+    avoid running the sanitizer for every emitted sentence.
+    """
     if global_station_id:
         return sanitize_s(global_station_id)
     if source_name_or_id and source_name_or_id != "ANONYMOUS":
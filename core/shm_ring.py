@@ -0,0 +1,234 @@
+"""Single-writer shared-memory record ring for co-located egress consumers.
+
+The writer appends length-prefixed records to a ``multiprocessing``
+shared-memory segment and then publishes a monotonic byte position. Readers
+in other processes attach by name and poll that position, so delivering a
+record costs no system call. Before it stores any record byte the writer
+also reserves the position the write will end at, so a reader can tell when
+a write still in progress may have overwritten what it just copied. The ring
+never waits for readers: a reader that falls a full capacity behind skips to
+the newest position and counts one overrun.
+
+Segment layout, all integers little-endian::
+
+    0   magic  b"AISR"
+    4   u32    layout version
+    8   u64    data capacity in bytes
+    16  u64    write position (total bytes ever advanced)
+    24  u64    records written
+    32  u64    reserved position (end of the write in progress)
+    64  data   8-byte aligned records: u32 length, payload, padding
+
+A record that would cross the end of the data area is preceded by a wrap
+marker and written from offset zero instead.
+"""
+
+from __future__ import annotations
+
+import struct
+from multiprocessing import resource_tracker, shared_memory
+
+
+SHM_RING_MAGIC = b"AISR"
+SHM_RING_VERSION = 1
+SHM_RING_HEADER_BYTES = 64
+DEFAULT_SHM_RING_BYTES = 1024 * 1024
+# Twice the largest UDP payload, so any coalesced datagram fits a record.
+MIN_SHM_RING_BYTES = 128 * 1024
+
+_PREAMBLE = struct.Struct("<4sIQ")
+_POSITION = struct.Struct("<Q")
+_PROGRESS = struct.Struct("<QQ")
+_LENGTH = struct.Struct("<I")
+_pack_length = _LENGTH.pack_into
+_pack_progress = _PROGRESS.pack_into
+_pack_position = _POSITION.pack_into
+_LENGTH_BYTES = _LENGTH.size
+_POSITION_OFFSET = 16
+_RESERVED_OFFSET = 32
+_WRAP_MARKER = 0xFFFFFFFF
+_ALIGNMENT = 8
+_ALIGNMENT_MASK = ~(_ALIGNMENT - 1)
+# Segments created by writers in this process. The resource tracker keeps one
+# registration per name, which a reader in the same process must leave alone.
+_WRITER_NAMES: set[str] = set()
+
+
+class ShmRingError(ValueError):
+    """Raised when a shared-memory ring cannot be created or attached."""
+
+
+class ShmRingWriter:
+    """Own one shared-memory ring and append records to it.
+
+    Creating a writer replaces a stale segment of the same name left behind
+    by an earlier process. ``close()`` unlinks the segment.
+    """
+
+    __slots__ = ("_memory", "_buffer", "_capacity", "_position", "_records")
+
+    def __init__(self, name: str, capacity: int = DEFAULT_SHM_RING_BYTES):
+        if isinstance(capacity, bool) or not isinstance(capacity, int):
+            raise TypeError("capacity must be an integer.")
+        if capacity < MIN_SHM_RING_BYTES or capacity % _ALIGNMENT:
+            raise ValueError(
+                f"capacity must be a multiple of {_ALIGNMENT} of at least "
+                f"{MIN_SHM_RING_BYTES} bytes."
+            )
+        size = SHM_RING_HEADER_BYTES + capacity
+        try:
+            memory = shared_memory.SharedMemory(name, create=True, size=size)
+        except FileExistsError:
+            stale = shared_memory.SharedMemory(name)
+            stale.close()
+            stale.unlink()
+            memory = shared_memory.SharedMemory(name, create=True, size=size)
+        _WRITER_NAMES.add(memory._name)
+        self._memory = memory
+        self._buffer = memory.buf
+        self._capacity = capacity
+        self._position = 0
+        self._records = 0
+        _PREAMBLE.pack_into(
+            self._buffer,
+            0,
+            SHM_RING_MAGIC,
+            SHM_RING_VERSION,
+            capacity,
+        )
+        _pack_progress(self._buffer, _POSITION_OFFSET, 0, 0)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def records_written(self) -> int:
+        return self._records
+
+    def write(self, record: bytes) -> None:
+        """Append one record and publish it to readers."""
+
+        length = len(record)
+        needed = (_LENGTH_BYTES + length + _ALIGNMENT - 1) & _ALIGNMENT_MASK
+        capacity = self._capacity
+        if needed > capacity >> 1:
+            raise ValueError(
+                f"record of {length} bytes does not fit ring capacity "
+                f"{capacity}."
+            )
+        buffer = self._buffer
+        position = self._position
+        offset = position % capacity
+        gap = capacity - offset if needed > capacity - offset else 0
+        _pack_position(buffer, _RESERVED_OFFSET, position + gap + needed)
+        if gap:
+            _pack_length(buffer, SHM_RING_HEADER_BYTES + offset, _WRAP_MARKER)
+            position += gap
+            offset = 0
+        start = SHM_RING_HEADER_BYTES + offset
+        _pack_length(buffer, start, length)
+        start += _LENGTH_BYTES
+        buffer[start:start + length] = record
+        position += needed
+        self._position = position
+        self._records += 1
+        # Storing the position is what publishes the record to readers.
+        _pack_progress(buffer, _POSITION_OFFSET, position, self._records)
+
+    def close(self) -> None:
+        """Detach and unlink the segment; readers keep their own mapping."""
+
+        if self._buffer is None:
+            return
+        self._buffer.release()
+        self._buffer = None
+        self._memory.close()
+        try:
+            self._memory.unlink()
+        except FileNotFoundError:
+            # A newer writer already replaced this segment.
+            pass
+        _WRITER_NAMES.discard(self._memory._name)
+
+
+class ShmRingReader:
+    """Poll one shared-memory ring for records appended after attaching."""
+
+    __slots__ = ("_memory", "_buffer", "_capacity", "_position", "overruns")
+
+    def __init__(self, name: str):
+        try:
+            memory = shared_memory.SharedMemory(name)
+        except FileNotFoundError as exc:
+            raise ShmRingError(f"Shared-memory ring {name!r} does not exist") from exc
+        # Readers must not unlink the writer's segment when they exit.
+        if memory._name not in _WRITER_NAMES:
+            resource_tracker.unregister(memory._name, "shared_memory")
+        magic, version, capacity = _PREAMBLE.unpack_from(memory.buf, 0)
+        if magic != SHM_RING_MAGIC or version != SHM_RING_VERSION:
+            memory.close()
+            raise ShmRingError(
+                f"Shared-memory segment {name!r} is not an aismixer ring"
+            )
+        self._memory = memory
+        self._buffer = memory.buf
+        self._capacity = capacity
+        self._position = self._write_position()
+        self.overruns = 0
+
+    def _write_position(self) -> int:
+        return _POSITION.unpack_from(self._buffer, _POSITION_OFFSET)[0]
+
+    def read(self) -> list[bytes]:
+        """Return every record published since the previous call."""
+
+        buffer = self._buffer
+        capacity = self._capacity
+        published = self._write_position()
+        if published - self._position > capacity:
+            self._position = published
+            self.overruns += 1
+            return []
+
+        records = []
+        position = self._position
+        while position < published:
+            offset = position % capacity
+            start = SHM_RING_HEADER_BYTES + offset
+            (length,) = _LENGTH.unpack_from(buffer, start)
+            if length == _WRAP_MARKER:
+                position += capacity - offset
+                continue
+            payload_start = start + _LENGTH_BYTES
+            records.append(bytes(buffer[payload_start:payload_start + length]))
+            position += (
+                _LENGTH_BYTES + length + _ALIGNMENT - 1
+            ) & _ALIGNMENT_MASK
+
+        # The writer may have lapped the copied region while it was read, or
+        # be part-way through overwriting it without having published yet.
+        reserved = _POSITION.unpack_from(buffer, _RESERVED_OFFSET)[0]
+        if reserved - self._position > capacity:
+            self._position = self._write_position()
+            self.overruns += 1
+            return []
+        self._position = position
+        return records
+
+    def close(self) -> None:
+        if self._buffer is None:
+            return
+        self._buffer.release()
+        self._buffer = None
+        self._memory.close()
+
+    def __enter__(self) -> ShmRingReader:
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
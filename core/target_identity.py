@@ -55,12 +55,49 @@ def freeze_target_id_by_name(
 def build_udp_target_id(configured_id: str) -> str:
     """Build the canonical opaque target ID for a configured UDP forwarder."""
 
+    return _build_target_id("udp", "UDP", configured_id)
+
+
+def build_unix_target_id(configured_id: str) -> str:
+    """Build the canonical opaque target ID for a Unix datagram forwarder."""
+
+    return _build_target_id("unix", "Unix", configured_id)
+
+
+def build_shm_target_id(configured_id: str) -> str:
+    """Build the canonical opaque target ID for a shared-memory forwarder."""
+
+    return _build_target_id("shm", "Shared-memory", configured_id)
+
+
+def build_tcp_target_id(configured_id: str) -> str:
+    """Build the canonical opaque target ID for a TCP fan-out forwarder."""
+
+    return _build_target_id("tcp", "TCP", configured_id)
+
+
+def build_multicast_target_id(configured_id: str) -> str:
+    """Build the canonical opaque target ID for a multicast forwarder."""
+
+    return _build_target_id("multicast", "Multicast", configured_id)
+
+
+def build_file_target_id(configured_id: str) -> str:
+    """Build the canonical opaque target ID for a file-sink forwarder."""
+
+    return _build_target_id("file", "File", configured_id)
+
+
+def _build_target_id(namespace: str, label: str, configured_id: str) -> str:
     if not isinstance(configured_id, str):
-        raise TypeError("UDP target identity requires a string configured_id.")
+        raise TypeError(f"{label} target identity requires a string configured_id.")
     if configured_id.strip() == "":
-        raise ValueError("UDP target identity requires a non-empty configured_id.")
+        raise ValueError(
+            f"{label} target identity requires a non-empty configured_id."
+        )
     if ":" in configured_id:
         raise ValueError(
-            "UDP target configured_id must be unnamespaced; use values like 'aishub'."
+            f"{label} target configured_id must be unnamespaced; "
+            "use values like 'aishub'."
         )
-    return f"udp:{configured_id}"
+    return f"{namespace}:{configured_id}"
@@ -0,0 +1,222 @@
+"""TCP server that fans every egress message out to its connected clients.
+
+Messages written during one event-loop iteration are joined and handed to
+each client transport once, on the next iteration. A client that still has
+unsent bytes and would then hold more than the per-client buffer bound is
+evicted instead of being waited for, so one slow subscriber never delays the
+data plane or the others. A client with an empty buffer always takes the
+write, however large one iteration's payload is.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+
+from core.metrics import TcpClientMetricsSnapshot, TcpServerMetricsSnapshot
+
+
+DEFAULT_TCP_CLIENT_BUFFER_BYTES = 256 * 1024
+DEFAULT_TCP_MAX_CLIENTS = 256
+
+
+class _TcpClientProtocol(asyncio.Protocol):
+    """Track one subscriber connection; anything it sends is ignored."""
+
+    __slots__ = (
+        "_server",
+        "transport",
+        "client_id",
+        "peer",
+        "bytes",
+        "backlog_since",
+    )
+
+    def __init__(self, server: TcpFanoutServer) -> None:
+        self._server = server
+        self.transport = None
+        self.client_id = 0
+        self.peer = ""
+        self.bytes = 0
+        self.backlog_since = None
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+        peer = transport.get_extra_info("peername")
+        if isinstance(peer, tuple):
+            self.peer = f"{peer[0]}:{peer[1]}"
+        sock = transport.get_extra_info("socket")
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            # Writes are already batched per loop iteration.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._server._client_connected(self)
+
+    def connection_lost(self, exc) -> None:
+        self._server._client_lost(self)
+
+    def data_received(self, data: bytes) -> None:
+        pass
+
+
+class TcpFanoutServer:
+    """Own one listening socket and its bounded subscriber connections."""
+
+    __slots__ = (
+        "_host",
+        "_port",
+        "_client_buffer_bytes",
+        "_max_clients",
+        "_loop",
+        "_server",
+        "_clients",
+        "_pending",
+        "_pending_bytes",
+        "_flush_handle",
+        "_next_client_id",
+        "_accepted",
+        "_rejected",
+        "_evicted",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        client_buffer_bytes: int = DEFAULT_TCP_CLIENT_BUFFER_BYTES,
+        max_clients: int = DEFAULT_TCP_MAX_CLIENTS,
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._client_buffer_bytes = client_buffer_bytes
+        self._max_clients = max_clients
+        self._loop = None
+        self._server = None
+        self._clients: dict[_TcpClientProtocol, None] = {}
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._flush_handle = None
+        self._next_client_id = 1
+        self._accepted = 0
+        self._rejected = 0
+        self._evicted = 0
+        self._closed = False
+
+    @property
+    def listen(self) -> str:
+        if self._server is not None and self._server.sockets:
+            host, port = self._server.sockets[0].getsockname()[:2]
+            return f"{host}:{port}"
+        return f"{self._host}:{self._port}"
+
+    @property
+    def pending_bytes(self) -> int:
+        return self._pending_bytes
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._server = await self._loop.create_server(
+            lambda: _TcpClientProtocol(self),
+            self._host,
+            self._port,
+        )
+
+    def write(self, data: bytes) -> None:
+        """Queue one message for every client on the next loop iteration."""
+
+        if not self._clients:
+            return
+        self._pending.append(data)
+        self._pending_bytes += len(data)
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        pending = self._pending
+        if not pending:
+            return
+        payload = pending[0] if len(pending) == 1 else b"".join(pending)
+        self._pending = []
+        self._pending_bytes = 0
+        size = len(payload)
+        limit = self._client_buffer_bytes
+        now = self._loop.time()
+        for client in tuple(self._clients):
+            transport = client.transport
+            buffered = transport.get_write_buffer_size()
+            if not buffered:
+                # Drained since the last flush: a new backlog starts now.
+                client.backlog_since = None
+            elif buffered + size > limit:
+                self._evicted += 1
+                del self._clients[client]
+                transport.abort()
+                continue
+            transport.write(payload)
+            client.bytes += size
+            if transport.get_write_buffer_size() == 0:
+                client.backlog_since = None
+            elif client.backlog_since is None:
+                client.backlog_since = now
+
+    def _client_connected(self, client: _TcpClientProtocol) -> None:
+        if self._closed or len(self._clients) >= self._max_clients:
+            self._rejected += 1
+            client.transport.abort()
+            return
+        self._accepted += 1
+        client.client_id = self._next_client_id
+        self._next_client_id += 1
+        self._clients[client] = None
+
+    def _client_lost(self, client: _TcpClientProtocol) -> None:
+        self._clients.pop(client, None)
+
+    def metrics_snapshot(
+        self,
+        target_id: int,
+        name: str | None,
+    ) -> TcpServerMetricsSnapshot:
+        now = self._loop.time() if self._loop is not None else 0.0
+        clients = []
+        for client in self._clients:
+            buffered = client.transport.get_write_buffer_size()
+            since = client.backlog_since
+            clients.append(
+                TcpClientMetricsSnapshot(
+                    client_id=client.client_id,
+                    peer=client.peer,
+                    bytes=client.bytes,
+                    buffered_bytes=buffered,
+                    lag_us=(
+                        0
+                        if since is None or buffered == 0
+                        else int((now - since) * 1e6)
+                    ),
+                )
+            )
+        return TcpServerMetricsSnapshot(
+            target_id=target_id,
+            name=name,
+            listen=self.listen,
+            accepted=self._accepted,
+            rejected=self._rejected,
+            evicted=self._evicted,
+            clients=tuple(clients),
+        )
+
+    def close(self) -> None:
+        self._closed = True
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending = []
+        self._pending_bytes = 0
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for client in tuple(self._clients):
+            client.transport.abort()
+        self._clients.clear()
@@ -0,0 +1,241 @@
+"""Binary UDPSEC batch data frames (data frame version 2).
+
+Version 1 data frames carry one JSON object, and so one NMEA sentence, per
+encrypted datagram. A station and server that both offer version 2 during
+session confirmation may instead send ``NMEA-B`` frames: one AES-GCM nonce
+and tag for many sentences. The plaintext is one header followed by
+length-prefixed sentences::
+
+    version (1 byte) | flags (1 byte) | count (2 bytes)
+    count x (length (2 bytes) | sentence bytes)
+
+Integers are unsigned big-endian. Sentences are the raw NMEA bytes without
+line endings. Pings and pongs stay version 1 JSON frames.
+
+Sessions that also agree on ``deflate-nmea1`` compression may set
+``BATCH_FLAG_DEFLATE``; everything after the header is then one raw deflate
+stream primed with ``NMEA_DEFLATE_DICTIONARY``. Each frame is compressed on
+its own so a lost datagram never affects the next one. This module is
+transport-neutral and performs no encryption; callers decompress only
+authenticated plaintext.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+
+
+BATCH_PREFIX = b"NMEA-B"
+BATCH_AAD = b"NMEA-B"
+DATA_VERSION_JSON = 1
+DATA_VERSION_BATCH = 2
+DEFAULT_BATCH_MAX_BYTES = 1200
+DEFAULT_BATCH_MAX_DELAY = 0.2
+BATCH_FLAG_DEFLATE = 0x01
+COMPRESSION_DEFLATE_NMEA = "deflate-nmea1"
+# Part of the ``deflate-nmea1`` wire format: never edit it, add a new
+# compression name instead. Deflate reaches the end of a preset dictionary
+# with the shortest distances, so the most common strings come last.
+NMEA_DEFLATE_DICTIONARY = (
+    b"$GPGSV,3,1,12,$GPGSA,A,3,$GPVTG,$GNRMC,$GPRMC,$GNGGA,$GPGGA,"
+    b"!AIVDO,1,1,,A,!AIVDO,1,1,,B,!BSVDM,1,1,,A,!ABVDM,1,1,,B,"
+    b"\\g:1-2-,\\g:2-2-,!AIVDM,2,1,,A,!AIVDM,2,2,,A,!AIVDM,2,1,,B,"
+    b"!AIVDM,2,2,,B,,2*,4*\\n:,r:,t:,d:,c:17,s:"
+    b"\\s:,c:17,0000,0*5,0*6,0*7,0*2,0*1,0*3,0*4,"
+    b"\\c:17\\!AIVDM,1,1,,B,!AIVDM,1,1,,A,\\c:17"
+)
+# The secure listener reads datagrams of at most 8192 bytes.
+BATCH_MAX_PLAINTEXT = 8192 - len(BATCH_PREFIX) - 12 - 16
+
+_HEADER = struct.Struct(">BBH")
+_LENGTH = struct.Struct(">H")
+BATCH_MIN_PLAINTEXT = _HEADER.size + _LENGTH.size + 1
+_MAX_SENTENCE = (1 << 16) - 1
+_MAX_COUNT = (1 << 16) - 1
+
+__all__ = (
+    "BATCH_AAD",
+    "BATCH_FLAG_DEFLATE",
+    "BATCH_MAX_PLAINTEXT",
+    "BATCH_MIN_PLAINTEXT",
+    "BATCH_PREFIX",
+    "COMPRESSION_DEFLATE_NMEA",
+    "DATA_VERSION_BATCH",
+    "DATA_VERSION_JSON",
+    "DEFAULT_BATCH_MAX_BYTES",
+    "DEFAULT_BATCH_MAX_DELAY",
+    "NMEA_DEFLATE_DICTIONARY",
+    "SentenceBatch",
+    "compress_batch",
+    "decode_batch",
+    "decompress_batch",
+    "encode_batch",
+)
+
+
+def encode_batch(sentences: list[bytes], flags: int = 0) -> bytes:
+    """Return the plaintext of one batch frame holding ``sentences``."""
+
+    if not sentences:
+        raise ValueError("batch must hold at least one sentence")
+    if len(sentences) > _MAX_COUNT:
+        raise ValueError("batch holds too many sentences")
+    parts = [_HEADER.pack(DATA_VERSION_BATCH, flags, len(sentences))]
+    pack_length = _LENGTH.pack
+    for sentence in sentences:
+        if not 0 < len(sentence) <= _MAX_SENTENCE:
+            raise ValueError("batch sentence length out of range")
+        parts.append(pack_length(len(sentence)))
+        parts.append(sentence)
+    return b"".join(parts)
+
+
+def decode_batch(plaintext: bytes) -> tuple[int, list[bytes]]:
+    """Return the flags and sentences of one authenticated batch plaintext.
+
+    Raises ``ValueError`` for any framing that ``encode_batch`` cannot
+    produce.
+    """
+
+    end = len(plaintext)
+    if end < _HEADER.size:
+        raise ValueError("Batch frame too short")
+    version, flags, count = _HEADER.unpack_from(plaintext)
+    if version != DATA_VERSION_BATCH:
+        raise ValueError(f"Unsupported batch frame version {version}")
+    if not count:
+        raise ValueError("Batch frame holds no sentences")
+
+    sentences = []
+    offset = _HEADER.size
+    unpack_length = _LENGTH.unpack_from
+    for _ in range(count):
+        if offset + _LENGTH.size > end:
+            raise ValueError("Batch frame truncated")
+        (length,) = unpack_length(plaintext, offset)
+        offset += _LENGTH.size
+        stop = offset + length
+        if not length or stop > end:
+            raise ValueError("Batch sentence length out of range")
+        sentences.append(plaintext[offset:stop])
+        offset = stop
+    if offset != end:
+        raise ValueError("Batch frame has trailing bytes")
+    return flags, sentences
+
+
+def compress_batch(plaintext: bytes) -> bytes:
+    """Return ``plaintext`` with its body deflated and the flag set.
+
+    A body that deflate cannot shrink is returned unchanged, without the
+    flag, so compression never makes a frame larger.
+    """
+
+    compressor = zlib.compressobj(
+        zlib.Z_BEST_COMPRESSION,
+        zlib.DEFLATED,
+        -zlib.MAX_WBITS,
+        zdict=NMEA_DEFLATE_DICTIONARY,
+    )
+    body = compressor.compress(plaintext[_HEADER.size:]) + compressor.flush()
+    if len(body) >= len(plaintext) - _HEADER.size:
+        return plaintext
+    return b"".join(
+        (
+            plaintext[:1],
+            bytes((plaintext[1] | BATCH_FLAG_DEFLATE,)),
+            plaintext[2:_HEADER.size],
+            body,
+        )
+    )
+
+
+def decompress_batch(plaintext: bytes) -> bytes:
+    """Return an authenticated batch plaintext with its body inflated.
+
+    Plaintext without ``BATCH_FLAG_DEFLATE`` is returned unchanged. The
+    inflated frame is held to ``BATCH_MAX_PLAINTEXT`` like an uncompressed
+    one; a larger, truncated or corrupt stream raises ``ValueError``.
+    """
+
+    if len(plaintext) < _HEADER.size:
+        raise ValueError("Batch frame too short")
+    flags = plaintext[1]
+    if not flags & BATCH_FLAG_DEFLATE:
+        return plaintext
+    decompressor = zlib.decompressobj(
+        -zlib.MAX_WBITS,
+        zdict=NMEA_DEFLATE_DICTIONARY,
+    )
+    try:
+        body = decompressor.decompress(
+            plaintext[_HEADER.size:],
+            BATCH_MAX_PLAINTEXT - _HEADER.size,
+        )
+    except zlib.error as exc:
+        raise ValueError(f"Corrupt compressed batch: {exc}") from None
+    if (
+        not decompressor.eof
+        or decompressor.unconsumed_tail
+        or decompressor.unused_data
+    ):
+        raise ValueError("Compressed batch is truncated or too large")
+    return b"".join(
+        (
+            plaintext[:1],
+            bytes((flags & ~BATCH_FLAG_DEFLATE,)),
+            plaintext[2:_HEADER.size],
+            body,
+        )
+    )
+
+
+class SentenceBatch:
+    """Sentences waiting to be sent in one batch frame.
+
+    ``add`` hands back the full batch when the next sentence would push its
+    plaintext past ``max_bytes``; a single longer sentence still gets a
+    batch of its own. ``started_at`` is the time of the oldest sentence,
+    from which the caller flushes by deadline.
+    """
+
+    __slots__ = ("max_bytes", "started_at", "_sentences", "_size")
+
+    def __init__(self, max_bytes: int = DEFAULT_BATCH_MAX_BYTES) -> None:
+        if not BATCH_MIN_PLAINTEXT <= max_bytes <= BATCH_MAX_PLAINTEXT:
+            raise ValueError(
+                f"batch max_bytes must be between {BATCH_MIN_PLAINTEXT} and "
+                f"{BATCH_MAX_PLAINTEXT}"
+            )
+        self.max_bytes = max_bytes
+        self.started_at: float | None = None
+        self._sentences: list[bytes] = []
+        self._size = _HEADER.size
+
+    def __len__(self) -> int:
+        return len(self._sentences)
+
+    def add(self, sentence: bytes, now: float) -> list[bytes] | None:
+        """Queue one sentence; return the batch it displaced, if any."""
+
+        full = None
+        size = _LENGTH.size + len(sentence)
+        if self._sentences and self._size + size > self.max_bytes:
+            full = self.take()
+        if not self._sentences:
+            self.started_at = now
+        self._sentences.append(sentence)
+        self._size += size
+        return full
+
+    def take(self) -> list[bytes] | None:
+        """Return the queued sentences and start an empty batch."""
+
+        if not self._sentences:
+            return None
+        sentences = self._sentences
+        self._sentences = []
+        self._size = _HEADER.size
+        self.started_at = None
+        return sentences
@@ -0,0 +1,569 @@
+"""Last known position of each vessel, keyed by MMSI, in parallel arrays.
+
+``VesselTable`` keeps one row per vessel across fixed-width ``array``
+columns instead of one object per vessel: about sixty bytes a vessel, so a
+hundred thousand vessels take a few MB. An open-addressing ``array`` of row
+numbers maps MMSIs to rows, a uniform grid links the rows of each cell for
+bounding-box queries, and a recency list links rows from the least to the
+most recently updated, so rows whose TTL has passed are recycled from its
+head in constant time. The table is not thread safe; the processor updates it
+and control queries read it from the same event loop.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+import math
+import time
+
+from core.ais_payload import AisPayload, AisPayloadError
+from core.geo_index import DEFAULT_GEO_CELL_DEGREES, Bounds
+
+
+DEFAULT_VESSEL_CAPACITY = 131_072
+DEFAULT_VESSEL_TTL_SECONDS = 1800.0
+DEFAULT_VESSEL_QUERY_LIMIT = 100
+MAX_VESSEL_QUERY_LIMIT = 1000
+
+# Position report type character -> message type.
+_POSITION_TYPES = {"1": 1, "2": 2, "3": 3, "B": 18, "C": 19, "K": 27}
+# Positions are kept in the 1/10000 minute units of types 1-3, 18 and 19.
+_DEGREE_UNITS = 600_000
+_SOG_UNAVAILABLE = 1023
+_COG_UNAVAILABLE = 3600
+_NO_ROW = -1
+# Rows beyond their TTL that one insert reclaims from the recency list.
+_RECLAIM_PER_INSERT = 2
+
+
+class VesselTableConfigError(ValueError):
+    """Raised when the optional ``vessel_table`` configuration is invalid."""
+
+
+@dataclass(frozen=True, slots=True)
+class VesselState:
+    """One vessel's last reported position, as returned by queries.
+
+    ``sog`` is in knots and ``cog`` in degrees, ``None`` when the report
+    marked them not available. ``source_id`` is the routing source of the
+    frame that carried the report.
+    """
+
+    mmsi: int
+    lon: float
+    lat: float
+    sog: float | None
+    cog: float | None
+    timestamp: float
+    message_type: int
+    source_id: str
+
+
+class VesselTable:
+    """Bounded MMSI-keyed table of the latest position report per vessel.
+
+    At most ``capacity`` vessels are kept. A vessel not updated for
+    ``ttl_s`` seconds is left out of queries and its row is reused; when
+    every row is live, the least recently updated vessel is evicted. Query
+    ages are measured against ``clock``.
+    """
+
+    __slots__ = (
+        "capacity",
+        "ttl_s",
+        "cell_degrees",
+        "evictions",
+        "_clock",
+        "_scale",
+        "_columns",
+        "_rows",
+        "_mmsi",
+        "_lon",
+        "_lat",
+        "_sog",
+        "_cog",
+        "_timestamp",
+        "_message_type",
+        "_source",
+        "_cell",
+        "_cell_next",
+        "_cell_prev",
+        "_older",
+        "_newer",
+        "_oldest",
+        "_newest",
+        "_cell_heads",
+        "_slots",
+        "_slot_mask",
+        "_sources",
+        "_source_rows",
+        "_source_refs",
+        "_free_sources",
+        "_free",
+        "_count",
+    )
+
+    def __init__(
+        self,
+        *,
+        capacity: int = DEFAULT_VESSEL_CAPACITY,
+        ttl_s: float = DEFAULT_VESSEL_TTL_SECONDS,
+        cell_degrees: float = DEFAULT_GEO_CELL_DEGREES,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if isinstance(capacity, bool) or not isinstance(capacity, int):
+            raise TypeError("capacity must be an integer.")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        if not ttl_s > 0:
+            raise ValueError("ttl_s must be greater than 0.")
+        if not 0 < cell_degrees <= 90:
+            raise ValueError("cell_degrees must be greater than 0 and at most 90.")
+        self.capacity = capacity
+        self.ttl_s = ttl_s
+        self.cell_degrees = cell_degrees
+        self.evictions = 0
+        self._clock = time.time if clock is None else clock
+        self._scale = 1 / cell_degrees
+        self._columns = math.ceil(360 / cell_degrees)
+        self._rows = math.ceil(180 / cell_degrees)
+        self._mmsi = array("I")
+        self._lon = array("i")
+        self._lat = array("i")
+        self._sog = array("H")
+        self._cog = array("H")
+        self._timestamp = array("d")
+        self._message_type = array("B")
+        self._source = array("I")
+        self._cell = array("i")
+        self._cell_next = array("i")
+        self._cell_prev = array("i")
+        self._older = array("i")
+        self._newer = array("i")
+        self._oldest = _NO_ROW
+        self._newest = _NO_ROW
+        self._cell_heads: dict[int, int] = {}
+        # Row + 1 per slot, 0 when empty; at most half full.
+        slot_count = 1 << (2 * capacity - 1).bit_length()
+        self._slots = array("i", bytes(4 * slot_count))
+        self._slot_mask = slot_count - 1
+        self._sources: list[str] = []
+        self._source_rows: dict[str, int] = {}
+        # Rows per interned source; a source's slot is reused once it has none.
+        self._source_refs: list[int] = []
+        self._free_sources: list[int] = []
+        self._free: list[int] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of rows in use, including expired ones."""
+
+        return self._count
+
+    def observe(self, sentence: str, source_id: str, timestamp: float) -> bool:
+        """Update the table from one AIVDM/AIVDO sentence.
+
+        Only position reports (types 1-3, 18, 19 and 27) with an available
+        position are recorded; returns whether the sentence was one.
+        """
+
+        fields = sentence.split(",", 7)
+        if len(fields) < 7:
+            return False
+        payload = fields[5]
+        message_type = _POSITION_TYPES.get(payload[:1])
+        if message_type is None:
+            return False
+        fill = fields[6][:1]
+        try:
+            report = AisPayload(payload, int(fill) if fill.isdigit() else 0)
+            lon = report["lon"]
+            lat = report["lat"]
+        except AisPayloadError:
+            return False
+        if lon is None or lat is None or not (
+            -180 <= lon <= 180 and -90 <= lat <= 90
+        ):
+            return False
+        sog = report["sog"]
+        cog = report["cog"]
+        if message_type == 27:
+            sog = None if sog is None or sog == 63 else sog
+            cog = None if cog is None or cog == 511 else cog
+        self.update(
+            report["mmsi"],
+            lon,
+            lat,
+            sog,
+            cog,
+            timestamp,
+            message_type,
+            source_id,
+        )
+        return True
+
+    def update(
+        self,
+        mmsi: int,
+        lon: float,
+        lat: float,
+        sog: float | None,
+        cog: float | None,
+        timestamp: float,
+        message_type: int,
+        source_id: str,
+    ) -> None:
+        """Record one vessel's position, replacing what the table held."""
+
+        row = self._find(mmsi)[1]
+        if row == _NO_ROW:
+            row = self._allocate(timestamp)
+            self._slots[self._find(mmsi)[0]] = row + 1
+            self._mmsi[row] = mmsi
+            self._cell[row] = _NO_ROW
+            self._count += 1
+            self._link_newest(row)
+            previous_source = _NO_ROW
+        else:
+            if row != self._newest:
+                self._unlink_recency(row)
+                self._link_newest(row)
+            previous_source = self._source[row]
+
+        self._lon[row] = round(lon * _DEGREE_UNITS)
+        self._lat[row] = round(lat * _DEGREE_UNITS)
+        self._sog[row] = (
+            _SOG_UNAVAILABLE
+            if sog is None or not 0 <= sog < 102.3
+            else round(sog * 10)
+        )
+        self._cog[row] = (
+            _COG_UNAVAILABLE
+            if cog is None or not 0 <= cog < 360
+            else round(cog * 10)
+        )
+        self._timestamp[row] = timestamp
+        self._message_type[row] = message_type
+        source = self._source_rows.get(source_id)
+        if source is None:
+            if self._free_sources:
+                source = self._free_sources.pop()
+                self._sources[source] = source_id
+            else:
+                source = len(self._sources)
+                self._sources.append(source_id)
+                self._source_refs.append(0)
+            self._source_rows[source_id] = source
+        if source != previous_source:
+            self._source_refs[source] += 1
+            if previous_source != _NO_ROW:
+                self._release_source(previous_source)
+            self._source[row] = source
+
+        # _cell_key inlined; positions are already in range.
+        scale = self._scale
+        columns = self._columns
+        column = int((lon + 180) * scale)
+        grid_row = int((lat + 90) * scale)
+        cell = (
+            (grid_row - (grid_row == self._rows)) * columns
+            + column
+            - (column == columns)
+        )
+        if cell != self._cell[row]:
+            if self._cell[row] != _NO_ROW:
+                self._unlink_cell(row)
+            self._link_cell(row, cell)
+
+    def get(self, mmsi: int) -> VesselState | None:
+        """Return the vessel's state, or ``None`` if unknown or expired."""
+
+        row = self._find(mmsi)[1]
+        if row == _NO_ROW or self._timestamp[row] < self._clock() - self.ttl_s:
+            return None
+        return self._state(row)
+
+    def query_bounds(
+        self,
+        bounds: Bounds,
+        *,
+        limit: int = DEFAULT_VESSEL_QUERY_LIMIT,
+    ) -> tuple[tuple[VesselState, ...], bool]:
+        """Return up to ``limit`` live vessels inside ``bounds``.
+
+        ``bounds`` is ``(min_lon, min_lat, max_lon, max_lat)`` and includes
+        its border. Vessels come in grid cell order, west to east and south
+        to north, and the flag reports whether more matched than ``limit``.
+        """
+
+        min_lon, min_lat, max_lon, max_lat = bounds
+        first_column = self._column(min_lon)
+        last_column = self._column(max_lon)
+        first_row = self._row(min_lat)
+        last_row = self._row(max_lat)
+        heads = self._cell_heads
+        columns = self._columns
+        cell_count = (last_column - first_column + 1) * (last_row - first_row + 1)
+        if cell_count > len(heads):
+            # Fewer occupied cells than cells in the box: visit only those.
+            cells = sorted(
+                cell
+                for cell in heads
+                if first_row <= cell // columns <= last_row
+                and first_column <= cell % columns <= last_column
+            )
+        else:
+            cells = [
+                row * columns + column
+                for row in range(first_row, last_row + 1)
+                for column in range(first_column, last_column + 1)
+            ]
+
+        low_lon = math.ceil(min_lon * _DEGREE_UNITS - 1e-6)
+        high_lon = math.floor(max_lon * _DEGREE_UNITS + 1e-6)
+        low_lat = math.ceil(min_lat * _DEGREE_UNITS - 1e-6)
+        high_lat = math.floor(max_lat * _DEGREE_UNITS + 1e-6)
+        oldest = self._clock() - self.ttl_s
+        lon_column = self._lon
+        lat_column = self._lat
+        timestamps = self._timestamp
+        cell_next = self._cell_next
+        matched: list[int] = []
+        for cell in cells:
+            row = heads.get(cell, _NO_ROW)
+            while row != _NO_ROW:
+                if (
+                    low_lon <= lon_column[row] <= high_lon
+                    and low_lat <= lat_column[row] <= high_lat
+                    and timestamps[row] >= oldest
+                ):
+                    if len(matched) == limit:
+                        return tuple(map(self._state, matched)), True
+                    matched.append(row)
+                row = cell_next[row]
+        return tuple(map(self._state, matched)), False
+
+    def expire(self) -> int:
+        """Free the rows of every vessel past its TTL and return how many."""
+
+        return self._reclaim(self._clock() - self.ttl_s, self._count)
+
+    def _state(self, row: int) -> VesselState:
+        sog = self._sog[row]
+        cog = self._cog[row]
+        return VesselState(
+            mmsi=self._mmsi[row],
+            lon=self._lon[row] / _DEGREE_UNITS,
+            lat=self._lat[row] / _DEGREE_UNITS,
+            sog=None if sog == _SOG_UNAVAILABLE else sog / 10,
+            cog=None if cog == _COG_UNAVAILABLE else cog / 10,
+            timestamp=self._timestamp[row],
+            message_type=self._message_type[row],
+            source_id=self._sources[self._source[row]],
+        )
+
+    def _find(self, mmsi: int) -> tuple[int, int]:
+        """Return ``(slot, row)`` for ``mmsi``; an empty slot has no row."""
+
+        slots = self._slots
+        mask = self._slot_mask
+        mmsi_column = self._mmsi
+        slot = (mmsi * 0x9E3779B1 >> 12) & mask
+        while True:
+            entry = slots[slot]
+            if not entry:
+                return slot, _NO_ROW
+            if mmsi_column[entry - 1] == mmsi:
+                return slot, entry - 1
+            slot = (slot + 1) & mask
+
+    def _allocate(self, timestamp: float) -> int:
+        self._reclaim(timestamp - self.ttl_s, _RECLAIM_PER_INSERT)
+        if self._free:
+            return self._free.pop()
+        row = len(self._mmsi)
+        if row < self.capacity:
+            for column in (
+                self._mmsi,
+                self._lon,
+                self._lat,
+                self._sog,
+                self._cog,
+                self._timestamp,
+                self._message_type,
+                self._source,
+                self._cell,
+                self._cell_next,
+                self._cell_prev,
+                self._older,
+                self._newer,
+            ):
+                column.append(0)
+            return row
+        self.evictions += 1
+        row = self._oldest
+        self._remove(row)
+        return self._free.pop()
+
+    def _reclaim(self, oldest: float, limit: int) -> int:
+        reclaimed = 0
+        while (
+            reclaimed < limit
+            and self._oldest != _NO_ROW
+            and self._timestamp[self._oldest] < oldest
+        ):
+            self._remove(self._oldest)
+            reclaimed += 1
+        return reclaimed
+
+    def _remove(self, row: int) -> None:
+        self._unindex(self._find(self._mmsi[row])[0])
+        self._unlink_cell(row)
+        self._unlink_recency(row)
+        self._release_source(self._source[row])
+        self._free.append(row)
+        self._count -= 1
+
+    def _release_source(self, source: int) -> None:
+        self._source_refs[source] -= 1
+        if not self._source_refs[source]:
+            del self._source_rows[self._sources[source]]
+            self._sources[source] = ""
+            self._free_sources.append(source)
+
+    def _unindex(self, slot: int) -> None:
+        # Linear probing deletion: pull later entries of the probe run back
+        # into the hole, so lookups never need tombstones.
+        slots = self._slots
+        mask = self._slot_mask
+        mmsi_column = self._mmsi
+        hole = slot
+        slot = (slot + 1) & mask
+        entry = slots[slot]
+        while entry:
+            home = (mmsi_column[entry - 1] * 0x9E3779B1 >> 12) & mask
+            if (slot - home) & mask >= (slot - hole) & mask:
+                slots[hole] = entry
+                hole = slot
+            slot = (slot + 1) & mask
+            entry = slots[slot]
+        slots[hole] = 0
+
+    def _cell_key(self, lon: float, lat: float) -> int:
+        return self._row(lat) * self._columns + self._column(lon)
+
+    def _column(self, lon: float) -> int:
+        column = int((lon + 180) * self._scale)
+        return min(max(column, 0), self._columns - 1)
+
+    def _row(self, lat: float) -> int:
+        row = int((lat + 90) * self._scale)
+        return min(max(row, 0), self._rows - 1)
+
+    def _link_cell(self, row: int, cell: int) -> None:
+        head = self._cell_heads.get(cell, _NO_ROW)
+        self._cell[row] = cell
+        self._cell_prev[row] = _NO_ROW
+        self._cell_next[row] = head
+        if head != _NO_ROW:
+            self._cell_prev[head] = row
+        self._cell_heads[cell] = row
+
+    def _unlink_cell(self, row: int) -> None:
+        previous = self._cell_prev[row]
+        following = self._cell_next[row]
+        if previous == _NO_ROW:
+            if following == _NO_ROW:
+                del self._cell_heads[self._cell[row]]
+            else:
+                self._cell_heads[self._cell[row]] = following
+        else:
+            self._cell_next[previous] = following
+        if following != _NO_ROW:
+            self._cell_prev[following] = previous
+
+    def _link_newest(self, row: int) -> None:
+        newest = self._newest
+        self._older[row] = newest
+        self._newer[row] = _NO_ROW
+        if newest == _NO_ROW:
+            self._oldest = row
+        else:
+            self._newer[newest] = row
+        self._newest = row
+
+    def _unlink_recency(self, row: int) -> None:
+        older = self._older[row]
+        newer = self._newer[row]
+        if older == _NO_ROW:
+            self._oldest = newer
+        else:
+            self._newer[older] = newer
+        if newer == _NO_ROW:
+            self._newest = older
+        else:
+            self._older[newer] = older
+
+
+def load_optional_vessel_table(
+    config: Mapping[str, object],
+) -> VesselTable | None:
+    """Build the table from the optional top-level ``vessel_table`` section.
+
+    The table exists only with ``vessel_table.enabled: true``; ``capacity``,
+    ``ttl_seconds`` and ``cell_degrees`` default to the module constants.
+    """
+
+    section = config.get("vessel_table")
+    if section is None:
+        return None
+    if not isinstance(section, Mapping):
+        raise VesselTableConfigError("'vessel_table' config must be a mapping.")
+    unknown_fields = set(section) - {
+        "enabled",
+        "capacity",
+        "ttl_seconds",
+        "cell_degrees",
+    }
+    if unknown_fields:
+        raise VesselTableConfigError(
+            "'vessel_table' config has unknown field(s): "
+            f"{', '.join(sorted(str(field) for field in unknown_fields))}."
+        )
+    enabled = section.get("enabled", False)
+    if not isinstance(enabled, bool):
+        raise VesselTableConfigError("'vessel_table.enabled' must be a boolean.")
+    if not enabled:
+        return None
+
+    capacity = section.get("capacity", DEFAULT_VESSEL_CAPACITY)
+    if isinstance(capacity, bool) or not isinstance(capacity, int) or capacity < 1:
+        raise VesselTableConfigError(
+            "'vessel_table.capacity' must be a positive integer."
+        )
+    values = {}
+    for name, default in (
+        ("ttl_seconds", DEFAULT_VESSEL_TTL_SECONDS),
+        ("cell_degrees", DEFAULT_GEO_CELL_DEGREES),
+    ):
+        value = section.get(name, default)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise VesselTableConfigError(
+                f"'vessel_table.{name}' must be a positive number."
+            )
+        values[name] = float(value)
+    if not values["ttl_seconds"] > 0:
+        raise VesselTableConfigError(
+            "'vessel_table.ttl_seconds' must be a positive number."
+        )
+    if not 0 < values["cell_degrees"] <= 90:
+        raise VesselTableConfigError(
+            "'vessel_table.cell_degrees' must be greater than 0 and at most 90."
+        )
+    return VesselTable(
+        capacity=capacity,
+        ttl_s=values["ttl_seconds"],
+        cell_degrees=values["cell_degrees"],
+    )
@@ -1,12 +1,40 @@
 import asyncio
 import ipaddress
 import socket
+import time
 from dataclasses import dataclass
 from types import MappingProxyType
 from typing import Iterable, Mapping
 
-from core.metrics import OutputTrafficMetricsSnapshot
-from core.target_identity import EgressTargetId, build_udp_target_id
+from core.file_sink import (
+    DEFAULT_FILE_SINK_FLUSH_INTERVAL_MS,
+    DEFAULT_FILE_SINK_QUEUE_MAX_BYTES,
+    DEFAULT_FILE_SINK_ROTATE_INTERVAL_S,
+    FILE_SINK_COMPRESSIONS,
+    FileSinkConfigError,
+    FileSinkWriter,
+    load_zstd_compressor_factory,
+)
+from core.metrics import OutputTrafficMetricsSnapshot, TcpServerMetricsSnapshot
+from core.shm_ring import (
+    DEFAULT_SHM_RING_BYTES,
+    MIN_SHM_RING_BYTES,
+    ShmRingWriter,
+)
+from core.target_identity import (
+    EgressTargetId,
+    build_file_target_id,
+    build_shm_target_id,
+    build_multicast_target_id,
+    build_tcp_target_id,
+    build_udp_target_id,
+    build_unix_target_id,
+)
+from core.tcp_fanout import (
+    DEFAULT_TCP_CLIENT_BUFFER_BYTES,
+    DEFAULT_TCP_MAX_CLIENTS,
+    TcpFanoutServer,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -17,6 +45,202 @@ class _UdpDestination:
     family: int = socket.AF_UNSPEC
 
 
+@dataclass(frozen=True, slots=True)
+class _UnixDestination:
+    path: str
+
+
+@dataclass(frozen=True, slots=True)
+class _ShmDestination:
+    name: str
+    size_bytes: int = DEFAULT_SHM_RING_BYTES
+
+
+@dataclass(frozen=True, slots=True)
+class _TcpServerDestination:
+    host: str
+    port: int
+    client_buffer_bytes: int = DEFAULT_TCP_CLIENT_BUFFER_BYTES
+    max_clients: int = DEFAULT_TCP_MAX_CLIENTS
+
+
+@dataclass(frozen=True, slots=True)
+class _MulticastDestination:
+    group: str
+    port: int
+    family: int
+    ttl: int = 1
+    loopback: bool = True
+    interface: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _FileSinkDestination:
+    directory: str
+    prefix: str = "aismixer"
+    compression: str = "none"
+    rotate_interval_s: int = DEFAULT_FILE_SINK_ROTATE_INTERVAL_S
+    flush_interval_ms: int = DEFAULT_FILE_SINK_FLUSH_INTERVAL_MS
+    queue_max_bytes: int = DEFAULT_FILE_SINK_QUEUE_MAX_BYTES
+
+
+DEFAULT_MULTICAST_TTL = 1
+FORWARDER_TARGET_TYPES = (
+    "udp",
+    "unix",
+    "shm",
+    "tcp_server",
+    "multicast",
+    "file",
+)
+DEFAULT_WRITE_BUFFER_MAX_BYTES = 1024 * 1024
+WRITE_BUFFER_OVERFLOW_POLICIES = ("drop", "keep")
+DEFAULT_RESOLVE_INTERVAL_S = 300.0
+
+
+class _ForwarderProtocol(asyncio.DatagramProtocol):
+    """Track flow-control state of one forwarder datagram transport."""
+
+    __slots__ = ("paused", "pauses")
+
+    def __init__(self) -> None:
+        self.paused = False
+        self.pauses = 0
+
+    def pause_writing(self) -> None:
+        self.paused = True
+        self.pauses += 1
+
+    def resume_writing(self) -> None:
+        self.paused = False
+
+
+class _UnixDatagramTransport:
+    """Address every datagram to one Unix socket path.
+
+    The socket stays unconnected so a consumer that is absent at startup or
+    restarts later only loses datagrams, exactly like a UDP receiver.
+    """
+
+    __slots__ = ("_transport", "_path")
+
+    def __init__(self, transport, path: str) -> None:
+        self._transport = transport
+        self._path = path
+
+    def sendto(self, data: bytes) -> None:
+        self._transport.sendto(data, self._path)
+
+    def get_write_buffer_size(self) -> int:
+        return self._transport.get_write_buffer_size()
+
+    def set_write_buffer_limits(self, high=None, low=None) -> None:
+        self._transport.set_write_buffer_limits(high=high, low=low)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _ShmRingTransport:
+    """Expose a shared-memory ring writer through the transport interface.
+
+    Ring writes never block or buffer, so the write buffer is always empty.
+    """
+
+    __slots__ = ("_writer",)
+
+    def __init__(self, writer: ShmRingWriter) -> None:
+        self._writer = writer
+
+    def sendto(self, data: bytes) -> None:
+        self._writer.write(data)
+
+    def get_write_buffer_size(self) -> int:
+        return 0
+
+    def set_write_buffer_limits(self, high=None, low=None) -> None:
+        pass
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class _TcpFanoutTransport:
+    """Expose a TCP fan-out server through the transport interface.
+
+    The buffered size is what waits for the next per-iteration flush; each
+    client's own buffer is bounded by the server.
+    """
+
+    __slots__ = ("server",)
+
+    def __init__(self, server: TcpFanoutServer) -> None:
+        self.server = server
+
+    def sendto(self, data: bytes) -> None:
+        self.server.write(data)
+
+    def get_write_buffer_size(self) -> int:
+        return self.server.pending_bytes
+
+    def set_write_buffer_limits(self, high=None, low=None) -> None:
+        pass
+
+    def close(self) -> None:
+        self.server.close()
+
+
+class _FileSinkTransport:
+    """Expose a background file-sink writer through the transport interface.
+
+    The buffered size is the batch waiting for the writer thread, so the
+    target's write-buffer bound also bounds that queue.
+    """
+
+    __slots__ = ("writer",)
+
+    def __init__(self, writer: FileSinkWriter) -> None:
+        self.writer = writer
+
+    def sendto(self, data: bytes) -> None:
+        self.writer.write(data)
+
+    def get_write_buffer_size(self) -> int:
+        return self.writer.pending_bytes
+
+    def set_write_buffer_limits(self, high=None, low=None) -> None:
+        pass
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class _ResolutionMetrics:
+    """Own hostname resolution counters for one forwarder transport."""
+
+    __slots__ = (
+        "resolutions",
+        "resolve_failures",
+        "transport_failures",
+        "address_changes",
+        "resolve_latency_us",
+    )
+
+    def __init__(self) -> None:
+        self.resolutions = 0
+        self.resolve_failures = 0
+        self.transport_failures = 0
+        self.address_changes = 0
+        self.resolve_latency_us = 0
+
+    def resolved(self, started: float) -> None:
+        self.resolutions += 1
+        self.resolve_latency_us = int((time.perf_counter() - started) * 1e6)
+
+
+_NO_RESOLUTION = _ResolutionMetrics()
+
+
 class _OutputTrafficMetrics:
     """Own lifetime local-dispatch counters for one numeric target."""
 
@@ -28,6 +252,7 @@ class _OutputTrafficMetrics:
         "_dispatch_failed",
         "_messages",
         "_bytes",
+        "_buffer_drops",
     )
 
     def __init__(self, target_id: EgressTargetId, name: str | None) -> None:
@@ -39,6 +264,19 @@ class _OutputTrafficMetrics:
             dispatch_failed=0,
             messages=0,
             bytes=0,
+            buffered_bytes=0,
+            buffer_drops=0,
+            write_pauses=0,
+            resolutions=0,
+            resolve_failures=0,
+            transport_failures=0,
+            address_changes=0,
+            resolve_latency_us=0,
+            sink_bytes_written=0,
+            sink_rotations=0,
+            sink_write_errors=0,
+            sink_dropped=0,
+            sink_lag_us=0,
         )
         self._target_id = initial.target_id
         self._name = initial.name
@@ -47,6 +285,7 @@ class _OutputTrafficMetrics:
         self._dispatch_failed = 0
         self._messages = 0
         self._bytes = 0
+        self._buffer_drops = 0
 
     def dispatch_started(self) -> None:
         self._dispatch_attempts += 1
@@ -61,7 +300,19 @@ class _OutputTrafficMetrics:
     def dispatch_failed(self) -> None:
         self._dispatch_failed += 1
 
-    def snapshot(self) -> OutputTrafficMetricsSnapshot:
+    def dispatch_dropped(self) -> None:
+        """Account a datagram dropped because the write buffer is full."""
+
+        self._buffer_drops += 1
+
+    def snapshot(
+        self,
+        *,
+        buffered_bytes: int = 0,
+        write_pauses: int = 0,
+        resolution: _ResolutionMetrics = _NO_RESOLUTION,
+        sink: FileSinkWriter | None = None,
+    ) -> OutputTrafficMetricsSnapshot:
         return OutputTrafficMetricsSnapshot(
             target_id=self._target_id,
             name=self._name,
@@ -70,9 +321,78 @@ class _OutputTrafficMetrics:
             dispatch_failed=self._dispatch_failed,
             messages=self._messages,
             bytes=self._bytes,
+            buffered_bytes=buffered_bytes,
+            buffer_drops=self._buffer_drops,
+            write_pauses=write_pauses,
+            resolutions=resolution.resolutions,
+            resolve_failures=resolution.resolve_failures,
+            transport_failures=resolution.transport_failures,
+            address_changes=resolution.address_changes,
+            resolve_latency_us=resolution.resolve_latency_us,
+            sink_bytes_written=0 if sink is None else sink.bytes_written,
+            sink_rotations=0 if sink is None else sink.rotations,
+            sink_write_errors=0 if sink is None else sink.write_errors,
+            sink_dropped=0 if sink is None else sink.dropped,
+            sink_lag_us=0 if sink is None else sink.lag_us,
         )
 
 
+# Per-target egress queue fields, interpreted by core.egress_targets.
+_EGRESS_QUEUE_KEYS = (
+    "queue_maxsize",
+    "queue_overflow",
+    "coalesce",
+    "coalesce_max_bytes",
+    "coalesce_deadline_ms",
+    "rate_messages_per_s",
+    "rate_burst_messages",
+    "rate_bytes_per_s",
+    "rate_burst_bytes",
+)
+_WRITE_BUFFER_KEYS = ("write_buffer_max_bytes", "write_buffer_overflow")
+_RESOLVER_KEYS = ("resolve_interval_s",)
+# Per-target payload framing, interpreted by core.output_builder.
+_OUTPUT_PROFILE_KEYS = ("output_profile",)
+# Per-target position downsampling, interpreted by core.emission_throttle.
+_THROTTLE_KEYS = ("throttle_interval_s",)
+_ADDRESS_KEYS = {
+    "udp": ("host", "port"),
+    "unix": ("path",),
+    "shm": ("name", "size_bytes"),
+    "tcp_server": (
+        "listen_host",
+        "listen_port",
+        "client_buffer_max_bytes",
+        "max_clients",
+    ),
+    "multicast": ("group", "port", "ttl", "loopback", "interface"),
+    "file": (
+        "directory",
+        "prefix",
+        "compression",
+        "rotate_interval_s",
+        "flush_interval_ms",
+        "queue_max_bytes",
+    ),
+}
+_REQUIRED_ADDRESS_KEYS = {
+    "udp": ("host", "port"),
+    "unix": ("path",),
+    "shm": ("name",),
+    "tcp_server": ("listen_host", "listen_port"),
+    "multicast": ("group", "port"),
+    "file": ("directory",),
+}
+_TARGET_ID_BUILDERS = {
+    "udp": build_udp_target_id,
+    "unix": build_unix_target_id,
+    "shm": build_shm_target_id,
+    "tcp_server": build_tcp_target_id,
+    "multicast": build_multicast_target_id,
+    "file": build_file_target_id,
+}
+
+
 class ForwarderConfigError(ValueError):
     """Raised when UDP forwarder configuration is invalid."""
 
@@ -88,16 +408,51 @@ class Forwarder:
         self._destinations = tuple(
             _destination_from_entry(entry) for entry in self._targets
         )
+        self._write_buffer_limits = tuple(
+            _write_buffer_limit_from_entry(entry) for entry in self._targets
+        )
+        self._transport_keys = tuple(
+            _transport_cache_key(destination)
+            for destination in self._destinations
+        )
+        # Hostname transports share one re-resolution loop per cache key,
+        # running at the shortest interval any of their targets asks for.
+        resolve_intervals: dict[tuple, float] = {}
+        resolve_destinations: dict[tuple, _UdpDestination] = {}
+        for entry, destination, key in zip(
+            self._targets,
+            self._destinations,
+            self._transport_keys,
+        ):
+            interval = _resolve_interval_from_entry(entry)
+            if (
+                not isinstance(destination, _UdpDestination)
+                or _parse_literal_host(destination.host) is not None
+            ):
+                continue
+            resolve_intervals[key] = min(
+                interval,
+                resolve_intervals.get(key, interval),
+            )
+            resolve_destinations[key] = destination
+        self._resolve_intervals = MappingProxyType(resolve_intervals)
+        self._resolve_destinations = MappingProxyType(resolve_destinations)
+        self._resolution = MappingProxyType(
+            {key: _ResolutionMetrics() for key in resolve_intervals}
+        )
+        self._resolved_addresses = {}
         self._all_target_ids = tuple(range(len(self._destinations)))
 
         target_id_by_name: dict[str, EgressTargetId] = {}
         for target_id, entry in enumerate(self._targets):
             if "id" not in entry:
                 continue
-            target_name = build_udp_target_id(entry["id"])
+            target_name = _TARGET_ID_BUILDERS[entry.get("type", "udp")](
+                entry["id"]
+            )
             if target_name in target_id_by_name:
                 raise ForwarderConfigError(
-                    f"Duplicate UDP forwarder target ID: {target_name}"
+                    f"Duplicate forwarder target ID: {target_name}"
                 )
             target_id_by_name[target_name] = target_id
 
@@ -108,11 +463,14 @@ class Forwarder:
         ]
         for target_name, target_id in target_id_by_name.items():
             target_name_by_id[target_id] = target_name
+        self._target_names = tuple(target_name_by_id)
         self._output_traffic = tuple(
             _OutputTrafficMetrics(target_id, target_name_by_id[target_id])
             for target_id in self._all_target_ids
         )
         self.transports = {}
+        self._protocols = {}
+        self._target_transports = None
 
     @property
     def target_ids(self):
@@ -129,72 +487,344 @@ class Forwarder:
     def output_traffic_snapshot(
         self,
     ) -> tuple[OutputTrafficMetricsSnapshot, ...]:
-        """Return fresh per-target local-dispatch snapshots in numeric order."""
+        """Return fresh per-target local-dispatch snapshots in numeric order.
 
-        return tuple(metrics.snapshot() for metrics in self._output_traffic)
+        Buffered bytes, write pauses, resolution and file-sink counters
+        describe the target's transport, which targets sharing one endpoint
+        and source address also share.
+        """
 
-    async def _ensure_transport(self, loop, destination):
-        key = _transport_cache_key(destination)
-        if key not in self.transports:
-            kwargs = {"remote_addr": (destination.host, destination.port)}
-            if destination.source_ip is not None:
-                kwargs["family"] = destination.family
-                kwargs["local_addr"] = (destination.source_ip, 0)
-            try:
-                transport, _ = await loop.create_datagram_endpoint(
-                    lambda: asyncio.DatagramProtocol(),
-                    **kwargs,
+        snapshots = []
+        for metrics, key in zip(self._output_traffic, self._transport_keys):
+            resolution = self._resolution.get(key, _NO_RESOLUTION)
+            transport = self.transports.get(key)
+            if transport is None:
+                snapshots.append(metrics.snapshot(resolution=resolution))
+                continue
+            snapshots.append(
+                metrics.snapshot(
+                    buffered_bytes=transport.get_write_buffer_size(),
+                    write_pauses=self._protocols[key].pauses,
+                    resolution=resolution,
+                    sink=(
+                        transport.writer
+                        if isinstance(transport, _FileSinkTransport)
+                        else None
+                    ),
                 )
-            except OSError as exc:
-                raise ForwarderConfigError(
-                    "Could not create UDP forwarder transport for "
-                    f"{destination.host}:{destination.port}"
-                    + (
-                        f" from source_ip {destination.source_ip}"
-                        if destination.source_ip
-                        else ""
+            )
+        return tuple(snapshots)
+
+    def tcp_server_snapshot(self) -> tuple[TcpServerMetricsSnapshot, ...]:
+        """Return fresh TCP fan-out server snapshots in numeric target order.
+
+        Only started ``tcp_server`` targets are reported.
+        """
+
+        snapshots = []
+        for target_id, key in enumerate(self._transport_keys):
+            transport = self.transports.get(key)
+            if isinstance(transport, _TcpFanoutTransport):
+                snapshots.append(
+                    transport.server.metrics_snapshot(
+                        target_id,
+                        self._target_names[target_id],
                     )
-                ) from exc
+                )
+        return tuple(snapshots)
+
+    async def start(self) -> None:
+        """Create every destination transport before traffic starts.
+
+        Hostname targets are resolved first, concurrently, and their
+        transports connect to the resolved address. Resolution and transport
+        creation failures surface here as ``ForwarderConfigError`` instead of
+        on a first send. Afterwards every send path indexes one transport per
+        numeric target without awaiting.
+        """
+
+        if self._target_transports is not None:
+            return
+        loop = asyncio.get_running_loop()
+        addresses = await asyncio.gather(
+            *(
+                self._resolve_for_start(loop, key, destination)
+                for key, destination in self._resolve_destinations.items()
+            )
+        )
+        self._resolved_addresses.update(
+            zip(self._resolve_destinations, addresses)
+        )
+        transports = []
+        for destination, limit in zip(
+            self._destinations,
+            self._write_buffer_limits,
+        ):
+            transports.append(
+                await self._ensure_transport(loop, destination, limit)
+            )
+        self._target_transports = tuple(transports)
+
+    async def run_resolver(self) -> None:
+        """Re-resolve hostname targets until cancelled.
+
+        Each hostname transport is re-resolved on its ``resolve_interval_s``.
+        When the address changes, a transport to the new address is created
+        first and then swapped in with one synchronous tuple replacement, so
+        dispatch never waits on resolution. A failed lookup keeps the current
+        transport and is only counted.
+        """
+
+        loop = asyncio.get_running_loop()
+        if not self._resolve_destinations:
+            await loop.create_future()
+        await asyncio.gather(
+            *(
+                self._re_resolve_loop(loop, key, destination)
+                for key, destination in self._resolve_destinations.items()
+            )
+        )
+
+    async def _re_resolve_loop(self, loop, key, destination) -> None:
+        interval = self._resolve_intervals[key]
+        write_buffer_limit = self._write_buffer_limits[
+            self._transport_keys.index(key)
+        ]
+        while True:
+            await asyncio.sleep(interval)
+            if self._target_transports is None:
+                continue
+            try:
+                address = await self._resolve(loop, key, destination)
+            except OSError:
+                continue
+            if address == self._resolved_addresses.get(key):
+                continue
+            try:
+                transport, protocol = await self._create_transport(
+                    loop,
+                    destination,
+                    address,
+                    write_buffer_limit,
+                )
+            except ForwarderConfigError:
+                # The lookup succeeded; the replacement socket did not.
+                self._resolution[key].transport_failures += 1
+                continue
+            self._swap_transport(key, address, transport, protocol)
+
+    def _swap_transport(self, key, address, transport, protocol) -> None:
+        target_transports = self._target_transports
+        if target_transports is None:
+            # close() ran while the replacement was being created.
+            transport.close()
+            return
+        previous = self.transports[key]
+        protocol.pauses = self._protocols[key].pauses
+        self.transports[key] = transport
+        self._protocols[key] = protocol
+        self._resolved_addresses[key] = address
+        self._target_transports = tuple(
+            transport if transport_key == key else current
+            for transport_key, current in zip(
+                self._transport_keys,
+                target_transports,
+            )
+        )
+        self._resolution[key].address_changes += 1
+        previous.close()
+
+    async def _resolve_for_start(self, loop, key, destination):
+        try:
+            return await self._resolve(loop, key, destination)
+        except OSError as exc:
+            raise ForwarderConfigError(
+                "Could not resolve UDP forwarder host "
+                f"{destination.host}:{destination.port}"
+            ) from exc
+
+    async def _resolve(self, loop, key, destination):
+        metrics = self._resolution[key]
+        started = time.perf_counter()
+        try:
+            infos = await loop.getaddrinfo(
+                destination.host,
+                destination.port,
+                family=destination.family,
+                type=socket.SOCK_DGRAM,
+            )
+        except OSError:
+            metrics.resolve_failures += 1
+            raise
+        if not infos:
+            metrics.resolve_failures += 1
+            raise OSError(f"No addresses for {destination.host!r}")
+        metrics.resolved(started)
+        return infos[0][4][:2]
+
+    async def _ensure_transport(self, loop, destination, write_buffer_limit):
+        key = _transport_cache_key(destination)
+        if key not in self.transports:
+            remote_addr = self._resolved_addresses.get(
+                key,
+                _remote_address(destination),
+            )
+            transport, protocol = await self._create_transport(
+                loop,
+                destination,
+                remote_addr,
+                write_buffer_limit,
+            )
             self.transports[key] = transport
+            self._protocols[key] = protocol
         return self.transports[key]
 
-    async def _send_to_destination(
+    async def _create_transport(
         self,
         loop,
         destination,
-        message: bytes,
-    ) -> None:
-        transport = await self._ensure_transport(loop, destination)
-        transport.sendto(message)
+        remote_addr,
+        write_buffer_limit,
+    ):
+        if isinstance(destination, _ShmDestination):
+            return self._create_shm_transport(destination)
+        if isinstance(destination, _TcpServerDestination):
+            return await self._create_tcp_transport(destination)
+        if isinstance(destination, _FileSinkDestination):
+            return self._create_file_transport(destination)
+        if isinstance(destination, _UnixDestination):
+            kwargs = {"family": socket.AF_UNIX}
+        elif isinstance(destination, _MulticastDestination):
+            kwargs = {}
+        else:
+            kwargs = {"remote_addr": remote_addr}
+            if destination.source_ip is not None:
+                kwargs["family"] = destination.family
+                kwargs["local_addr"] = (destination.source_ip, 0)
+        try:
+            if isinstance(destination, _MulticastDestination):
+                kwargs["sock"] = _multicast_socket(destination)
+            transport, protocol = await loop.create_datagram_endpoint(
+                _ForwarderProtocol,
+                **kwargs,
+            )
+        except OSError as exc:
+            raise ForwarderConfigError(
+                f"Could not create {_describe_destination(destination)}"
+            ) from exc
+        if isinstance(destination, _UnixDestination):
+            transport = _UnixDatagramTransport(transport, destination.path)
+        if write_buffer_limit is not None:
+            # Pause at the drop bound so write_pauses counts real
+            # pressure rather than asyncio's default high-water mark.
+            transport.set_write_buffer_limits(high=write_buffer_limit)
+        return transport, protocol
+
+    def _create_shm_transport(self, destination):
+        try:
+            writer = ShmRingWriter(destination.name, destination.size_bytes)
+        except OSError as exc:
+            raise ForwarderConfigError(
+                f"Could not create {_describe_destination(destination)}"
+            ) from exc
+        return _ShmRingTransport(writer), _ForwarderProtocol()
+
+    def _create_file_transport(self, destination):
+        writer = FileSinkWriter(
+            destination.directory,
+            prefix=destination.prefix,
+            compression=destination.compression,
+            rotate_interval_s=destination.rotate_interval_s,
+            flush_interval_ms=destination.flush_interval_ms,
+            queue_max_bytes=destination.queue_max_bytes,
+        )
+        try:
+            writer.start()
+        except OSError as exc:
+            raise ForwarderConfigError(
+                f"Could not create {_describe_destination(destination)}"
+            ) from exc
+        return _FileSinkTransport(writer), _ForwarderProtocol()
+
+    async def _create_tcp_transport(self, destination):
+        server = TcpFanoutServer(
+            destination.host,
+            destination.port,
+            client_buffer_bytes=destination.client_buffer_bytes,
+            max_clients=destination.max_clients,
+        )
+        try:
+            await server.start()
+        except OSError as exc:
+            raise ForwarderConfigError(
+                f"Could not create {_describe_destination(destination)}"
+            ) from exc
+        return _TcpFanoutTransport(server), _ForwarderProtocol()
 
     async def _dispatch_to_ids(
         self,
         target_ids: Iterable[EgressTargetId],
         message: bytes,
     ) -> None:
+        transports = self._target_transports
+        if transports is not None:
+            self._dispatch_nowait(transports, target_ids, message)
+            return
         loop = asyncio.get_running_loop()
         for target_id in target_ids:
             await self._dispatch_to_id(loop, target_id, message)
 
+    def _dispatch_nowait(
+        self,
+        transports,
+        target_ids: Iterable[EgressTargetId],
+        message: bytes,
+    ) -> None:
+        output_traffic = self._output_traffic
+        for target_id in target_ids:
+            output_traffic[target_id].dispatch_started()
+            self._send_started(target_id, transports[target_id], message)
+
+    def _send_started(
+        self,
+        target_id: EgressTargetId,
+        transport,
+        message: bytes,
+    ) -> None:
+        metrics = self._output_traffic[target_id]
+        limit = self._write_buffer_limits[target_id]
+        if limit is not None and transport.get_write_buffer_size() >= limit:
+            metrics.dispatch_dropped()
+            return
+        try:
+            transport.sendto(message)
+        except BaseException:
+            metrics.dispatch_failed()
+            raise
+        metrics.dispatch_completed(message)
+
     async def _dispatch_to_id(
         self,
         loop,
         target_id: EgressTargetId,
         message: bytes,
     ) -> None:
+        transports = self._target_transports
+        if transports is not None:
+            self._dispatch_nowait(transports, (target_id,), message)
+            return
         metrics = self._output_traffic[target_id]
         metrics.dispatch_started()
         try:
-            await self._send_to_destination(
+            transport = await self._ensure_transport(
                 loop,
                 self._destinations[target_id],
-                message,
+                self._write_buffer_limits[target_id],
             )
         except BaseException:
             metrics.dispatch_failed()
             raise
-        else:
-            metrics.dispatch_completed(message)
+        self._send_started(target_id, transport, message)
 
     async def send(self, message: bytes) -> None:
         message = _validate_payload(message)
@@ -204,6 +834,9 @@ class Forwarder:
         for transport in self.transports.values():
             transport.close()
         self.transports.clear()
+        self._protocols.clear()
+        self._resolved_addresses.clear()
+        self._target_transports = None
 
     async def send_to_ids(
         self,
@@ -217,6 +850,29 @@ class Forwarder:
         )
         await self._dispatch_to_ids(validated_target_ids, message)
 
+    def send_to_ids_nowait(
+        self,
+        target_ids: Iterable[EgressTargetId],
+        message: bytes,
+    ) -> None:
+        """Send to numeric targets synchronously after ``start()``.
+
+        Validation, de-duplication, ordering, and per-target accounting match
+        ``send_to_ids()``; every send is one direct ``transport.sendto()``.
+        """
+
+        message = _validate_payload(message)
+        validated_target_ids = _validate_numeric_target_ids(
+            target_ids,
+            len(self._destinations),
+        )
+        transports = self._target_transports
+        if transports is None:
+            raise RuntimeError(
+                "Forwarder.start() must complete before send_to_ids_nowait()."
+            )
+        self._dispatch_nowait(transports, validated_target_ids, message)
+
     async def send_to(
         self,
         target_ids: Iterable[str],
@@ -241,18 +897,89 @@ def _validate_payload(message: object) -> bytes:
 
 
 def _copy_target_entry(entry: Mapping[str, object]) -> Mapping[str, object]:
+    target_type = entry.get("type", "udp")
+    if target_type not in FORWARDER_TARGET_TYPES:
+        raise ForwarderConfigError(
+            f"{_target_context(entry)}: type must be one of: "
+            + ", ".join(FORWARDER_TARGET_TYPES)
+        )
     copied = {
-        "host": entry["host"],
-        "port": entry["port"],
+        key: entry[key] for key in _ADDRESS_KEYS[target_type] if key in entry
     }
+    missing = [
+        key for key in _REQUIRED_ADDRESS_KEYS[target_type] if key not in copied
+    ]
+    if missing:
+        raise ForwarderConfigError(
+            f"{_target_context(entry)}: {target_type} targets require "
+            + ", ".join(missing)
+        )
+    if "type" in entry:
+        copied["type"] = target_type
     if "id" in entry:
         copied["id"] = entry["id"]
     if "source_ip" in entry:
         copied["source_ip"] = _normalize_source_ip(entry["source_ip"], entry)
+    for optional_key in (
+        *_EGRESS_QUEUE_KEYS,
+        *_WRITE_BUFFER_KEYS,
+        *_RESOLVER_KEYS,
+        *_OUTPUT_PROFILE_KEYS,
+        *_THROTTLE_KEYS,
+    ):
+        if optional_key in entry:
+            copied[optional_key] = entry[optional_key]
     return MappingProxyType(copied)
 
 
-def _destination_from_entry(entry: Mapping[str, object]) -> _UdpDestination:
+def _write_buffer_limit_from_entry(entry: Mapping[str, object]) -> int | None:
+    context = _target_context(entry)
+    limit = entry.get("write_buffer_max_bytes", DEFAULT_WRITE_BUFFER_MAX_BYTES)
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise ForwarderConfigError(
+            f"{context}: write_buffer_max_bytes must be a positive integer"
+        )
+    policy = entry.get("write_buffer_overflow", "drop")
+    if policy not in WRITE_BUFFER_OVERFLOW_POLICIES:
+        raise ForwarderConfigError(
+            f"{context}: write_buffer_overflow must be one of: "
+            + ", ".join(WRITE_BUFFER_OVERFLOW_POLICIES)
+        )
+    return limit if policy == "drop" else None
+
+
+def _resolve_interval_from_entry(entry: Mapping[str, object]) -> float:
+    interval = entry.get("resolve_interval_s", DEFAULT_RESOLVE_INTERVAL_S)
+    if (
+        isinstance(interval, bool)
+        or not isinstance(interval, (int, float))
+        or not 0 < interval < float("inf")
+    ):
+        raise ForwarderConfigError(
+            f"{_target_context(entry)}: resolve_interval_s must be a finite "
+            "positive number"
+        )
+    return float(interval)
+
+
+def _destination_from_entry(entry: Mapping[str, object]):
+    target_type = entry.get("type", "udp")
+    if target_type == "unix":
+        path = entry["path"]
+        if not isinstance(path, str) or not path:
+            raise ForwarderConfigError(
+                f"{_target_context(entry)}: path must be a non-empty string"
+            )
+        return _UnixDestination(path)
+    if target_type == "shm":
+        return _shm_destination_from_entry(entry)
+    if target_type == "tcp_server":
+        return _tcp_server_destination_from_entry(entry)
+    if target_type == "multicast":
+        return _multicast_destination_from_entry(entry)
+    if target_type == "file":
+        return _file_sink_destination_from_entry(entry)
+
     host = str(entry["host"])
     port = int(entry["port"])
     source_ip = entry.get("source_ip")
@@ -272,6 +999,196 @@ def _destination_from_entry(entry: Mapping[str, object]) -> _UdpDestination:
     return _UdpDestination(host, port, str(source_address), family)
 
 
+def _shm_destination_from_entry(entry: Mapping[str, object]) -> _ShmDestination:
+    context = _target_context(entry)
+    name = entry["name"]
+    if not isinstance(name, str) or not name or "/" in name:
+        raise ForwarderConfigError(
+            f"{context}: name must be a non-empty string without '/'"
+        )
+    size_bytes = entry.get("size_bytes", DEFAULT_SHM_RING_BYTES)
+    if (
+        isinstance(size_bytes, bool)
+        or not isinstance(size_bytes, int)
+        or size_bytes < MIN_SHM_RING_BYTES
+        or size_bytes % 8
+    ):
+        raise ForwarderConfigError(
+            f"{context}: size_bytes must be a multiple of 8 of at least "
+            f"{MIN_SHM_RING_BYTES}"
+        )
+    return _ShmDestination(name, size_bytes)
+
+
+def _tcp_server_destination_from_entry(
+    entry: Mapping[str, object],
+) -> _TcpServerDestination:
+    context = _target_context(entry)
+    host = entry["listen_host"]
+    if not isinstance(host, str) or not host:
+        raise ForwarderConfigError(
+            f"{context}: listen_host must be a non-empty string"
+        )
+    port = entry["listen_port"]
+    if isinstance(port, bool) or not isinstance(port, int) or not 0 <= port <= 65535:
+        raise ForwarderConfigError(
+            f"{context}: listen_port must be an integer from 0 to 65535"
+        )
+    limits = {}
+    for key, default in (
+        ("client_buffer_max_bytes", DEFAULT_TCP_CLIENT_BUFFER_BYTES),
+        ("max_clients", DEFAULT_TCP_MAX_CLIENTS),
+    ):
+        value = entry.get(key, default)
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise ForwarderConfigError(
+                f"{context}: {key} must be a positive integer"
+            )
+        limits[key] = value
+    return _TcpServerDestination(
+        host,
+        port,
+        limits["client_buffer_max_bytes"],
+        limits["max_clients"],
+    )
+
+
+def _multicast_destination_from_entry(
+    entry: Mapping[str, object],
+) -> _MulticastDestination:
+    context = _target_context(entry)
+    group = entry["group"]
+    try:
+        group_address = ipaddress.ip_address(group)
+    except ValueError:
+        group_address = None
+    if group_address is None or not group_address.is_multicast:
+        raise ForwarderConfigError(
+            f"{context}: group must be a literal IPv4 or IPv6 multicast address"
+        )
+    port = entry["port"]
+    if isinstance(port, bool) or not isinstance(port, int) or not 0 < port <= 65535:
+        raise ForwarderConfigError(
+            f"{context}: port must be an integer from 1 to 65535"
+        )
+    ttl = entry.get("ttl", DEFAULT_MULTICAST_TTL)
+    if isinstance(ttl, bool) or not isinstance(ttl, int) or not 0 <= ttl <= 255:
+        raise ForwarderConfigError(
+            f"{context}: ttl must be an integer from 0 to 255"
+        )
+    loopback = entry.get("loopback", True)
+    if not isinstance(loopback, bool):
+        raise ForwarderConfigError(f"{context}: loopback must be true or false")
+    interface = entry.get("interface")
+    if interface is not None:
+        if not isinstance(interface, str) or not interface:
+            raise ForwarderConfigError(
+                f"{context}: interface must be a non-empty string"
+            )
+        if group_address.version == 4:
+            interface_address = _parse_literal_host(interface)
+            if interface_address is None or interface_address.version != 4:
+                raise ForwarderConfigError(
+                    f"{context}: interface for an IPv4 group must be a local "
+                    "IPv4 address"
+                )
+    family = socket.AF_INET6 if group_address.version == 6 else socket.AF_INET
+    return _MulticastDestination(
+        str(group_address),
+        port,
+        family,
+        ttl,
+        loopback,
+        interface,
+    )
+
+
+def _file_sink_destination_from_entry(
+    entry: Mapping[str, object],
+) -> _FileSinkDestination:
+    context = _target_context(entry)
+    directory = entry["directory"]
+    if not isinstance(directory, str) or not directory:
+        raise ForwarderConfigError(
+            f"{context}: directory must be a non-empty string"
+        )
+    prefix = entry.get("prefix", "aismixer")
+    if not isinstance(prefix, str) or not prefix or "/" in prefix:
+        raise ForwarderConfigError(
+            f"{context}: prefix must be a non-empty string without '/'"
+        )
+    compression = entry.get("compression", "none")
+    if compression not in FILE_SINK_COMPRESSIONS:
+        raise ForwarderConfigError(
+            f"{context}: compression must be one of: "
+            + ", ".join(FILE_SINK_COMPRESSIONS)
+        )
+    if compression == "zstd":
+        try:
+            load_zstd_compressor_factory()
+        except FileSinkConfigError as exc:
+            raise ForwarderConfigError(f"{context}: {exc}") from exc
+    settings = {}
+    for key, default in (
+        ("rotate_interval_s", DEFAULT_FILE_SINK_ROTATE_INTERVAL_S),
+        ("flush_interval_ms", DEFAULT_FILE_SINK_FLUSH_INTERVAL_MS),
+        ("queue_max_bytes", DEFAULT_FILE_SINK_QUEUE_MAX_BYTES),
+    ):
+        value = entry.get(key, default)
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise ForwarderConfigError(
+                f"{context}: {key} must be a positive integer"
+            )
+        settings[key] = value
+    return _FileSinkDestination(
+        directory,
+        prefix,
+        compression,
+        settings["rotate_interval_s"],
+        settings["flush_interval_ms"],
+        settings["queue_max_bytes"],
+    )
+
+
+def _multicast_socket(destination: _MulticastDestination) -> socket.socket:
+    sock = socket.socket(destination.family, socket.SOCK_DGRAM)
+    try:
+        if destination.family == socket.AF_INET6:
+            level = socket.IPPROTO_IPV6
+            options = (
+                (socket.IPV6_MULTICAST_HOPS, destination.ttl),
+                (socket.IPV6_MULTICAST_LOOP, int(destination.loopback)),
+            )
+            if destination.interface is not None:
+                options += (
+                    (
+                        socket.IPV6_MULTICAST_IF,
+                        socket.if_nametoindex(destination.interface),
+                    ),
+                )
+        else:
+            level = socket.IPPROTO_IP
+            options = (
+                (socket.IP_MULTICAST_TTL, destination.ttl),
+                (socket.IP_MULTICAST_LOOP, int(destination.loopback)),
+            )
+            if destination.interface is not None:
+                options += (
+                    (
+                        socket.IP_MULTICAST_IF,
+                        socket.inet_aton(destination.interface),
+                    ),
+                )
+        for option, value in options:
+            sock.setsockopt(level, option, value)
+        sock.setblocking(False)
+        sock.connect((destination.group, destination.port))
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
 def _normalize_source_ip(value: object, entry: Mapping[str, object]) -> str:
     if not isinstance(value, str) or not value.strip():
         raise ForwarderConfigError(
@@ -295,10 +1212,81 @@ def _parse_literal_host(host: str):
 def _target_context(entry: Mapping[str, object]) -> str:
     if "id" in entry:
         return f"forwarder {entry['id']!r}"
+    if entry.get("type") == "unix":
+        return f"forwarder path {entry.get('path')!r}"
+    if entry.get("type") == "shm":
+        return f"forwarder shared memory {entry.get('name')!r}"
+    if entry.get("type") == "file":
+        return f"forwarder directory {entry.get('directory')!r}"
+    if entry.get("type") == "multicast":
+        return (
+            f"forwarder group {entry.get('group')!r}:{entry.get('port')!r}"
+        )
+    if entry.get("type") == "tcp_server":
+        return (
+            f"forwarder listener {entry.get('listen_host')!r}:"
+            f"{entry.get('listen_port')!r}"
+        )
     return f"forwarder {entry.get('host')!r}:{entry.get('port')!r}"
 
 
-def _transport_cache_key(destination: _UdpDestination):
+def _describe_destination(destination) -> str:
+    if isinstance(destination, _UnixDestination):
+        return f"Unix datagram forwarder transport for {destination.path}"
+    if isinstance(destination, _ShmDestination):
+        return f"shared-memory forwarder ring {destination.name}"
+    if isinstance(destination, _FileSinkDestination):
+        return f"file-sink forwarder writer in {destination.directory}"
+    if isinstance(destination, _MulticastDestination):
+        return (
+            "multicast forwarder transport for "
+            f"{destination.group}:{destination.port}"
+            + (
+                f" on interface {destination.interface}"
+                if destination.interface
+                else ""
+            )
+        )
+    if isinstance(destination, _TcpServerDestination):
+        return (
+            "TCP fan-out forwarder server on "
+            f"{destination.host}:{destination.port}"
+        )
+    return (
+        "UDP forwarder transport for "
+        f"{destination.host}:{destination.port}"
+        + (
+            f" from source_ip {destination.source_ip}"
+            if destination.source_ip
+            else ""
+        )
+    )
+
+
+def _remote_address(destination):
+    if isinstance(destination, _UdpDestination):
+        return (destination.host, destination.port)
+    return None
+
+
+def _transport_cache_key(destination):
+    if isinstance(destination, _UnixDestination):
+        return ("unix", destination.path)
+    if isinstance(destination, _ShmDestination):
+        return ("shm", destination.name)
+    if isinstance(destination, _TcpServerDestination):
+        return ("tcp_server", destination.host, destination.port)
+    if isinstance(destination, _FileSinkDestination):
+        return ("file", destination.directory, destination.prefix)
+    if isinstance(destination, _MulticastDestination):
+        return (
+            "multicast",
+            destination.group,
+            destination.port,
+            destination.ttl,
+            destination.loopback,
+            destination.interface,
+        )
     if destination.source_ip is None:
         return (destination.host, destination.port)
     return (destination.host, destination.port, destination.source_ip)
@@ -28,8 +28,7 @@ def wrap_with_meta(
         wall_clock = time.time if clock is None else clock
         timestamp = int(wall_clock())
 
-    parts = nmea_line.split(",")
-    if len(parts) < 4:
+    if nmea_line.count(",") < 3:
         return nmea_line  # safety fallback
 
     # g се подава отвън (ако е нужно) като triplet "<part>-<total>-<gid>".
@@ -6,6 +6,7 @@ import time
 import sys
 import json
 import select
+from dataclasses import dataclass
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
@@ -35,6 +36,7 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.dirname(SCRIPT_DIR)
 _SHARED_CORE_MODULES = (
     "network_policy.py",
+    "udpsec_batch.py",
     "udpsec_crypto.py",
     "udpsec_protocol.py",
 )
@@ -59,6 +61,20 @@ from core.network_policy import (  # noqa: E402
     NetworkPolicyConfigError,
     compile_ingress_policy,
 )
+from core.udpsec_batch import (  # noqa: E402
+    BATCH_AAD,
+    BATCH_MAX_PLAINTEXT,
+    BATCH_MIN_PLAINTEXT,
+    BATCH_PREFIX,
+    COMPRESSION_DEFLATE_NMEA,
+    DATA_VERSION_BATCH,
+    DATA_VERSION_JSON,
+    DEFAULT_BATCH_MAX_BYTES,
+    DEFAULT_BATCH_MAX_DELAY,
+    SentenceBatch,
+    compress_batch,
+    encode_batch,
+)
 from core.udpsec_crypto import (  # noqa: E402
     SessionKeyMaterial,
     build_client_auth_digest,
@@ -116,6 +132,9 @@ DEFAULT_CONFIG = {
     "keepalive_interval": 30,
     "peer_timeout": 90,
     "session_refresh_interval": 0,
+    "batch_max_bytes": DEFAULT_BATCH_MAX_BYTES,
+    "batch_max_delay": DEFAULT_BATCH_MAX_DELAY,
+    "batch_compression": False,
     "log_level": "INFO",
 }
 
@@ -124,6 +143,20 @@ class ProxyConfigError(ValueError):
     """Raised for operator-facing proxy configuration errors."""
 
 
+@dataclass
+class SessionOptions:
+    """Data frame options of one UDPSEC session.
+
+    perform_handshake() offers ``data_version`` and ``compression`` with the
+    session confirmation and lowers each to what the server accepts.
+    """
+
+    data_version: int = DATA_VERSION_JSON
+    batch_max_bytes: int = DEFAULT_BATCH_MAX_BYTES
+    batch_max_delay: float = DEFAULT_BATCH_MAX_DELAY
+    compression: bool = False
+
+
 def resolve_existing_path(candidates):
     for path in candidates:
         if os.path.exists(path):
@@ -221,9 +254,48 @@ def load_config(path=None):
     resolve_configured_key_paths(config, user_config, selected_path)
     validate_local_input_config(config)
     validate_output_config(config)
+    session_options_from_config(config)
     return config
 
 
+def session_options_from_config(config):
+    """Return the session options to offer; ``batch_max_bytes: 0`` keeps v1."""
+
+    max_bytes = config.get("batch_max_bytes", DEFAULT_BATCH_MAX_BYTES)
+    max_delay = config.get("batch_max_delay", DEFAULT_BATCH_MAX_DELAY)
+    compression = config.get("batch_compression", False)
+    if (
+        isinstance(max_delay, bool)
+        or not isinstance(max_delay, (int, float))
+        or not 0 <= max_delay < float("inf")
+    ):
+        raise ProxyConfigError(
+            "batch_max_delay must be a non-negative number of seconds."
+        )
+    if type(max_bytes) is not int or (
+        max_bytes != 0
+        and not BATCH_MIN_PLAINTEXT <= max_bytes <= BATCH_MAX_PLAINTEXT
+    ):
+        raise ProxyConfigError(
+            "batch_max_bytes must be 0 or an integer between "
+            f"{BATCH_MIN_PLAINTEXT} and {BATCH_MAX_PLAINTEXT}."
+        )
+    if not isinstance(compression, bool):
+        raise ProxyConfigError("batch_compression must be true or false.")
+    if max_bytes == 0:
+        if compression:
+            raise ProxyConfigError(
+                "batch_compression requires batch_max_bytes above 0."
+            )
+        return SessionOptions(data_version=DATA_VERSION_JSON)
+    return SessionOptions(
+        data_version=DATA_VERSION_BATCH,
+        batch_max_bytes=max_bytes,
+        batch_max_delay=float(max_delay),
+        compression=compression,
+    )
+
+
 def validate_local_input_config(config):
     try:
         input_config = normalize_local_input_config(config)
@@ -378,7 +450,7 @@ def is_no_session_hint(data):
     return data == NOSESSION_PREFIX or data.startswith(NOSESSION_PREFIX + b"|")
 
 
-def handle_server_packet(
+def read_server_packet(
     data,
     addr,
     remote_addr,
@@ -386,29 +458,50 @@ def handle_server_packet(
     station_id,
     expected_ping_seq,
 ):
+    """Return the classification of one server packet and its pong, if any."""
+
     if not remote_addresses_match(addr, remote_addr):
-        return SERVER_PACKET_IGNORED
+        return SERVER_PACKET_IGNORED, None
 
     if is_no_session_hint(data):
-        return SERVER_PACKET_NO_SESSION
+        return SERVER_PACKET_NO_SESSION, None
 
     try:
         message = decrypt_secure_json_message(data, server_to_client_key)
     except Exception:
-        return SERVER_PACKET_IGNORED
+        return SERVER_PACKET_IGNORED, None
 
     if not isinstance(message, dict):
-        return SERVER_PACKET_IGNORED
+        return SERVER_PACKET_IGNORED, None
     message_sequence = message.get("seq")
     if type(message_sequence) is not int:
-        return SERVER_PACKET_IGNORED
+        return SERVER_PACKET_IGNORED, None
     if (
         message.get("type") == "pong"
         and message.get("source_id") == station_id
         and message_sequence == expected_ping_seq
     ):
-        return SERVER_PACKET_AUTHENTICATED
-    return SERVER_PACKET_IGNORED
+        return SERVER_PACKET_AUTHENTICATED, message
+    return SERVER_PACKET_IGNORED, None
+
+
+def handle_server_packet(
+    data,
+    addr,
+    remote_addr,
+    server_to_client_key,
+    station_id,
+    expected_ping_seq,
+):
+    result, _ = read_server_packet(
+        data,
+        addr,
+        remote_addr,
+        server_to_client_key,
+        station_id,
+        expected_ping_seq,
+    )
+    return result
 
 
 def session_expiration_reason(
@@ -483,6 +576,58 @@ def send_udpsec_nmea_sentence(
     )
 
 
+class UdpsecBatchSender:
+    """Send sentences in version 2 batch frames, flushed by size or deadline."""
+
+    def __init__(
+        self,
+        out_sock,
+        client_to_server_key,
+        remote_addr,
+        max_bytes=DEFAULT_BATCH_MAX_BYTES,
+        max_delay=DEFAULT_BATCH_MAX_DELAY,
+        compress=False,
+    ):
+        self._out_sock = out_sock
+        self._aesgcm = AESGCM(client_to_server_key)
+        self._remote_addr = remote_addr
+        self._batch = SentenceBatch(max_bytes)
+        self._max_delay = max_delay
+        self._compress = compress
+
+    def send_sentence(self, clean_line):
+        full = self._batch.add(clean_line.encode(), time.monotonic())
+        if full is not None:
+            self._send(full)
+
+    def poll_timeout(self, now):
+        started_at = self._batch.started_at
+        if started_at is None:
+            return None
+        return max(0.0, started_at + self._max_delay - now)
+
+    def flush_due(self, now):
+        started_at = self._batch.started_at
+        if started_at is not None and now - started_at >= self._max_delay:
+            self.flush()
+
+    def flush(self):
+        sentences = self._batch.take()
+        if sentences is not None:
+            self._send(sentences)
+
+    def _send(self, sentences):
+        plaintext = encode_batch(sentences)
+        if self._compress:
+            plaintext = compress_batch(plaintext)
+        nonce = os.urandom(12)
+        ciphertext = self._aesgcm.encrypt(nonce, plaintext, BATCH_AAD)
+        self._out_sock.sendto(
+            BATCH_PREFIX + nonce + ciphertext,
+            self._remote_addr,
+        )
+
+
 def forward_input_payload(data, send_sentence):
     for clean_line in iter_forwardable_nmea_sentences(data):
         if not clean_line:
@@ -496,13 +641,25 @@ def forward_pending_input(input_adapter, send_sentence):
         forward_input_payload(data, send_sentence)
 
 
-def send_ping(sock, remote_addr, client_to_server_key, station_id, seq):
+def send_ping(
+    sock,
+    remote_addr,
+    client_to_server_key,
+    station_id,
+    seq,
+    data_versions=None,
+    compression=None,
+):
     message = {
         "type": "ping",
         "seq": seq,
         "timestamp": int(time.time()),
         "source_id": station_id,
     }
+    if data_versions:
+        message["data_versions"] = list(data_versions)
+    if compression:
+        message["compression"] = list(compression)
     sock.sendto(
         encrypt_secure_json_message(message, client_to_server_key),
         remote_addr,
@@ -515,8 +672,18 @@ def perform_handshake(
     station_identity_private_key,
     server_identity_public_key,
     remote_addr,
+    session_options=None,
 ):
     station_id = config["station_id"]
+    offered_versions = None
+    offered_compression = None
+    if (
+        session_options is not None
+        and session_options.data_version != DATA_VERSION_JSON
+    ):
+        offered_versions = (DATA_VERSION_JSON, session_options.data_version)
+        if session_options.compression:
+            offered_compression = (COMPRESSION_DEFLATE_NMEA,)
     timestamp = int(time.time())
     client_random = os.urandom(32)
     client_ephemeral_private_key = generate_ephemeral_private_key()
@@ -638,6 +805,8 @@ def perform_handshake(
                     session_key_material.client_to_server_key,
                     station_id,
                     SESSION_CONFIRMATION_SEQUENCE,
+                    offered_versions,
+                    offered_compression,
                 )
             except OSError as e:
                 print(f"❌ Session confirmation send error: {e}")
@@ -673,7 +842,7 @@ def perform_handshake(
                 ):
                     continue
 
-                confirmation_result = handle_server_packet(
+                confirmation_result, pong = read_server_packet(
                     confirmation,
                     confirmation_addr,
                     remote_addr,
@@ -690,6 +859,20 @@ def perform_handshake(
                     print("❌ Invalid secure session confirmation.")
                     return None
 
+                if session_options is not None:
+                    accepted = pong.get("data_version", DATA_VERSION_JSON)
+                    if (
+                        offered_versions is None
+                        or type(accepted) is not int
+                        or accepted not in offered_versions
+                    ):
+                        accepted = DATA_VERSION_JSON
+                    session_options.data_version = accepted
+                    session_options.compression = (
+                        accepted == DATA_VERSION_BATCH
+                        and offered_compression is not None
+                        and pong.get("compression") == COMPRESSION_DEFLATE_NMEA
+                    )
                 print("Mutual ECDHE session confirmed.")
                 return session_key_material
     finally:
@@ -704,6 +887,7 @@ def forward_loop(
     session_key_material,
     remote_addr,
     ingress_policy=None,
+    session_options=None,
 ):
     input_adapter = _coerce_input_adapter(local_input, ingress_policy)
     client_to_server_key = session_key_material.client_to_server_key
@@ -713,13 +897,28 @@ def forward_loop(
     last_ping_at = session_started_at
     expected_ping_seq = None
     next_ping_seq = 1
-    send_sentence = lambda clean_line: send_udpsec_nmea_sentence(
-        clean_line,
-        out_sock,
-        config,
-        client_to_server_key,
-        remote_addr,
-    )
+    batch_sender = None
+    if (
+        session_options is not None
+        and session_options.data_version == DATA_VERSION_BATCH
+    ):
+        batch_sender = UdpsecBatchSender(
+            out_sock,
+            client_to_server_key,
+            remote_addr,
+            session_options.batch_max_bytes,
+            session_options.batch_max_delay,
+            session_options.compression,
+        )
+        send_sentence = batch_sender.send_sentence
+    else:
+        send_sentence = lambda clean_line: send_udpsec_nmea_sentence(
+            clean_line,
+            out_sock,
+            config,
+            client_to_server_key,
+            remote_addr,
+        )
 
     while True:
         now = time.monotonic()
@@ -727,6 +926,11 @@ def forward_loop(
             now, session_started_at, last_authenticated_peer, config
         )
         if expiration_reason:
+            if batch_sender is not None:
+                try:
+                    batch_sender.flush()
+                except Exception as e:
+                    print(f"❌ Forwarding error: {e}")
             if expiration_reason == SESSION_END_PLANNED_REFRESH:
                 print("Secure session planned refresh due.")
             else:
@@ -744,6 +948,10 @@ def forward_loop(
         input_poll_interval = input_adapter.poll_interval()
         if input_poll_interval is not None:
             poll_timeout = min(poll_timeout, input_poll_interval)
+        if batch_sender is not None:
+            batch_timeout = batch_sender.poll_timeout(now)
+            if batch_timeout is not None:
+                poll_timeout = min(poll_timeout, batch_timeout)
 
         try:
             forward_pending_input(
@@ -801,6 +1009,13 @@ def forward_loop(
                 return SESSION_END_SOCKET_ERROR
 
         now = time.monotonic()
+        if batch_sender is not None:
+            try:
+                batch_sender.flush_due(now)
+            except Exception as e:
+                print(f"❌ Forwarding error: {e}")
+                return SESSION_END_SOCKET_ERROR
+
         if now - last_ping_at >= keepalive_interval:
             try:
                 send_ping(
@@ -1006,12 +1221,14 @@ def main(argv=None):
             )
 
         while True:
+            session_options = session_options_from_config(config)
             session_key_material = perform_handshake(
                 out_sock,
                 config,
                 station_identity_private_key,
                 server_identity_public_key,
                 remote_addr,
+                session_options,
             )
             if session_key_material:
                 reason = forward_loop(
@@ -1021,6 +1238,7 @@ def main(argv=None):
                     session_key_material,
                     remote_addr,
                     ingress_policy,
+                    session_options,
                 )
             else:
                 reason = HANDSHAKE_FAILURE
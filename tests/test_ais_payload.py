@@ -0,0 +1,149 @@
+import random
+import sys
+
+import pytest
+
+from core.ais_payload import (
+    SIXBIT_VALUES,
+    AisPayload,
+    AisPayloadError,
+    dearmour,
+    decode_payload,
+    decode_payloads,
+)
+
+
+# Reference reports from the gpsd AIVDM notes.
+POSITION = "177KQJ5000G?tO`K>RA1wUbN0TKH"
+STATIC = (
+    "55?MbV02;H;s<HtKR20EHE:0@T4@Dn2222222216L961O5Gf0NSQEp6ClRp8"
+    "88888888880"
+)
+CLASS_B = "B52K>;h00Fc>jpUlNV@ikwpUoP06"
+
+
+def reference_bits(payload):
+    bits = 0
+    for character in payload:
+        bits = bits << 6 | SIXBIT_VALUES[character]
+    return bits
+
+
+def test_dearmour_matches_a_per_character_decode_at_every_length():
+    characters = list(SIXBIT_VALUES)
+    rng = random.Random(45)
+
+    for length in range(90):
+        payload = "".join(rng.choice(characters) for _ in range(length))
+        for fill_bits in range(min(6, length * 6 + 1)):
+            assert dearmour(payload, fill_bits) == (
+                reference_bits(payload) >> fill_bits,
+                length * 6 - fill_bits,
+            )
+
+
+@pytest.mark.parametrize(
+    ("payload", "fill_bits"),
+    [("17!K", 0), ("17éK", 0), ("177K", 6), ("", 1)],
+)
+def test_invalid_armour_and_fill_bits_are_rejected(payload, fill_bits):
+    with pytest.raises(AisPayloadError):
+        dearmour(payload, fill_bits)
+
+
+def test_position_report_fields_are_decoded():
+    payload = AisPayload(POSITION)
+
+    assert {name: payload[name] for name in payload.fields} == {
+        "message_type": 1,
+        "repeat": 0,
+        "mmsi": 477553000,
+        "nav_status": 5,
+        "rot": 0,
+        "sog": 0.0,
+        "position_accuracy": 0,
+        "lon": pytest.approx(-122.345833),
+        "lat": pytest.approx(47.582833),
+        "cog": 51.0,
+        "heading": 181,
+        "second": 15,
+    }
+    class_b = AisPayload(CLASS_B)
+    assert (class_b["mmsi"], class_b["lon"], class_b["lat"]) == (
+        338087471,
+        pytest.approx(-74.072132),
+        pytest.approx(40.68454),
+    )
+
+
+def test_static_report_text_fields_are_decoded():
+    payload = AisPayload(STATIC, 2)
+
+    assert payload["mmsi"] == 351759000
+    assert payload["imo"] == 9134270
+    assert payload["callsign"] == "3FOF8"
+    assert payload["shipname"] == "EVER DIADEM"
+    assert payload["destination"] == "NEW YORK"
+    assert (payload["ship_type"], payload["draught"]) == (70, 12.2)
+
+
+def test_fields_are_decoded_lazily_and_kept():
+    payload = AisPayload(POSITION)
+
+    assert payload.message_type == 1
+    assert payload._bits is None
+    assert payload["mmsi"] == 477553000
+    assert payload._values == {"mmsi": 477553000}
+
+
+def test_missing_and_unknown_fields():
+    payload = AisPayload(POSITION[:15])
+
+    assert payload["mmsi"] == 477553000
+    assert payload["lat"] is None
+    with pytest.raises(KeyError):
+        payload["shipname"]
+    assert payload.get("shipname", "n/a") == "n/a"
+    with pytest.raises(AisPayloadError):
+        AisPayload("!77KQJ5")
+
+
+def test_decode_payload_shares_one_decoded_payload():
+    decode_payload.cache_clear()
+
+    first = decode_payload(POSITION)
+    first["mmsi"]
+
+    assert decode_payload(POSITION) is first
+    assert decode_payload.cache_info().hits == 1
+    assert decode_payload(POSITION, 2) is not first
+
+
+def test_batch_decode_fills_missing_fields_per_type():
+    numpy = pytest.importorskip("numpy")
+
+    columns = decode_payloads(
+        [POSITION, STATIC, CLASS_B, POSITION[:15]],
+        ["mmsi", "lat", "imo"],
+    )
+
+    assert columns["mmsi"].tolist() == [477553000, 351759000, 338087471, 477553000]
+    assert columns["imo"].tolist() == [-1, 9134270, -1, -1]
+    assert columns["lat"][[0, 2]].tolist() == pytest.approx([47.582833, 40.68454])
+    assert numpy.isnan(columns["lat"][[1, 3]]).all()
+
+
+def test_batch_decode_rejects_text_and_unknown_fields():
+    pytest.importorskip("numpy")
+
+    with pytest.raises(AisPayloadError, match="text field"):
+        decode_payloads([STATIC], ["shipname"])
+    with pytest.raises(KeyError):
+        decode_payloads([STATIC], ["speed"])
+
+
+def test_batch_decode_without_numpy_names_the_package(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    with pytest.raises(ImportError, match="numpy package"):
+        decode_payloads([POSITION], ["mmsi"])
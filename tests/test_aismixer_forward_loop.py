@@ -249,6 +249,9 @@ class RecordingRoutingTable:
         self.source_ids.append(source_id)
         return self.target_ids
 
+    def match_target_filter(self, _source_id):
+        return None
+
     def match(self, _source_id):
         raise AssertionError("descriptive routing matcher was called")
 
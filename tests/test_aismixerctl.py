@@ -8,6 +8,8 @@ import aismixerctl
 from core.routing_control_protocol import (
     ERROR_STALE_GENERATION,
     METHOD_RUNTIME_STATISTICS,
+    METHOD_RUNTIME_STATISTICS_ANOMALIES,
+    METHOD_RUNTIME_STATISTICS_CLIENTS,
     METHOD_RUNTIME_STATISTICS_INPUTS,
     METHOD_RUNTIME_STATISTICS_OUTPUTS,
     ROUTING_CONTROL_PROTOCOL_VERSION,
@@ -101,6 +103,7 @@ def statistics_result(ingress_queues=None):
             "reset_completed": 2,
             "reset_failed": 0,
             "reset_in_flight": 1,
+            "gid_pool_refills": 2,
         },
         "egress_queue": queue_statistics(
             "egress",
@@ -177,6 +180,21 @@ def output_traffic_result(outputs=None):
                 "dispatch_failed": 0,
                 "messages": 10,
                 "bytes": 900,
+                "buffered_bytes": 0,
+                "buffer_drops": 0,
+                "write_pauses": 0,
+                "resolutions": 0,
+                "resolve_failures": 0,
+                "transport_failures": 0,
+                "address_changes": 0,
+                "resolve_latency_us": 0,
+                "sink_bytes_written": 0,
+                "sink_rotations": 0,
+                "sink_write_errors": 0,
+                "sink_dropped": 0,
+                "sink_lag_us": 0,
+                "queue": None,
+                "throttled": None,
             },
             {
                 "target_id": 1,
@@ -186,6 +204,33 @@ def output_traffic_result(outputs=None):
                 "dispatch_failed": 1,
                 "messages": 24,
                 "bytes": 2160,
+                "buffered_bytes": 180,
+                "buffer_drops": 0,
+                "write_pauses": 1,
+                "resolutions": 4,
+                "resolve_failures": 0,
+                "transport_failures": 0,
+                "address_changes": 1,
+                "resolve_latency_us": 1250,
+                "sink_bytes_written": 0,
+                "sink_rotations": 0,
+                "sink_write_errors": 0,
+                "sink_dropped": 0,
+                "sink_lag_us": 0,
+                "queue": {
+                    "overflow_policy": "drop_oldest",
+                    "capacity": 1024,
+                    "depth": 3,
+                    "peak_depth": 40,
+                    "enqueued": 27,
+                    "dequeued": 24,
+                    "dropped": 2,
+                    "put_waits": 0,
+                    "sent_messages": 24,
+                    "sent_datagrams": 8,
+                    "shaped": 0,
+                },
+                "throttled": 7,
             },
         ]
     return {"outputs": list(outputs)}
@@ -420,6 +465,22 @@ def test_runtime_statistics_outputs_request_shapes(output, expected_params):
     }
 
 
+def test_runtime_statistics_clients_request_uses_output_filter_rules():
+    assert aismixerctl.build_runtime_statistics_clients_request("req-1") == {
+        "version": ROUTING_CONTROL_PROTOCOL_VERSION,
+        "request_id": "req-1",
+        "method": METHOD_RUNTIME_STATISTICS_CLIENTS,
+    }
+    assert aismixerctl.build_runtime_statistics_clients_request(
+        "req-1",
+        "2",
+    )["params"] == {"target_id": 2}
+    assert aismixerctl.build_runtime_statistics_clients_request(
+        "req-1",
+        "tcp:partners",
+    )["params"] == {"name": "tcp:partners"}
+
+
 @pytest.mark.parametrize(
     "parser_factory",
     [aismixerctl.build_parser, aismixerctl.build_shell_parser],
@@ -446,6 +507,7 @@ def test_show_statistics_uses_shared_nested_parser(parser_factory):
             {"input": "udp-ingress:0:station-a"},
         ),
         (["outputs"], METHOD_RUNTIME_STATISTICS_OUTPUTS, None),
+        (["anomalies"], METHOD_RUNTIME_STATISTICS_ANOMALIES, None),
         (["outputs", "1"], METHOD_RUNTIME_STATISTICS_OUTPUTS, {"target_id": 1}),
         (
             ["outputs", "udp:aishub"],
@@ -517,6 +579,95 @@ def test_replace_with_expected_generation():
     assert request["params"]["expected_generation"] == 3
 
 
+def test_patch_request_shape():
+    operations = [{"op": "add_source", "zone": "fixed", "source": "udp:roof"}]
+
+    request = aismixerctl.build_patch_request(
+        "req-1",
+        operations,
+        expected_generation=2,
+    )
+
+    assert request == {
+        "version": ROUTING_CONTROL_PROTOCOL_VERSION,
+        "request_id": "req-1",
+        "method": "routing.patch",
+        "params": {"operations": operations, "expected_generation": 2},
+    }
+
+
+def test_patch_request_requires_operations():
+    with pytest.raises(aismixerctl.AismixerCtlInputError):
+        aismixerctl.build_patch_request("req-1", [])
+
+
+@pytest.mark.parametrize(
+    ("tokens", "operation"),
+    [
+        (
+            ["add-source", "fixed", "udp:roof"],
+            {"op": "add_source", "zone": "fixed", "source": "udp:roof"},
+        ),
+        (
+            ["remove-target", "fixed_to_a", "udp:a"],
+            {"op": "remove_target", "route": "fixed_to_a", "target": "udp:a"},
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "parser_factory",
+    [aismixerctl.build_parser, aismixerctl.build_shell_parser],
+)
+def test_patch_commands_build_single_operation_requests(
+    parser_factory,
+    tokens,
+    operation,
+):
+    args = parser_factory().parse_args(
+        ["patch", *tokens, "--expected-generation", "3"]
+    )
+
+    request = aismixerctl.build_request_from_args(args, "req-1")
+
+    assert request["method"] == "routing.patch"
+    assert request["params"] == {
+        "operations": [operation],
+        "expected_generation": 3,
+    }
+
+
+@pytest.mark.parametrize(
+    "parser_factory",
+    [aismixerctl.build_parser, aismixerctl.build_shell_parser],
+)
+def test_show_vessel_commands_build_vessel_requests(parser_factory):
+    parser = parser_factory()
+
+    vessel = aismixerctl.build_request_from_args(
+        parser.parse_args(["show", "vessel", "477553000"]),
+        "req-1",
+    )
+    vessels = aismixerctl.build_request_from_args(
+        parser.parse_args(
+            ["show", "vessels", "-10", "35.5", "30", "60", "--limit", "20"]
+        ),
+        "req-2",
+    )
+
+    assert vessel == {
+        "version": ROUTING_CONTROL_PROTOCOL_VERSION,
+        "request_id": "req-1",
+        "method": "vessels.get",
+        "params": {"mmsi": 477553000},
+    }
+    assert vessels["method"] == "vessels.query"
+    assert vessels["params"] == {"bbox": [-10.0, 35.5, 30.0, 60.0], "limit": 20}
+    assert "limit" not in aismixerctl.build_vessels_request(
+        "req-3",
+        (0, 0, 1, 1),
+    )["params"]
+
+
 def test_generated_request_id_can_be_injected():
     assert (
         aismixerctl.build_request_id(None, generated_request_id=lambda: "generated")
@@ -1428,6 +1579,85 @@ def test_interactive_output_statistics_table_uses_local_completion_terms(
     assert stderr == ""
 
 
+def test_interactive_output_statistics_table_shows_target_queue(tmp_path):
+    FakeClient.response = output_traffic_response("traffic-1")
+
+    rc, _input_func, stdout, stderr = run_shell(
+        tmp_path,
+        ["show statistics outputs", "exit"],
+        generated_request_id=lambda: "traffic-1",
+    )
+
+    assert rc == aismixerctl.EXIT_OK
+    for heading in (
+        "POLICY",
+        "QUEUE DEPTH",
+        "QUEUE PEAK",
+        "DROPPED",
+        "SENT MSGS",
+        "DATAGRAMS",
+        "SHAPED",
+        "THROTTLED",
+    ):
+        assert heading in stdout
+    rows = stdout.splitlines()[2:]
+    assert rows[0].split()[-8:] == ["-"] * 8
+    assert rows[1].split()[-8:] == [
+        "drop_oldest",
+        "3/1024",
+        "40",
+        "2",
+        "24",
+        "8",
+        "0",
+        "7",
+    ]
+    assert stderr == ""
+
+
+@pytest.mark.parametrize(
+    "queue",
+    [
+        "drop_oldest",
+        {"overflow_policy": "drop_oldest"},
+        {
+            "overflow_policy": "lossless",
+            "capacity": 1,
+            "depth": 0,
+            "peak_depth": 0,
+            "enqueued": 0,
+            "dequeued": 0,
+            "dropped": 0,
+            "put_waits": 0,
+            "sent_messages": 0,
+            "sent_datagrams": 0,
+            "shaped": 0,
+        },
+        {
+            "overflow_policy": "block",
+            "capacity": 1,
+            "depth": -1,
+            "peak_depth": 0,
+            "enqueued": 0,
+            "dequeued": 0,
+            "dropped": 0,
+            "put_waits": 0,
+            "sent_messages": 0,
+            "sent_datagrams": 0,
+            "shaped": 0,
+        },
+    ],
+)
+def test_output_statistics_rejects_malformed_target_queue(queue):
+    outputs = output_traffic_result()["outputs"]
+    outputs[1] = {**outputs[1], "queue": queue}
+
+    with pytest.raises(RoutingControlResponseError):
+        aismixerctl.format_runtime_statistics_outputs(
+            output_traffic_result(outputs)
+        )
+
+
 @pytest.mark.parametrize(
     ("command", "response", "expected_params", "heading"),
     [
@@ -1923,8 +2153,19 @@ def test_basic_completion_candidates():
     assert "--expected-generation" in disable_options
     assert show_candidates == {"show"}
     assert statistics_candidates == {"statistics"}
-    assert traffic_candidates == {"inputs", "outputs"}
-    assert aismixerctl.completion_candidates("show ", "") == ("statistics",)
+    assert traffic_candidates == {"inputs", "outputs", "clients", "anomalies"}
+    assert aismixerctl.completion_candidates("show ", "") == (
+        "statistics",
+        "vessel",
+        "vessels",
+    )
+    assert aismixerctl.completion_candidates("show vessels", "vessels") == (
+        "vessels",
+    )
+    assert aismixerctl.completion_candidates(
+        "show vessels 0 50 5 55 --l",
+        "--l",
+    ) == ("--limit",)
     assert aismixerctl.completion_candidates(
         "show statistics in",
         "in",
@@ -1933,6 +2174,15 @@ def test_basic_completion_candidates():
         "show statistics inputs ",
         "",
     ) == ()
+    assert "patch" in command_candidates
+    assert aismixerctl.completion_candidates("patch add", "add") == (
+        "add-source",
+        "add-target",
+    )
+    assert aismixerctl.completion_candidates(
+        "patch add-source fixed udp:roof --e",
+        "--e",
+    ) == ("--expected-generation",)
 
 
 def test_one_shot_and_nested_help_include_show_statistics(capsys):
@@ -1950,6 +2200,7 @@ def test_one_shot_and_nested_help_include_show_statistics(capsys):
     assert "show statistics" in top_level_help
     assert "show statistics inputs [INPUT]" in top_level_help
     assert "show statistics outputs [OUTPUT]" in top_level_help
+    assert "show vessels MIN_LON MIN_LAT MAX_LON MAX_LAT" in top_level_help
     assert "statistics" in nested_help
     assert "inputs" in statistics_help
     assert "outputs" in statistics_help
@@ -1985,3 +2236,100 @@ def test_show_statistics_rejects_invalid_filter_forms(
     assert rc == aismixerctl.EXIT_USAGE_OR_INPUT
     assert FakeClient.calls == []
     assert captured.err
+
+
+def tcp_client_statistics_result():
+    return {
+        "servers": [
+            {
+                "target_id": 2,
+                "name": "tcp:partners",
+                "listen": "0.0.0.0:10110",
+                "accepted": 5,
+                "rejected": 1,
+                "evicted": 2,
+                "clients": [
+                    {
+                        "client_id": 4,
+                        "peer": "192.0.2.10:50112",
+                        "bytes": 9120,
+                        "buffered_bytes": 0,
+                        "lag_us": 0,
+                    },
+                    {
+                        "client_id": 5,
+                        "peer": "192.0.2.11:40022",
+                        "bytes": 8800,
+                        "buffered_bytes": 4096,
+                        "lag_us": 1500,
+                    },
+                ],
+            },
+        ]
+    }
+
+
+def test_client_statistics_render_server_and_client_tables():
+    rendered = aismixerctl.format_runtime_statistics_clients(
+        tcp_client_statistics_result()
+    )
+
+    servers, clients = rendered.rstrip("\n").split("\n\n")
+    assert servers.splitlines()[0] == "TCP servers"
+    assert servers.splitlines()[3].split() == [
+        "2",
+        "tcp:partners",
+        "0.0.0.0:10110",
+        "2",
+        "5",
+        "1",
+        "2",
+    ]
+    assert [line.split() for line in clients.splitlines()[3:]] == [
+        ["2", "4", "192.0.2.10:50112", "9120", "0", "0"],
+        ["2", "5", "192.0.2.11:40022", "8800", "4096", "1500"],
+    ]
+
+
+def test_anomaly_statistics_render_one_counter_row():
+    rendered = aismixerctl.format_runtime_statistics_anomalies(
+        {
+            "anomalies": {
+                "checked": 1200,
+                "speed": 4,
+                "teleport": 2,
+                "duplicate_mmsi": 1,
+                "out_of_range": 0,
+                "tracked_vessels": 310,
+            }
+        }
+    )
+
+    lines = rendered.splitlines()
+    assert lines[0].split() == [
+        "CHECKED",
+        "SPEED",
+        "TELEPORT",
+        "DUPLICATE",
+        "MMSI",
+        "OUT",
+        "OF",
+        "RANGE",
+        "TRACKED",
+    ]
+    assert lines[2].split() == ["1200", "4", "2", "1", "0", "310"]
+    assert aismixerctl.format_runtime_statistics_anomalies(
+        {"anomalies": None}
+    ) == "Anomaly detection is not enabled.\n"
+    with pytest.raises(RoutingControlResponseError):
+        aismixerctl.format_runtime_statistics_anomalies(
+            {"anomalies": {"checked": 1}}
+        )
+
+
+def test_client_statistics_reject_malformed_client_rows():
+    result = tcp_client_statistics_result()
+    result["servers"][0]["clients"][0] = {"client_id": 4}
+
+    with pytest.raises(RoutingControlResponseError):
+        aismixerctl.format_runtime_statistics_clients(result)
@@ -0,0 +1,200 @@
+import pytest
+
+from core.anomaly_detection import (
+    Anomaly,
+    AnomalyConfigError,
+    AnomalyDetector,
+    AnomalyRouting,
+    load_optional_anomaly_detector,
+)
+from core.metrics import AnomalyMetricsSnapshot
+
+
+MMSI = 366053209
+STATIC = "!AIVDM,1,1,,A,55Muq?002>G?svP00<:O?vN60<0,0*00"
+
+
+def position_sentence(lon, lat, *, mmsi=MMSI):
+    """Return a type 1 report; checksums are not checked by the detector."""
+
+    bits = 1 << 162 | mmsi << 130
+    bits |= (round(lon * 600_000) & (1 << 28) - 1) << 79
+    bits |= (round(lat * 600_000) & (1 << 27) - 1) << 52
+    payload = "".join(
+        chr(value + 48 if value < 40 else value + 56)
+        for value in (bits >> shift & 63 for shift in range(162, -1, -6))
+    )
+    return f"!AIVDM,1,1,,A,{payload},0*00"
+
+
+def test_plausible_tracks_and_other_sentences_are_not_flagged():
+    detector = AnomalyDetector()
+
+    # 0.1 degrees of latitude (6 nm) in an hour is 6 knots.
+    assert detector.check(position_sentence(10.0, 50.0), 0.0) == Anomaly(0)
+    assert detector.check(position_sentence(10.0, 50.1), 3600.0) == Anomaly(0)
+    # Position noise between reports arriving together is tolerated.
+    assert detector.check(position_sentence(10.0, 50.1005), 3600.0) == 0
+    assert detector.check(STATIC, 3600.0) == Anomaly(0)
+    assert detector.check("!AIVDM,1,1,,A,1,0*00", 3600.0) == Anomaly(0)
+    assert detector.check("!AIVDM,1,1,,A,1~~~,0*00", 3600.0) == Anomaly(0)
+
+    assert detector.metrics_snapshot() == AnomalyMetricsSnapshot(
+        checked=3,
+        speed=0,
+        teleport=0,
+        duplicate_mmsi=0,
+        out_of_range=0,
+        tracked_vessels=1,
+    )
+
+
+def test_impossible_speed_and_jumps_are_flagged():
+    detector = AnomalyDetector(max_speed_knots=60, teleport_nm=10)
+    detector.check(position_sentence(10.0, 50.0), 0.0)
+
+    # 3 nm in a minute is 180 knots; 90 nm at once is a jump.
+    assert detector.check(position_sentence(10.0, 50.05), 60.0) is Anomaly.SPEED
+    assert (
+        detector.check(position_sentence(10.0, 51.5), 120.0)
+        is Anomaly.TELEPORT
+    )
+    # The track stays where the last plausible report left it.
+    assert detector.check(position_sentence(10.0, 50.001), 180.0) == 0
+
+
+def test_distance_wraps_across_the_antimeridian():
+    detector = AnomalyDetector()
+    detector.check(position_sentence(179.999, 0.0), 0.0)
+
+    assert detector.check(position_sentence(-179.999, 0.0), 60.0) == 0
+
+
+def test_two_transmitters_sharing_an_mmsi_are_flagged_as_duplicates():
+    detector = AnomalyDetector()
+    west = position_sentence(4.0, 52.0)
+    east = position_sentence(5.0, 52.0)
+
+    assert detector.check(west, 0.0) == 0
+    assert detector.check(east, 10.0) is Anomaly.TELEPORT
+    assert detector.check(west, 20.0) == 0
+    assert detector.check(east, 30.0) is Anomaly.DUPLICATE_MMSI
+    assert detector.check(west, 40.0) == 0
+    assert detector.check(east, 50.0) is Anomaly.DUPLICATE_MMSI
+
+    snapshot = detector.metrics_snapshot()
+    assert (snapshot.teleport, snapshot.duplicate_mmsi) == (1, 2)
+
+
+def test_a_jump_followed_by_silence_at_the_old_position_moves_the_track():
+    detector = AnomalyDetector(duplicate_window_s=600)
+    detector.check(position_sentence(4.0, 52.0), 0.0)
+
+    assert detector.check(position_sentence(5.0, 52.0), 10.0) is Anomaly.TELEPORT
+    assert detector.check(position_sentence(5.0, 52.0), 20.0) == 0
+    assert detector.check(position_sentence(5.0, 52.001), 30.0) == 0
+    assert (
+        detector.check(position_sentence(4.0, 52.0), 40.0)
+        is Anomaly.TELEPORT
+    )
+
+
+def test_out_of_range_coordinates_are_flagged_and_not_tracked():
+    detector = AnomalyDetector()
+
+    assert (
+        detector.check(position_sentence(200.0, 50.0), 0.0)
+        is Anomaly.OUT_OF_RANGE
+    )
+    # 181/91 mean "not available" and are no position at all.
+    assert detector.check(position_sentence(181.0, 91.0), 0.0) == 0
+
+    assert len(detector) == 0
+    assert detector.metrics_snapshot().out_of_range == 1
+
+
+def test_track_table_evicts_the_least_recently_reporting_vessel():
+    detector = AnomalyDetector(capacity=2)
+    detector.check(position_sentence(10.0, 50.0, mmsi=1), 0.0)
+    detector.check(position_sentence(10.0, 50.0, mmsi=2), 0.0)
+    detector.check(position_sentence(10.0, 50.0, mmsi=1), 1.0)
+
+    detector.check(position_sentence(10.0, 50.0, mmsi=3), 2.0)
+    assert len(detector) == 2
+
+    # MMSI 2 was forgotten, so its jump starts a new track.
+    assert detector.check(position_sentence(20.0, 50.0, mmsi=2), 3.0) == 0
+    assert detector.check(position_sentence(20.0, 50.0, mmsi=3), 3.0) != 0
+
+
+def test_flagged_targets_copy_or_divert_to_the_anomaly_target():
+    assert AnomalyDetector().flagged_targets((0, 1)) == (0, 1)
+    assert AnomalyDetector(
+        routing=AnomalyRouting(target_id=2),
+    ).flagged_targets((0, 1)) == (0, 1, 2)
+    assert AnomalyDetector(
+        routing=AnomalyRouting(target_id=1),
+    ).flagged_targets((0, 1)) == (0, 1)
+    assert AnomalyDetector(
+        routing=AnomalyRouting(target_id=2, divert=True),
+    ).flagged_targets((0, 1)) == (2,)
+
+
+def test_metrics_snapshot_rejects_more_flags_than_checks():
+    with pytest.raises(ValueError):
+        AnomalyMetricsSnapshot(
+            checked=1,
+            speed=1,
+            teleport=1,
+            duplicate_mmsi=0,
+            out_of_range=0,
+            tracked_vessels=0,
+        )
+
+
+def test_optional_config_builds_the_detector_only_when_enabled():
+    targets = {"udp:review": 3}
+    assert load_optional_anomaly_detector({}, targets) is None
+    assert (
+        load_optional_anomaly_detector(
+            {"anomaly_detection": {"enabled": False}},
+            targets,
+        )
+        is None
+    )
+
+    detector = load_optional_anomaly_detector(
+        {
+            "anomaly_detection": {
+                "enabled": True,
+                "max_speed_knots": 45,
+                "target": "udp:review",
+                "divert": True,
+            }
+        },
+        targets,
+    )
+
+    assert detector.max_speed_knots == 45.0
+    assert detector.routing == AnomalyRouting(target_id=3, divert=True)
+
+
+@pytest.mark.parametrize(
+    "section",
+    [
+        [],
+        {"enabled": "yes"},
+        {"enabled": True, "max_speed_knots": 0},
+        {"enabled": True, "teleport_nm": True},
+        {"enabled": True, "capacity": 1.5},
+        {"enabled": True, "target": "udp:missing"},
+        {"enabled": True, "divert": True},
+        {"enabled": True, "tag": True},
+    ],
+)
+def test_invalid_config_is_rejected(section):
+    with pytest.raises(AnomalyConfigError):
+        load_optional_anomaly_detector(
+            {"anomaly_detection": section},
+            {"udp:review": 3},
+        )
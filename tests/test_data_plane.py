@@ -15,6 +15,7 @@ from core.data_plane import (
     ProcessorResetReport,
 )
 from core.ingress_frame import IngressFrame
+from core.message_filter import TargetFilter
 from core.metrics import ProcessorMetricsSnapshot
 
 
@@ -70,13 +71,42 @@ def test_processing_snapshot_is_frozen_slotted_and_target_only():
         "routing_generation",
         "deduplication_mode",
         "target_ids",
+        "target_filter",
     )
+    assert snapshot.target_filter is None
     assert snapshot.routing_generation == 7
     assert snapshot.deduplication_mode is DeduplicationMode.PER_TARGET
     assert snapshot.target_ids == (2, 0, 1)
     assert isinstance(snapshot.target_ids, tuple)
 
 
+def test_processing_snapshot_target_filter_requires_per_target_mode():
+    target_filter = TargetFilter(clauses=((None, (0,)),))
+
+    snapshot = ProcessingSnapshot(
+        routing_generation=0,
+        deduplication_mode=DeduplicationMode.PER_TARGET,
+        target_ids=(0,),
+        target_filter=target_filter,
+    )
+
+    assert snapshot.target_filter is target_filter
+    with pytest.raises(ValueError, match="PER_TARGET"):
+        ProcessingSnapshot(
+            routing_generation=0,
+            deduplication_mode=DeduplicationMode.GLOBAL,
+            target_ids=(0,),
+            target_filter=target_filter,
+        )
+    with pytest.raises(TypeError, match="TargetFilter"):
+        ProcessingSnapshot(
+            routing_generation=0,
+            deduplication_mode=DeduplicationMode.PER_TARGET,
+            target_ids=(0,),
+            target_filter=((None, (0,)),),
+        )
+
+
 def test_processing_snapshot_copies_a_non_string_iterable():
     snapshot = ProcessingSnapshot(
         routing_generation=0,
@@ -533,6 +563,7 @@ def test_minimal_synchronous_fake_satisfies_processor_protocol():
         reset_completed=0,
         reset_failed=0,
         reset_in_flight=0,
+        gid_pool_refills=0,
     )
 
     class FakeProcessor:
@@ -0,0 +1,500 @@
+import asyncio
+
+import pytest
+
+from core.egress_targets import (
+    DEFAULT_COALESCE_MAX_BYTES,
+    DEFAULT_TARGET_OVERFLOW_POLICY,
+    DEFAULT_TARGET_QUEUE_MAXSIZE,
+    EgressOverflowPolicy,
+    EgressTargetQueueConfigError,
+    EgressTargetQueueSettings,
+    PerTargetEgressDispatcher,
+    UnknownEgressTargetError,
+    _TokenBucket,
+    load_target_queue_settings,
+)
+
+
+class RecordingSender:
+    def __init__(self, *, blocked_target_ids=()):
+        self.sent = []
+        self.blocked_target_ids = frozenset(blocked_target_ids)
+        self.release = asyncio.Event()
+
+    async def send_to_ids(self, target_ids, message):
+        target_ids = tuple(target_ids)
+        if set(target_ids) & self.blocked_target_ids:
+            await self.release.wait()
+        self.sent.append((target_ids, message))
+
+
+def settings(maxsize, policy):
+    return EgressTargetQueueSettings(maxsize=maxsize, overflow_policy=policy)
+
+
+def coalescing(max_bytes, deadline=0.0):
+    return EgressTargetQueueSettings(
+        coalesce_max_bytes=max_bytes,
+        coalesce_deadline=deadline,
+    )
+
+
+def sentence(index, width=10):
+    return f"{index:0{width - 2}d}\r\n".encode("ascii")
+
+
+async def drain(dispatcher, target_id):
+    task = asyncio.create_task(dispatcher.run_target(target_id))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+def test_load_settings_applies_defaults_and_per_target_overrides():
+    loaded = load_target_queue_settings(
+        (
+            {"host": "127.0.0.1", "port": 1},
+            {
+                "host": "127.0.0.1",
+                "port": 2,
+                "queue_maxsize": 8,
+                "queue_overflow": "block",
+            },
+        )
+    )
+
+    assert loaded == (
+        settings(DEFAULT_TARGET_QUEUE_MAXSIZE, DEFAULT_TARGET_OVERFLOW_POLICY),
+        settings(8, EgressOverflowPolicy.BLOCK),
+    )
+
+
+def test_load_settings_enables_coalescing_per_target():
+    loaded = load_target_queue_settings(
+        (
+            {"coalesce_max_bytes": 512},
+            {"coalesce": True},
+            {
+                "coalesce": True,
+                "coalesce_max_bytes": 512,
+                "coalesce_deadline_ms": 5,
+            },
+        )
+    )
+
+    assert [target.coalesce_max_bytes for target in loaded] == [
+        None,
+        DEFAULT_COALESCE_MAX_BYTES,
+        512,
+    ]
+    assert [target.coalesce_deadline for target in loaded] == [
+        0.02,
+        0.02,
+        0.005,
+    ]
+
+
+def test_load_settings_enables_token_buckets_with_one_second_bursts():
+    loaded = load_target_queue_settings(
+        (
+            {"rate_messages_per_s": 20},
+            {"rate_bytes_per_s": 0.5, "rate_messages_per_s": 5},
+            {"rate_bytes_per_s": 9600, "rate_burst_bytes": 1200},
+        )
+    )
+
+    assert [
+        (
+            target.rate_messages_per_s,
+            target.rate_burst_messages,
+            target.rate_bytes_per_s,
+            target.rate_burst_bytes,
+        )
+        for target in loaded
+    ] == [(20, 20, None, None), (5, 5, 0.5, 1), (None, None, 9600, 1200)]
+    assert all(target.is_shaped for target in loaded)
+
+
+@pytest.mark.parametrize(
+    ("entry", "message"),
+    [
+        ({"queue_maxsize": 0}, r"forwarders\[0\]\.queue_maxsize"),
+        ({"coalesce": "yes"}, r"forwarders\[0\]\.coalesce "),
+        ({"coalesce_max_bytes": 0}, r"forwarders\[0\]\.coalesce_max_bytes"),
+        (
+            {"coalesce_max_bytes": 65508},
+            r"forwarders\[0\]\.coalesce_max_bytes",
+        ),
+        (
+            {"coalesce_deadline_ms": -1},
+            r"forwarders\[0\]\.coalesce_deadline_ms",
+        ),
+        (
+            {"coalesce_deadline_ms": float("nan")},
+            r"forwarders\[0\]\.coalesce_deadline_ms",
+        ),
+        ({"queue_maxsize": True}, r"forwarders\[0\]\.queue_maxsize"),
+        ({"queue_maxsize": "8"}, r"forwarders\[0\]\.queue_maxsize"),
+        ({"queue_overflow": "drop"}, r"forwarders\[0\]\.queue_overflow"),
+        ({"queue_overflow": None}, r"forwarders\[0\]\.queue_overflow"),
+        (
+            {"rate_messages_per_s": 0},
+            r"forwarders\[0\]\.rate_messages_per_s",
+        ),
+        (
+            {"rate_bytes_per_s": float("inf")},
+            r"forwarders\[0\]\.rate_bytes_per_s",
+        ),
+        (
+            {"rate_burst_bytes": 4096},
+            r"forwarders\[0\]\.rate_burst_bytes requires rate_bytes_per_s",
+        ),
+        (
+            {"rate_messages_per_s": 10, "queue_overflow": "block"},
+            r"forwarders\[0\]\.queue_overflow cannot be block",
+        ),
+    ],
+)
+def test_load_settings_rejects_invalid_queue_fields(entry, message):
+    with pytest.raises(EgressTargetQueueConfigError, match=message):
+        load_target_queue_settings(({"host": "127.0.0.1", "port": 1, **entry},))
+
+
+def test_send_to_ids_enqueues_once_per_distinct_target_in_fifo_order():
+    async def scenario():
+        sender = RecordingSender()
+        dispatcher = PerTargetEgressDispatcher(
+            sender,
+            (settings(4, EgressOverflowPolicy.BLOCK),) * 2,
+        )
+
+        await dispatcher.send_to_ids((1, 0, 1), b"first")
+        await dispatcher.send_to_ids((1,), b"second")
+        await drain(dispatcher, 1)
+        await drain(dispatcher, 0)
+
+        assert sender.sent == [
+            ((1,), b"first"),
+            ((1,), b"second"),
+            ((0,), b"first"),
+        ]
+        first, second = dispatcher.target_queue_snapshot()
+        assert (first.enqueued, first.dequeued, first.depth) == (1, 1, 0)
+        assert (second.enqueued, second.dequeued, second.depth) == (2, 2, 0)
+        assert second.peak_depth == 2
+        assert (second.sent_messages, second.sent_datagrams) == (2, 2)
+
+    asyncio.run(scenario())
+
+
+def test_stuck_target_does_not_delay_healthy_target():
+    async def scenario():
+        sender = RecordingSender(blocked_target_ids=(0,))
+        dispatcher = PerTargetEgressDispatcher(
+            sender,
+            (settings(2, EgressOverflowPolicy.DROP_OLDEST),) * 2,
+        )
+        workers = [
+            asyncio.create_task(dispatcher.run_target(target_id))
+            for target_id in dispatcher.all_target_ids
+        ]
+
+        for index in range(5):
+            await dispatcher.send_to_ids((0, 1), b"%d" % index)
+            await asyncio.sleep(0)
+
+        assert [message for ids, message in sender.sent if ids == (1,)] == [
+            b"0",
+            b"1",
+            b"2",
+            b"3",
+            b"4",
+        ]
+        stuck = dispatcher.target_queue_snapshot()[0]
+        assert stuck.depth == 2
+        assert stuck.dropped == 2
+
+        sender.release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert [message for ids, message in sender.sent if ids == (0,)] == [
+            b"0",
+            b"3",
+            b"4",
+        ]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_drop_newest_keeps_queued_messages_and_counts_drops():
+    async def scenario():
+        sender = RecordingSender()
+        dispatcher = PerTargetEgressDispatcher(
+            sender,
+            (settings(2, EgressOverflowPolicy.DROP_NEWEST),),
+        )
+
+        for message in (b"a", b"b", b"c"):
+            await dispatcher.send_to_ids((0,), message)
+        await drain(dispatcher, 0)
+
+        assert sender.sent == [((0,), b"a"), ((0,), b"b")]
+        (snapshot,) = dispatcher.target_queue_snapshot()
+        assert snapshot.overflow_policy == "drop_newest"
+        assert (snapshot.enqueued, snapshot.dropped) == (2, 1)
+
+    asyncio.run(scenario())
+
+
+def test_block_policy_waits_for_worker_capacity():
+    async def scenario():
+        sender = RecordingSender()
+        dispatcher = PerTargetEgressDispatcher(
+            sender,
+            (settings(1, EgressOverflowPolicy.BLOCK),),
+        )
+
+        await dispatcher.send_to_ids((0,), b"a")
+        blocked = asyncio.create_task(dispatcher.send_to_ids((0,), b"b"))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        await drain(dispatcher, 0)
+        await blocked
+
+        (snapshot,) = dispatcher.target_queue_snapshot()
+        assert snapshot.put_waits == 1
+        assert snapshot.dropped == 0
+        assert (snapshot.enqueued, snapshot.dequeued) == (2, 2)
+        assert sender.sent == [((0,), b"a"), ((0,), b"b")]
+
+    asyncio.run(scenario())
+
+
+def test_worker_send_failure_propagates():
+    class FailingSender:
+        async def send_to_ids(self, _target_ids, _message):
+            raise OSError("send failed")
+
+    async def scenario():
+        dispatcher = PerTargetEgressDispatcher(
+            FailingSender(),
+            (EgressTargetQueueSettings(),),
+        )
+        await dispatcher.send_to_ids((0,), b"a")
+
+        with pytest.raises(OSError, match="send failed"):
+            await dispatcher.run_target(0)
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize(
+    ("target_ids", "exception"),
+    [
+        ((2,), UnknownEgressTargetError),
+        ((-1,), UnknownEgressTargetError),
+        ((True,), TypeError),
+        ("0", TypeError),
+    ],
+)
+def test_send_to_ids_rejects_invalid_targets_before_enqueueing(
+    target_ids,
+    exception,
+):
+    async def scenario():
+        dispatcher = PerTargetEgressDispatcher(
+            RecordingSender(),
+            (EgressTargetQueueSettings(),) * 2,
+        )
+
+        with pytest.raises(exception):
+            await dispatcher.send_to_ids((0, *target_ids), b"a")
+
+        assert all(
+            snapshot.enqueued == 0
+            for snapshot in dispatcher.target_queue_snapshot()
+        )
+
+    asyncio.run(scenario())
+
+
+def test_send_to_ids_rejects_mutable_messages():
+    async def scenario():
+        dispatcher = PerTargetEgressDispatcher(
+            RecordingSender(),
+            (EgressTargetQueueSettings(),),
+        )
+
+        with pytest.raises(TypeError, match="bytes"):
+            await dispatcher.send_to_ids((0,), bytearray(b"a"))
+
+    asyncio.run(scenario())
+
+
+def test_coalescing_packs_queued_messages_up_to_the_size_limit():
+    async def scenario():
+        sender = RecordingSender()
+        dispatcher = PerTargetEgressDispatcher(sender, (coalescing(25),))
+        messages = [sentence(index) for index in range(5)]
+        for message in messages:
+            await dispatcher.send_to_ids((0,), message)
+
+        await drain(dispatcher, 0)
+
+        assert sender.sent == [
+            ((0,), messages[0] + messages[1]),
+            ((0,), messages[2] + messages[3]),
+            ((0,), messages[4]),
+        ]
+        (snapshot,) = dispatcher.target_queue_snapshot()
+        assert (snapshot.sent_messages, snapshot.sent_datagrams) == (5, 3)
+
+    asyncio.run(scenario())
+
+
+def test_coalescing_waits_up_to_the_deadline_for_more_messages():
+    async def scenario():
+        sender = RecordingSender()
+        dispatcher = PerTargetEgressDispatcher(
+            sender,
+            (coalescing(1000, deadline=0.05),),
+        )
+        worker = asyncio.create_task(dispatcher.run_target(0))
+
+        await dispatcher.send_to_ids((0,), sentence(1))
+        await asyncio.sleep(0.005)
+        assert sender.sent == []
+        await dispatcher.send_to_ids((0,), sentence(2))
+        await asyncio.sleep(0.1)
+
+        assert sender.sent == [((0,), sentence(1) + sentence(2))]
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_coalescing_sends_unterminated_and_oversized_messages_alone():
+    async def scenario():
+        sender = RecordingSender()
+        dispatcher = PerTargetEgressDispatcher(sender, (coalescing(25),))
+        messages = [sentence(1), b"raw", sentence(2), sentence(3, width=30)]
+        for message in messages:
+            await dispatcher.send_to_ids((0,), message)
+
+        await drain(dispatcher, 0)
+
+        assert sender.sent == [((0,), message) for message in messages]
+        (snapshot,) = dispatcher.target_queue_snapshot()
+        assert (snapshot.sent_messages, snapshot.sent_datagrams) == (4, 4)
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize(
+    ("maxsize", "exception"),
+    [(0, ValueError), (True, TypeError), (1.5, TypeError)],
+)
+def test_settings_reject_invalid_maxsize(maxsize, exception):
+    with pytest.raises(exception, match="maxsize"):
+        EgressTargetQueueSettings(maxsize=maxsize)
+
+
+def test_token_bucket_allows_a_burst_then_paces_and_accepts_debt():
+    bucket = _TokenBucket(10, 2)
+
+    assert bucket.reserve(1, 0.0) == 0.0
+    assert bucket.reserve(1, 0.0) == 0.0
+    assert bucket.reserve(1, 0.0) == pytest.approx(0.1)
+    assert bucket.reserve(1, 0.1) == pytest.approx(0.1)
+    # Refill never exceeds the burst, and an oversized payload is paced by
+    # the debt it leaves instead of waiting forever.
+    assert bucket.reserve(5, 10.0) == pytest.approx(0.3)
+
+
+def test_rate_limited_target_is_paced_without_delaying_other_targets():
+    async def scenario():
+        sender = RecordingSender()
+        dispatcher = PerTargetEgressDispatcher(
+            sender,
+            (
+                EgressTargetQueueSettings(
+                    rate_messages_per_s=50,
+                    rate_burst_messages=2,
+                ),
+                EgressTargetQueueSettings(),
+            ),
+        )
+        workers = [
+            asyncio.create_task(dispatcher.run_target(target_id))
+            for target_id in (0, 1)
+        ]
+        for index in range(4):
+            await dispatcher.send_to_ids((0, 1), sentence(index))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        early = [target_ids for target_ids, _message in sender.sent]
+        await asyncio.sleep(0.1)
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        return early, sender.sent, dispatcher.target_queue_snapshot()
+
+    early, sent, (shaped, unshaped) = asyncio.run(scenario())
+
+    assert early.count((0,)) == 2
+    assert early.count((1,)) == 4
+    assert [message for target_ids, message in sent if target_ids == (0,)] == [
+        sentence(index) for index in range(4)
+    ]
+    assert (shaped.shaped, shaped.sent_messages) == (2, 4)
+    assert (unshaped.shaped, unshaped.sent_messages) == (0, 4)
+
+
+def test_rate_limited_backlog_uses_the_queue_overflow_policy():
+    async def scenario():
+        sender = RecordingSender()
+        dispatcher = PerTargetEgressDispatcher(
+            sender,
+            (
+                EgressTargetQueueSettings(
+                    maxsize=2,
+                    overflow_policy=EgressOverflowPolicy.DROP_OLDEST,
+                    rate_bytes_per_s=1000,
+                    rate_burst_bytes=10,
+                ),
+            ),
+        )
+        worker = asyncio.create_task(dispatcher.run_target(0))
+        for index in range(5):
+            await dispatcher.send_to_ids((0,), sentence(index))
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.05)
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        return sender.sent, dispatcher.target_queue_snapshot()[0]
+
+    sent, snapshot = asyncio.run(scenario())
+
+    assert [message for _target_ids, message in sent] == [
+        sentence(0),
+        sentence(1),
+        sentence(3),
+        sentence(4),
+    ]
+    assert (snapshot.dropped, snapshot.shaped) == (1, 3)
+
+
+def test_settings_reject_block_policy_for_rate_limited_queue():
+    with pytest.raises(ValueError, match="block overflow policy"):
+        EgressTargetQueueSettings(
+            overflow_policy=EgressOverflowPolicy.BLOCK,
+            rate_messages_per_s=10,
+        )
@@ -0,0 +1,92 @@
+import pytest
+
+from core.emission_throttle import (
+    EmissionThrottle,
+    EmissionThrottleConfigError,
+    load_optional_emission_throttle,
+)
+
+
+def report(mmsi, type_character="1"):
+    """Return a sentence whose payload carries only a type and an MMSI."""
+
+    bits = mmsi << 130
+    payload = type_character + "".join(
+        chr(value + 48 if value < 40 else value + 56)
+        for value in (bits >> shift & 63 for shift in range(156, -1, -6))
+    )
+    return f"!AIVDM,1,1,,A,{payload},0*00"
+
+
+STATIC = "!AIVDM,1,1,,A,55Muq?002>G?svP00<:O?vN60<0,0*00"
+
+
+def test_throttled_target_gets_one_report_per_vessel_and_interval():
+    throttle = EmissionThrottle({1: 10.0})
+
+    assert throttle.select(report(366053209), (0, 1), 100.0) == (0, 1)
+    assert throttle.select(report(366053209), (0, 1), 105.0) == (0,)
+    assert throttle.select(report(366053210), (0, 1), 105.0) == (0, 1)
+    assert throttle.select(report(366053209), (0, 1), 110.0) == (0, 1)
+
+    assert throttle.suppressed == {1: 1}
+    assert [
+        (snapshot.target_id, snapshot.suppressed)
+        for snapshot in throttle.metrics_snapshot()
+    ] == [(1, 1)]
+
+
+def test_message_classes_are_throttled_separately_and_others_pass():
+    throttle = EmissionThrottle({0: 10.0})
+    throttle.select(report(366053209, "1"), (0,), 100.0)
+
+    assert throttle.select(report(366053209, "3"), (0,), 101.0) == ()
+    assert throttle.select(report(366053209, "B"), (0,), 101.0) == (0,)
+    assert throttle.select(report(366053209, "K"), (0,), 101.0) == (0,)
+    assert throttle.select(STATIC, (0,), 101.0) == (0,)
+    assert throttle.select(STATIC, (0,), 101.0) == (0,)
+    assert throttle.select("!AIVDM,1,1,,A,1~~~~~~~~,0*00", (0,), 101.0) == (0,)
+
+
+def test_targets_keep_their_own_intervals():
+    throttle = EmissionThrottle({0: 5.0, 1: 60.0})
+    throttle.select(report(1), (0, 1), 0.0)
+
+    assert throttle.select(report(1), (0, 1), 6.0) == (0,)
+    assert throttle.select(report(1), (1,), 61.0) == (1,)
+
+
+def test_clock_stepping_back_does_not_silence_a_vessel():
+    throttle = EmissionThrottle({0: 10.0})
+    throttle.select(report(1), (0,), 1000.0)
+
+    assert throttle.select(report(1), (0,), 500.0) == (0,)
+    assert throttle.select(report(1), (0,), 505.0) == ()
+
+
+def test_expired_entries_are_reclaimed_as_others_are_emitted():
+    throttle = EmissionThrottle({0: 10.0})
+    for mmsi in range(100):
+        throttle.select(report(mmsi), (0,), float(mmsi) / 100)
+    assert len(throttle) == 100
+
+    for step, mmsi in enumerate(range(100, 150)):
+        throttle.select(report(mmsi), (0,), 20.0 + step)
+
+    assert len(throttle) == 50
+
+
+def test_optional_config_reads_forwarder_intervals():
+    assert load_optional_emission_throttle([{"host": "a"}]) is None
+
+    throttle = load_optional_emission_throttle(
+        [{"host": "a"}, {"host": "b", "throttle_interval_s": 30}]
+    )
+
+    assert throttle.intervals == {1: 30.0}
+
+
+@pytest.mark.parametrize("interval", [0, -1, True, "30", float("inf")])
+def test_invalid_intervals_are_rejected(interval):
+    with pytest.raises(EmissionThrottleConfigError, match=r"forwarders\[0\]"):
+        load_optional_emission_throttle([{"throttle_interval_s": interval}])
@@ -0,0 +1,165 @@
+import gzip
+import sys
+import time
+
+import pytest
+
+from core.file_sink import FileSinkConfigError, FileSinkWriter
+
+
+class _WallClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_writes_are_batched_until_the_writer_thread_flushes(tmp_path):
+    writer = FileSinkWriter(str(tmp_path), flush_interval_ms=60_000)
+    writer.start()
+    writer.write(b"one\r\n")
+    writer.write(b"two\r\n")
+
+    assert writer.pending_bytes == 10
+    assert list(tmp_path.iterdir()) == []
+
+    writer.close()
+
+    (archive,) = tmp_path.iterdir()
+    assert archive.read_bytes() == b"one\r\ntwo\r\n"
+    assert (writer.pending_bytes, writer.bytes_written) == (0, 10)
+
+
+def test_flush_interval_hands_batches_to_disk_without_close(tmp_path):
+    writer = FileSinkWriter(str(tmp_path), flush_interval_ms=10)
+    writer.start()
+    try:
+        writer.write(b"one\r\n")
+        deadline = time.monotonic() + 2
+        while writer.bytes_written == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        writer.close()
+
+    assert writer.bytes_written == 5
+
+
+def test_files_rotate_on_wall_clock_period_boundaries(tmp_path):
+    clock = _WallClock(1_700_000_000)
+    writer = FileSinkWriter(
+        str(tmp_path),
+        prefix="feed",
+        rotate_interval_s=60,
+        wall_clock=clock,
+    )
+    writer.write(b"first\r\n")
+    writer._flush()
+    clock.now += 30
+    writer.write(b"second\r\n")
+    writer._flush()
+    clock.now += 60
+    writer.write(b"third\r\n")
+    writer._flush()
+    writer._discard_file()
+
+    archives = sorted(path.name for path in tmp_path.iterdir())
+    assert archives == [
+        "feed-20231114T221300Z.nmea",
+        "feed-20231114T221400Z.nmea",
+    ]
+    assert (tmp_path / archives[0]).read_bytes() == b"first\r\nsecond\r\n"
+    assert (tmp_path / archives[1]).read_bytes() == b"third\r\n"
+    assert writer.rotations == 1
+
+
+def test_gzip_archives_round_trip(tmp_path):
+    writer = FileSinkWriter(str(tmp_path), compression="gzip")
+    writer.start()
+    writer.write(b"!AIVDM,1,1,,A,13aEOK?P00PD2wVMdLDRhgvL289?,0*26\r\n")
+    writer.close()
+
+    (archive,) = tmp_path.iterdir()
+    assert archive.suffix == ".gz"
+    with gzip.open(archive, "rb") as file:
+        assert file.read().startswith(b"!AIVDM")
+
+
+def test_failed_write_drops_the_batch_and_reopens_on_next_flush(tmp_path):
+    writer = FileSinkWriter(str(tmp_path / "archive"))
+    writer.write(b"lost\r\n")
+    writer._flush()
+    (tmp_path / "archive").mkdir()
+    writer.write(b"kept\r\n")
+    writer._flush()
+    writer._discard_file()
+
+    (archive,) = (tmp_path / "archive").iterdir()
+    assert archive.read_bytes() == b"kept\r\n"
+    assert (writer.write_errors, writer.bytes_written) == (1, 6)
+
+
+def test_non_os_errors_drop_the_batch_and_keep_the_thread_running(
+    tmp_path,
+    monkeypatch,
+):
+    writer = FileSinkWriter(str(tmp_path), flush_interval_ms=10)
+    open_file = FileSinkWriter._open
+    failures = [FileSinkConfigError("compressor failed")]
+
+    def flaky_open(self, period_start):
+        if failures:
+            raise failures.pop()
+        return open_file(self, period_start)
+
+    monkeypatch.setattr(FileSinkWriter, "_open", flaky_open)
+    writer.start()
+    try:
+        writer.write(b"lost\r\n")
+        deadline = time.monotonic() + 2
+        while writer.write_errors == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        writer.write(b"kept\r\n")
+        while writer.bytes_written == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        alive = writer._thread.is_alive()
+    finally:
+        writer.close()
+
+    (archive,) = tmp_path.iterdir()
+    assert alive is True
+    assert archive.read_bytes() == b"kept\r\n"
+    assert (writer.write_errors, writer.bytes_written) == (1, 6)
+
+
+def test_writes_past_the_queue_bound_are_dropped_and_counted(tmp_path):
+    writer = FileSinkWriter(str(tmp_path), queue_max_bytes=8)
+
+    writer.write(b"12345")
+    writer.write(b"12345")
+    writer.write(b"123")
+
+    assert (writer.pending_bytes, writer.dropped) == (8, 1)
+    writer._flush()
+    writer._discard_file()
+    (archive,) = tmp_path.iterdir()
+    assert archive.read_bytes() == b"12345123"
+
+
+def test_lag_measures_the_oldest_unflushed_message(tmp_path):
+    writer = FileSinkWriter(str(tmp_path))
+
+    assert writer.lag_us == 0
+    writer.write(b"x")
+    time.sleep(0.01)
+    assert writer.lag_us >= 10_000
+    writer._flush()
+    writer._discard_file()
+    assert writer.lag_us == 0
+
+
+def test_zstd_without_zstandard_names_the_package(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    with pytest.raises(FileSinkConfigError, match="zstandard package"):
+        FileSinkWriter(str(tmp_path), compression="zstd")
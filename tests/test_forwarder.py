@@ -1,11 +1,13 @@
 import asyncio as real_asyncio
 import inspect
 import socket
+import sys
 
 import pytest
 
 import forwarder as forwarder_module
 from core.metrics import OutputTrafficMetricsSnapshot
+from core.shm_ring import ShmRingReader
 from forwarder import (
     Forwarder,
     ForwarderConfigError,
@@ -19,6 +21,8 @@ class _FakeTransport:
         self.remote_addr = remote_addr
         self.sent = []
         self.closed = False
+        self.buffered_bytes = 0
+        self.write_buffer_high = None
 
     def sendto(self, data):
         failure = self.loop.send_errors.get(self.remote_addr)
@@ -27,6 +31,12 @@ class _FakeTransport:
         self.sent.append(data)
         self.loop.sends.append((self.remote_addr, data, self))
 
+    def get_write_buffer_size(self):
+        return self.buffered_bytes
+
+    def set_write_buffer_limits(self, high=None, low=None):
+        self.write_buffer_high = high
+
     def close(self):
         self.closed = True
 
@@ -37,6 +47,16 @@ class _FakeLoop:
         self.sends = []
         self.endpoint_kwargs = []
         self.send_errors = {}
+        self.create_errors = {}
+        self.addresses = {}
+        self.lookups = []
+
+    async def getaddrinfo(self, host, port, *, family=0, type=0):
+        self.lookups.append((host, port, family, type))
+        address = self.addresses[host]
+        if isinstance(address, Exception):
+            raise address
+        return [(socket.AF_INET, type, 17, "", (address, port))]
 
     async def create_datagram_endpoint(
         self,
@@ -45,6 +65,9 @@ class _FakeLoop:
         family=0,
         local_addr=None,
     ):
+        failure = self.create_errors.get(remote_addr)
+        if failure is not None:
+            raise failure
         transport = _FakeTransport(self, remote_addr)
         protocol = protocol_factory()
         self.created.append((remote_addr, transport))
@@ -58,6 +81,8 @@ class _FakeLoop:
 
 class _FakeAsyncioModule:
     DatagramProtocol = real_asyncio.DatagramProtocol
+    gather = staticmethod(real_asyncio.gather)
+    sleep = staticmethod(real_asyncio.sleep)
 
     def __init__(self, loop):
         self._loop = loop
@@ -93,6 +118,19 @@ def _output_snapshot(target_id, name, **overrides):
         "dispatch_failed": 0,
         "messages": 0,
         "bytes": 0,
+        "buffered_bytes": 0,
+        "buffer_drops": 0,
+        "write_pauses": 0,
+        "resolutions": 0,
+        "resolve_failures": 0,
+        "transport_failures": 0,
+        "address_changes": 0,
+        "resolve_latency_us": 0,
+        "sink_bytes_written": 0,
+        "sink_rotations": 0,
+        "sink_write_errors": 0,
+        "sink_dropped": 0,
+        "sink_lag_us": 0,
     }
     values.update(overrides)
     return OutputTrafficMetricsSnapshot(**values)
@@ -675,6 +713,35 @@ def test_source_ip_is_copied_into_immutable_target_entry():
         forwarder.targets[0]["source_ip"] = "192.0.2.99"
 
 
+def test_target_queue_settings_are_copied_into_target_entry():
+    forwarder = Forwarder(
+        [
+            {
+                "host": "198.51.100.20",
+                "port": 10110,
+                "queue_maxsize": 64,
+                "queue_overflow": "block",
+                "coalesce": True,
+                "coalesce_max_bytes": 1400,
+                "coalesce_deadline_ms": 5,
+                "output_profile": "bare",
+                "throttle_interval_s": 30,
+            },
+            {"host": "198.51.100.21", "port": 10110},
+        ]
+    )
+
+    assert forwarder.targets[0]["queue_maxsize"] == 64
+    assert forwarder.targets[0]["queue_overflow"] == "block"
+    assert forwarder.targets[0]["coalesce"] is True
+    assert forwarder.targets[0]["coalesce_max_bytes"] == 1400
+    assert forwarder.targets[0]["coalesce_deadline_ms"] == 5
+    assert forwarder.targets[0]["output_profile"] == "bare"
+    assert forwarder.targets[0]["throttle_interval_s"] == 30
+    assert "queue_maxsize" not in forwarder.targets[1]
+    assert "queue_overflow" not in forwarder.targets[1]
+
+
 def test_source_ip_binds_ipv4_transport(monkeypatch):
     loop = _patch_forwarder_loop(monkeypatch)
     forwarder = Forwarder([
@@ -785,3 +852,752 @@ def test_close_closes_cached_transports(monkeypatch):
 
     assert transport.closed
     assert forwarder.transports == {}
+
+
+def test_start_creates_every_transport_before_the_first_send(monkeypatch):
+    loop = _patch_forwarder_loop(monkeypatch)
+    forwarder = Forwarder(
+        _targets() + [{"id": "shared", "host": "127.0.0.1", "port": 19000}]
+    )
+
+    real_asyncio.run(forwarder.start())
+    real_asyncio.run(forwarder.start())
+
+    assert [addr for addr, _ in loop.created] == [
+        ("127.0.0.1", 19000),
+        ("192.0.2.20", 10110),
+        ("127.0.0.1", 19001),
+    ]
+    assert loop.sends == []
+
+
+def test_start_reports_transport_creation_failure(monkeypatch):
+    loop = _patch_forwarder_loop(monkeypatch)
+    loop.create_errors[("192.0.2.20", 10110)] = OSError("unreachable")
+    forwarder = Forwarder(_targets())
+
+    with pytest.raises(ForwarderConfigError, match="192.0.2.20:10110"):
+        real_asyncio.run(forwarder.start())
+
+    with pytest.raises(RuntimeError, match="start"):
+        forwarder.send_to_ids_nowait((0,), b"message")
+
+
+def test_send_to_ids_nowait_sends_directly_with_send_to_ids_semantics(
+    monkeypatch,
+):
+    loop = _patch_forwarder_loop(monkeypatch)
+    forwarder = Forwarder(_targets())
+    real_asyncio.run(forwarder.start())
+    payload = b"message"
+
+    assert forwarder.send_to_ids_nowait((2, 0, 2), payload) is None
+
+    assert [(addr, data) for addr, data, _ in loop.sends] == [
+        (("127.0.0.1", 19001), payload),
+        (("127.0.0.1", 19000), payload),
+    ]
+    assert all(data is payload for _addr, data, _ in loop.sends)
+    snapshots = forwarder.output_traffic_snapshot()
+    assert [snapshot.messages for snapshot in snapshots] == [1, 0, 1]
+    with pytest.raises(UnknownForwarderTargetError):
+        forwarder.send_to_ids_nowait((3,), payload)
+    with pytest.raises(TypeError):
+        forwarder.send_to_ids_nowait((0,), bytearray(payload))
+
+
+def test_started_async_sends_reuse_eager_transports(monkeypatch):
+    loop = _patch_forwarder_loop(monkeypatch)
+    forwarder = Forwarder(_targets())
+    real_asyncio.run(forwarder.start())
+
+    real_asyncio.run(forwarder.send_to_ids((1,), b"numeric"))
+    real_asyncio.run(forwarder.send_to(("udp:local_debug",), b"named"))
+    real_asyncio.run(forwarder.send(b"all"))
+
+    assert len(loop.created) == 3
+    assert [(addr, data) for addr, data, _ in loop.sends] == [
+        (("192.0.2.20", 10110), b"numeric"),
+        (("127.0.0.1", 19001), b"named"),
+        (("127.0.0.1", 19000), b"all"),
+        (("192.0.2.20", 10110), b"all"),
+        (("127.0.0.1", 19001), b"all"),
+    ]
+
+
+def test_close_discards_eager_transports(monkeypatch):
+    loop = _patch_forwarder_loop(monkeypatch)
+    forwarder = Forwarder(_targets())
+    real_asyncio.run(forwarder.start())
+
+    forwarder.close()
+
+    assert all(transport.closed for _addr, transport in loop.created)
+    with pytest.raises(RuntimeError, match="start"):
+        forwarder.send_to_ids_nowait((0,), b"message")
+
+
+def test_start_applies_write_buffer_bound_as_high_water_mark(monkeypatch):
+    loop = _patch_forwarder_loop(monkeypatch)
+    forwarder = Forwarder(
+        [
+            {"host": "127.0.0.1", "port": 19000},
+            {"host": "127.0.0.1", "port": 19001, "write_buffer_max_bytes": 4096},
+            {"host": "127.0.0.1", "port": 19002, "write_buffer_overflow": "keep"},
+        ]
+    )
+
+    real_asyncio.run(forwarder.start())
+
+    assert [transport.write_buffer_high for _addr, transport in loop.created] == [
+        forwarder_module.DEFAULT_WRITE_BUFFER_MAX_BYTES,
+        4096,
+        None,
+    ]
+
+
+def test_full_write_buffer_drops_datagrams_and_counts_them(monkeypatch):
+    loop = _patch_forwarder_loop(monkeypatch)
+    forwarder = Forwarder(
+        [
+            {"host": "127.0.0.1", "port": 19000, "write_buffer_max_bytes": 100},
+            {"host": "127.0.0.1", "port": 19001},
+        ]
+    )
+    real_asyncio.run(forwarder.start())
+    congested = loop.created[0][1]
+    congested.buffered_bytes = 100
+
+    forwarder.send_to_ids_nowait((0, 1), b"first")
+    real_asyncio.run(forwarder.send_to_ids((0,), b"second"))
+    congested.buffered_bytes = 99
+    forwarder.send_to_ids_nowait((0,), b"third")
+
+    assert congested.sent == [b"third"]
+    assert forwarder.output_traffic_snapshot() == (
+        _output_snapshot(
+            0,
+            None,
+            dispatch_attempts=3,
+            dispatch_completed=1,
+            messages=1,
+            bytes=5,
+            buffered_bytes=99,
+            buffer_drops=2,
+        ),
+        _output_snapshot(
+            1,
+            None,
+            dispatch_attempts=1,
+            dispatch_completed=1,
+            messages=1,
+            bytes=5,
+        ),
+    )
+
+
+def test_keep_policy_sends_regardless_of_buffered_bytes(monkeypatch):
+    loop = _patch_forwarder_loop(monkeypatch)
+    forwarder = Forwarder(
+        [
+            {
+                "host": "127.0.0.1",
+                "port": 19000,
+                "write_buffer_max_bytes": 100,
+                "write_buffer_overflow": "keep",
+            }
+        ]
+    )
+
+    real_asyncio.run(forwarder.send_to_ids((0,), b"first"))
+    transport = loop.created[0][1]
+    transport.buffered_bytes = 1000
+    real_asyncio.run(forwarder.send_to_ids((0,), b"second"))
+
+    assert transport.sent == [b"first", b"second"]
+    (snapshot,) = forwarder.output_traffic_snapshot()
+    assert (snapshot.buffered_bytes, snapshot.buffer_drops) == (1000, 0)
+
+
+def test_protocol_flow_control_is_counted_per_transport(monkeypatch):
+    _patch_forwarder_loop(monkeypatch)
+    forwarder = Forwarder(_targets())
+    real_asyncio.run(forwarder.start())
+    protocol = forwarder._protocols[("192.0.2.20", 10110)]
+
+    protocol.pause_writing()
+    assert protocol.paused is True
+    protocol.resume_writing()
+    protocol.pause_writing()
+
+    assert [
+        snapshot.write_pauses for snapshot in forwarder.output_traffic_snapshot()
+    ] == [0, 2, 0]
+
+
+def test_write_buffer_settings_are_copied_into_target_entry():
+    forwarder = Forwarder(
+        [
+            {
+                "host": "198.51.100.20",
+                "port": 10110,
+                "write_buffer_max_bytes": 8192,
+                "write_buffer_overflow": "keep",
+            }
+        ]
+    )
+
+    assert forwarder.targets[0]["write_buffer_max_bytes"] == 8192
+    assert forwarder.targets[0]["write_buffer_overflow"] == "keep"
+
+
+@pytest.mark.parametrize(
+    ("entry", "message"),
+    [
+        ({"write_buffer_max_bytes": 0}, "write_buffer_max_bytes"),
+        ({"write_buffer_max_bytes": True}, "write_buffer_max_bytes"),
+        ({"write_buffer_max_bytes": "64"}, "write_buffer_max_bytes"),
+        ({"write_buffer_overflow": "block"}, "write_buffer_overflow"),
+        ({"write_buffer_overflow": None}, "write_buffer_overflow"),
+    ],
+)
+def test_invalid_write_buffer_settings_are_rejected(entry, message):
+    with pytest.raises(ForwarderConfigError, match=f"'aishub'.*{message}"):
+        Forwarder([{"id": "aishub", "host": "198.51.100.20", "port": 10110, **entry}])
+
+
+def _hostname_targets(**overrides):
+    return [
+        {"id": "feed", "host": "feed.example.net", "port": 10110, **overrides},
+        {"host": "127.0.0.1", "port": 19000},
+        {"id": "mirror", "host": "feed.example.net", "port": 10110},
+    ]
+
+
+def test_start_resolves_hostnames_once_per_transport_and_pins_address(
+    monkeypatch,
+):
+    loop = _patch_forwarder_loop(monkeypatch)
+    loop.addresses["feed.example.net"] = "198.51.100.7"
+    forwarder = Forwarder(_hostname_targets())
+
+    real_asyncio.run(forwarder.start())
+    forwarder.send_to_ids_nowait((0, 2), b"message")
+
+    assert loop.lookups == [
+        ("feed.example.net", 10110, socket.AF_UNSPEC, socket.SOCK_DGRAM)
+    ]
+    assert [kwargs["remote_addr"] for kwargs in loop.endpoint_kwargs] == [
+        ("198.51.100.7", 10110),
+        ("127.0.0.1", 19000),
+    ]
+    assert [(addr, data) for addr, data, _ in loop.sends] == [
+        (("198.51.100.7", 10110), b"message"),
+    ] * 2
+    assert [
+        snapshot.resolutions for snapshot in forwarder.output_traffic_snapshot()
+    ] == [1, 0, 1]
+
+
+def test_start_reports_resolution_failure(monkeypatch):
+    loop = _patch_forwarder_loop(monkeypatch)
+    loop.addresses["feed.example.net"] = socket.gaierror("no such host")
+    forwarder = Forwarder(_hostname_targets())
+
+    with pytest.raises(ForwarderConfigError, match="resolve.*feed.example.net"):
+        real_asyncio.run(forwarder.start())
+
+    assert forwarder.output_traffic_snapshot()[0].resolve_failures == 1
+    assert loop.created == []
+
+
+def test_resolver_swaps_transport_when_address_changes(monkeypatch):
+    loop = _patch_forwarder_loop(monkeypatch)
+    loop.addresses["feed.example.net"] = "198.51.100.7"
+    forwarder = Forwarder(_hostname_targets(resolve_interval_s=0.001))
+
+    async def scenario():
+        await forwarder.start()
+        previous = forwarder.transports[("feed.example.net", 10110)]
+        forwarder._protocols[("feed.example.net", 10110)].pause_writing()
+        loop.addresses["feed.example.net"] = "198.51.100.8"
+        resolver = real_asyncio.create_task(forwarder.run_resolver())
+        await real_asyncio.sleep(0.02)
+        resolver.cancel()
+        await real_asyncio.gather(resolver, return_exceptions=True)
+        return previous
+
+    previous = real_asyncio.run(scenario())
+    forwarder.send_to_ids_nowait((0, 1, 2), b"message")
+
+    assert previous.closed is True
+    assert [(addr, data) for addr, data, _ in loop.sends] == [
+        (("198.51.100.8", 10110), b"message"),
+        (("127.0.0.1", 19000), b"message"),
+        (("198.51.100.8", 10110), b"message"),
+    ]
+    feed, local, mirror = forwarder.output_traffic_snapshot()
+    assert feed.address_changes == mirror.address_changes == 1
+    assert feed.resolutions >= 2
+    assert feed.write_pauses == 1
+    assert local.resolutions == 0
+
+
+def test_resolver_keeps_transport_when_lookup_fails(monkeypatch):
+    loop = _patch_forwarder_loop(monkeypatch)
+    loop.addresses["feed.example.net"] = "198.51.100.7"
+    forwarder = Forwarder(_hostname_targets(resolve_interval_s=0.001))
+
+    async def scenario():
+        await forwarder.start()
+        loop.addresses["feed.example.net"] = socket.gaierror("temporary")
+        resolver = real_asyncio.create_task(forwarder.run_resolver())
+        await real_asyncio.sleep(0.02)
+        resolver.cancel()
+        await real_asyncio.gather(resolver, return_exceptions=True)
+
+    real_asyncio.run(scenario())
+    forwarder.send_to_ids_nowait((0,), b"message")
+
+    assert [addr for addr, _data, _ in loop.sends] == [("198.51.100.7", 10110)]
+    feed = forwarder.output_traffic_snapshot()[0]
+    assert feed.resolve_failures >= 1
+    assert feed.address_changes == 0
+
+
+def test_resolver_counts_replacement_socket_failure_apart_from_lookup(
+    monkeypatch,
+):
+    loop = _patch_forwarder_loop(monkeypatch)
+    loop.addresses["feed.example.net"] = "198.51.100.7"
+    forwarder = Forwarder(_hostname_targets(resolve_interval_s=0.001))
+
+    async def scenario():
+        await forwarder.start()
+        loop.addresses["feed.example.net"] = "198.51.100.8"
+        loop.create_errors[("198.51.100.8", 10110)] = OSError("no buffers")
+        resolver = real_asyncio.create_task(forwarder.run_resolver())
+        await real_asyncio.sleep(0.02)
+        resolver.cancel()
+        await real_asyncio.gather(resolver, return_exceptions=True)
+
+    real_asyncio.run(scenario())
+    forwarder.send_to_ids_nowait((0,), b"message")
+
+    assert [addr for addr, _data, _ in loop.sends] == [("198.51.100.7", 10110)]
+    feed = forwarder.output_traffic_snapshot()[0]
+    assert feed.resolutions >= 2
+    assert feed.resolve_failures == 0
+    assert feed.transport_failures >= 1
+    assert feed.address_changes == 0
+
+
+@pytest.mark.parametrize("interval", [0, -1, True, "60", float("inf")])
+def test_invalid_resolve_interval_is_rejected(interval):
+    with pytest.raises(ForwarderConfigError, match="'feed'.*resolve_interval_s"):
+        Forwarder(_hostname_targets(resolve_interval_s=interval))
+
+
+def test_unix_target_sends_datagrams_to_socket_path(tmp_path):
+    path = str(tmp_path / "feed.sock")
+    receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    receiver.bind(path)
+    receiver.settimeout(1)
+    forwarder = Forwarder([{"type": "unix", "path": path, "id": "plotter"}])
+
+    async def scenario():
+        await forwarder.start()
+        try:
+            await forwarder.send_to(("unix:plotter",), b"message")
+        finally:
+            forwarder.close()
+
+    try:
+        real_asyncio.run(scenario())
+        assert receiver.recv(64) == b"message"
+    finally:
+        receiver.close()
+
+    assert forwarder.target_id_by_name == {"unix:plotter": 0}
+    assert forwarder.output_traffic_snapshot()[0].messages == 1
+
+
+def test_unix_target_tolerates_a_missing_consumer(tmp_path):
+    forwarder = Forwarder([{"type": "unix", "path": str(tmp_path / "absent")}])
+
+    async def scenario():
+        await forwarder.start()
+        try:
+            forwarder.send_to_ids_nowait((0,), b"lost")
+        finally:
+            forwarder.close()
+
+    real_asyncio.run(scenario())
+
+    assert forwarder.output_traffic_snapshot()[0].dispatch_failed == 0
+
+
+def test_shm_target_writes_records_readable_without_a_socket():
+    name = f"aismixer-test-{id(object())}"
+    forwarder = Forwarder([{"type": "shm", "name": name, "id": "plotter"}])
+
+    async def scenario():
+        await forwarder.start()
+        with ShmRingReader(name) as reader:
+            forwarder.send_to_ids_nowait((0,), b"one")
+            forwarder.send_to_ids_nowait((0,), b"two")
+            return reader.read()
+
+    try:
+        assert real_asyncio.run(scenario()) == [b"one", b"two"]
+    finally:
+        forwarder.close()
+
+    assert forwarder.target_id_by_name == {"shm:plotter": 0}
+    snapshot = forwarder.output_traffic_snapshot()[0]
+    assert (snapshot.messages, snapshot.bytes) == (2, 6)
+
+
+def test_local_target_entries_are_copied_by_type():
+    forwarder = Forwarder(
+        [
+            {"type": "unix", "path": "/run/aismixer.sock", "port": 1},
+            {"type": "shm", "name": "ais", "size_bytes": 262144},
+        ]
+    )
+
+    assert [dict(entry) for entry in forwarder.targets] == [
+        {"path": "/run/aismixer.sock", "type": "unix"},
+        {"name": "ais", "size_bytes": 262144, "type": "shm"},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("entry", "message"),
+    [
+        ({"type": "tcp", "host": "h", "port": 1}, "type must be one of"),
+        ({"type": "unix"}, "unix targets require path"),
+        ({"type": "unix", "path": ""}, "path must be a non-empty string"),
+        ({"type": "shm"}, "shm targets require name"),
+        ({"type": "shm", "name": "a/b"}, "name must be a non-empty string"),
+        ({"type": "shm", "name": "ais", "size_bytes": 1024}, "size_bytes"),
+    ],
+)
+def test_invalid_local_target_entries_are_rejected(entry, message):
+    with pytest.raises(ForwarderConfigError, match=message):
+        Forwarder([entry])
+
+
+def test_target_names_are_unique_per_type_namespace():
+    forwarder = Forwarder(
+        [
+            {"host": "127.0.0.1", "port": 19000, "id": "plotter"},
+            {"type": "unix", "path": "/run/plotter.sock", "id": "plotter"},
+        ]
+    )
+
+    assert forwarder.target_ids == ("udp:plotter", "unix:plotter")
+
+
+def test_tcp_server_target_fans_messages_out_to_connected_clients():
+    forwarder = Forwarder(
+        [
+            {
+                "type": "tcp_server",
+                "listen_host": "127.0.0.1",
+                "listen_port": 0,
+                "id": "partners",
+            }
+        ]
+    )
+
+    async def scenario():
+        await forwarder.start()
+        try:
+            listen = forwarder.tcp_server_snapshot()[0].listen
+            host, port = listen.rsplit(":", 1)
+            reader, writer = await real_asyncio.open_connection(host, int(port))
+            await real_asyncio.sleep(0.01)
+            forwarder.send_to_ids_nowait((0,), b"one\r\n")
+            await forwarder.send_to(("tcp:partners",), b"two\r\n")
+            received = await reader.readexactly(10)
+            snapshot = forwarder.tcp_server_snapshot()
+            writer.close()
+            return received, snapshot
+        finally:
+            forwarder.close()
+
+    received, (server,) = real_asyncio.run(scenario())
+
+    assert received == b"one\r\ntwo\r\n"
+    assert (server.target_id, server.name, server.accepted) == (
+        0,
+        "tcp:partners",
+        1,
+    )
+    assert server.clients[0].bytes == 10
+    assert forwarder.output_traffic_snapshot()[0].messages == 2
+
+
+def test_tcp_server_snapshot_is_empty_before_start_and_for_other_types():
+    forwarder = Forwarder(
+        [
+            {"host": "127.0.0.1", "port": 19000},
+            {"type": "tcp_server", "listen_host": "127.0.0.1", "listen_port": 0},
+        ]
+    )
+
+    assert forwarder.tcp_server_snapshot() == ()
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"listen_host": None}, "tcp_server targets require listen_host"),
+        ({"listen_host": ""}, "listen_host must be a non-empty string"),
+        ({"listen_port": 70000}, "listen_port must be an integer"),
+        ({"client_buffer_max_bytes": 0}, "client_buffer_max_bytes"),
+        ({"max_clients": True}, "max_clients must be a positive integer"),
+    ],
+)
+def test_invalid_tcp_server_entries_are_rejected(overrides, message):
+    entry = {"type": "tcp_server", "listen_host": "127.0.0.1", "listen_port": 0}
+    entry.update(overrides)
+    entry = {key: value for key, value in entry.items() if value is not None}
+
+    with pytest.raises(ForwarderConfigError, match=message):
+        Forwarder([entry])
+
+
+def _multicast_receiver(group):
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("", 0))
+    try:
+        receiver.setsockopt(
+            socket.IPPROTO_IP,
+            socket.IP_ADD_MEMBERSHIP,
+            socket.inet_aton(group) + socket.inet_aton("127.0.0.1"),
+        )
+    except OSError as exc:
+        receiver.close()
+        pytest.skip(f"multicast is unavailable here: {exc}")
+    receiver.settimeout(1)
+    return receiver
+
+
+def test_multicast_target_sends_to_group_with_configured_options():
+    group = "239.255.10.1"
+    receiver = _multicast_receiver(group)
+    port = receiver.getsockname()[1]
+    forwarder = Forwarder(
+        [
+            {
+                "type": "multicast",
+                "group": group,
+                "port": port,
+                "interface": "127.0.0.1",
+                "ttl": 0,
+                "id": "lan",
+            }
+        ]
+    )
+
+    async def scenario():
+        await forwarder.start()
+        try:
+            sock = forwarder.transports[
+                ("multicast", group, port, 0, True, "127.0.0.1")
+            ].get_extra_info("socket")
+            options = (
+                sock.getsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL),
+                sock.getsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP),
+            )
+            await forwarder.send_to(("multicast:lan",), b"hello")
+            return options
+        finally:
+            forwarder.close()
+
+    try:
+        assert real_asyncio.run(scenario()) == (0, 1)
+        assert receiver.recv(64) == b"hello"
+    finally:
+        receiver.close()
+
+    snapshot = forwarder.output_traffic_snapshot()[0]
+    assert (snapshot.name, snapshot.messages) == ("multicast:lan", 1)
+
+
+def test_multicast_entries_are_copied_and_not_resolved():
+    forwarder = Forwarder(
+        [
+            {
+                "type": "multicast",
+                "group": "ff02::fb",
+                "port": 5353,
+                "loopback": False,
+                "interface": "lo",
+                "resolve_interval_s": 10,
+            }
+        ]
+    )
+
+    assert dict(forwarder.targets[0]) == {
+        "group": "ff02::fb",
+        "port": 5353,
+        "loopback": False,
+        "interface": "lo",
+        "type": "multicast",
+        "resolve_interval_s": 10,
+    }
+    assert forwarder._resolve_destinations == {}
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"group": "192.0.2.1"}, "group must be a literal IPv4 or IPv6 multicast"),
+        ({"group": "mcast.example.net"}, "group must be a literal"),
+        ({"port": 0}, "port must be an integer from 1 to 65535"),
+        ({"ttl": 256}, "ttl must be an integer from 0 to 255"),
+        ({"loopback": "yes"}, "loopback must be true or false"),
+        ({"interface": "eth0"}, "interface for an IPv4 group"),
+    ],
+)
+def test_invalid_multicast_entries_are_rejected(overrides, message):
+    entry = {"type": "multicast", "group": "239.255.10.1", "port": 10110}
+    entry.update(overrides)
+
+    with pytest.raises(ForwarderConfigError, match=message):
+        Forwarder([entry])
+
+
+def test_file_target_archives_messages_and_reports_sink_statistics(tmp_path):
+    forwarder = Forwarder(
+        [
+            {
+                "type": "file",
+                "directory": str(tmp_path),
+                "prefix": "feed",
+                "flush_interval_ms": 10_000,
+                "id": "archive",
+            }
+        ]
+    )
+
+    async def scenario():
+        await forwarder.start()
+        try:
+            forwarder.send_to_ids_nowait((0,), b"one\r\n")
+            await forwarder.send_to(("file:archive",), b"two\r\n")
+            queued = forwarder.output_traffic_snapshot()[0]
+            forwarder.transports[("file", str(tmp_path), "feed")].writer._flush()
+            return queued, forwarder.output_traffic_snapshot()[0]
+        finally:
+            forwarder.close()
+
+    queued, flushed = real_asyncio.run(scenario())
+    (archive,) = tmp_path.iterdir()
+
+    assert (queued.name, queued.messages, queued.buffered_bytes) == (
+        "file:archive",
+        2,
+        10,
+    )
+    assert queued.sink_bytes_written == 0
+    assert archive.name.startswith("feed-")
+    assert archive.name.endswith(".nmea")
+    assert archive.read_bytes() == b"one\r\ntwo\r\n"
+    assert (flushed.sink_bytes_written, flushed.sink_lag_us) == (10, 0)
+
+
+def test_file_target_queue_is_bounded_by_write_buffer_limit(tmp_path):
+    forwarder = Forwarder(
+        [
+            {
+                "type": "file",
+                "directory": str(tmp_path),
+                "flush_interval_ms": 10_000,
+                "write_buffer_max_bytes": 8,
+            }
+        ]
+    )
+
+    async def scenario():
+        await forwarder.start()
+        try:
+            for _ in range(3):
+                forwarder.send_to_ids_nowait((0,), b"12345")
+            return forwarder.output_traffic_snapshot()[0]
+        finally:
+            forwarder.close()
+
+    snapshot = real_asyncio.run(scenario())
+
+    assert (snapshot.messages, snapshot.buffer_drops) == (2, 1)
+
+
+def test_file_target_queue_bound_holds_when_write_buffer_overflow_keeps(
+    tmp_path,
+):
+    forwarder = Forwarder(
+        [
+            {
+                "type": "file",
+                "directory": str(tmp_path),
+                "flush_interval_ms": 10_000,
+                "write_buffer_overflow": "keep",
+                "queue_max_bytes": 8,
+            }
+        ]
+    )
+
+    async def scenario():
+        await forwarder.start()
+        try:
+            for _ in range(3):
+                forwarder.send_to_ids_nowait((0,), b"12345")
+            return forwarder.output_traffic_snapshot()[0]
+        finally:
+            forwarder.close()
+
+    snapshot = real_asyncio.run(scenario())
+
+    assert (snapshot.buffered_bytes, snapshot.buffer_drops) == (5, 0)
+    assert snapshot.sink_dropped == 2
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"directory": None}, "file targets require directory"),
+        ({"directory": ""}, "directory must be a non-empty string"),
+        ({"prefix": "a/b"}, "prefix must be a non-empty string without '/'"),
+        ({"compression": "xz"}, "compression must be one of"),
+        ({"rotate_interval_s": 0}, "rotate_interval_s must be a positive"),
+        ({"flush_interval_ms": 1.5}, "flush_interval_ms must be a positive"),
+        ({"queue_max_bytes": 0}, "queue_max_bytes must be a positive"),
+    ],
+)
+def test_invalid_file_entries_are_rejected(overrides, message):
+    entry = {"type": "file", "directory": "/var/lib/aismixer"}
+    entry.update(overrides)
+    entry = {key: value for key, value in entry.items() if value is not None}
+
+    with pytest.raises(ForwarderConfigError, match=message):
+        Forwarder([entry])
+
+
+def test_zstd_file_target_without_zstandard_names_the_package(monkeypatch):
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    with pytest.raises(ForwarderConfigError, match="requires the zstandard"):
+        Forwarder(
+            [
+                {
+                    "type": "file",
+                    "directory": "/var/lib/aismixer",
+                    "compression": "zstd",
+                    "id": "archive",
+                }
+            ]
+        )
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from core.geo_index import GeoArea, GeoGridIndex, load_geo_area
+
+
+# Concave "U" whose notch opens northwards between longitudes 1 and 2.
+NOTCHED = GeoArea(
+    polygon=((0, 0), (3, 0), (3, 3), (2, 3), (2, 1), (1, 1), (1, 3), (0, 3))
+)
+
+
+def test_box_contains_its_border_and_polygon_uses_even_odd_rule():
+    box = load_geo_area({"bbox": [10, 50, 11, 51]})
+
+    assert box == GeoArea(bounds=(10.0, 50.0, 11.0, 51.0))
+    assert box.contains(10, 50) and box.contains(11, 51)
+    assert not box.contains(11.0001, 50.5)
+    assert NOTCHED.bounds == (0.0, 0.0, 3.0, 3.0)
+    assert NOTCHED.contains(0.5, 2.5) and NOTCHED.contains(2.5, 2.5)
+    assert not NOTCHED.contains(1.5, 2.5)
+    assert NOTCHED.contains(1.5, 0.5)
+
+
+@pytest.mark.parametrize(
+    ("config", "error"),
+    [
+        ([1, 2, 3, 4], TypeError),
+        ({"bbox": [1, 2, 3, 4], "polygon": [[0, 0]]}, TypeError),
+        ({"circle": [0, 0, 1]}, ValueError),
+        ({"bbox": [1, 2, 3]}, TypeError),
+        ({"bbox": [3, 2, 1, 4]}, ValueError),
+        ({"bbox": [0, 0, 181, 1]}, ValueError),
+        ({"polygon": [[0, 0], [1, 1]]}, ValueError),
+        ({"polygon": [[0, 0], [1, "1"], [1, 0]]}, TypeError),
+        ({"polygon": "0,0 1,1 1,0"}, TypeError),
+    ],
+)
+def test_invalid_area_config_is_rejected(config, error):
+    with pytest.raises(error):
+        load_geo_area(config)
+
+
+def test_grid_locate_agrees_with_exact_tests_everywhere():
+    areas = (
+        NOTCHED,
+        GeoArea(bounds=(1.2, 0.4, 2.7, 2.2)),
+        GeoArea(polygon=((0.3, 2.9), (2.9, 0.1), (2.9, 2.9))),
+        GeoArea(bounds=(-1.0, -1.0, 4.0, 4.0)),
+        GeoArea(bounds=(179.0, 89.0, 180.0, 90.0)),
+    )
+    index = GeoGridIndex(areas, cell_degrees=0.25)
+    points = random.Random(44)
+
+    for _ in range(5000):
+        lon = points.uniform(-0.5, 3.5)
+        lat = points.uniform(-0.5, 3.5)
+        assert index.locate(lon, lat) == frozenset(
+            area_id
+            for area_id, area in enumerate(areas)
+            if area.contains(lon, lat)
+        )
+    assert index.locate(180, 90) == frozenset({4})
+
+
+def test_cells_away_from_borders_share_one_result():
+    index = GeoGridIndex((GeoArea(bounds=(0.0, 0.0, 10.0, 10.0)),))
+
+    assert index.locate(5.1, 5.1) is index.locate(2.3, 7.9)
+    assert index.locate(20, 20) == frozenset()
+    # The box's northern and eastern borders start one more row and column.
+    assert len(index) == 21 * 21
+
+
+def test_cell_size_must_be_positive_and_at_most_ninety_degrees():
+    with pytest.raises(ValueError):
+        GeoGridIndex((), cell_degrees=0)
+    with pytest.raises(ValueError):
+        GeoGridIndex((), cell_degrees=91)
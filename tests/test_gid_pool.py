@@ -0,0 +1,92 @@
+from collections import Counter
+
+import pytest
+
+from core.gid_pool import NumericGroupIdPool
+
+
+class RecordingRandomBytes:
+    def __init__(self, *blocks):
+        self.blocks = list(blocks)
+        self.requests = []
+
+    def __call__(self, size):
+        self.requests.append(size)
+        return self.blocks.pop(0)
+
+
+@pytest.mark.parametrize("digits", (1, 6, 18, 19))
+def test_pool_returns_fixed_width_numeric_ids_from_os_random(digits):
+    pool = NumericGroupIdPool(pool_size=8)
+
+    gids = [pool(digits) for _ in range(40)]
+
+    assert all(len(gid) == digits and gid.isdigit() for gid in gids)
+    assert all(gid[0] != "0" for gid in gids)
+    assert pool.refills >= 5
+
+
+def test_pool_maps_every_accepted_byte_to_an_exactly_uniform_digit():
+    random_bytes = RecordingRandomBytes(bytes(range(256)))
+    pool = NumericGroupIdPool(pool_size=256, random_bytes=random_bytes)
+
+    gids = [pool(1) for _ in range(252)]
+
+    assert random_bytes.requests == [256]
+    assert pool.refills == 1
+    assert Counter(gids) == {str(digit): 28 for digit in range(1, 10)}
+
+
+def test_pool_rejects_out_of_range_candidates_and_refills():
+    random_bytes = RecordingRandomBytes(
+        bytes((252, 253, 254, 255)),
+        bytes((255, 0, 255, 8)),
+    )
+    pool = NumericGroupIdPool(pool_size=4, random_bytes=random_bytes)
+
+    assert [pool(1), pool(1)] == ["9", "1"]
+    assert random_bytes.requests == [4, 4]
+    assert pool.refills == 2
+
+
+def test_pool_draws_whole_byte_candidates_for_configured_width():
+    span = 9 * 10 ** 17
+    random_bytes = RecordingRandomBytes(
+        (span - 1).to_bytes(8, "big") + (0).to_bytes(8, "big"),
+    )
+    pool = NumericGroupIdPool(pool_size=2, random_bytes=random_bytes)
+
+    assert pool(18) == "100000000000000000"
+    assert pool(18) == "999999999999999999"
+    assert random_bytes.requests == [16]
+
+
+def test_pool_discards_pooled_ids_when_digit_count_changes():
+    random_bytes = RecordingRandomBytes(bytes((0, 1)), bytes((0, 1)))
+    pool = NumericGroupIdPool(pool_size=2, random_bytes=random_bytes)
+
+    assert pool(1) == "2"
+    assert pool(2) == "11"
+    assert pool.refills == 2
+    assert random_bytes.requests == [2, 2]
+
+
+@pytest.mark.parametrize(
+    ("pool_size", "error"),
+    ((0, ValueError), (True, TypeError), (1.5, TypeError)),
+)
+def test_pool_rejects_invalid_pool_size(pool_size, error):
+    with pytest.raises(error, match="pool_size"):
+        NumericGroupIdPool(pool_size=pool_size)
+
+
+@pytest.mark.parametrize(
+    ("digits", "error"),
+    ((0, ValueError), (True, TypeError), ("6", TypeError)),
+)
+def test_pool_rejects_invalid_digit_counts(digits, error):
+    pool = NumericGroupIdPool()
+
+    with pytest.raises(error, match="digits"):
+        pool(digits)
+    assert pool.refills == 0
@@ -0,0 +1,219 @@
+import pytest
+
+from core.geo_index import GeoArea, GeoGridIndex
+from core.message_filter import (
+    MessageFilter,
+    TargetFilter,
+    VesselPositions,
+    decode_ais_header,
+    decode_ais_position,
+    load_message_filter,
+)
+
+
+# Reference position report for MMSI 477553000 from the gpsd AIVDM notes.
+POSITION = "!AIVDM,1,1,,B,177KQJ5000G?tO`K>RA1wUbN0TKH,0*5C"
+
+
+def sentence(payload):
+    return f"!AIVDM,1,1,,A,{payload},0*00"
+
+
+def armour(bits, length):
+    characters = []
+    for shift in range(length * 6 - 6, -1, -6):
+        value = bits >> shift & 0x3F
+        characters.append(chr(value + 48 if value < 40 else value + 56))
+    return "".join(characters)
+
+
+def header_payload(message_type, mmsi):
+    return armour(message_type << 36 | mmsi << 4, 7)
+
+
+def type27_payload(mmsi, lon_tenth_minutes, lat_tenth_minutes):
+    bits = (
+        27 << 90
+        | mmsi << 58
+        | (lon_tenth_minutes & (1 << 18) - 1) << 34
+        | (lat_tenth_minutes & (1 << 17) - 1) << 17
+    )
+    return armour(bits, 16)
+
+
+def test_header_decode_reads_type_and_mmsi_from_first_characters():
+    assert decode_ais_header(POSITION) == (1, 477553000)
+    assert decode_ais_header(sentence("B77KQJ5")) == (18, 477553000)
+    assert decode_ais_header(
+        sentence(header_payload(27, 999999999) + "00")
+    ) == (27, 999999999)
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        sentence("177KQJ"),
+        sentence("177KQJ!000"),
+        "!AIVDM,1,1,,B",
+        "",
+    ],
+)
+def test_unreadable_headers_decode_to_none(line):
+    assert decode_ais_header(line) is None
+
+
+def test_position_decode_reads_class_a_class_b_and_long_range_reports():
+    assert decode_ais_position(POSITION) == pytest.approx(
+        (-122.345833, 47.582833)
+    )
+    # Class B report for MMSI 338087471 from the gpsd AIVDM notes.
+    assert decode_ais_position(
+        "!AIVDM,1,1,,B,B52K>;h00Fc>jpUlNV@ikwpUoP06,0*4C"
+    ) == pytest.approx((-74.072132, 40.68454))
+    assert decode_ais_position(
+        sentence(type27_payload(211000000, -3000, 32400))
+    ) == (-5.0, 54.0)
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        sentence(header_payload(5, 211000000) + "0" * 40),
+        sentence(POSITION.split(",")[5][:19]),
+        # Longitude 181 and latitude 91 mean "not available".
+        sentence(type27_payload(211000000, 181 * 600, 91 * 600)),
+    ],
+)
+def test_positions_that_cannot_be_read_decode_to_none(line):
+    assert decode_ais_position(line) is None
+
+
+def test_vessel_positions_evict_the_least_recently_updated():
+    positions = VesselPositions(capacity=2)
+
+    positions.update(1, (1.0, 1.0))
+    positions.update(2, (2.0, 2.0))
+    positions.update(1, (1.5, 1.5))
+    positions.update(3, (3.0, 3.0))
+
+    assert len(positions) == 2
+    assert positions.get(2) is None
+    assert positions.get(1) == (1.5, 1.5)
+
+
+def test_filter_requires_every_restricted_field_to_pass():
+    message_filter = MessageFilter(
+        message_types=frozenset({1, 2, 3}),
+        mmsis=frozenset({211000000}),
+        mmsi_ranges=((477000000, 477999999),),
+    )
+
+    assert message_filter.matches(1, 477553000) is True
+    assert message_filter.matches(3, 211000000) is True
+    assert message_filter.matches(5, 477553000) is False
+    assert message_filter.matches(1, 211000001) is False
+    assert MessageFilter(message_types=frozenset({5})).matches(5, 1) is True
+    assert MessageFilter(mmsi_ranges=((1, 1),)).matches(27, 1) is True
+
+
+def test_plain_filter_config_is_loaded():
+    assert load_message_filter(
+        {"message_types": [1, 18], "mmsi": [211000000], "mmsi_ranges": [[1, 9]]}
+    ) == MessageFilter(
+        message_types=frozenset({1, 18}),
+        mmsis=frozenset({211000000}),
+        mmsi_ranges=((1, 9),),
+    )
+
+
+def test_area_filter_config_is_loaded():
+    assert load_message_filter(
+        {"areas": [{"bbox": [-6, 53, -4, 55]}]}
+    ) == MessageFilter(areas=(GeoArea(bounds=(-6.0, 53.0, -4.0, 55.0)),))
+
+
+@pytest.mark.parametrize(
+    ("config", "error"),
+    [
+        ([1, 2], TypeError),
+        ({}, ValueError),
+        ({"types": [1]}, ValueError),
+        ({"message_types": []}, TypeError),
+        ({"message_types": "123"}, TypeError),
+        ({"message_types": [True]}, TypeError),
+        ({"message_types": [0]}, ValueError),
+        ({"message_types": [28]}, ValueError),
+        ({"mmsi": [1_000_000_000]}, ValueError),
+        ({"mmsi_ranges": [[5, 1]]}, ValueError),
+        ({"mmsi_ranges": [[1, 2, 3]]}, TypeError),
+        ({"mmsi_ranges": "1-2"}, TypeError),
+        ({"areas": {"bbox": [0, 0, 1, 1]}}, TypeError),
+        ({"areas": [{"bbox": [1, 0, 0, 1]}]}, ValueError),
+    ],
+)
+def test_invalid_filter_config_is_rejected(config, error):
+    with pytest.raises(error):
+        load_message_filter(config)
+
+
+def test_target_filter_selects_passing_clauses_in_order_once():
+    target_filter = TargetFilter(
+        clauses=(
+            (MessageFilter(message_types=frozenset({5})), (3,)),
+            (None, (1, 3)),
+            (MessageFilter(mmsi_ranges=((477000000, 477999999),)), (2, 1)),
+        )
+    )
+
+    assert target_filter.select(POSITION) == (1, 3, 2)
+    assert target_filter.select(sentence(header_payload(5, 211000000))) == (3, 1)
+    assert target_filter.select(sentence("1")) == (1, 3)
+
+
+def test_target_filter_memo_is_bounded_and_keeps_results(monkeypatch):
+    monkeypatch.setattr("core.message_filter._SELECTION_CACHE_SIZE", 2)
+    target_filter = TargetFilter(
+        clauses=((MessageFilter(message_types=frozenset({1})), (0,)),)
+    )
+
+    selections = [
+        target_filter.select(sentence(header_payload(message_type, 211000000)))
+        for message_type in (1, 5, 18, 1)
+    ]
+
+    assert selections == [(0,), (), (), (0,)]
+    assert len(target_filter._selections) <= 2
+    assert target_filter == TargetFilter(clauses=target_filter.clauses)
+
+
+def test_area_clauses_place_static_reports_at_last_known_position():
+    irish_sea = GeoArea(bounds=(-6.0, 53.0, -4.0, 55.0))
+    puget_sound = GeoArea(bounds=(-123.0, 47.0, -122.0, 48.0))
+    target_filter = TargetFilter(
+        clauses=(
+            (MessageFilter(areas=(irish_sea,)), (0,)),
+            (MessageFilter(message_types=frozenset({1}), areas=(puget_sound,)), (1,)),
+            (None, (2,)),
+        ),
+        geo_index=GeoGridIndex((puget_sound, irish_sea)),
+    )
+    static = sentence(header_payload(5, 211000000) + "0" * 40)
+
+    assert target_filter.select(POSITION) == (1, 2)
+    assert target_filter.select(static) == (2,)
+    assert target_filter.select(
+        sentence(type27_payload(211000000, -3000, 32400))
+    ) == (0, 2)
+    assert target_filter.select(static) == (0, 2)
+    assert target_filter.positions.get(477553000) == pytest.approx(
+        (-122.345833, 47.582833)
+    )
+
+
+def test_area_clauses_require_an_index_holding_their_areas():
+    area_filter = MessageFilter(areas=(GeoArea(bounds=(0.0, 0.0, 1.0, 1.0)),))
+
+    with pytest.raises(ValueError, match="geo_index"):
+        TargetFilter(clauses=((area_filter, (0,)),))
+    with pytest.raises(ValueError, match="geo_index"):
+        TargetFilter(clauses=((area_filter, (0,)),), geo_index=GeoGridIndex(()))
@@ -4,6 +4,7 @@ import pytest
 
 from core.metrics import (
     EgressMetricsSnapshot,
+    EgressTargetQueueMetricsSnapshot,
     InputTrafficMetricsSnapshot,
     OutputTrafficMetricsSnapshot,
     ProcessorMetricsSnapshot,
@@ -35,6 +36,7 @@ PROCESSOR_FIELDS = (
     "reset_completed",
     "reset_failed",
     "reset_in_flight",
+    "gid_pool_refills",
 )
 EGRESS_FIELDS = (
     "batches_started",
@@ -65,6 +67,19 @@ OUTPUT_TRAFFIC_FIELDS = (
     "dispatch_failed",
     "messages",
     "bytes",
+    "buffered_bytes",
+    "buffer_drops",
+    "write_pauses",
+    "resolutions",
+    "resolve_failures",
+    "transport_failures",
+    "address_changes",
+    "resolve_latency_us",
+    "sink_bytes_written",
+    "sink_rotations",
+    "sink_write_errors",
+    "sink_dropped",
+    "sink_lag_us",
 )
 OUTPUT_TRAFFIC_NUMERIC_FIELDS = OUTPUT_TRAFFIC_FIELDS[2:]
 RUNTIME_STATISTICS_FIELDS = (
@@ -112,6 +127,7 @@ def processor_snapshot(**overrides):
         "reset_completed": 2,
         "reset_failed": 1,
         "reset_in_flight": 1,
+        "gid_pool_refills": 4,
     }
     values.update(overrides)
     return ProcessorMetricsSnapshot(**values)
@@ -168,11 +184,64 @@ def output_traffic_snapshot(**overrides):
         "dispatch_failed": 1,
         "messages": 8,
         "bytes": 720,
+        "buffered_bytes": 180,
+        "buffer_drops": 1,
+        "write_pauses": 2,
+        "resolutions": 3,
+        "resolve_failures": 1,
+        "transport_failures": 4,
+        "address_changes": 1,
+        "resolve_latency_us": 850,
+        "sink_bytes_written": 4096,
+        "sink_rotations": 2,
+        "sink_write_errors": 1,
+        "sink_dropped": 5,
+        "sink_lag_us": 1500,
     }
     values.update(overrides)
     return OutputTrafficMetricsSnapshot(**values)
 
 
+TARGET_QUEUE_FIELDS = (
+    "target_id",
+    "overflow_policy",
+    "capacity",
+    "depth",
+    "peak_depth",
+    "enqueued",
+    "dequeued",
+    "dropped",
+    "put_waits",
+    "sent_messages",
+    "sent_datagrams",
+    "shaped",
+)
+TARGET_QUEUE_NUMERIC_FIELDS = tuple(
+    field_name
+    for field_name in TARGET_QUEUE_FIELDS
+    if field_name != "overflow_policy"
+)
+
+
+def target_queue_snapshot(**overrides):
+    values = {
+        "target_id": 1,
+        "overflow_policy": "drop_oldest",
+        "capacity": 16,
+        "depth": 3,
+        "peak_depth": 9,
+        "enqueued": 40,
+        "dequeued": 37,
+        "dropped": 2,
+        "put_waits": 0,
+        "sent_messages": 36,
+        "sent_datagrams": 12,
+        "shaped": 5,
+    }
+    values.update(overrides)
+    return EgressTargetQueueMetricsSnapshot(**values)
+
+
 def assert_frozen_slotted(snapshot, expected_fields, field_name):
     assert tuple(field.name for field in fields(snapshot)) == expected_fields
     assert not hasattr(snapshot, "__dict__")
@@ -287,6 +356,7 @@ def test_processor_metrics_snapshot_is_frozen_slotted_and_preserves_values():
         2,
         1,
         1,
+        4,
     )
 
 
@@ -480,6 +550,19 @@ def test_output_traffic_snapshot_is_frozen_slotted_and_preserves_values():
         1,
         8,
         720,
+        180,
+        1,
+        2,
+        3,
+        1,
+        4,
+        1,
+        850,
+        4096,
+        2,
+        1,
+        5,
+        1500,
     )
 
 
@@ -492,6 +575,19 @@ def test_output_traffic_snapshot_accepts_unnamed_zero_target():
         dispatch_failed=0,
         messages=0,
         bytes=0,
+        buffered_bytes=0,
+        buffer_drops=0,
+        write_pauses=0,
+        resolutions=0,
+        resolve_failures=0,
+        transport_failures=0,
+        address_changes=0,
+        resolve_latency_us=0,
+        sink_bytes_written=0,
+        sink_rotations=0,
+        sink_write_errors=0,
+        sink_dropped=0,
+        sink_lag_us=0,
     )
 
     assert snapshot.target_id == 0
@@ -543,6 +639,70 @@ def test_output_traffic_snapshot_rejects_negative_counters(field_name):
         output_traffic_snapshot(**{field_name: -1})
 
 
+def test_target_queue_snapshot_is_frozen_slotted_and_preserves_values():
+    snapshot = target_queue_snapshot()
+
+    assert_frozen_slotted(snapshot, TARGET_QUEUE_FIELDS, "depth")
+    assert tuple(getattr(snapshot, name) for name in TARGET_QUEUE_FIELDS) == (
+        1,
+        "drop_oldest",
+        16,
+        3,
+        9,
+        40,
+        37,
+        2,
+        0,
+        36,
+        12,
+        5,
+    )
+
+
+@pytest.mark.parametrize(
+    ("overflow_policy", "exception"),
+    [("", ValueError), (None, TypeError), (1, TypeError)],
+)
+def test_target_queue_snapshot_rejects_invalid_overflow_policy(
+    overflow_policy,
+    exception,
+):
+    with pytest.raises(exception, match="overflow_policy"):
+        target_queue_snapshot(overflow_policy=overflow_policy)
+
+
+@pytest.mark.parametrize("field_name", TARGET_QUEUE_NUMERIC_FIELDS)
+@pytest.mark.parametrize("value", INVALID_NUMERIC_VALUES)
+def test_target_queue_snapshot_rejects_non_integer_fields(field_name, value):
+    with pytest.raises(TypeError, match=field_name):
+        target_queue_snapshot(**{field_name: value})
+
+
+@pytest.mark.parametrize("field_name", TARGET_QUEUE_NUMERIC_FIELDS)
+def test_target_queue_snapshot_rejects_negative_fields(field_name):
+    with pytest.raises(ValueError, match=field_name):
+        target_queue_snapshot(**{field_name: -1})
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"capacity": 0, "depth": 0, "peak_depth": 0}, "capacity"),
+        ({"depth": 17, "peak_depth": 17}, "depth"),
+        ({"depth": 5, "peak_depth": 4}, "peak_depth"),
+        ({"peak_depth": 17}, "peak_depth"),
+        ({"sent_messages": 38}, "sent_messages"),
+        ({"sent_datagrams": 37}, "sent_datagrams"),
+    ],
+)
+def test_target_queue_snapshot_enforces_structural_invariants(
+    overrides,
+    message,
+):
+    with pytest.raises(ValueError, match=message):
+        target_queue_snapshot(**overrides)
+
+
 def test_runtime_statistics_snapshot_is_frozen_slotted_and_preserves_fields():
     first_ingress = queue_snapshot(name="udpsec-ingress:0:secure-a")
     second_ingress = queue_snapshot(name="udp-ingress:0:station-a")
@@ -1,4 +1,13 @@
-from core.output_builder import build_output_bytes
+import pytest
+
+from core.output_builder import (
+    OutputProfile,
+    OutputProfileConfigError,
+    build_output_bytes,
+    build_profile_output_bytes,
+    build_single_output_bytes,
+    load_target_output_profiles,
+)
 from meta_writer import wrap_with_meta
 
 
@@ -129,3 +138,187 @@ def test_build_output_bytes_matches_canonical_string_formatter():
         is_first=True,
         g_triplet="1-2-99",
     ) == (expected_text + "\r\n").encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    ("nmea_line", "station_id", "timestamp", "g_triplet"),
+    (
+        (SINGLE, "boat", 123, None),
+        (SINGLE, "boat", "987", None),
+        (SINGLE, "boat", 123, "1-1-424242"),
+        (SINGLE, "båt ⛵", 123, None),
+        (SINGLE, "ĀȀ", 123, "1-1-99"),
+        ("malformed", "boat", 123, None),
+        ("!AIVDM,1,1,payload*00", "boat", 123, "1-1-99"),
+    ),
+)
+def test_build_single_output_bytes_matches_general_builder(
+    nmea_line,
+    station_id,
+    timestamp,
+    g_triplet,
+):
+    assert build_single_output_bytes(
+        nmea_line,
+        station_id,
+        timestamp,
+        g_triplet,
+    ) == build_output_bytes(
+        nmea_line,
+        station_id,
+        timestamp,
+        is_first=True,
+        g_triplet=g_triplet,
+    )
+
+
+@pytest.mark.parametrize("timestamp", (None, 0))
+def test_build_single_output_bytes_uses_injected_fallback_clock(timestamp):
+    payload = build_single_output_bytes(
+        SINGLE,
+        "boat",
+        timestamp,
+        clock=lambda: 456.9,
+    )
+
+    assert payload == (
+        "\\c:456,s:boat*13\\" + SINGLE + "\r\n"
+    ).encode("utf-8")
+
+
+def test_build_single_output_bytes_does_not_observe_clock_for_timestamp():
+    def fail_clock():
+        raise AssertionError("clock must not be observed")
+
+    payload = build_single_output_bytes(
+        SINGLE,
+        "boat",
+        123,
+        clock=fail_clock,
+    )
+
+    assert payload == b"\\c:123,s:boat*14\\" + SINGLE.encode() + b"\r\n"
+
+
+def test_build_single_output_bytes_rejects_unencodable_text_like_general():
+    line = "!AIVDM,1,1,,A,\udcff,0*00"
+
+    with pytest.raises(UnicodeEncodeError):
+        build_output_bytes(line, "boat", timestamp=123)
+    with pytest.raises(UnicodeEncodeError):
+        build_single_output_bytes(line, "boat", 123)
+
+
+@pytest.mark.parametrize(
+    ("nmea_line", "station_id", "timestamp", "is_first", "g_triplet"),
+    (
+        (SINGLE, "boat", 123, True, None),
+        (SINGLE, "boat", "987", False, None),
+        (FIRST, "boat", 123, True, "1-2-99"),
+        (SECOND, "boat", 123, False, "2-2-99"),
+        (SECOND, "båt", 123, False, "2-2-Ā"),
+        (FIRST, "ĀȀ", 123, True, "1-2-99"),
+        ("!AIVDM,2,2,payload*00", "boat", 123, False, "2-2-99"),
+    ),
+)
+def test_build_output_bytes_matches_canonical_writer_for_all_shapes(
+    nmea_line,
+    station_id,
+    timestamp,
+    is_first,
+    g_triplet,
+):
+    expected_text = wrap_with_meta(
+        nmea_line,
+        station_id,
+        timestamp,
+        is_first=is_first,
+        g_triplet=g_triplet,
+    )
+
+    for _ in range(2):
+        assert build_output_bytes(
+            nmea_line,
+            station_id,
+            timestamp,
+            is_first=is_first,
+            g_triplet=g_triplet,
+        ) == (expected_text + "\r\n").encode("utf-8")
+
+
+def test_build_output_bytes_keys_cached_headers_by_timestamp_and_s():
+    assert build_output_bytes(SINGLE, "boat", 123) == (
+        b"\\c:123,s:boat*14\\" + SINGLE.encode() + b"\r\n"
+    )
+    assert build_output_bytes(SINGLE, "ship", 123).startswith(
+        b"\\c:123,s:ship*"
+    )
+    assert build_output_bytes(SINGLE, "boat", 456).startswith(
+        b"\\c:456,s:boat*"
+    )
+    assert build_output_bytes(SINGLE, "boat", "123") == (
+        build_output_bytes(SINGLE, "boat", 123)
+    )
+
+
+@pytest.mark.parametrize(
+    ("profile", "expected"),
+    [
+        (OutputProfile.FULL, "\\c:123,s:boat,g:1-2-99*66\\" + FIRST),
+        (OutputProfile.C_S, "\\c:123,s:boat*14\\" + FIRST),
+        (OutputProfile.C, "\\c:123*69\\" + FIRST),
+        (OutputProfile.S, "\\s:boat*51\\" + FIRST),
+        (OutputProfile.BARE, FIRST),
+    ],
+)
+def test_build_profile_output_bytes_frames_each_profile(profile, expected):
+    payload = build_profile_output_bytes(
+        profile,
+        FIRST,
+        "boat",
+        123,
+        True,
+        "1-2-99",
+    )
+
+    assert payload == (expected + "\r\n").encode("utf-8")
+
+
+def test_reduced_profiles_repeat_their_header_on_later_parts():
+    payload = build_profile_output_bytes(
+        OutputProfile.C_S,
+        SECOND,
+        "boat",
+        123,
+        False,
+        "2-2-99",
+    )
+
+    assert payload == build_output_bytes(SECOND, "boat", 123)
+
+
+def test_reduced_profiles_keep_short_lines_unframed():
+    assert build_profile_output_bytes(
+        OutputProfile.C,
+        "!AIVDM,1",
+        "boat",
+        123,
+    ) == b"!AIVDM,1\r\n"
+
+
+def test_load_target_output_profiles_defaults_to_full():
+    assert load_target_output_profiles(
+        (
+            {"host": "127.0.0.1", "port": 1},
+            {"host": "127.0.0.1", "port": 2, "output_profile": "bare"},
+        )
+    ) == (OutputProfile.FULL, OutputProfile.BARE)
+
+
+@pytest.mark.parametrize("value", ["tag", None, 1])
+def test_load_target_output_profiles_rejects_unknown_profiles(value):
+    with pytest.raises(
+        OutputProfileConfigError,
+        match=r"forwarders\[1\]\.output_profile",
+    ):
+        load_target_output_profiles(({}, {"output_profile": value}))
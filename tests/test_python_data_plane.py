@@ -4,6 +4,7 @@ import pytest
 
 import core.python_data_plane as python_data_plane_module
 from assembler import AIVDMAssembler
+from core.anomaly_detection import AnomalyDetector, AnomalyRouting
 from core.data_plane import (
     DataPlaneProcessor,
     DeduplicationMode,
@@ -12,10 +13,14 @@ from core.data_plane import (
     ProcessorOutput,
     ProcessorResetReport,
 )
+from core.emission_throttle import EmissionThrottle
 from core.ingress_frame import IngressFrame
+from core.message_filter import MessageFilter, TargetFilter
 from core.metrics import ProcessorMetricsSnapshot
+from core.output_builder import OutputProfile
 from core.python_data_plane import PythonDataPlaneProcessor
 from core.state.s_cache import SourceState
+from core.vessel_table import VesselTable
 from dedup import Deduplicator
 
 
@@ -68,11 +73,13 @@ def make_snapshot(
     generation=0,
     mode=DeduplicationMode.GLOBAL,
     target_ids=(),
+    target_filter=None,
 ):
     return ProcessingSnapshot(
         routing_generation=generation,
         deduplication_mode=mode,
         target_ids=target_ids,
+        target_filter=target_filter,
     )
 
 
@@ -99,6 +106,7 @@ def make_metrics_snapshot(**overrides):
         "reset_completed": 0,
         "reset_failed": 0,
         "reset_in_flight": 0,
+        "gid_pool_refills": 0,
     }
     values.update(overrides)
     return ProcessorMetricsSnapshot(**values)
@@ -427,6 +435,129 @@ def test_routed_no_match_does_not_invoke_builder(monkeypatch):
     ) == ()
 
 
+def test_profiles_render_once_per_distinct_profile_in_target_order(
+    monkeypatch,
+):
+    calls = []
+    original_builder = python_data_plane_module.build_profile_output_bytes
+
+    def recording_builder(profile, *args):
+        calls.append(profile)
+        return original_builder(profile, *args)
+
+    monkeypatch.setattr(
+        python_data_plane_module,
+        "build_profile_output_bytes",
+        recording_builder,
+    )
+    processor = make_processor(
+        target_profiles=(
+            OutputProfile.BARE,
+            OutputProfile.FULL,
+            OutputProfile.BARE,
+            OutputProfile.S,
+        ),
+    )
+
+    outputs = process_outputs(
+        processor,
+        make_frame(SENTENCE),
+        make_snapshot(target_ids=(2, 1, 0, 3, 4)),
+    )
+
+    assert calls == [OutputProfile.BARE, OutputProfile.FULL, OutputProfile.S]
+    assert outputs == (
+        ProcessorOutput(
+            message=(SENTENCE + "\r\n").encode("utf-8"),
+            target_ids=(2, 0),
+        ),
+        ProcessorOutput(
+            message=(
+                tag_block(f"c:{WALL_TIME},s:test_station") + SENTENCE + "\r\n"
+            ).encode("utf-8"),
+            target_ids=(1, 4),
+        ),
+        ProcessorOutput(
+            message=(tag_block("s:test_station") + SENTENCE + "\r\n").encode(
+                "utf-8"
+            ),
+            target_ids=(3,),
+        ),
+    )
+
+
+def test_profile_grouping_memo_keeps_only_the_newest_target_sets(
+    monkeypatch,
+):
+    monkeypatch.setattr(python_data_plane_module, "_PROFILE_GROUPS_MAX", 2)
+    processor = make_processor(
+        target_profiles=(OutputProfile.BARE, OutputProfile.FULL),
+    )
+
+    for index, target_ids in enumerate(((0,), (1,), (0, 1))):
+        sentence = make_nmea_sentence(
+            f"AIVDM,1,1,,A,15Muq?002>G?svP00<:O?vN60<{index},0"
+        )
+        outputs = process_outputs(
+            processor,
+            make_frame(sentence),
+            make_snapshot(target_ids=target_ids),
+        )
+        assert [output.target_ids for output in outputs] == [
+            (target_id,) for target_id in target_ids
+        ]
+
+    assert tuple(processor._profile_groups) == ((1,), (0, 1))
+
+
+def test_profiles_drop_group_tags_from_multipart_outputs():
+    first = make_multipart_sentence(1, "first")
+    second = make_multipart_sentence(2, "second")
+    processor = make_processor(
+        target_profiles=(OutputProfile.FULL, OutputProfile.C_S),
+    )
+    snapshot = make_snapshot(target_ids=(0, 1))
+
+    assert process_outputs(processor, make_frame(first), snapshot) == ()
+    outputs = process_outputs(processor, make_frame(second), snapshot)
+
+    assert [output.target_ids for output in outputs] == [(0,), (1,)] * 2
+    assert [leading_tag_content(output.message) for output in outputs] == [
+        f"c:{WALL_TIME},s:test_station,g:1-2-999999",
+        f"c:{WALL_TIME},s:test_station",
+        "g:2-2-999999",
+        f"c:{WALL_TIME},s:test_station",
+    ]
+
+
+@pytest.mark.parametrize("single_fast_path", [True, False])
+def test_profiled_single_outputs_match_between_fast_and_general_paths(
+    single_fast_path,
+):
+    processor = make_processor(
+        single_fast_path=single_fast_path,
+        target_profiles=(OutputProfile.C, OutputProfile.FULL),
+    )
+
+    outputs = process_outputs(
+        processor,
+        make_frame(SENTENCE),
+        make_snapshot(target_ids=(0, 1)),
+    )
+
+    assert [output.message for output in outputs] == [
+        (tag_block(f"c:{WALL_TIME}") + SENTENCE + "\r\n").encode("utf-8"),
+        (
+            tag_block(f"c:{WALL_TIME},s:test_station") + SENTENCE + "\r\n"
+        ).encode("utf-8"),
+    ]
+
+
+def test_processor_rejects_non_profile_target_profiles():
+    with pytest.raises(TypeError, match="OutputProfile"):
+        make_processor(target_profiles=("bare",))
+
+
 def test_processor_delegates_framing_and_encoding_to_output_builder():
     process_source = inspect.getsource(PythonDataPlaneProcessor._process_impl)
 
@@ -539,7 +670,7 @@ def test_global_mode_carries_snapshot_targets_and_uses_global_scope():
 
 def test_global_mode_with_empty_targets_still_builds_output(monkeypatch):
     calls = []
-    original_builder = python_data_plane_module.build_output_bytes
+    original_builder = python_data_plane_module.build_single_output_bytes
 
     def recording_builder(*args, **kwargs):
         calls.append((args, kwargs))
@@ -547,7 +678,7 @@ def test_global_mode_with_empty_targets_still_builds_output(monkeypatch):
 
     monkeypatch.setattr(
         python_data_plane_module,
-        "build_output_bytes",
+        "build_single_output_bytes",
         recording_builder,
     )
 
@@ -1469,3 +1600,325 @@ def test_multipart_crosses_generations_and_uses_completion_numeric_targets():
     )
     assert assembler.stats().completed == 1
     assert assembler.stats().resets == 0
+
+
+# Targets 0 and 2 want type 5 only; target 1 wants everything.
+STATIC_ONLY_FILTER = TargetFilter(
+    clauses=(
+        (MessageFilter(message_types=frozenset({5})), (0, 2)),
+        (None, (1,)),
+    )
+)
+
+
+@pytest.mark.parametrize("single_fast_path", [True, False])
+def test_target_filter_selects_single_sentence_targets(single_fast_path):
+    processor = make_processor(single_fast_path=single_fast_path)
+    static = make_nmea_sentence("AIVDM,1,1,,A,55Muq?002>G?svP00<:O?vN60<0,0")
+    snapshot = make_snapshot(
+        mode=DeduplicationMode.PER_TARGET,
+        target_ids=(0, 2, 1),
+        target_filter=STATIC_ONLY_FILTER,
+    )
+
+    position_outputs = process_outputs(processor, make_frame(SENTENCE), snapshot)
+    static_outputs = process_outputs(processor, make_frame(static), snapshot)
+
+    assert [output.target_ids for output in position_outputs] == [(1,)]
+    assert [output.target_ids for output in static_outputs] == [(0, 2, 1)]
+
+
+def test_filtered_out_targets_do_not_admit_message_to_their_dedup_scope():
+    processor = make_processor()
+    filtered = make_snapshot(
+        mode=DeduplicationMode.PER_TARGET,
+        target_ids=(0, 2, 1),
+        target_filter=STATIC_ONLY_FILTER,
+    )
+    unfiltered = make_snapshot(
+        mode=DeduplicationMode.PER_TARGET,
+        target_ids=(0, 1),
+    )
+
+    process_outputs(processor, make_frame(SENTENCE), filtered)
+    outputs = process_outputs(processor, make_frame(SENTENCE), unfiltered)
+
+    assert [output.target_ids for output in outputs] == [(0,)]
+
+
+def test_multipart_group_is_filtered_once_by_its_first_fragment_at_completion():
+    processor = make_processor()
+    first = make_multipart_sentence(1, "55Muq?002>G?svP00")
+    second = make_multipart_sentence(2, "<:O?vN60<0")
+    snapshot = make_snapshot(
+        mode=DeduplicationMode.PER_TARGET,
+        target_ids=(0, 2, 1),
+        target_filter=STATIC_ONLY_FILTER,
+    )
+
+    assert process_outputs(processor, make_frame(first), snapshot) == ()
+    outputs = process_outputs(processor, make_frame(second), snapshot)
+
+    assert [output.target_ids for output in outputs] == [(0, 2, 1), (0, 2, 1)]
+
+
+def realistic_mixed_frames():
+    """Build single-heavy traffic with TAG variants, repeats, and multipart."""
+
+    singles = [
+        make_nmea_sentence(f"AIVDM,1,1,,{channel},{kind}5Muq?00{index}>G?,0")
+        for index, (channel, kind) in enumerate(
+            zip("ABABAB", "123BCH")
+        )
+    ]
+    frames = []
+    for index, sentence in enumerate(singles):
+        frames.append(make_frame(sentence))
+        frames.append(
+            make_frame(tag_block(f"c:{1_700_000_100 + index}") + sentence)
+        )
+        frames.append(
+            make_frame(
+                tag_block(f"s:rx{index},c:0") + sentence,
+                assembler_key=f"198.51.100.{index}:4000",
+            )
+        )
+        frames.append(
+            make_frame(
+                tag_block(f"s:rx{index},g:1-1-{4000 + index}") + sentence,
+                alias_for_s="alias" if index % 2 else None,
+                remote_ip=f"2001:db8::{index}",
+            )
+        )
+
+    for sequence in "1234":
+        first = make_multipart_sentence(
+            1,
+            "first" + sequence,
+            sequence=sequence,
+        )
+        second = make_multipart_sentence(
+            2,
+            "second" + sequence,
+            sequence=sequence,
+        )
+        frames.append(
+            make_frame(tag_block(f"c:12{sequence},g:1-2-77") + first)
+        )
+        frames.append(make_frame(singles[int(sequence)]))
+        frames.append(make_frame(tag_block("g:2-2-77") + second))
+        frames.append(make_frame(first + second))
+
+    frames.append(make_frame(singles[0] + singles[1] + "garbage"))
+    frames.append(make_frame("!AIVDM,1,1,,A,short*00"))
+    return frames
+
+
+@pytest.mark.parametrize("always_tag_single", (False, True))
+@pytest.mark.parametrize("preserve_ingress_c", (False, True))
+@pytest.mark.parametrize("preserve_ingress_gid", (False, True))
+@pytest.mark.parametrize("station_id", ("test_station", None))
+@pytest.mark.parametrize(
+    "snapshot",
+    (
+        make_snapshot(target_ids=(0, 1)),
+        make_snapshot(mode=DeduplicationMode.PER_TARGET, target_ids=(2, 0)),
+    ),
+)
+def test_single_fast_path_matches_general_path_on_mixed_traffic(
+    always_tag_single,
+    preserve_ingress_c,
+    preserve_ingress_gid,
+    station_id,
+    snapshot,
+):
+    def make_differential_processor(single_fast_path):
+        generated = iter(range(100_000, 200_000))
+
+        def gid_generator(_digits):
+            # The general path also draws for untagged singles; only tagged
+            # configurations may observe a changing sequence.
+            if always_tag_single:
+                return str(next(generated))
+            return "999999"
+
+        return make_processor(
+            station_id=station_id,
+            preserve_ingress_c=preserve_ingress_c,
+            preserve_ingress_gid=preserve_ingress_gid,
+            always_tag_single=always_tag_single,
+            gid_generator=gid_generator,
+            assembler=AIVDMAssembler(clock=lambda: 0.0),
+            deduplicator=Deduplicator(clock=lambda: 0.0),
+            single_fast_path=single_fast_path,
+        )
+
+    fast = make_differential_processor(True)
+    general = make_differential_processor(False)
+
+    for frame in realistic_mixed_frames():
+        assert process_batch(fast, frame, snapshot) == process_batch(
+            general,
+            frame,
+            snapshot,
+        )
+
+    assert fast.metrics_snapshot() == general.metrics_snapshot()
+    assert fast._assembler.stats() == general._assembler.stats()
+    assert fast._deduplicator.stats() == general._deduplicator.stats()
+    assert fast.reset() == general.reset()
+
+
+def test_single_fast_path_skips_multipart_metadata_and_untagged_gids():
+    gid_calls = []
+
+    def gid_generator(digits):
+        gid_calls.append(digits)
+        return "999999"
+
+    processor = make_processor(gid_generator=gid_generator)
+    first = make_multipart_sentence(1, "first")
+    processor.process(
+        make_frame(tag_block("c:123,s:x,g:1-2-5") + first),
+        make_snapshot(),
+    )
+    contexts = (
+        dict(processor._multipart_s_ctx),
+        dict(processor._multipart_c_ctx),
+        dict(processor._multipart_gid_ctx),
+    )
+
+    outputs = process_outputs(
+        processor,
+        make_frame(tag_block("c:456,s:y,g:1-1-6") + SENTENCE),
+        make_snapshot(),
+    )
+
+    assert outputs[0].message == (
+        tag_block("c:456,s:test_station") + SENTENCE + "\r\n"
+    ).encode("utf-8")
+    assert gid_calls == []
+    assert (
+        processor._multipart_s_ctx,
+        processor._multipart_c_ctx,
+        processor._multipart_gid_ctx,
+    ) == contexts
+
+
+@pytest.mark.parametrize("single_fast_path", [True, False])
+def test_vessel_table_records_emitted_position_reports_once(single_fast_path):
+    vessel_table = VesselTable(clock=lambda: WALL_TIME)
+    processor = make_processor(
+        single_fast_path=single_fast_path,
+        vessel_table=vessel_table,
+    )
+    static = make_nmea_sentence("AIVDM,1,1,,A,55Muq?002>G?svP00<:O?vN60<0,0")
+
+    process_outputs(processor, make_frame(SENTENCE), make_snapshot())
+    process_outputs(
+        processor,
+        make_frame(SENTENCE, source_id="udp:other"),
+        make_snapshot(),
+    )
+    process_outputs(processor, make_frame(static), make_snapshot())
+    processor.reset()
+
+    assert len(vessel_table) == 1
+    (vessel,), _truncated = vessel_table.query_bounds((-180, -90, 180, 90))
+    assert (vessel.timestamp, vessel.message_type, vessel.source_id) == (
+        WALL_TIME,
+        1,
+        SOURCE_ID,
+    )
+
+
+@pytest.mark.parametrize("single_fast_path", [True, False])
+@pytest.mark.parametrize(
+    ("divert", "flagged_targets"),
+    [(False, (0, 1, 2)), (True, (2,))],
+)
+def test_anomaly_detector_routes_flagged_reports_unchanged(
+    single_fast_path,
+    divert,
+    flagged_targets,
+):
+    detector = AnomalyDetector(
+        routing=AnomalyRouting(target_id=2, divert=divert),
+    )
+    processor = make_processor(
+        single_fast_path=single_fast_path,
+        anomaly_detector=detector,
+    )
+    # One MMSI at 10.5 E and, at the same instant, 12.0 E.
+    here = make_nmea_sentence("AIVDM,1,1,,A,15M67F@0000h4;0Lh=L000000000,0")
+    there = make_nmea_sentence("AIVDM,1,1,,A,15M67F@0000ns`0Lh=L000000000,0")
+    snapshot = make_snapshot(target_ids=(0, 1))
+
+    (plausible,) = process_outputs(processor, make_frame(here), snapshot)
+    (flagged,) = process_outputs(processor, make_frame(there), snapshot)
+
+    assert plausible.target_ids == (0, 1)
+    assert flagged.target_ids == flagged_targets
+    assert flagged.message.endswith((there + "\r\n").encode("utf-8"))
+    assert detector.metrics_snapshot().teleport == 1
+
+
+@pytest.mark.parametrize("single_fast_path", [True, False])
+def test_emission_throttle_drops_recently_served_targets(single_fast_path):
+    now = [WALL_TIME]
+    vessel_table = VesselTable(clock=lambda: now[0])
+    processor = make_processor(
+        single_fast_path=single_fast_path,
+        wall_clock=lambda: now[0],
+        vessel_table=vessel_table,
+        emission_throttle=EmissionThrottle({1: 30.0}),
+    )
+    repeat = make_nmea_sentence("AIVDM,1,1,,B,15Muq?002>G?svP00<:O?vN60<0,0")
+
+    (first,) = process_outputs(
+        processor,
+        make_frame(SENTENCE),
+        make_snapshot(target_ids=(0, 1)),
+    )
+    now[0] += 10
+    (second,) = process_outputs(
+        processor,
+        make_frame(SECOND_SENTENCE),
+        make_snapshot(target_ids=(0, 1)),
+    )
+    throttled_only = process_outputs(
+        processor,
+        make_frame(repeat),
+        make_snapshot(target_ids=(1,)),
+    )
+
+    assert (first.target_ids, second.target_ids) == ((0, 1), (0,))
+    assert throttled_only == ()
+    # Throttling limits delivery, not what the processor has seen.
+    (vessel,), _truncated = vessel_table.query_bounds((-180, -90, 180, 90))
+    assert vessel.timestamp == WALL_TIME + 10
+
+
+def test_default_gid_pool_refills_are_reported_in_processor_metrics():
+    processor = make_processor(
+        always_tag_single=True,
+        gid_generator=None,
+        gid_digits=6,
+    )
+
+    outputs = process_outputs(processor, make_frame(SENTENCE), make_snapshot())
+
+    gid = outputs[0].message.split(b",g:1-1-", 1)[1].split(b"*", 1)[0]
+    assert len(gid) == 6 and gid.isdigit()
+    assert processor.metrics_snapshot().gid_pool_refills == 1
+
+
+def test_injected_gid_generator_reports_no_gid_pool_refills():
+    processor = make_processor(
+        always_tag_single=True,
+        gid_generator=lambda digits: "7" * digits,
+    )
+
+    process_outputs(processor, make_frame(SENTENCE), make_snapshot())
+
+    assert processor.metrics_snapshot().gid_pool_refills == 0
@@ -3,14 +3,17 @@ from dataclasses import replace
 import pytest
 
 import core.routing as routing_module
+from core.message_filter import MessageFilter, TargetFilter
 from core.routing import (
     CircularZoneReferenceError,
     RouteDefinition,
+    RoutingPatchOperation,
     UnknownZoneError,
     ZoneDefinition,
     ZoneResolutionError,
     RoutingTable,
     load_route_definitions,
+    load_routing_patch_operations,
     load_zone_definitions,
     match_routes,
     resolve_zones,
@@ -515,6 +518,39 @@ def test_compiled_target_routes_cannot_be_passed_to_constructor():
         )
 
 
+def test_target_memo_cannot_be_passed_to_constructor():
+    with pytest.raises(TypeError, match="_target_ids_by_source"):
+        RoutingTable(
+            resolved_zones={},
+            route_definitions=(),
+            _target_ids_by_source={},
+        )
+
+
+def test_compiled_table_memoises_ordered_unique_targets_per_source():
+    table = RoutingTable.from_definitions(
+        {
+            "north": {"include": ["udp:a", "udp:b"]},
+            "south": {"include": ["udp:b", "udp:c"]},
+        },
+        [
+            {"name": "north", "from_zone": "north", "to": ["udp:x", "udp:y"]},
+            {"name": "south", "from_zone": "south", "to": ["udp:z", "udp:x"]},
+        ],
+    ).compile_target_ids({"udp:x": 0, "udp:y": 1, "udp:z": 2})
+
+    assert dict(table._target_ids_by_source) == {
+        "udp:a": (0, 1),
+        "udp:b": (0, 1, 2),
+        "udp:c": (2, 0),
+    }
+    assert table.match_target_ids("udp:b") is table.match_target_ids("udp:b")
+    assert table.match_target_ids("udp:unknown") == ()
+    assert "udp:unknown" not in table._target_ids_by_source
+    with pytest.raises(TypeError):
+        table._target_ids_by_source["udp:a"] = ()
+
+
 def test_numeric_target_compilation_preserves_external_route_definitions():
     table = RoutingTable.from_definitions(
         {"trusted": {"include": ["udp:source"]}},
@@ -806,3 +842,333 @@ def test_numeric_target_compilation_reports_unknown_external_names():
 
     with pytest.raises(ValueError, match="udp:missing"):
         table.compile_target_ids({"udp:target": 0})
+
+
+PATCH_TARGET_ID_BY_NAME = {"udp:a": 0, "udp:b": 1, "udp:c": 2}
+PATCH_ZONES = {
+    "fixed": {"include": ["udp:roof", "udp:mast"]},
+    "portable": {"include": ["udpsec:pi"]},
+    "quarantined": {"include": ["udp:mast"]},
+    "trusted": {"union": ["fixed", "portable"]},
+    "clean": {"difference": ["trusted", "quarantined"]},
+    "fixed_clean": {"intersection": ["fixed", "clean"]},
+}
+PATCH_ROUTES = [
+    {"name": "clean_to_a", "from_zone": "clean", "to": ["udp:a"]},
+    {"name": "fixed_clean_to_b", "from_zone": "fixed_clean", "to": ["udp:b"]},
+    {"name": "quarantined_to_c", "from_zone": "quarantined", "to": ["udp:c"]},
+]
+
+
+def _patch_table(zones=PATCH_ZONES, routes=PATCH_ROUTES):
+    return RoutingTable.from_config(zones, routes).compile_target_ids(
+        PATCH_TARGET_ID_BY_NAME
+    )
+
+
+def _assert_same_plan(patched, expected, source_ids):
+    assert patched.resolved_zones == expected.resolved_zones
+    assert patched.route_definitions == expected.route_definitions
+    assert dict(patched._target_ids_by_source) == dict(
+        expected._target_ids_by_source
+    )
+    for source_id in source_ids:
+        assert patched.match_target_ids(source_id) == (
+            expected.match_target_ids(source_id)
+        )
+        assert patched.match(source_id) == expected.match(source_id)
+
+
+@pytest.mark.parametrize(
+    ("operations", "zones", "routes"),
+    [
+        (
+            [{"op": "add_source", "zone": "fixed", "source": "udp:tower"}],
+            {
+                **PATCH_ZONES,
+                "fixed": {"include": ["udp:roof", "udp:mast", "udp:tower"]},
+            },
+            PATCH_ROUTES,
+        ),
+        (
+            [{"op": "add_source", "zone": "quarantined", "source": "udp:roof"}],
+            {
+                **PATCH_ZONES,
+                "quarantined": {"include": ["udp:mast", "udp:roof"]},
+            },
+            PATCH_ROUTES,
+        ),
+        (
+            [
+                {"op": "remove_source", "zone": "quarantined", "source": "udp:mast"},
+                {"op": "remove_source", "zone": "portable", "source": "udpsec:pi"},
+            ],
+            {
+                **PATCH_ZONES,
+                "quarantined": {"include": []},
+                "portable": {"include": []},
+            },
+            PATCH_ROUTES,
+        ),
+        (
+            [
+                {"op": "add_target", "route": "clean_to_a", "target": "udp:c"},
+                {"op": "remove_target", "route": "quarantined_to_c", "target": "udp:c"},
+            ],
+            PATCH_ZONES,
+            [
+                {"name": "clean_to_a", "from_zone": "clean", "to": ["udp:a", "udp:c"]},
+                PATCH_ROUTES[1],
+                {"name": "quarantined_to_c", "from_zone": "quarantined", "to": []},
+            ],
+        ),
+    ],
+)
+def test_patch_matches_full_recompile_of_patched_config(operations, zones, routes):
+    table = _patch_table()
+
+    patched = table.apply_patch(
+        load_routing_patch_operations(operations),
+        PATCH_TARGET_ID_BY_NAME,
+    )
+
+    _assert_same_plan(
+        patched,
+        _patch_table(zones, routes),
+        ("udp:roof", "udp:mast", "udpsec:pi", "udp:tower", "udp:unknown"),
+    )
+
+
+def test_patch_leaves_original_table_unchanged_and_can_be_patched_again():
+    table = _patch_table()
+
+    added = table.apply_patch(
+        [RoutingPatchOperation("add_source", "fixed", "udp:tower")],
+        PATCH_TARGET_ID_BY_NAME,
+    )
+    removed = added.apply_patch(
+        [RoutingPatchOperation("remove_source", "fixed", "udp:tower")],
+        PATCH_TARGET_ID_BY_NAME,
+    )
+
+    assert table.match_target_ids("udp:tower") == ()
+    assert added.match_target_ids("udp:tower") == (0, 1)
+    _assert_same_plan(removed, table, ("udp:roof", "udp:mast", "udp:tower"))
+
+
+@pytest.mark.parametrize(
+    ("operation", "error", "message"),
+    [
+        (
+            RoutingPatchOperation("add_source", "missing", "udp:x"),
+            UnknownZoneError,
+            "missing",
+        ),
+        (
+            RoutingPatchOperation("add_source", "trusted", "udp:x"),
+            ZoneResolutionError,
+            "not an include zone",
+        ),
+        (
+            RoutingPatchOperation("add_source", "fixed", "udp:roof"),
+            ValueError,
+            "already includes",
+        ),
+        (
+            RoutingPatchOperation("remove_source", "fixed", "udp:x"),
+            ValueError,
+            "does not include",
+        ),
+        (
+            RoutingPatchOperation("add_target", "missing", "udp:a"),
+            ValueError,
+            "Unknown route",
+        ),
+        (
+            RoutingPatchOperation("add_target", "clean_to_a", "udp:a"),
+            ValueError,
+            "already targets",
+        ),
+        (
+            RoutingPatchOperation("add_target", "clean_to_a", "udp:z"),
+            ValueError,
+            "unavailable or unsupported",
+        ),
+        (
+            RoutingPatchOperation("remove_target", "clean_to_a", "udp:b"),
+            ValueError,
+            "does not target",
+        ),
+    ],
+)
+def test_invalid_patch_operations_are_rejected(operation, error, message):
+    with pytest.raises(error, match=message):
+        _patch_table().apply_patch([operation], PATCH_TARGET_ID_BY_NAME)
+
+
+def test_patch_rejects_duplicate_route_names():
+    routes = PATCH_ROUTES + [
+        {"name": "clean_to_a", "from_zone": "fixed", "to": ["udp:b"]}
+    ]
+
+    with pytest.raises(ValueError, match="not unique"):
+        _patch_table(routes=routes).apply_patch(
+            [RoutingPatchOperation("add_target", "clean_to_a", "udp:c")],
+            PATCH_TARGET_ID_BY_NAME,
+        )
+
+
+def test_patch_requires_compiled_table():
+    table = RoutingTable.from_config(PATCH_ZONES, PATCH_ROUTES)
+
+    with pytest.raises(RuntimeError, match="compile_target_ids"):
+        table.apply_patch([], PATCH_TARGET_ID_BY_NAME)
+
+
+@pytest.mark.parametrize(
+    ("config", "error"),
+    [
+        ([], ValueError),
+        ("add_source", TypeError),
+        ([["add_source"]], TypeError),
+        ([{"op": "rename", "zone": "a", "source": "b"}], ValueError),
+        ([{"op": "add_source", "zone": "a"}], ValueError),
+        ([{"op": "add_source", "zone": "a", "target": "b"}], ValueError),
+        ([{"op": "add_target", "route": "a", "target": 1}], TypeError),
+    ],
+)
+def test_invalid_plain_patch_operations_are_rejected(config, error):
+    with pytest.raises(error):
+        load_routing_patch_operations(config)
+
+
+FILTERED_ROUTES = [
+    {
+        "name": "positions_to_a",
+        "from_zone": "fixed",
+        "to": ["udp:a"],
+        "filter": {"message_types": [1, 2, 3, 18, 19, 27]},
+    },
+    {"name": "fixed_to_b", "from_zone": "fixed", "to": ["udp:b"]},
+    {
+        "name": "fleet_to_c",
+        "from_zone": "portable",
+        "to": ["udp:c", "udp:a"],
+        "filter": {"mmsi": [211000000], "mmsi_ranges": [[477000000, 477999999]]},
+    },
+]
+
+
+def test_route_filter_config_is_loaded_into_definitions():
+    route = load_route_definitions(FILTERED_ROUTES)[0]
+
+    assert route.filter == MessageFilter(
+        message_types=frozenset({1, 2, 3, 18, 19, 27})
+    )
+    assert load_route_definitions(FILTERED_ROUTES)[1].filter is None
+
+
+def test_compiled_filters_are_memoised_only_for_sources_with_filtered_routes():
+    zones = {
+        **PATCH_ZONES,
+        "portable": {"include": ["udpsec:pi", "udp:roof"]},
+    }
+    table = _patch_table(zones, FILTERED_ROUTES)
+
+    assert table.match_target_ids("udp:roof") == (0, 1, 2)
+    assert table.match_target_filter("udp:roof") == TargetFilter(
+        clauses=(
+            (table.route_definitions[0].filter, (0,)),
+            (None, (1,)),
+            (table.route_definitions[2].filter, (2, 0)),
+        )
+    )
+    assert table.match_target_ids("udpsec:pi") == (2, 0)
+    assert table.match_target_filter("udp:unknown") is None
+    assert _patch_table().match_target_filter("udp:roof") is None
+
+
+def test_descriptive_match_ignores_route_filters():
+    table = _patch_table(routes=FILTERED_ROUTES)
+
+    assert table.match("udp:mast").route_names == ("positions_to_a", "fixed_to_b")
+
+
+def test_patch_keeps_route_filters_and_recomputes_filter_memo():
+    table = _patch_table(routes=FILTERED_ROUTES)
+
+    patched = table.apply_patch(
+        load_routing_patch_operations(
+            [
+                {"op": "add_source", "zone": "portable", "source": "udp:mast"},
+                {"op": "remove_target", "route": "fixed_to_b", "target": "udp:b"},
+            ]
+        ),
+        PATCH_TARGET_ID_BY_NAME,
+    )
+    expected = _patch_table(
+        {**PATCH_ZONES, "portable": {"include": ["udpsec:pi", "udp:mast"]}},
+        [
+            FILTERED_ROUTES[0],
+            {"name": "fixed_to_b", "from_zone": "fixed", "to": []},
+            FILTERED_ROUTES[2],
+        ],
+    )
+
+    assert patched.route_definitions == expected.route_definitions
+    for source_id in ("udp:roof", "udp:mast", "udpsec:pi"):
+        assert patched.match_target_ids(source_id) == (
+            expected.match_target_ids(source_id)
+        )
+        assert patched.match_target_filter(source_id) == (
+            expected.match_target_filter(source_id)
+        )
+
+
+AREA_ROUTES = [
+    {
+        "name": "irish_sea_to_a",
+        "from_zone": "fixed",
+        "to": ["udp:a"],
+        "filter": {"areas": [{"bbox": [-6, 53, -4, 55]}]},
+    },
+    {
+        "name": "irish_sea_statics_to_b",
+        "from_zone": "portable",
+        "to": ["udp:b"],
+        "filter": {
+            "message_types": [5],
+            "areas": [{"bbox": [-6, 53, -4, 55]}],
+        },
+    },
+]
+
+
+def test_route_areas_share_one_index_and_vessel_positions_per_table():
+    table = _patch_table(routes=AREA_ROUTES)
+    roof_filter = table.match_target_filter("udp:roof")
+    pi_filter = table.match_target_filter("udpsec:pi")
+
+    assert roof_filter.geo_index is pi_filter.geo_index
+    assert roof_filter.geo_index.areas == (
+        table.route_definitions[0].filter.areas
+    )
+    assert roof_filter.positions is pi_filter.positions
+    assert _patch_table().match_target_filter("udp:roof") is None
+
+
+def test_patch_reuses_the_area_index_and_vessel_positions():
+    table = _patch_table(routes=AREA_ROUTES)
+
+    patched = table.apply_patch(
+        load_routing_patch_operations(
+            [{"op": "add_source", "zone": "portable", "source": "udp:mast"}]
+        ),
+        PATCH_TARGET_ID_BY_NAME,
+    )
+
+    assert patched.match_target_ids("udp:mast") == (0, 1)
+    patched_filter = patched.match_target_filter("udp:mast")
+    original_filter = table.match_target_filter("udp:roof")
+    assert patched_filter.geo_index is original_filter.geo_index
+    assert patched_filter.positions is original_filter.positions
@@ -421,3 +421,64 @@ def test_independent_routing_states_remain_independent():
 
     assert first.replace_from_config(routing_section()).generation == 1
     assert second.status().generation == 0
+
+
+def add_source_operation(source="udp:extra"):
+    return {"op": "add_source", "zone": "source", "source": source}
+
+
+def test_patch_installs_incremental_change_with_next_generation():
+    state = RoutingState()
+    service = RoutingControlService(state, TARGET_ID_BY_NAME)
+    service.replace_from_config(routing_section())
+
+    status = service.patch(
+        [
+            add_source_operation(),
+            {"op": "add_target", "route": "source_to_a", "target": "udp:b"},
+        ],
+        expected_generation=1,
+    )
+
+    assert status.generation == 2
+    assert status.target_ids == ("udp:a", "udp:b")
+    assert state.snapshot().table.match_target_ids("udp:extra") == (0, 1)
+    assert state.snapshot().table.match_target_ids("udp:source") == (0, 1)
+
+
+def test_stale_patch_does_not_install_candidate():
+    state = RoutingState()
+    service = RoutingControlService(state, TARGET_ID_BY_NAME)
+    service.replace_from_config(routing_section())
+
+    with pytest.raises(StaleRoutingGenerationError):
+        service.patch([add_source_operation()], expected_generation=0)
+
+    assert state.snapshot().generation == 1
+    assert state.snapshot().table.match_target_ids("udp:extra") == ()
+
+
+@pytest.mark.parametrize(
+    "operations",
+    [
+        [],
+        [{"op": "add_source", "zone": "missing", "source": "udp:extra"}],
+        [{"op": "add_target", "route": "source_to_a", "target": "udp:z"}],
+    ],
+)
+def test_invalid_patch_is_wrapped_and_not_installed(operations):
+    state = RoutingState()
+    service = RoutingControlService(state, TARGET_ID_BY_NAME)
+    service.replace_from_config(routing_section())
+
+    with pytest.raises(RoutingCandidateConfigError):
+        service.patch(operations)
+
+    assert state.snapshot().generation == 1
+
+
+def test_patch_requires_enabled_routing():
+    service = RoutingControlService(RoutingState(), TARGET_ID_BY_NAME)
+
+    with pytest.raises(RoutingCandidateConfigError, match="disabled"):
+        service.patch([add_source_operation()])
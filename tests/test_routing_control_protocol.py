@@ -3,12 +3,17 @@ import json
 import pytest
 
 from core.metrics import (
+    AnomalyMetricsSnapshot,
     EgressMetricsSnapshot,
+    EgressTargetQueueMetricsSnapshot,
+    EmissionThrottleMetricsSnapshot,
     InputTrafficMetricsSnapshot,
     OutputTrafficMetricsSnapshot,
     ProcessorMetricsSnapshot,
     QueueMetricsSnapshot,
     RuntimeStatisticsSnapshot,
+    TcpClientMetricsSnapshot,
+    TcpServerMetricsSnapshot,
 )
 from core.routing_control import (
     RoutingCandidateConfigError,
@@ -22,9 +27,14 @@ from core.routing_control_protocol import (
     ERROR_STALE_GENERATION,
     ERROR_UNKNOWN_METHOD,
     ERROR_UNSUPPORTED_VERSION,
+    ERROR_VESSEL_TABLE_DISABLED,
     METHOD_RUNTIME_STATISTICS,
+    METHOD_RUNTIME_STATISTICS_ANOMALIES,
+    METHOD_RUNTIME_STATISTICS_CLIENTS,
     METHOD_RUNTIME_STATISTICS_INPUTS,
     METHOD_RUNTIME_STATISTICS_OUTPUTS,
+    METHOD_VESSELS_GET,
+    METHOD_VESSELS_QUERY,
     ROUTING_CONTROL_PROTOCOL_VERSION,
     RoutingControlProtocol,
     build_error_response,
@@ -33,6 +43,7 @@ from core.routing_control_protocol import (
 )
 from core.routing_state import RoutingState
 from core.runtime_routing import compile_routing_section
+from core.vessel_table import VesselTable
 
 
 TARGET_ID_BY_NAME = {
@@ -81,6 +92,7 @@ def zero_runtime_statistics_snapshot():
             reset_completed=0,
             reset_failed=0,
             reset_in_flight=0,
+            gid_pool_refills=0,
         ),
         egress_queue=queue_metrics("egress", capacity=1),
         egress_operations=EgressMetricsSnapshot(
@@ -99,15 +111,34 @@ def zero_runtime_statistics_snapshot():
 
 
 class RecordingStatisticsSource:
-    def __init__(self, snapshot=None, *, inputs=(), outputs=()):
+    def __init__(
+        self,
+        snapshot=None,
+        *,
+        inputs=(),
+        outputs=(),
+        target_queues=(),
+        tcp_servers=(),
+        emission_throttle=(),
+        vessels=None,
+        anomalies=None,
+    ):
+        self._vessels = vessels
+        self._anomalies = anomalies
         self._snapshot = (
             zero_runtime_statistics_snapshot() if snapshot is None else snapshot
         )
         self._inputs = tuple(inputs)
         self._outputs = tuple(outputs)
+        self._target_queues = tuple(target_queues)
+        self._tcp_servers = tuple(tcp_servers)
+        self._emission_throttle = tuple(emission_throttle)
         self.snapshot_calls = 0
         self.input_traffic_snapshot_calls = 0
         self.output_traffic_snapshot_calls = 0
+        self.target_queue_snapshot_calls = 0
+        self.tcp_server_snapshot_calls = 0
+        self.emission_throttle_snapshot_calls = 0
 
     def snapshot(self):
         self.snapshot_calls += 1
@@ -121,6 +152,24 @@ class RecordingStatisticsSource:
         self.output_traffic_snapshot_calls += 1
         return self._outputs
 
+    def target_queue_snapshot(self):
+        self.target_queue_snapshot_calls += 1
+        return self._target_queues
+
+    def tcp_server_snapshot(self):
+        self.tcp_server_snapshot_calls += 1
+        return self._tcp_servers
+
+    def emission_throttle_snapshot(self):
+        self.emission_throttle_snapshot_calls += 1
+        return self._emission_throttle
+
+    def vessel_table(self):
+        return self._vessels
+
+    def anomaly_snapshot(self):
+        return self._anomalies
+
 
 def routing_section(routes=None, zones=None):
     return {
@@ -197,6 +246,21 @@ def runtime_statistics_outputs_request(request_id="req-1", params=None):
     return request
 
 
+def runtime_statistics_clients_request(request_id="req-1", params=None):
+    request = runtime_statistics_outputs_request(request_id, params)
+    request["method"] = METHOD_RUNTIME_STATISTICS_CLIENTS
+    return request
+
+
+def vessels_request(method, params, request_id="req-1"):
+    return {
+        "version": ROUTING_CONTROL_PROTOCOL_VERSION,
+        "request_id": request_id,
+        "method": method,
+        "params": params,
+    }
+
+
 def replace_request(request_id="req-1", section=None, expected_generation=None):
     params = {"routing": section or routing_section()}
     if expected_generation is not None:
@@ -209,6 +273,21 @@ def replace_request(request_id="req-1", section=None, expected_generation=None):
     }
 
 
+def patch_request(request_id="req-1", operations=None, expected_generation=None):
+    params = {
+        "operations": operations
+        or [{"op": "add_source", "zone": "source", "source": "udp:extra"}]
+    }
+    if expected_generation is not None:
+        params["expected_generation"] = expected_generation
+    return {
+        "version": ROUTING_CONTROL_PROTOCOL_VERSION,
+        "request_id": request_id,
+        "method": "routing.patch",
+        "params": params,
+    }
+
+
 def disable_request(request_id="req-1", expected_generation=None):
     request = {
         "version": ROUTING_CONTROL_PROTOCOL_VERSION,
@@ -305,6 +384,7 @@ def test_runtime_statistics_serializes_exact_all_zero_result_and_calls_once():
                 "reset_completed": 0,
                 "reset_failed": 0,
                 "reset_in_flight": 0,
+                "gid_pool_refills": 0,
             },
             "egress_queue": {
                 "name": "egress",
@@ -377,6 +457,7 @@ def test_runtime_statistics_serializes_populated_snapshot_in_ingress_order():
             reset_completed=2,
             reset_failed=1,
             reset_in_flight=1,
+            gid_pool_refills=3,
         ),
         egress_queue=queue_metrics(
             "egress",
@@ -456,6 +537,7 @@ def test_runtime_statistics_serializes_populated_snapshot_in_ingress_order():
                 "reset_completed": 2,
                 "reset_failed": 1,
                 "reset_in_flight": 1,
+                "gid_pool_refills": 3,
             },
             "egress_queue": {
                 "name": "egress",
@@ -614,7 +696,9 @@ def test_runtime_statistics_inputs_accepts_empty_params_object():
 def test_runtime_statistics_outputs_serializes_ordered_snapshots_and_calls_once():
     statistics = RecordingStatisticsSource(
         outputs=(
-            OutputTrafficMetricsSnapshot(0, None, 10, 10, 0, 10, 900),
+            OutputTrafficMetricsSnapshot(
+                0, None, 10, 10, 0, 10, 900, *(0,) * 13
+            ),
             OutputTrafficMetricsSnapshot(
                 1,
                 "udp:aishub",
@@ -623,8 +707,40 @@ def test_runtime_statistics_outputs_serializes_ordered_snapshots_and_calls_once(
                 1,
                 24,
                 2160,
+                180,
+                0,
+                1,
+                4,
+                0,
+                0,
+                1,
+                1250,
+                0,
+                0,
+                0,
+                0,
+                0,
             ),
-        )
+        ),
+        target_queues=(
+            EgressTargetQueueMetricsSnapshot(
+                target_id=1,
+                overflow_policy="drop_oldest",
+                capacity=1024,
+                depth=3,
+                peak_depth=40,
+                enqueued=27,
+                dequeued=24,
+                dropped=2,
+                put_waits=0,
+                sent_messages=24,
+                sent_datagrams=8,
+                shaped=0,
+            ),
+        ),
+        emission_throttle=(
+            EmissionThrottleMetricsSnapshot(target_id=1, suppressed=7),
+        ),
     )
     _state, protocol = make_protocol(statistics=statistics)
 
@@ -633,6 +749,8 @@ def test_runtime_statistics_outputs_serializes_ordered_snapshots_and_calls_once(
     )
 
     assert statistics.output_traffic_snapshot_calls == 1
+    assert statistics.target_queue_snapshot_calls == 1
+    assert statistics.emission_throttle_snapshot_calls == 1
     assert statistics.snapshot_calls == 0
     assert statistics.input_traffic_snapshot_calls == 0
     assert response == {
@@ -649,6 +767,21 @@ def test_runtime_statistics_outputs_serializes_ordered_snapshots_and_calls_once(
                     "dispatch_failed": 0,
                     "messages": 10,
                     "bytes": 900,
+                    "buffered_bytes": 0,
+                    "buffer_drops": 0,
+                    "write_pauses": 0,
+                    "resolutions": 0,
+                    "resolve_failures": 0,
+                    "transport_failures": 0,
+                    "address_changes": 0,
+                    "resolve_latency_us": 0,
+                    "sink_bytes_written": 0,
+                    "sink_rotations": 0,
+                    "sink_write_errors": 0,
+                    "sink_dropped": 0,
+                    "sink_lag_us": 0,
+                    "queue": None,
+                    "throttled": None,
                 },
                 {
                     "target_id": 1,
@@ -658,6 +791,33 @@ def test_runtime_statistics_outputs_serializes_ordered_snapshots_and_calls_once(
                     "dispatch_failed": 1,
                     "messages": 24,
                     "bytes": 2160,
+                    "buffered_bytes": 180,
+                    "buffer_drops": 0,
+                    "write_pauses": 1,
+                    "resolutions": 4,
+                    "resolve_failures": 0,
+                    "transport_failures": 0,
+                    "address_changes": 1,
+                    "resolve_latency_us": 1250,
+                    "sink_bytes_written": 0,
+                    "sink_rotations": 0,
+                    "sink_write_errors": 0,
+                    "sink_dropped": 0,
+                    "sink_lag_us": 0,
+                    "queue": {
+                        "overflow_policy": "drop_oldest",
+                        "capacity": 1024,
+                        "depth": 3,
+                        "peak_depth": 40,
+                        "enqueued": 27,
+                        "dequeued": 24,
+                        "dropped": 2,
+                        "put_waits": 0,
+                        "sent_messages": 24,
+                        "sent_datagrams": 8,
+                        "shaped": 0,
+                    },
+                    "throttled": 7,
                 },
             ]
         },
@@ -679,9 +839,11 @@ def test_runtime_statistics_outputs_filters_by_numeric_id_or_name(
 ):
     statistics = RecordingStatisticsSource(
         outputs=(
-            OutputTrafficMetricsSnapshot(0, None, 0, 0, 0, 0, 0),
             OutputTrafficMetricsSnapshot(
-                1, "udp:aishub", 1, 1, 0, 1, 90
+                0, None, *(0,) * 18
+            ),
+            OutputTrafficMetricsSnapshot(
+                1, "udp:aishub", 1, 1, 0, 1, 90, *(0,) * 13
             ),
         )
     )
@@ -722,6 +884,110 @@ def test_runtime_statistics_outputs_rejects_invalid_params_without_pulling(param
 
     assert_error(response, ERROR_INVALID_REQUEST)
     assert statistics.output_traffic_snapshot_calls == 0
+    assert statistics.target_queue_snapshot_calls == 0
+
+
+def _tcp_server_snapshot(target_id, name, clients=()):
+    return TcpServerMetricsSnapshot(
+        target_id=target_id,
+        name=name,
+        listen="127.0.0.1:10110",
+        accepted=len(clients) + 1,
+        rejected=0,
+        evicted=1,
+        clients=clients,
+    )
+
+
+def test_runtime_statistics_clients_serializes_servers_and_clients():
+    statistics = RecordingStatisticsSource(
+        tcp_servers=(
+            _tcp_server_snapshot(
+                2,
+                "tcp:partners",
+                (
+                    TcpClientMetricsSnapshot(
+                        client_id=7,
+                        peer="127.0.0.1:50000",
+                        bytes=512,
+                        buffered_bytes=64,
+                        lag_us=250,
+                    ),
+                ),
+            ),
+        )
+    )
+    _state, protocol = make_protocol(statistics=statistics)
+
+    response = protocol.handle_request(runtime_statistics_clients_request())
+
+    assert response["result"] == {
+        "servers": [
+            {
+                "target_id": 2,
+                "name": "tcp:partners",
+                "listen": "127.0.0.1:10110",
+                "accepted": 2,
+                "rejected": 0,
+                "evicted": 1,
+                "clients": [
+                    {
+                        "client_id": 7,
+                        "peer": "127.0.0.1:50000",
+                        "bytes": 512,
+                        "buffered_bytes": 64,
+                        "lag_us": 250,
+                    }
+                ],
+            }
+        ]
+    }
+    assert statistics.tcp_server_snapshot_calls == 1
+    assert statistics.output_traffic_snapshot_calls == 0
+
+
+@pytest.mark.parametrize(
+    ("params", "expected_target_ids"),
+    [
+        ({"target_id": 3}, [3]),
+        ({"name": "tcp:partners"}, [2]),
+        ({"name": "tcp:unknown"}, []),
+    ],
+)
+def test_runtime_statistics_clients_filters_like_outputs(
+    params,
+    expected_target_ids,
+):
+    statistics = RecordingStatisticsSource(
+        tcp_servers=(
+            _tcp_server_snapshot(2, "tcp:partners"),
+            _tcp_server_snapshot(3, None),
+        )
+    )
+    _state, protocol = make_protocol(statistics=statistics)
+
+    response = protocol.handle_request(
+        runtime_statistics_clients_request(params=params)
+    )
+
+    assert [
+        row["target_id"] for row in response["result"]["servers"]
+    ] == expected_target_ids
+
+
+def test_runtime_statistics_clients_rejects_invalid_params_without_pulling():
+    statistics = RecordingStatisticsSource()
+    _state, protocol = make_protocol(statistics=statistics)
+
+    response = protocol.handle_request(
+        runtime_statistics_clients_request(
+            params={"target_id": 1, "name": "tcp:partners"}
+        )
+    )
+
+    assert_error(response, ERROR_INVALID_REQUEST)
+    assert "runtime.statistics.clients" in response["error"]["message"]
+    assert statistics.tcp_server_snapshot_calls == 0
 
 
 def test_runtime_statistics_outputs_accepts_empty_params_object():
@@ -737,6 +1003,126 @@ def test_runtime_statistics_outputs_accepts_empty_params_object():
     assert statistics.output_traffic_snapshot_calls == 1
 
 
+def test_runtime_statistics_anomalies_returns_detector_counters():
+    statistics = RecordingStatisticsSource(
+        anomalies=AnomalyMetricsSnapshot(
+            checked=40,
+            speed=3,
+            teleport=2,
+            duplicate_mmsi=1,
+            out_of_range=0,
+            tracked_vessels=12,
+        )
+    )
+    _state, protocol = make_protocol(statistics=statistics)
+    request = runtime_statistics_request()
+    request["method"] = METHOD_RUNTIME_STATISTICS_ANOMALIES
+
+    response = protocol.handle_request(request)
+
+    assert response["result"] == {
+        "anomalies": {
+            "checked": 40,
+            "speed": 3,
+            "teleport": 2,
+            "duplicate_mmsi": 1,
+            "out_of_range": 0,
+            "tracked_vessels": 12,
+        }
+    }
+
+
+def test_runtime_statistics_anomalies_reports_a_disabled_detector():
+    _state, protocol = make_protocol()
+    request = runtime_statistics_request()
+    request["method"] = METHOD_RUNTIME_STATISTICS_ANOMALIES
+
+    assert protocol.handle_request(request)["result"] == {"anomalies": None}
+
+    request["params"] = {}
+    assert_error(protocol.handle_request(request), ERROR_INVALID_REQUEST)
+
+
+def test_vessel_methods_query_the_provider_vessel_table():
+    vessels = VesselTable(clock=lambda: 1000.0)
+    vessels.update(477553000, 10.5, 50.25, 12.3, 45.0, 999.5, 1, "udp:roof")
+    vessels.update(338087471, 11.5, 50.25, None, None, 999.0, 18, "udp:roof")
+    _state, protocol = make_protocol(
+        statistics=RecordingStatisticsSource(vessels=vessels)
+    )
+
+    found = protocol.handle_request(
+        vessels_request(METHOD_VESSELS_GET, {"mmsi": 477553000})
+    )
+    missing = protocol.handle_request(
+        vessels_request(METHOD_VESSELS_GET, {"mmsi": 1})
+    )
+    query = protocol.handle_request(
+        vessels_request(
+            METHOD_VESSELS_QUERY,
+            {"bbox": [10, 50, 12, 51], "limit": 1},
+        )
+    )
+
+    assert found["result"] == {
+        "vessel": {
+            "mmsi": 477553000,
+            "lon": 10.5,
+            "lat": 50.25,
+            "sog": 12.3,
+            "cog": 45.0,
+            "timestamp": 999.5,
+            "message_type": 1,
+            "source_id": "udp:roof",
+        }
+    }
+    assert missing["result"] == {"vessel": None}
+    assert len(query["result"]["vessels"]) == 1
+    assert query["result"]["truncated"] is True
+
+
+def test_vessel_methods_report_a_disabled_table():
+    _state, protocol = make_protocol()
+
+    response = protocol.handle_request(
+        vessels_request(METHOD_VESSELS_GET, {"mmsi": 477553000})
+    )
+
+    assert_error(response, ERROR_VESSEL_TABLE_DISABLED)
+
+
+@pytest.mark.parametrize(
+    ("method", "params"),
+    [
+        (METHOD_VESSELS_GET, None),
+        (METHOD_VESSELS_GET, {}),
+        (METHOD_VESSELS_GET, {"mmsi": "477553000"}),
+        (METHOD_VESSELS_GET, {"mmsi": True}),
+        (METHOD_VESSELS_GET, {"mmsi": 1_000_000_000}),
+        (METHOD_VESSELS_GET, {"mmsi": 1, "limit": 1}),
+        (METHOD_VESSELS_QUERY, {}),
+        (METHOD_VESSELS_QUERY, {"bbox": [0, 0, 1]}),
+        (METHOD_VESSELS_QUERY, {"bbox": [0, 0, 1, "1"]}),
+        (METHOD_VESSELS_QUERY, {"bbox": [1, 0, 0, 1]}),
+        (METHOD_VESSELS_QUERY, {"bbox": [0, 0, 1, 91]}),
+        (METHOD_VESSELS_QUERY, {"bbox": [0, 0, 1, 1], "limit": 0}),
+        (METHOD_VESSELS_QUERY, {"bbox": [0, 0, 1, 1], "limit": 1001}),
+    ],
+)
+def test_vessel_methods_reject_invalid_params(method, params):
+    vessels = VesselTable()
+    _state, protocol = make_protocol(
+        statistics=RecordingStatisticsSource(vessels=vessels)
+    )
+    request = vessels_request(method, params)
+    if params is None:
+        del request["params"]
+
+    response = protocol.handle_request(request)
+
+    assert_error(response, ERROR_INVALID_REQUEST)
+
+
 def test_routing_methods_do_not_pull_runtime_statistics():
     statistics = RecordingStatisticsSource()
     _state, protocol = make_protocol(statistics=statistics)
@@ -751,6 +1137,7 @@ def test_routing_methods_do_not_pull_runtime_statistics():
     assert statistics.snapshot_calls == 0
     assert statistics.input_traffic_snapshot_calls == 0
     assert statistics.output_traffic_snapshot_calls == 0
+    assert statistics.target_queue_snapshot_calls == 0
 
 
 @pytest.mark.parametrize(
@@ -1303,3 +1690,58 @@ def test_success_response_contains_no_python_only_objects():
         isinstance(target_id, str)
         for target_id in response["result"]["target_ids"]
     )
+
+
+def test_valid_patch_request_installs_incremental_change():
+    state, protocol = make_protocol(routing_section())
+
+    response = protocol.handle_request(patch_request(expected_generation=0))
+
+    assert response["ok"] is True
+    assert response["result"]["generation"] == 1
+    assert state.snapshot().table.match_target_ids("udp:extra") == (0,)
+
+
+def test_stale_patch_returns_stale_generation():
+    _state, protocol = make_protocol(routing_section())
+
+    response = protocol.handle_request(patch_request(expected_generation=3))
+
+    assert_error(response, ERROR_STALE_GENERATION)
+    assert response["error"]["actual_generation"] == 0
+
+
+def test_invalid_patch_operation_returns_invalid_routing_config():
+    state, protocol = make_protocol(routing_section())
+
+    response = protocol.handle_request(
+        patch_request(
+            operations=[{"op": "remove_source", "zone": "source", "source": "udp:x"}]
+        )
+    )
+
+    assert_error(response, ERROR_INVALID_ROUTING_CONFIG)
+    assert state.snapshot().generation == 0
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        None,
+        [],
+        {},
+        {"operations": []},
+        {"operations": {"op": "add_source"}},
+        {"operations": [{}], "routing": {}},
+        {"operations": [{}], "expected_generation": -1},
+    ],
+)
+def test_invalid_patch_params_are_rejected(params):
+    _state, protocol = make_protocol(routing_section())
+    request = patch_request()
+    if params is None:
+        del request["params"]
+    else:
+        request["params"] = params
+
+    assert_error(protocol.handle_request(request), ERROR_INVALID_REQUEST)
@@ -259,3 +259,12 @@ def test_independent_routing_state_instances_do_not_share_state():
     assert second_snapshot.generation == 1
     assert first_state.snapshot().table is first_table
     assert second_state.snapshot().table is second_table
+
+
+def test_snapshot_reads_do_not_take_the_replacement_lock():
+    state = RoutingState(make_table())
+
+    with state._lock:
+        snapshot = state.snapshot()
+
+    assert snapshot.generation == 0
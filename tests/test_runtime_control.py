@@ -7,6 +7,7 @@ import pytest
 import aismixer
 from assembler import AIVDMAssembler
 from core.data_plane import DeduplicationMode
+from core.egress_targets import PerTargetEgressDispatcher
 from core.event import IngressEvent
 from core.metrics import EgressMetricsSnapshot, QueueMetricsSnapshot
 from core.python_data_plane import PythonDataPlaneProcessor
@@ -356,10 +357,18 @@ async def run_aismixer_main(
         all_target_ids = (0,)
         target_id_by_name = {"udp:a": 0}
         target_ids = ("udp:a",)
+        targets = ({"host": "127.0.0.1", "port": 1, "id": "a"},)
 
         def __init__(self):
+            self.start_count = 0
             self.close_count = 0
 
+        async def start(self):
+            self.start_count += 1
+
+        async def run_resolver(self):
+            pass
+
         def close(self):
             self.close_count += 1
 
@@ -438,10 +447,13 @@ def test_disabled_control_runtime_does_not_start_server(monkeypatch):
         "ingress-fan-in",
         "processor-stage",
         "egress-stage",
+        "egress-targets",
+        "forwarder-resolver",
     )
     fan_in_factory = specs["ingress-fan-in"].coroutine_factory
     processor_factory = specs["processor-stage"].coroutine_factory
     egress_factory = specs["egress-stage"].coroutine_factory
+    targets_factory = specs["egress-targets"].coroutine_factory
     processing_queue = fan_in_factory.args[1]
     assert fan_in_factory.args[0] == ()
     assert fan_in_factory.keywords == {
@@ -460,9 +472,14 @@ def test_disabled_control_runtime_does_not_start_server(monkeypatch):
     assert processor_factory.args[0] is processing_queue
     assert processor_factory.keywords == {
         "processor": result["processor"],
+        "max_inflight_batches": aismixer.DEFAULT_EGRESS_INFLIGHT_BATCHES,
     }
     assert result["processor_factory_calls"] == [None]
-    assert egress_factory.args[1] is result["forwarder"]
+    egress_dispatcher = egress_factory.args[1]
+    assert isinstance(egress_dispatcher, PerTargetEgressDispatcher)
+    assert egress_dispatcher.all_target_ids == result["forwarder"].all_target_ids
+    assert targets_factory.func is aismixer.egress_target_workers_loop
+    assert targets_factory.args == (egress_dispatcher,)
     egress_metrics = egress_factory.keywords["metrics"]
     assert isinstance(egress_metrics, aismixer._EgressMetrics)
     assert egress_metrics.metrics_snapshot() == empty_egress_metrics()
@@ -486,6 +503,8 @@ def test_disabled_control_runtime_does_not_start_server(monkeypatch):
     assert statistics.egress_operations is egress_metrics
     assert statistics.input_traffic == ()
     assert statistics.output_traffic is result["forwarder"]
+    assert statistics.target_queues is egress_dispatcher
+    assert result["forwarder"].start_count == 1
     assert result["forwarder_close_count"] == 1
 
 
@@ -580,10 +599,18 @@ class _MainTestForwarder:
     all_target_ids = (0,)
     target_id_by_name = {"udp:target": 0}
     target_ids = ("udp:target",)
+    targets = ({"host": "127.0.0.1", "port": 1, "id": "target"},)
 
     def __init__(self):
+        self.start_count = 0
         self.close_count = 0
 
+    async def start(self):
+        self.start_count += 1
+
+    async def run_resolver(self):
+        pass
+
     def close(self):
         self.close_count += 1
 
@@ -695,6 +722,8 @@ def test_main_hands_every_essential_role_to_one_runtime_supervisor(monkeypatch):
             "ingress-fan-in",
             "processor-stage",
             "egress-stage",
+            "egress-targets",
+            "forwarder-resolver",
         ]
 
         secure_factories = tuple(
@@ -706,6 +735,8 @@ def test_main_hands_every_essential_role_to_one_runtime_supervisor(monkeypatch):
         fan_in_factory = specs[4].coroutine_factory
         processor_factory = specs[5].coroutine_factory
         egress_factory = specs[6].coroutine_factory
+        targets_factory = specs[7].coroutine_factory
+        assert targets_factory.func is aismixer.egress_target_workers_loop
 
         assert all(
             factory.func is aismixer.secure_server
@@ -797,9 +828,12 @@ def test_main_hands_every_essential_role_to_one_runtime_supervisor(monkeypatch):
         assert processor_factory.args[0] is processing_queue
         assert processor_factory.keywords == {
             "processor": processor,
+            "max_inflight_batches": aismixer.DEFAULT_EGRESS_INFLIGHT_BATCHES,
         }
         assert egress_factory.func is aismixer.egress_stage_loop
-        assert egress_factory.args[1] is output_forwarder
+        egress_dispatcher = egress_factory.args[1]
+        assert isinstance(egress_dispatcher, PerTargetEgressDispatcher)
+        assert egress_dispatcher.all_target_ids == output_forwarder.all_target_ids
         egress_queue = egress_factory.args[0]
         assert processor_factory.args[1] is egress_queue
         assert isinstance(egress_queue, aismixer._ObservedQueue)
@@ -830,6 +864,7 @@ def test_main_hands_every_essential_role_to_one_runtime_supervisor(monkeypatch):
         assert statistics.input_traffic == input_traffic
         assert statistics.input_traffic_snapshot() == traffic_snapshots
         assert statistics.output_traffic is output_forwarder
+        assert statistics.target_queues is egress_dispatcher
         assert first_udp_socket.close_count == 1
         assert second_udp_socket.close_count == 1
         assert output_forwarder.close_count == 1
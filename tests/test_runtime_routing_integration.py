@@ -39,6 +39,12 @@ class _FakeTransport:
         self.sent.append(data)
         self.loop.sends.append((self.remote_addr, data, self))
 
+    def get_write_buffer_size(self):
+        return 0
+
+    def set_write_buffer_limits(self, high=None, low=None):
+        pass
+
     def close(self):
         self.closed = True
 
@@ -280,6 +286,80 @@ def test_legacy_broadcast_sends_exact_same_datagram_object_to_all_destinations(
     assert all(payload is payloads[0] for payload in payloads)
 
 
+def test_routed_udp_applies_message_type_route_filters(monkeypatch):
+    # SENTENCE is a type 1 position report.
+    table = RoutingTable.from_definitions(
+        {"source_a": {"include": ["udp:source_a"]}},
+        [
+            {
+                "name": "statics_to_target_a",
+                "from_zone": "source_a",
+                "to": ["udp:target_a"],
+                "filter": {"message_types": [5, 24]},
+            },
+            {
+                "name": "positions_to_target_b",
+                "from_zone": "source_a",
+                "to": ["udp:target_b"],
+                "filter": {"message_types": [1, 2, 3]},
+            },
+        ],
+    )
+    fake_loop = real_asyncio.run(
+        run_routed_events(
+            monkeypatch,
+            split_targets_forwarders(),
+            table,
+            [make_event("udp:source_a")],
+            expected_datagrams=1,
+        )
+    )
+
+    by_addr = datagrams_by_addr(fake_loop)
+
+    assert TARGET_A_ADDR not in by_addr
+    assert by_addr[TARGET_B_ADDR] == [EXPECTED_DATAGRAM]
+
+
+def test_routed_udp_applies_route_area_filters(monkeypatch):
+    # SENTENCE reports a position at about 122.35 W on the equator.
+    table = RoutingTable.from_definitions(
+        {"source_a": {"include": ["udp:source_a"]}},
+        [
+            {
+                "name": "north_pacific_to_target_a",
+                "from_zone": "source_a",
+                "to": ["udp:target_a"],
+                "filter": {"areas": [{"bbox": [-180, 1, -100, 60]}]},
+            },
+            {
+                "name": "equator_to_target_b",
+                "from_zone": "source_a",
+                "to": ["udp:target_b"],
+                "filter": {
+                    "areas": [
+                        {"polygon": [[-123, -1], [-122, -1], [-122.5, 1]]},
+                    ],
+                },
+            },
+        ],
+    )
+    fake_loop = real_asyncio.run(
+        run_routed_events(
+            monkeypatch,
+            split_targets_forwarders(),
+            table,
+            [make_event("udp:source_a")],
+            expected_datagrams=1,
+        )
+    )
+
+    by_addr = datagrams_by_addr(fake_loop)
+
+    assert TARGET_A_ADDR not in by_addr
+    assert by_addr[TARGET_B_ADDR] == [EXPECTED_DATAGRAM]
+
+
 def test_routed_udp_no_route_sends_no_datagram_and_task_stays_running(monkeypatch):
     fake_loop = real_asyncio.run(
         run_routed_events(
@@ -11,10 +11,16 @@ from core.data_plane import (
     ProcessingWorkItem,
     ProcessorOutput,
 )
+from core.egress_targets import (
+    PerTargetEgressDispatcher,
+    load_target_queue_settings,
+)
 from core.ingress_frame import IngressFrame
+from core.output_builder import OutputProfile
 from core.python_data_plane import PythonDataPlaneProcessor
 from core.routing import RoutingTable
 from core.routing_state import RoutingSnapshot, RoutingState
+from forwarder import Forwarder
 
 
 def make_frame(label):
@@ -137,6 +143,9 @@ class RecordingNumericRoutingTable:
         self.source_ids.append(source_id)
         return self.target_ids
 
+    def match_target_filter(self, _source_id):
+        return None
+
     def match(self, _source_id):
         raise AssertionError("descriptive routing matcher was called")
 
@@ -275,6 +284,16 @@ def test_processor_factory_uses_current_runtime_configuration(monkeypatch):
     monkeypatch.setattr(aismixer, "G_PRESERVE_INGRESS_GID", False)
     monkeypatch.setattr(aismixer, "G_ALWAYS_TAG_SINGLE", True)
     monkeypatch.setattr(aismixer, "G_ID_DIGITS", 6)
+    monkeypatch.setattr(
+        aismixer,
+        "forwarder",
+        Forwarder(
+            [
+                {"host": "127.0.0.1", "port": 10110},
+                {"host": "127.0.0.1", "port": 10111, "output_profile": "bare"},
+            ]
+        ),
+    )
 
     assert aismixer.create_data_plane_processor() is processor
     assert constructor_calls == [
@@ -284,6 +303,10 @@ def test_processor_factory_uses_current_runtime_configuration(monkeypatch):
             "preserve_ingress_gid": False,
             "always_tag_single": True,
             "gid_digits": 6,
+            "target_profiles": (OutputProfile.FULL, OutputProfile.BARE),
+            "vessel_table": None,
+            "anomaly_detector": None,
+            "emission_throttle": None,
         }
     ]
 
@@ -361,10 +384,15 @@ def test_processor_stage_signature_has_no_routing_dependencies():
         "processing_queue",
         "egress_queue",
         "processor",
+        "max_inflight_batches",
     )
     assert signature.parameters["processor"].kind is (
         inspect.Parameter.KEYWORD_ONLY
     )
+    assert signature.parameters["max_inflight_batches"].kind is (
+        inspect.Parameter.KEYWORD_ONLY
+    )
+    assert signature.parameters["max_inflight_batches"].default == 1
     source = inspect.getsource(aismixer.processor_stage_loop)
     for forbidden_operation in (
         "coerce_ingress_frame",
@@ -1363,10 +1391,27 @@ def test_main_constructs_one_processor_and_wires_runtime_stages(
             target_ids = ("udp:target",)
             target_id_by_name = {"udp:target": 1}
             all_target_ids = (0, 1)
+            targets = (
+                {"host": "127.0.0.1", "port": 10110},
+                {
+                    "host": "127.0.0.1",
+                    "port": 10111,
+                    "id": "target",
+                    "queue_maxsize": 8,
+                    "queue_overflow": "block",
+                },
+            )
 
             def __init__(self):
+                self.start_count = 0
                 self.close_calls = 0
 
+            async def start(self):
+                self.start_count += 1
+
+            async def run_resolver(self):
+                pass
+
             def close(self):
                 self.close_calls += 1
 
@@ -1427,6 +1472,7 @@ def test_main_constructs_one_processor_and_wires_runtime_stages(
         await aismixer.main()
 
         assert processor_factory_calls == [None]
+        assert output_forwarder.start_count == 1
         assert len(metrics_instances) == 1
         assert len(builder_calls) == 1
         assert builder_calls[0][:3] == (
@@ -1440,6 +1486,8 @@ def test_main_constructs_one_processor_and_wires_runtime_stages(
             "ingress-fan-in",
             "processor-stage",
             "egress-stage",
+            "egress-targets",
+            "forwarder-resolver",
         )
 
         fan_in_factory = specs["ingress-fan-in"].coroutine_factory
@@ -1458,7 +1506,22 @@ def test_main_constructs_one_processor_and_wires_runtime_stages(
         assert statistics.egress_queue is egress_queue
         assert statistics.egress_operations is metrics_instances[0]
         assert egress_factory.func is aismixer.egress_stage_loop
-        assert egress_factory.args == (egress_queue, output_forwarder)
+        assert egress_factory.args[0] is egress_queue
+        egress_dispatcher = egress_factory.args[1]
+        assert isinstance(egress_dispatcher, PerTargetEgressDispatcher)
+        assert egress_dispatcher.all_target_ids == (0, 1)
+        assert [
+            (queue.capacity, queue.overflow_policy)
+            for queue in egress_dispatcher.target_queue_snapshot()
+        ] == [(1024, "drop_oldest"), (8, "block")]
+        assert statistics.target_queues is egress_dispatcher
+        targets_factory = specs["egress-targets"].coroutine_factory
+        assert targets_factory.func is aismixer.egress_target_workers_loop
+        assert targets_factory.args == (egress_dispatcher,)
+        assert (
+            specs["forwarder-resolver"].coroutine_factory
+            == output_forwarder.run_resolver
+        )
         assert isinstance(
             processing_queue,
             aismixer._BoundedProcessingQueue,
@@ -1477,7 +1540,10 @@ def test_main_constructs_one_processor_and_wires_runtime_stages(
             "routing_state": state,
             "legacy_target_ids": (0, 1),
         }
-        assert processor_factory.keywords == {"processor": processor}
+        assert processor_factory.keywords == {
+            "processor": processor,
+            "max_inflight_batches": 1,
+        }
         assert egress_factory.keywords == {
             "debug": False,
             "timestamp": aismixer.ts,
@@ -1655,3 +1721,203 @@ def test_empty_target_ids_use_unified_numeric_dispatch_without_failure():
         assert forwarder.events == [("numeric", (), payload)]
 
     asyncio.run(scenario())
+
+
+def test_inflight_window_lets_processor_run_ahead_and_preserves_order():
+    async def scenario():
+        frames = tuple(
+            make_frame(label) for label in ("first", "second", "third")
+        )
+        second_call = asyncio.Event()
+        third_call = asyncio.Event()
+        processor = ScriptedProcessor(
+            *(output_batch(output(frame.source_id, 0)) for frame in frames)
+        )
+        processor.add_call_events(asyncio.Event(), second_call, third_call)
+        ingress_queue = asyncio.Queue()
+        for frame in frames:
+            await ingress_queue.put(frame)
+        egress_queue = RecordingEgressQueue()
+        forwarder = GatedForwarder()
+        task = asyncio.create_task(
+            aismixer._run_runtime_stages(
+                ingress_queue,
+                egress_queue,
+                processor=processor,
+                legacy_target_ids=(),
+                output_forwarder=forwarder,
+                egress_inflight_batches=2,
+            )
+        )
+        try:
+            await asyncio.wait_for(
+                forwarder.first_send_started.wait(),
+                timeout=1.0,
+            )
+            await asyncio.wait_for(second_call.wait(), timeout=1.0)
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+            # The second batch fills the window; the third frame waits for
+            # the first completion.
+            assert len(egress_queue.batches) == 2
+            assert not third_call.is_set()
+
+            forwarder.release_first_send.set()
+            await asyncio.wait_for(third_call.wait(), timeout=1.0)
+            while len(forwarder.events) < len(frames):
+                await asyncio.sleep(0)
+        finally:
+            await cancel_task(task)
+
+        assert [call[0] for call in processor.calls] == list(frames)
+        assert [event[2] for event in forwarder.events] == [
+            f"udp:{label}\r\n".encode("ascii")
+            for label in ("first", "second", "third")
+        ]
+
+    asyncio.run(scenario())
+
+
+def test_inflight_window_propagates_egress_failure_fail_fast():
+    async def scenario():
+        frames = tuple(
+            make_frame(label) for label in ("first", "second", "third")
+        )
+        processor = ScriptedProcessor(
+            *(output_batch(output(frame.source_id, 0)) for frame in frames)
+        )
+        ingress_queue = asyncio.Queue()
+        for frame in frames:
+            await ingress_queue.put(frame)
+        forwarder = FirstSendFailingForwarder()
+
+        with pytest.raises(RuntimeError, match="send failed"):
+            await aismixer._run_runtime_stages(
+                ingress_queue,
+                asyncio.Queue(maxsize=2),
+                processor=processor,
+                legacy_target_ids=(),
+                output_forwarder=forwarder,
+                egress_inflight_batches=2,
+            )
+
+        assert forwarder.events == [
+            ("numeric", (0,), b"udp:first\r\n")
+        ]
+        assert len(processor.calls) <= 2
+
+    asyncio.run(scenario())
+
+
+def test_processor_stage_reaps_completed_batches_and_cancels_pending():
+    async def scenario():
+        processing_queue = aismixer._BoundedProcessingQueue(4)
+        for label in ("first", "second"):
+            item = make_work_item(make_frame(label))
+            await processing_queue.admit(lambda item=item: item)
+        processor = ScriptedProcessor(
+            output_batch(output("first", 0)),
+            output_batch(output("second", 0)),
+        )
+        egress_queue = RecordingEgressQueue()
+        task = asyncio.create_task(
+            aismixer.processor_stage_loop(
+                processing_queue,
+                egress_queue,
+                processor=processor,
+                max_inflight_batches=3,
+            )
+        )
+        while len(egress_queue.batches) < 2:
+            await asyncio.sleep(0)
+        await cancel_task(task)
+
+        assert all(
+            batch.completion.cancelled() for batch in egress_queue.batches
+        )
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize(
+    ("max_inflight_batches", "error"),
+    ((0, ValueError), (True, TypeError), (1.5, TypeError)),
+)
+def test_processor_stage_rejects_invalid_inflight_window(
+    max_inflight_batches,
+    error,
+):
+    async def scenario():
+        with pytest.raises(error, match="max_inflight_batches"):
+            await aismixer.processor_stage_loop(
+                FiniteQueue(),
+                CompletingEgressQueue(),
+                processor=ScriptedProcessor(),
+                max_inflight_batches=max_inflight_batches,
+            )
+
+    asyncio.run(scenario())
+
+
+def test_main_rejects_invalid_egress_inflight_window(monkeypatch):
+    monkeypatch.setattr(aismixer, "EGRESS_INFLIGHT_BATCHES", 0)
+    monkeypatch.setattr(
+        aismixer,
+        "create_data_plane_processor",
+        lambda: pytest.fail("processor must not be created"),
+    )
+
+    with pytest.raises(ValueError, match="egress_inflight_batches"):
+        asyncio.run(aismixer.main())
+
+
+def test_egress_target_workers_loop_drains_every_target_queue():
+    async def scenario():
+        output_forwarder = RecordingForwarder()
+        dispatcher = PerTargetEgressDispatcher(
+            output_forwarder,
+            load_target_queue_settings(({}, {})),
+        )
+        await dispatcher.send_to_ids((1, 0), b"message")
+
+        task = asyncio.create_task(
+            aismixer.egress_target_workers_loop(dispatcher)
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)
+        await cancel_task(task)
+
+        assert sorted(output_forwarder.events) == [
+            ("numeric", (0,), b"message"),
+            ("numeric", (1,), b"message"),
+        ]
+
+    asyncio.run(scenario())
+
+
+def test_egress_target_worker_failure_fails_the_workers_loop():
+    async def scenario():
+        dispatcher = PerTargetEgressDispatcher(
+            FirstSendFailingForwarder(),
+            load_target_queue_settings(({},)),
+        )
+        await dispatcher.send_to_ids((0,), b"message")
+
+        with pytest.raises(RuntimeError, match="send failed"):
+            await aismixer.egress_target_workers_loop(dispatcher)
+
+    asyncio.run(scenario())
+
+
+def test_egress_target_workers_loop_without_targets_waits_for_cancellation():
+    async def scenario():
+        dispatcher = PerTargetEgressDispatcher(RecordingForwarder(), ())
+        task = asyncio.create_task(
+            aismixer.egress_target_workers_loop(dispatcher)
+        )
+        await asyncio.sleep(0)
+        assert not task.done()
+        await cancel_task(task)
+
+    asyncio.run(scenario())
@@ -4,12 +4,17 @@ import pytest
 
 import core.runtime_statistics as runtime_statistics_module
 from core.metrics import (
+    AnomalyMetricsSnapshot,
     EgressMetricsSnapshot,
+    EgressTargetQueueMetricsSnapshot,
+    EmissionThrottleMetricsSnapshot,
     InputTrafficMetricsSnapshot,
     OutputTrafficMetricsSnapshot,
     ProcessorMetricsSnapshot,
     QueueMetricsSnapshot,
     RuntimeStatisticsSnapshot,
+    TcpClientMetricsSnapshot,
+    TcpServerMetricsSnapshot,
 )
 from core.runtime_statistics import InputTrafficMetrics, RuntimeStatisticsProvider
 
@@ -22,6 +27,11 @@ PROVIDER_SOURCE_FIELDS = (
     "egress_operations",
     "input_traffic",
     "output_traffic",
+    "target_queues",
+    "tcp_servers",
+    "emission_throttle",
+    "vessels",
+    "anomalies",
 )
 
 
@@ -61,6 +71,7 @@ def processor_snapshot(*, completed=0):
         reset_completed=0,
         reset_failed=0,
         reset_in_flight=0,
+        gid_pool_refills=0,
     )
 
 
@@ -124,6 +135,26 @@ class FakeOutputTrafficSource:
         return tuple(replace(snapshot) for snapshot in self.current_snapshots)
 
 
+class FakeTargetQueueSource:
+    def __init__(self, snapshots):
+        self.current_snapshots = tuple(snapshots)
+        self.snapshot_calls = 0
+
+    def target_queue_snapshot(self):
+        self.snapshot_calls += 1
+        return tuple(replace(snapshot) for snapshot in self.current_snapshots)
+
+
+class FakeTcpServerSource:
+    def __init__(self, snapshots):
+        self.current_snapshots = tuple(snapshots)
+        self.snapshot_calls = 0
+
+    def tcp_server_snapshot(self):
+        self.snapshot_calls += 1
+        return tuple(replace(snapshot) for snapshot in self.current_snapshots)
+
+
 def input_traffic_snapshot(name, kind="udp", **overrides):
     values = {
         "name": name,
@@ -146,6 +177,19 @@ def output_traffic_snapshot(target_id, name, **overrides):
         "dispatch_failed": 0,
         "messages": 0,
         "bytes": 0,
+        "buffered_bytes": 0,
+        "buffer_drops": 0,
+        "write_pauses": 0,
+        "resolutions": 0,
+        "resolve_failures": 0,
+        "transport_failures": 0,
+        "address_changes": 0,
+        "resolve_latency_us": 0,
+        "sink_bytes_written": 0,
+        "sink_rotations": 0,
+        "sink_write_errors": 0,
+        "sink_dropped": 0,
+        "sink_lag_us": 0,
     }
     values.update(overrides)
     return OutputTrafficMetricsSnapshot(**values)
@@ -192,6 +236,8 @@ def make_provider(
     *,
     input_traffic=(),
     output_traffic=None,
+    target_queues=None,
+    tcp_servers=None,
 ):
     if ingress_queues is None:
         ingress_queues = (
@@ -206,6 +252,8 @@ def make_provider(
         sources["egress_operations"],
         input_traffic=input_traffic,
         output_traffic=output_traffic,
+        target_queues=target_queues,
+        tcp_servers=tcp_servers,
     )
 
 
@@ -456,6 +504,138 @@ def test_detailed_traffic_pulls_are_ordered_fresh_and_independent_of_stage_two()
     ]
 
 
+def test_provider_pulls_fresh_target_queue_snapshots_without_caching():
+    source = FakeTargetQueueSource(
+        (
+            EgressTargetQueueMetricsSnapshot(
+                target_id=0,
+                overflow_policy="drop_oldest",
+                capacity=4,
+                depth=1,
+                peak_depth=4,
+                enqueued=9,
+                dequeued=8,
+                dropped=3,
+                put_waits=0,
+                sent_messages=0,
+                sent_datagrams=0,
+                shaped=0,
+            ),
+        )
+    )
+    provider = make_provider(make_sources(), target_queues=source)
+
+    first = provider.target_queue_snapshot()
+    second = provider.target_queue_snapshot()
+
+    assert first == second
+    assert first[0] is not second[0]
+    assert source.snapshot_calls == 2
+    assert make_provider(make_sources()).target_queue_snapshot() == ()
+
+
+def test_provider_pulls_fresh_tcp_server_snapshots_without_caching():
+    source = FakeTcpServerSource(
+        (
+            TcpServerMetricsSnapshot(
+                target_id=1,
+                name="tcp:partners",
+                listen="127.0.0.1:10110",
+                accepted=3,
+                rejected=0,
+                evicted=1,
+                clients=(
+                    TcpClientMetricsSnapshot(
+                        client_id=3,
+                        peer="127.0.0.1:50000",
+                        bytes=120,
+                        buffered_bytes=0,
+                        lag_us=0,
+                    ),
+                ),
+            ),
+        )
+    )
+    provider = make_provider(make_sources(), tcp_servers=source)
+
+    first = provider.tcp_server_snapshot()
+    second = provider.tcp_server_snapshot()
+
+    assert first == second
+    assert first[0] is not second[0]
+    assert source.snapshot_calls == 2
+    assert make_provider(make_sources()).tcp_server_snapshot() == ()
+
+
+def test_provider_pulls_fresh_emission_throttle_snapshots():
+    class FakeThrottle:
+        snapshot_calls = 0
+
+        def metrics_snapshot(self):
+            self.snapshot_calls += 1
+            return (
+                EmissionThrottleMetricsSnapshot(target_id=2, suppressed=5),
+            )
+
+    source = FakeThrottle()
+    provider = RuntimeStatisticsProvider(
+        (),
+        *(
+            make_sources()[name]
+            for name in (
+                "processing_queue",
+                "processor",
+                "egress_queue",
+                "egress_operations",
+            )
+        ),
+        emission_throttle=source,
+    )
+
+    first = provider.emission_throttle_snapshot()
+    second = provider.emission_throttle_snapshot()
+
+    assert first == second == (
+        EmissionThrottleMetricsSnapshot(target_id=2, suppressed=5),
+    )
+    assert source.snapshot_calls == 2
+    assert make_provider(make_sources()).emission_throttle_snapshot() == ()
+
+
+def test_provider_pulls_fresh_anomaly_snapshots_without_caching():
+    source = FakeMetricsSource(
+        "anomalies",
+        AnomalyMetricsSnapshot(
+            checked=10,
+            speed=1,
+            teleport=2,
+            duplicate_mmsi=0,
+            out_of_range=1,
+            tracked_vessels=4,
+        ),
+    )
+    provider = RuntimeStatisticsProvider(
+        (),
+        *(
+            make_sources()[name]
+            for name in (
+                "processing_queue",
+                "processor",
+                "egress_queue",
+                "egress_operations",
+            )
+        ),
+        anomalies=source,
+    )
+
+    first = provider.anomaly_snapshot()
+    second = provider.anomaly_snapshot()
+
+    assert first == second == source.current_snapshot
+    assert first is not second
+    assert source.snapshot_calls == 2
+
+
 def test_provider_contains_only_metric_source_references_not_counter_state():
     sources = make_sources()
     provider = make_provider(sources)
@@ -471,6 +651,9 @@ def test_provider_contains_only_metric_source_references_not_counter_state():
     assert provider.egress_operations is sources["egress_operations"]
     assert provider.input_traffic == ()
     assert provider.output_traffic is None
+    assert provider.target_queues is None
+    assert provider.vessel_table() is None
+    assert provider.anomaly_snapshot() is None
 
     with pytest.raises(FrozenInstanceError):
         provider.processor = sources["processor"]
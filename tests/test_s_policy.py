@@ -212,3 +212,13 @@ def test_explicit_candidate_helper_matches_legacy_source_policy(
         incoming_raw,
         remote_ip,
     )
+
+
+def test_explicit_candidate_helper_memoises_repeated_selection():
+    choose_s_value_from_candidates.cache_clear()
+
+    first = choose_s_value_from_candidates(None, "rx:1", None, "192.0.2.1")
+    second = choose_s_value_from_candidates(None, "rx:1", None, "192.0.2.1")
+
+    assert first == second == "rx_1"
+    assert choose_s_value_from_candidates.cache_info().hits == 1
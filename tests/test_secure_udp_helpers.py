@@ -23,6 +23,7 @@ from core.ingress_frame import (
     decode_frame_slice,
 )
 from core.network_policy import NetworkPolicy
+from core.udpsec_batch import decode_batch
 from core.udpsec_crypto import SessionKeyMaterial
 from core.udpsec_protocol import (
     ClientHello,
@@ -2603,6 +2604,128 @@ def test_proxy_local_allow_from_allows_matching_senders(monkeypatch, entries, ad
     }
 
 
+def test_proxy_forward_loop_batches_sentences_until_deadline(monkeypatch):
+    proxy = load_proxy_module()
+    client_to_server_key = b"\x01" * 32
+    remote_addr = ("192.0.2.10", 17777)
+    sentences = [
+        "!AIVDM,1,1,,A,first,0*00",
+        "!AIVDM,1,1,,A,second,0*00",
+    ]
+
+    class LocalSocket:
+        def recvfrom(self, _size):
+            return "\n".join(sentences).encode(), ("127.0.0.1", 40000)
+
+    class OutSocket:
+        def __init__(self):
+            self.sent = []
+
+        def sendto(self, data, destination):
+            self.sent.append((data, destination))
+
+    udp_sock = LocalSocket()
+    out_sock = OutSocket()
+    clock = [0.0]
+    timeouts = []
+
+    def fake_select(_readable, _writable, _exceptional, timeout):
+        timeouts.append(timeout)
+        if len(timeouts) == 1:
+            return [udp_sock], [], []
+        if len(timeouts) == 2:
+            clock[0] += timeout
+            return [], [], []
+        raise OSError("end test")
+
+    monkeypatch.setattr(proxy.select, "select", fake_select)
+    monkeypatch.setattr(proxy.time, "monotonic", lambda: clock[0])
+
+    reason = proxy.forward_loop(
+        udp_sock,
+        out_sock,
+        {
+            "station_id": "boat_001",
+            "keepalive_interval": 30,
+            "peer_timeout": 90,
+            "session_refresh_interval": 0,
+        },
+        _proxy_session_key_material(
+            proxy,
+            client_to_server_key=client_to_server_key,
+        ),
+        remote_addr,
+        session_options=proxy.SessionOptions(
+            data_version=proxy.DATA_VERSION_BATCH,
+            batch_max_delay=0.5,
+        ),
+    )
+
+    assert reason == proxy.SESSION_END_SOCKET_ERROR
+    assert timeouts[1] == 0.5
+    assert len(out_sock.sent) == 1
+    packet, destination = out_sock.sent[0]
+    assert destination == remote_addr
+    assert packet.startswith(proxy.BATCH_PREFIX)
+    nonce = packet[len(proxy.BATCH_PREFIX):len(proxy.BATCH_PREFIX) + 12]
+    plaintext = AESGCM(client_to_server_key).decrypt(
+        nonce,
+        packet[len(proxy.BATCH_PREFIX) + 12:],
+        proxy.BATCH_AAD,
+    )
+    assert decode_batch(plaintext) == (
+        0,
+        [sentence.encode() for sentence in sentences],
+    )
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("batch_max_bytes", 6),
+        ("batch_max_bytes", 8159),
+        ("batch_max_bytes", 1200.0),
+        ("batch_max_bytes", True),
+        ("batch_max_delay", -1),
+        ("batch_max_delay", "0.2"),
+        ("batch_compression", "yes"),
+        ("batch_compression", 1),
+    ],
+)
+def test_proxy_rejects_invalid_batch_options(field, value):
+    proxy = load_proxy_module()
+
+    with pytest.raises(proxy.ProxyConfigError, match=field):
+        proxy.session_options_from_config({field: value})
+
+
+def test_proxy_batch_compression_requires_batch_frames():
+    proxy = load_proxy_module()
+
+    with pytest.raises(proxy.ProxyConfigError, match="batch_compression"):
+        proxy.session_options_from_config(
+            {"batch_max_bytes": 0, "batch_compression": True}
+        )
+    assert proxy.session_options_from_config(
+        {"batch_compression": True}
+    ).compression is True
+
+
+def test_proxy_batch_options_default_to_version_2_and_zero_keeps_json():
+    proxy = load_proxy_module()
+
+    assert proxy.session_options_from_config(proxy.DEFAULT_CONFIG) == (
+        proxy.SessionOptions(
+            data_version=proxy.DATA_VERSION_BATCH,
+            batch_max_bytes=1200,
+            batch_max_delay=0.2,
+        )
+    )
+    assert proxy.session_options_from_config(
+        {"batch_max_bytes": 0}
+    ).data_version == proxy.DATA_VERSION_JSON
+
+
 def test_proxy_local_allow_from_drops_denied_packet_before_processing(
     monkeypatch,
     capsys,
@@ -5335,6 +5458,9 @@ def test_secure_state_stats_start_at_zero_and_are_frozen_snapshots(monkeypatch):
         "data_nonces_expired",
         "data_nonces_capacity_evicted",
         "data_nonces_session_discarded",
+        "batch_frames_accepted",
+        "batch_sentences_accepted",
+        "compression_by_station",
         "current_handshake_replays",
         "peak_handshake_replays",
         "current_sessions",
@@ -5344,7 +5470,12 @@ def test_secure_state_stats_start_at_zero_and_are_frozen_snapshots(monkeypatch):
         "current_data_nonces",
         "peak_data_nonces",
     }
-    assert all(value == 0 for value in vars(initial).values())
+    assert initial.compression_by_station == ()
+    assert all(
+        value == 0
+        for name, value in vars(initial).items()
+        if name != "compression_by_station"
+    )
     with pytest.raises(FrozenInstanceError):
         initial.current_sessions = 1
 
@@ -0,0 +1,112 @@
+import itertools
+
+import pytest
+
+from core import shm_ring
+from core.shm_ring import (
+    MIN_SHM_RING_BYTES,
+    ShmRingError,
+    ShmRingReader,
+    ShmRingWriter,
+)
+
+
+_names = itertools.count()
+
+
+@pytest.fixture
+def writer():
+    ring = ShmRingWriter(f"aismixer-ring-test-{next(_names)}", MIN_SHM_RING_BYTES)
+    yield ring
+    ring.close()
+
+
+def test_reader_receives_records_written_after_attaching(writer):
+    writer.write(b"before")
+    with ShmRingReader(writer.name) as reader:
+        writer.write(b"one")
+        writer.write(b"")
+        writer.write(b"three")
+
+        assert reader.read() == [b"one", b"", b"three"]
+        assert reader.read() == []
+        assert reader.overruns == 0
+    assert writer.records_written == 4
+
+
+def test_records_wrap_around_the_end_of_the_ring(writer):
+    record = bytes(range(256)) * 40
+    with ShmRingReader(writer.name) as reader:
+        received = []
+        for index in range(40):
+            writer.write(record[index:])
+            received.extend(reader.read())
+
+    assert received == [record[index:] for index in range(40)]
+    assert reader.overruns == 0
+
+
+def test_lapped_reader_skips_to_newest_record_and_counts_overrun(writer):
+    with ShmRingReader(writer.name) as reader:
+        for _ in range(MIN_SHM_RING_BYTES // 1024 + 1):
+            writer.write(b"x" * 1024)
+
+        assert reader.read() == []
+        writer.write(b"fresh")
+
+        assert reader.read() == [b"fresh"]
+        assert reader.overruns == 1
+
+
+def test_reader_counts_overrun_for_unpublished_write_over_its_records(
+    writer,
+    monkeypatch,
+):
+    record = b"x" * 1024
+    with ShmRingReader(writer.name) as reader:
+        # Fill the ring to a full capacity lead without lapping the reader.
+        for _ in range(MIN_SHM_RING_BYTES // 1032):
+            writer.write(record)
+        # The next record wraps to offset zero; stop it before publishing.
+        monkeypatch.setattr(shm_ring, "_pack_progress", lambda *_args: None)
+        writer.write(b"y" * 1024)
+
+        assert reader.read() == []
+        assert reader.overruns == 1
+
+
+def test_independent_readers_keep_their_own_position(writer):
+    with ShmRingReader(writer.name) as first, ShmRingReader(writer.name) as second:
+        writer.write(b"one")
+        assert first.read() == [b"one"]
+        writer.write(b"two")
+
+        assert first.read() == [b"two"]
+        assert second.read() == [b"one", b"two"]
+
+
+def test_writer_replaces_stale_segment_with_same_name(writer):
+    writer.write(b"stale")
+    replacement = ShmRingWriter(writer.name, MIN_SHM_RING_BYTES)
+    try:
+        with ShmRingReader(replacement.name) as reader:
+            replacement.write(b"fresh")
+            assert reader.read() == [b"fresh"]
+    finally:
+        replacement.close()
+
+
+def test_oversized_record_is_rejected(writer):
+    with pytest.raises(ValueError, match="does not fit"):
+        writer.write(b"x" * MIN_SHM_RING_BYTES)
+
+
+@pytest.mark.parametrize("capacity", [1024, MIN_SHM_RING_BYTES + 1])
+def test_invalid_capacity_is_rejected(capacity):
+    with pytest.raises(ValueError, match="capacity"):
+        ShmRingWriter("aismixer-ring-test-invalid", capacity)
+
+
+def test_reader_rejects_missing_segment():
+    with pytest.raises(ShmRingError, match="does not exist"):
+        ShmRingReader("aismixer-ring-test-missing")
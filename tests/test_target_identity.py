@@ -1,6 +1,13 @@
 import pytest
 
-from core.target_identity import build_udp_target_id
+from core.target_identity import (
+    build_file_target_id,
+    build_multicast_target_id,
+    build_shm_target_id,
+    build_tcp_target_id,
+    build_udp_target_id,
+    build_unix_target_id,
+)
 
 
 def test_build_udp_target_id_returns_canonical_namespaced_id():
@@ -29,3 +36,18 @@ def test_build_udp_target_id_rejects_non_string_ids(configured_id):
 def test_build_udp_target_id_rejects_already_namespaced_id():
     with pytest.raises(ValueError, match="unnamespaced"):
         build_udp_target_id("udp:aishub")
+
+
+def test_local_target_ids_use_their_own_namespace():
+    assert build_unix_target_id("plotter") == "unix:plotter"
+    assert build_shm_target_id("plotter") == "shm:plotter"
+    assert build_tcp_target_id("partners") == "tcp:partners"
+    assert build_multicast_target_id("lan") == "multicast:lan"
+    assert build_file_target_id("archive") == "file:archive"
+
+
+def test_local_target_ids_reject_already_namespaced_id():
+    with pytest.raises(ValueError, match="unnamespaced"):
+        build_unix_target_id("unix:plotter")
+    with pytest.raises(ValueError, match="unnamespaced"):
+        build_shm_target_id("shm:plotter")
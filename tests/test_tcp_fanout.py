@@ -0,0 +1,183 @@
+import asyncio
+
+from core.tcp_fanout import TcpFanoutServer, _TcpClientProtocol
+
+
+class _FakeClientTransport:
+    def __init__(self, buffered=0, peer=("192.0.2.1", 40000)):
+        self.buffered = buffered
+        self.peer = peer
+        self.writes = []
+        self.aborted = False
+
+    def get_extra_info(self, name):
+        return self.peer if name == "peername" else None
+
+    def get_write_buffer_size(self):
+        return self.buffered
+
+    def write(self, data):
+        self.writes.append(data)
+
+    def abort(self):
+        self.aborted = True
+
+
+def _connect_fake(server, transport):
+    client = _TcpClientProtocol(server)
+    client.connection_made(transport)
+    return client
+
+
+async def _connect(server):
+    host, port = server.listen.rsplit(":", 1)
+    reader, writer = await asyncio.open_connection(host, int(port))
+    # Let the server-side protocol register the connection.
+    await asyncio.sleep(0.01)
+    return reader, writer
+
+
+def test_messages_written_in_one_iteration_reach_every_client_once():
+    async def scenario():
+        server = TcpFanoutServer("127.0.0.1", 0)
+        await server.start()
+        try:
+            first_reader, first_writer = await _connect(server)
+            second_reader, second_writer = await _connect(server)
+            server.write(b"one\r\n")
+            server.write(b"two\r\n")
+            pending = server.pending_bytes
+            received = [
+                await reader.readexactly(10)
+                for reader in (first_reader, second_reader)
+            ]
+            snapshot = server.metrics_snapshot(3, "tcp:partners")
+            first_writer.close()
+            second_writer.close()
+            return pending, received, snapshot
+        finally:
+            server.close()
+
+    pending, received, snapshot = asyncio.run(scenario())
+
+    assert pending == 10
+    assert received == [b"one\r\ntwo\r\n"] * 2
+    assert (snapshot.target_id, snapshot.name) == (3, "tcp:partners")
+    assert (snapshot.accepted, snapshot.rejected, snapshot.evicted) == (2, 0, 0)
+    assert [client.bytes for client in snapshot.clients] == [10, 10]
+    assert [client.client_id for client in snapshot.clients] == [1, 2]
+
+
+def test_connections_beyond_max_clients_are_rejected():
+    async def scenario():
+        server = TcpFanoutServer("127.0.0.1", 0, max_clients=1)
+        await server.start()
+        try:
+            _first_reader, first_writer = await _connect(server)
+            second_reader, second_writer = await _connect(server)
+            closed = await second_reader.read()
+            snapshot = server.metrics_snapshot(0, None)
+            first_writer.close()
+            second_writer.close()
+            return closed, snapshot
+        finally:
+            server.close()
+
+    closed, snapshot = asyncio.run(scenario())
+
+    assert closed == b""
+    assert (snapshot.accepted, snapshot.rejected) == (1, 1)
+    assert len(snapshot.clients) == 1
+
+
+def test_client_over_its_buffer_bound_is_evicted_without_affecting_others():
+    async def scenario():
+        server = TcpFanoutServer("127.0.0.1", 0, client_buffer_bytes=100)
+        server._loop = asyncio.get_running_loop()
+        slow = _FakeClientTransport(buffered=96)
+        healthy = _FakeClientTransport(peer=("192.0.2.2", 40001))
+        _connect_fake(server, slow)
+        _connect_fake(server, healthy)
+        server.write(b"12345")
+        await asyncio.sleep(0)
+        return server.metrics_snapshot(0, None), slow, healthy
+
+    snapshot, slow, healthy = asyncio.run(scenario())
+
+    assert slow.aborted is True
+    assert slow.writes == []
+    assert healthy.writes == [b"12345"]
+    assert snapshot.evicted == 1
+    assert [client.peer for client in snapshot.clients] == ["192.0.2.2:40001"]
+
+
+def test_burst_larger_than_the_buffer_bound_reaches_a_drained_client():
+    async def scenario():
+        server = TcpFanoutServer("127.0.0.1", 0, client_buffer_bytes=1024)
+        server._loop = asyncio.get_running_loop()
+        idle = _FakeClientTransport()
+        _connect_fake(server, idle)
+        for _ in range(30):
+            server.write(b"m" * 60)
+        await asyncio.sleep(0)
+        return server.metrics_snapshot(0, None), idle
+
+    snapshot, idle = asyncio.run(scenario())
+
+    assert idle.aborted is False
+    assert idle.writes == [b"m" * 1800]
+    assert snapshot.evicted == 0
+    assert len(snapshot.clients) == 1
+
+
+def test_client_lag_measures_time_since_its_backlog_started():
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        server = TcpFanoutServer("127.0.0.1", 0)
+        server._loop = loop
+        transport = _FakeClientTransport(buffered=10)
+        _connect_fake(server, transport)
+        server.write(b"x")
+        await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+        lagging = server.metrics_snapshot(0, None).clients[0]
+        transport.buffered = 0
+        drained = server.metrics_snapshot(0, None).clients[0]
+        return lagging, drained
+
+    lagging, drained = asyncio.run(scenario())
+
+    assert lagging.buffered_bytes == 10
+    assert lagging.lag_us >= 10_000
+    assert drained.lag_us == 0
+
+
+def test_client_lag_restarts_after_its_backlog_drains():
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        server = TcpFanoutServer("127.0.0.1", 0)
+        server._loop = loop
+        transport = _FakeClientTransport(buffered=10)
+        _connect_fake(server, transport)
+        server.write(b"x")
+        await asyncio.sleep(0)
+        await asyncio.sleep(0.05)
+        # Drains between flushes, then backs up again on the next write.
+        transport.buffered = 0
+        transport.write = lambda data: setattr(transport, "buffered", 10)
+        server.write(b"y")
+        await asyncio.sleep(0)
+        return server.metrics_snapshot(0, None).clients[0]
+
+    client = asyncio.run(scenario())
+
+    assert client.buffered_bytes == 10
+    assert client.lag_us < 50_000
+
+
+def test_writes_without_clients_are_discarded():
+    server = TcpFanoutServer("127.0.0.1", 0)
+
+    server.write(b"nobody")
+
+    assert server.pending_bytes == 0
@@ -0,0 +1,135 @@
+import zlib
+
+import pytest
+
+from core.udpsec_batch import (
+    BATCH_FLAG_DEFLATE,
+    BATCH_MAX_PLAINTEXT,
+    BATCH_MIN_PLAINTEXT,
+    DATA_VERSION_BATCH,
+    NMEA_DEFLATE_DICTIONARY,
+    SentenceBatch,
+    compress_batch,
+    decode_batch,
+    decompress_batch,
+    encode_batch,
+)
+
+
+SENTENCES = [
+    b"!AIVDM,1,1,,A,13aG?P0000PD;88MD5MTDwvN0<0l,0*7D",
+    b"\\s:rPiAIS002,c:1700000000*00\\!AIVDM,1,1,,B,B52K>;h00Fc>jpUlNV@ikwpUoP06,0*4C",
+]
+
+
+def test_batch_round_trips_sentences_in_order():
+    plaintext = encode_batch(SENTENCES)
+
+    assert plaintext[:4] == bytes((DATA_VERSION_BATCH, 0, 0, 2))
+    assert plaintext[4:6] == len(SENTENCES[0]).to_bytes(2, "big")
+    assert len(plaintext) == 4 + sum(2 + len(s) for s in SENTENCES)
+    assert decode_batch(plaintext) == (0, SENTENCES)
+
+
+def test_batch_flags_are_carried_for_the_receiver_to_check():
+    assert decode_batch(encode_batch(SENTENCES, flags=1))[0] == 1
+
+
+@pytest.mark.parametrize(
+    "plaintext",
+    [
+        b"",
+        b"\x02\x00\x00",
+        b"\x01\x00\x00\x01\x00\x01A",
+        b"\x02\x00\x00\x00",
+        b"\x02\x00\x00\x01\x00",
+        b"\x02\x00\x00\x01\x00\x00",
+        b"\x02\x00\x00\x01\x00\x02A",
+        b"\x02\x00\x00\x01\x00\x01AB",
+        b"\x02\x00\x00\x02\x00\x01A",
+    ],
+)
+def test_malformed_batches_are_rejected(plaintext):
+    with pytest.raises(ValueError):
+        decode_batch(plaintext)
+
+
+@pytest.mark.parametrize("sentences", [[], [b""], [b"A" * 65536]])
+def test_unencodable_batches_are_rejected(sentences):
+    with pytest.raises(ValueError):
+        encode_batch(sentences)
+
+
+def test_sentence_batch_hands_back_a_full_batch_before_overflowing():
+    batch = SentenceBatch(max_bytes=4 + 2 * (2 + 10))
+
+    assert batch.add(b"A" * 10, 1.0) is None
+    assert batch.add(b"B" * 10, 2.0) is None
+    assert batch.started_at == 1.0
+    assert len(batch) == 2
+
+    assert batch.add(b"C" * 10, 3.0) == [b"A" * 10, b"B" * 10]
+    assert batch.started_at == 3.0
+    assert batch.take() == [b"C" * 10]
+    assert batch.started_at is None
+    assert batch.take() is None
+
+
+def test_sentence_longer_than_the_limit_gets_its_own_batch():
+    batch = SentenceBatch(max_bytes=BATCH_MIN_PLAINTEXT)
+
+    assert batch.add(b"A" * 100, 0.0) is None
+    assert batch.add(b"B", 0.0) == [b"A" * 100]
+    assert batch.take() == [b"B"]
+
+
+@pytest.mark.parametrize(
+    "max_bytes",
+    [BATCH_MIN_PLAINTEXT - 1, BATCH_MAX_PLAINTEXT + 1],
+)
+def test_sentence_batch_limit_must_fit_one_datagram(max_bytes):
+    with pytest.raises(ValueError, match="max_bytes"):
+        SentenceBatch(max_bytes)
+
+
+def _deflated(body):
+    compressor = zlib.compressobj(
+        wbits=-zlib.MAX_WBITS,
+        zdict=NMEA_DEFLATE_DICTIONARY,
+    )
+    return compressor.compress(body) + compressor.flush()
+
+
+def test_compressed_batch_round_trips_and_shrinks():
+    plaintext = encode_batch(SENTENCES * 4)
+
+    compressed = compress_batch(plaintext)
+
+    assert compressed[1] == BATCH_FLAG_DEFLATE
+    assert compressed[2:4] == plaintext[2:4]
+    assert len(compressed) < len(plaintext) // 2
+    assert decompress_batch(compressed) == plaintext
+
+
+def test_incompressible_batch_is_sent_as_is():
+    plaintext = encode_batch([bytes(range(1, 256))])
+
+    assert compress_batch(plaintext) == plaintext
+    assert decompress_batch(plaintext) == plaintext
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"not deflate",
+        _deflated(b"\x00\x01A")[:-1],
+        _deflated(b"\x00\x01A") + b"trailing",
+        _deflated(b"A" * BATCH_MAX_PLAINTEXT),
+    ],
+    ids=["corrupt", "truncated", "trailing", "oversized"],
+)
+def test_malformed_compressed_batches_are_rejected(body):
+    header = bytes((DATA_VERSION_BATCH, BATCH_FLAG_DEFLATE, 0, 1))
+
+    with pytest.raises(ValueError):
+        decompress_batch(header + body)
@@ -14,6 +14,7 @@ DEPLOYED_PYTHON_FILES = {
     "output_adapters.py": ROOT / "nmea_sproxy" / "output_adapters.py",
     "meta_cleaner.py": ROOT / "nmea_sproxy" / "meta_cleaner.py",
     "core/network_policy.py": ROOT / "core" / "network_policy.py",
+    "core/udpsec_batch.py": ROOT / "core" / "udpsec_batch.py",
     "core/udpsec_crypto.py": ROOT / "core" / "udpsec_crypto.py",
     "core/udpsec_protocol.py": ROOT / "core" / "udpsec_protocol.py",
 }
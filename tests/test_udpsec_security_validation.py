@@ -635,6 +635,213 @@ def test_real_udp_loopback_interoperability(
                 )
 
 
+def test_real_batch_negotiation_delivers_many_sentences_per_frame(
+    real_udpsec_endpoints,
+):
+    endpoints = real_udpsec_endpoints
+    proxy = endpoints.proxy
+    with _running_secure_server(
+        endpoints.secure, socket.AF_INET, "127.0.0.1"
+    ) as server:
+        with _client_socket(socket.AF_INET, "127.0.0.1") as client:
+            options = proxy.SessionOptions(
+                data_version=proxy.DATA_VERSION_BATCH
+            )
+            key_material = proxy.perform_handshake(
+                client,
+                {"station_id": STATION_ID},
+                endpoints.station_private_key,
+                endpoints.server_public_key,
+                server.remote_addr,
+                options,
+            )
+
+            session = _assert_single_confirmed_session(server)
+            assert options.data_version == proxy.DATA_VERSION_BATCH
+            assert session.data_version == proxy.DATA_VERSION_BATCH
+
+            sender = proxy.UdpsecBatchSender(
+                client,
+                key_material.client_to_server_key,
+                server.remote_addr,
+            )
+            sentences = [NMEA_PAYLOAD, NMEA_PAYLOAD.replace("A,13", "B,13")]
+            for sentence in sentences:
+                sender.send_sentence(sentence)
+            sender.flush()
+
+            frames = [server.ingress.get() for _ in sentences]
+            assert [frame.payload for frame in frames] == [
+                sentence.encode() for sentence in sentences
+            ]
+            assert {frame.source_id for frame in frames} == {
+                f"udpsec:{STATION_ID}"
+            }
+            assert {frame.alias_for_s for frame in frames} == {
+                "loopback-validation"
+            }
+            stats = server.call_in_loop(server.state.stats)
+            assert stats.batch_frames_accepted == 1
+            assert stats.batch_sentences_accepted == 2
+            assert stats.data_nonces_accepted == 2
+
+
+def test_real_batch_frames_need_both_sides_to_negotiate(
+    real_udpsec_endpoints,
+    monkeypatch,
+):
+    endpoints = real_udpsec_endpoints
+    proxy = endpoints.proxy
+    secure = endpoints.secure
+    # A server that predates batch frames ignores the offer.
+    monkeypatch.setattr(
+        secure,
+        "_negotiated_data_version",
+        lambda _confirmation: secure.DATA_VERSION_JSON,
+    )
+    with _running_secure_server(secure, socket.AF_INET, "127.0.0.1") as server:
+        with _client_socket(socket.AF_INET, "127.0.0.1") as client:
+            options = proxy.SessionOptions(
+                data_version=proxy.DATA_VERSION_BATCH
+            )
+            key_material = proxy.perform_handshake(
+                client,
+                {"station_id": STATION_ID},
+                endpoints.station_private_key,
+                endpoints.server_public_key,
+                server.remote_addr,
+                options,
+            )
+
+            session = _assert_single_confirmed_session(server)
+            assert options.data_version == proxy.DATA_VERSION_JSON
+            assert session.data_version == secure.DATA_VERSION_JSON
+
+            sender = proxy.UdpsecBatchSender(
+                client,
+                key_material.client_to_server_key,
+                server.remote_addr,
+            )
+            sender.send_sentence(NMEA_PAYLOAD)
+            sender.flush()
+            endpoints.proxy.send_udpsec_nmea_sentence(
+                NMEA_PAYLOAD,
+                client,
+                {"station_id": STATION_ID},
+                key_material.client_to_server_key,
+                server.remote_addr,
+            )
+
+            frame = server.ingress.get()
+            assert frame.text_mode is PayloadTextMode.UTF8_SURROGATEPASS
+            assert server.ingress.empty()
+            stats = server.call_in_loop(server.state.stats)
+            assert stats.batch_frames_accepted == 0
+            assert stats.data_nonces_accepted == 2
+
+
+def test_real_compressed_batches_report_ratio_per_station(
+    real_udpsec_endpoints,
+):
+    endpoints = real_udpsec_endpoints
+    proxy = endpoints.proxy
+    with _running_secure_server(
+        endpoints.secure, socket.AF_INET, "127.0.0.1"
+    ) as server:
+        with _client_socket(socket.AF_INET, "127.0.0.1") as client:
+            options = proxy.SessionOptions(
+                data_version=proxy.DATA_VERSION_BATCH,
+                compression=True,
+            )
+            key_material = proxy.perform_handshake(
+                client,
+                {"station_id": STATION_ID},
+                endpoints.station_private_key,
+                endpoints.server_public_key,
+                server.remote_addr,
+                options,
+            )
+
+            session = _assert_single_confirmed_session(server)
+            assert options.compression is True
+            assert session.compression == proxy.COMPRESSION_DEFLATE_NMEA
+
+            sender = proxy.UdpsecBatchSender(
+                client,
+                key_material.client_to_server_key,
+                server.remote_addr,
+                compress=True,
+            )
+            sentences = [
+                NMEA_PAYLOAD.replace("A,13", f"{channel},13")
+                for channel in "ABAB"
+            ]
+            for sentence in sentences:
+                sender.send_sentence(sentence)
+            sender.flush()
+
+            frames = [server.ingress.get() for _ in sentences]
+            assert [frame.payload for frame in frames] == [
+                sentence.encode() for sentence in sentences
+            ]
+            stats = server.call_in_loop(server.state.stats)
+            (station,) = stats.compression_by_station
+            assert station.station_id == STATION_ID
+            assert station.frames == 1
+            assert station.uncompressed_bytes == 4 + sum(
+                2 + len(sentence) for sentence in sentences
+            )
+            assert station.compressed_bytes < station.uncompressed_bytes
+            assert station.ratio > 1
+            assert station.cpu_ns >= 0
+
+
+def test_real_compressed_batches_need_negotiated_compression(
+    real_udpsec_endpoints,
+):
+    endpoints = real_udpsec_endpoints
+    proxy = endpoints.proxy
+    with _running_secure_server(
+        endpoints.secure, socket.AF_INET, "127.0.0.1"
+    ) as server:
+        with _client_socket(socket.AF_INET, "127.0.0.1") as client:
+            options = proxy.SessionOptions(
+                data_version=proxy.DATA_VERSION_BATCH
+            )
+            key_material = proxy.perform_handshake(
+                client,
+                {"station_id": STATION_ID},
+                endpoints.station_private_key,
+                endpoints.server_public_key,
+                server.remote_addr,
+                options,
+            )
+
+            session = _assert_single_confirmed_session(server)
+            assert options.compression is False
+            assert session.compression is None
+
+            for compress in (True, False):
+                sender = proxy.UdpsecBatchSender(
+                    client,
+                    key_material.client_to_server_key,
+                    server.remote_addr,
+                    compress=compress,
+                )
+                sender.send_sentence(NMEA_PAYLOAD)
+                sender.send_sentence(NMEA_PAYLOAD)
+                sender.flush()
+
+            frames = [server.ingress.get() for _ in range(2)]
+            assert {frame.payload for frame in frames} == {
+                NMEA_PAYLOAD.encode()
+            }
+            assert server.ingress.empty()
+            stats = server.call_in_loop(server.state.stats)
+            assert stats.batch_frames_accepted == 1
+            assert stats.compression_by_station == ()
+
+
 def test_real_confirmed_same_address_rekey_replaces_traffic_keys(
     real_udpsec_endpoints,
 ):
@@ -1714,6 +1921,8 @@ def test_session_state_retains_only_directional_cipher_contexts(
         "created_at",
         "last_seen",
         "seen_data_nonces",
+        "data_version",
+        "compression",
     }
     assert set(vars(pending)) == {
         "_address",
@@ -0,0 +1,200 @@
+import random
+
+import pytest
+
+from core.vessel_table import (
+    VesselState,
+    VesselTable,
+    VesselTableConfigError,
+    load_optional_vessel_table,
+)
+
+
+# Reference reports from the gpsd AIVDM notes.
+POSITION = "!AIVDM,1,1,,B,177KQJ5000G?tO`K>RA1wUbN0TKH,0*5C"
+CLASS_B = "!AIVDM,1,1,,B,B52K>;h00Fc>jpUlNV@ikwpUoP06,0*4C"
+STATIC = (
+    "!AIVDM,2,1,3,B,55?MbV02;H;s<HtKR20EHE:0@T4@Dn2222222216L961O5Gf0NSQEp6ClRp8"
+    ",0*1C"
+)
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_observe_records_position_reports_only():
+    table = VesselTable(clock=Clock())
+
+    assert table.observe(POSITION, "udp:roof", 1000.0)
+    assert table.observe(CLASS_B, "udpsec:rPiAIS002", 999.0)
+    assert not table.observe(STATIC, "udp:roof", 1000.0)
+    assert not table.observe("!AIVDM,1,1,,B", "udp:roof", 1000.0)
+
+    assert len(table) == 2
+    assert table.get(477553000) == VesselState(
+        mmsi=477553000,
+        lon=pytest.approx(-122.345833),
+        lat=pytest.approx(47.582833),
+        sog=0.0,
+        cog=51.0,
+        timestamp=1000.0,
+        message_type=1,
+        source_id="udp:roof",
+    )
+    class_b = table.get(338087471)
+    assert (class_b.message_type, class_b.source_id) == (18, "udpsec:rPiAIS002")
+    assert table.get(351759000) is None
+
+
+def test_unavailable_speed_and_course_read_back_as_none():
+    table = VesselTable(clock=Clock())
+
+    table.update(1, 10.0, 50.0, None, 360.0, 1000.0, 27, "udp:a")
+    table.update(2, 10.0, 50.0, 102.3, None, 1000.0, 1, "udp:a")
+
+    assert (table.get(1).sog, table.get(1).cog) == (None, None)
+    assert table.get(2).sog is None
+
+
+def test_rows_expire_after_their_ttl_and_are_reused():
+    clock = Clock()
+    table = VesselTable(capacity=4, ttl_s=60, clock=clock)
+    for mmsi in range(1, 4):
+        table.update(mmsi, 10.0, 50.0, 1.0, 2.0, 1000.0, 1, "udp:a")
+
+    clock.now = 1061.0
+    assert table.get(1) is None
+    assert table.query_bounds((0, 40, 20, 60)) == ((), False)
+
+    # Inserting a vessel reclaims expired rows instead of growing.
+    table.update(9, 11.0, 51.0, 1.0, 2.0, 1061.0, 1, "udp:a")
+    assert len(table) == 2
+    assert table.expire() == 1
+    assert len(table) == 1
+    assert table.get(9).lon == 11.0
+
+
+def test_full_table_evicts_the_least_recently_updated_vessel():
+    table = VesselTable(capacity=3, clock=Clock())
+    for mmsi in (1, 2, 3):
+        table.update(mmsi, 10.0, 50.0, 1.0, 2.0, 1000.0, 1, "udp:a")
+    table.update(1, 10.5, 50.0, 1.0, 2.0, 1000.0, 1, "udp:a")
+
+    table.update(4, 10.0, 50.0, 1.0, 2.0, 1000.0, 1, "udp:a")
+
+    assert table.evictions == 1
+    assert table.get(2) is None
+    assert {table.get(mmsi).lon for mmsi in (1, 3, 4)} == {10.5, 10.0}
+
+
+def test_source_ids_are_released_with_their_last_row():
+    clock = Clock(0.0)
+    table = VesselTable(capacity=4, ttl_s=60, clock=clock)
+
+    for step in range(1000):
+        clock.now = float(step)
+        table.update(
+            step % 10,
+            10.0,
+            50.0,
+            1.0,
+            2.0,
+            clock.now,
+            1,
+            f"udp:192.0.2.{step % 250}",
+        )
+
+    assert len(table._sources) <= 5
+    assert len(table._source_rows) <= 4
+    assert table.get(999 % 10).source_id == "udp:192.0.2.249"
+
+    # A vessel heard from a new source no longer holds the old one.
+    table.update(9, 10.0, 50.0, 1.0, 2.0, clock.now, 1, "udp:a")
+    assert "udp:192.0.2.249" not in table._source_rows
+
+
+def test_query_bounds_includes_borders_and_reports_truncation():
+    table = VesselTable(clock=Clock())
+    table.update(1, 10.0, 50.0, 1.0, 2.0, 1000.0, 1, "udp:a")
+    table.update(2, 11.0, 51.0, 1.0, 2.0, 1000.0, 1, "udp:a")
+    table.update(3, 11.0001, 51.0, 1.0, 2.0, 1000.0, 1, "udp:a")
+
+    vessels, truncated = table.query_bounds((10, 50, 11, 51))
+    assert sorted(vessel.mmsi for vessel in vessels) == [1, 2]
+    assert not truncated
+
+    vessels, truncated = table.query_bounds((-180, -90, 180, 90), limit=2)
+    assert len(vessels) == 2 and truncated
+
+    table.update(4, 180.0, 90.0, 1.0, 2.0, 1000.0, 1, "udp:a")
+    vessels, _truncated = table.query_bounds((179.9, 89.9, 180, 90))
+    assert [vessel.mmsi for vessel in vessels] == [4]
+
+
+def test_table_agrees_with_a_dict_through_moves_and_expiry():
+    clock = Clock(0.0)
+    table = VesselTable(capacity=300, ttl_s=50, cell_degrees=1.0, clock=clock)
+    expected = {}
+    rng = random.Random(46)
+
+    for step in range(5000):
+        clock.now = step / 10
+        mmsi = rng.randrange(200_000_000, 200_000_400)
+        lon = rng.uniform(-5.0, 5.0)
+        lat = rng.uniform(45.0, 55.0)
+        table.update(mmsi, lon, lat, 1.0, 2.0, clock.now, 1, "udp:a")
+        expected[mmsi] = (lon, lat, clock.now)
+        while len(expected) > 300:
+            oldest = min(expected, key=lambda key: expected[key][2])
+            del expected[oldest]
+
+        if step % 250 == 0:
+            live = {
+                mmsi: value
+                for mmsi, value in expected.items()
+                if value[2] >= clock.now - 50
+            }
+            for mmsi in range(200_000_000, 200_000_400):
+                state = table.get(mmsi)
+                assert (state is None) == (mmsi not in live)
+            vessels, _truncated = table.query_bounds(
+                (-2.0, 47.0, 3.0, 52.0),
+                limit=1000,
+            )
+            assert sorted(vessel.mmsi for vessel in vessels) == sorted(
+                mmsi
+                for mmsi, (lon, lat, _timestamp) in live.items()
+                if -2.0 <= lon <= 3.0 and 47.0 <= lat <= 52.0
+            )
+
+
+def test_optional_config_builds_the_table_only_when_enabled():
+    assert load_optional_vessel_table({}) is None
+    assert load_optional_vessel_table({"vessel_table": {"enabled": False}}) is None
+
+    table = load_optional_vessel_table(
+        {"vessel_table": {"enabled": True, "capacity": 10, "ttl_seconds": 30}}
+    )
+
+    assert (table.capacity, table.ttl_s, table.cell_degrees) == (10, 30.0, 0.5)
+
+
+@pytest.mark.parametrize(
+    "section",
+    [
+        [],
+        {"enabled": "yes"},
+        {"enabled": True, "capacity": 0},
+        {"enabled": True, "ttl_seconds": -1},
+        {"enabled": True, "cell_degrees": 91},
+        {"enabled": True, "size": 10},
+    ],
+)
+def test_invalid_config_is_rejected(section):
+    with pytest.raises(VesselTableConfigError):
+        load_optional_vessel_table({"vessel_table": section})